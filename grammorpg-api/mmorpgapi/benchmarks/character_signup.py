@@ -0,0 +1,250 @@
+"""A benchmark of the database round trips of a character sign-up.
+
+A stand-in database compiles every statement the way the `databases`
+Postgres backend does, counts it and answers after `--rtt-ms`, the round
+trip to Postgres. Three sign-up paths are measured against it, one
+sign-up at a time for the latency and `--signups` at a time for a burst:
+
+- baseline: the statements the original code issued, an inventory
+  insert and reselect, a name check, a player insert and reselect,
+- create calls: `POST /inventory/create` then `POST /player/create`,
+  both now using INSERT ... RETURNING,
+- character: `POST /player/character`, one CTE inserting both rows.
+
+Run from the `mmorpgapi` directory:
+
+    PYTHONPATH=. python benchmarks/character_signup.py
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from typing import Any, Awaitable, Callable
+
+# The configuration requires a secret, which this benchmark never uses.
+os.environ.setdefault("JWT_SECRET", "benchmark-secret-" + "x" * 32)
+
+from databases.backends.postgres import PostgresBackend  # noqa: E402
+
+from src.core.domain.character import CharacterIn  # noqa: E402
+from src.core.domain.inventory import InventoryIn  # noqa: E402
+from src.core.domain.player import PlayerBaseIn, PlayerIn  # noqa: E402
+from src.db import inventory_table, player_table  # noqa: E402
+from src.infrastructure.repositories import inventorydb, playerdb, playernamedb  # noqa: E402
+from src.infrastructure.repositories.inventorydb import InventoryRepository  # noqa: E402
+from src.infrastructure.repositories.playerdb import PlayerRepository  # noqa: E402
+from src.infrastructure.utils.dbrouter import DatabaseRouter  # noqa: E402
+from src.infrastructure.utils.sharding import ShardRouter  # noqa: E402
+
+ROW = {
+    "id": 1,
+    "name": "hero",
+    "strength": 10,
+    "hp": 100,
+    "maxhp": 100,
+    "connectedinventory": 1,
+    "money": 50,
+    "itemlist": "",
+    "inventory_money": 50,
+    "inventory_itemlist": "",
+}
+
+
+class CountingDatabase:
+    """A class standing in for a database reached over the network."""
+
+    def __init__(self, rtt_seconds: float) -> None:
+        """The initializer of the stand-in.
+
+        Args:
+            rtt_seconds (float): The duration of a round trip.
+        """
+
+        self._rtt_seconds = rtt_seconds
+        self._connection = PostgresBackend("postgresql://localhost/benchmark").connection()
+        self.statements = 0
+
+    async def execute(self, query: Any, values: dict | None = None) -> int:
+        """A method running a statement.
+
+        Args:
+            query (Any): The statement.
+            values (dict | None): The parameters, ignored.
+
+        Returns:
+            int: The id of the inserted row.
+        """
+
+        await self._round_trip(query)
+        return ROW["id"]
+
+    async def fetch_one(self, query: Any, values: dict | None = None) -> dict:
+        """A method running a statement returning a row.
+
+        Args:
+            query (Any): The statement.
+            values (dict | None): The parameters, ignored.
+
+        Returns:
+            dict: A row with the columns of every queried table.
+        """
+
+        await self._round_trip(query)
+        return ROW
+
+    async def _round_trip(self, query: Any) -> None:
+        """A private method compiling a statement and waiting for its answer.
+
+        Args:
+            query (Any): The statement.
+        """
+
+        self._connection._compile(query)
+        self.statements += 1
+        await asyncio.sleep(self._rtt_seconds)
+
+
+async def baseline(
+    database: CountingDatabase,
+    players: PlayerRepository,
+    inventories: InventoryRepository,
+) -> None:
+    """A function replaying the statements of the original sign-up.
+
+    Args:
+        database (CountingDatabase): The stand-in.
+        players (PlayerRepository): Unused, the statements are issued directly.
+        inventories (InventoryRepository): Unused as well.
+    """
+
+    inventory_id = await database.execute(
+        inventory_table.insert().values(money=50, itemlist="")
+    )
+    await database.fetch_one(
+        inventory_table.select().where(inventory_table.c.id == inventory_id)
+    )
+    await database.fetch_one(
+        player_table.select().where(player_table.c.name == "hero")
+    )
+    player_id = await database.execute(
+        player_table.insert().values(
+            name="hero", strength=10, hp=100, maxhp=100, connectedinventory=inventory_id
+        )
+    )
+    await database.fetch_one(
+        player_table.select().where(player_table.c.id == player_id)
+    )
+
+
+async def create_calls(
+    database: CountingDatabase,
+    players: PlayerRepository,
+    inventories: InventoryRepository,
+) -> None:
+    """A function signing up through the two create endpoints.
+
+    Args:
+        database (CountingDatabase): The stand-in, reached by the repositories.
+        players (PlayerRepository): The player repository.
+        inventories (InventoryRepository): The inventory repository.
+    """
+
+    inventory = await inventories.add_inventory(InventoryIn(money=50, itemlist=""))
+    await players.add_player(PlayerIn(
+        name="hero", strength=10, hp=100, maxhp=100, connectedinventory=inventory.id
+    ))
+
+
+async def character(
+    database: CountingDatabase,
+    players: PlayerRepository,
+    inventories: InventoryRepository,
+) -> None:
+    """A function signing up through the character endpoint.
+
+    Args:
+        database (CountingDatabase): The stand-in, reached by the repositories.
+        players (PlayerRepository): The player repository.
+        inventories (InventoryRepository): Unused, the player repository
+            inserts both rows.
+    """
+
+    await players.add_character(CharacterIn(
+        player=PlayerBaseIn(name="hero", strength=10, hp=100, maxhp=100),
+        inventory=InventoryIn(money=50, itemlist=""),
+    ))
+
+
+def use(database: CountingDatabase) -> None:
+    """A function pointing the repositories at the stand-in.
+
+    Args:
+        database (CountingDatabase): The stand-in.
+    """
+
+    router = ShardRouter({"benchmark": DatabaseRouter(database, [])})
+    for module in (playerdb, inventorydb, playernamedb):
+        module.shard_router = router
+
+
+async def run(
+    signup: Callable[[CountingDatabase, PlayerRepository, InventoryRepository], Awaitable[None]],
+    signups: int,
+    rtt_seconds: float,
+) -> tuple[float, float, float]:
+    """A function measuring a sign-up path.
+
+    Args:
+        signup (Callable[..., Awaitable[None]]): The sign-up path.
+        signups (int): The number of sign-ups.
+        rtt_seconds (float): The duration of a round trip.
+
+    Returns:
+        tuple[float, float, float]: The statements per sign-up, the mean
+            latency of a single sign-up and the duration of the burst,
+            both in seconds.
+    """
+
+    database = CountingDatabase(rtt_seconds)
+    use(database)
+    # The container keeps a single instance of every repository.
+    players = PlayerRepository()
+    inventories = InventoryRepository()
+
+    started = time.perf_counter()
+    for _ in range(signups):
+        await signup(database, players, inventories)
+    latency = (time.perf_counter() - started) / signups
+
+    started = time.perf_counter()
+    await asyncio.gather(*(signup(database, players, inventories) for _ in range(signups)))
+    burst = time.perf_counter() - started
+
+    return database.statements / signups / 2, latency, burst
+
+
+async def main() -> None:
+    """The entry point of the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rtt-ms", type=float, default=1.0)
+    parser.add_argument("--signups", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"{args.signups} sign-ups, {args.rtt_ms:g} ms per round trip")
+    for name, signup in (
+        ("baseline", baseline),
+        ("create calls", create_calls),
+        ("character", character),
+    ):
+        statements, latency, burst = await run(signup, args.signups, args.rtt_ms / 1000)
+        print(
+            f"{name:<14} {statements:g} round trips, "
+            f"{latency * 1000:5.2f} ms per sign-up, "
+            f"burst of {args.signups} in {burst * 1000:4.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
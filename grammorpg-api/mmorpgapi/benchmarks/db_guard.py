@@ -0,0 +1,205 @@
+"""A benchmark of the database guard against a throttled database.
+
+The stand-in database serves `--pool` statements at a time, each taking
+`--query-ms`, which is how a saturated pool in front of Postgres looks
+to the application. An open-loop generator sends `--rate` requests per
+second for `--seconds`, 70% gameplay and 30% analytics, once straight to
+the stand-in and once through `GuardedDatabase`. A last run takes the
+database down and up again to show the circuit breaker.
+
+Run from the `mmorpgapi` directory:
+
+    PYTHONPATH=. python benchmarks/db_guard.py
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from src.infrastructure.utils.dbguard import (
+    PRIORITY_ANALYTICS,
+    PRIORITY_GAMEPLAY,
+    AdaptiveLimiter,
+    CircuitBreaker,
+    DatabaseOverloadedError,
+    GuardedDatabase,
+    set_request_priority,
+)
+
+
+class ThrottledDatabase:
+    """A class standing in for a database with a small connection pool."""
+
+    def __init__(self, pool: int, query_seconds: float) -> None:
+        """The initializer of the stand-in.
+
+        Args:
+            pool (int): The number of statements served at a time.
+            query_seconds (float): The duration of a statement.
+        """
+
+        self._pool = asyncio.Semaphore(pool)
+        self._query_seconds = query_seconds
+        self.down = False
+
+    async def fetch_val(self, query: str, values: dict | None = None, column: int = 0) -> int:
+        """A method running a statement.
+
+        Args:
+            query (str): The statement, ignored.
+            values (dict | None): The parameters, ignored.
+            column (int): The column, ignored.
+
+        Raises:
+            OSError: If the database is down.
+
+        Returns:
+            int: Always 1.
+        """
+
+        if self.down:
+            raise OSError("connection refused")
+
+        async with self._pool:
+            await asyncio.sleep(self._query_seconds)
+
+        return 1
+
+
+def percentile(latencies: list[float], share: float) -> float:
+    """A function returning a percentile of the latencies in milliseconds.
+
+    Args:
+        latencies (list[float]): The latencies in seconds.
+        share (float): The percentile, e.g. 0.99.
+
+    Returns:
+        float: The percentile, 0 if there are no latencies.
+    """
+
+    if not latencies:
+        return 0.0
+
+    latencies = sorted(latencies)
+
+    return latencies[min(int(share * len(latencies)), len(latencies) - 1)] * 1000
+
+
+async def run_load(database, rate: int, seconds: float) -> dict:
+    """A function sending an open-loop load and collecting the outcomes.
+
+    Args:
+        database: The database, guarded or not.
+        rate (int): The requests per second.
+        seconds (float): The duration of the load.
+
+    Returns:
+        dict: The latencies and the number of shed calls per priority.
+    """
+
+    results = {
+        PRIORITY_GAMEPLAY: {"latencies": [], "shed": 0},
+        PRIORITY_ANALYTICS: {"latencies": [], "shed": 0},
+    }
+    rng = random.Random(7)
+
+    async def request(priority: int) -> None:
+        set_request_priority(priority)
+        started = time.perf_counter()
+        try:
+            await database.fetch_val("SELECT 1")
+        except DatabaseOverloadedError:
+            results[priority]["shed"] += 1
+            return
+        results[priority]["latencies"].append(time.perf_counter() - started)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    tasks = []
+    for sent in range(int(rate * seconds)):
+        await asyncio.sleep(max(0.0, start + sent / rate - loop.time()))
+        priority = PRIORITY_GAMEPLAY if rng.random() < 0.7 else PRIORITY_ANALYTICS
+        tasks.append(asyncio.create_task(request(priority)))
+
+    await asyncio.gather(*tasks)
+
+    return results
+
+
+def report(name: str, results: dict) -> None:
+    """A function printing the outcome of a run.
+
+    Args:
+        name (str): The name of the run.
+        results (dict): The outcome returned by `run_load`.
+    """
+
+    for priority, label in ((PRIORITY_GAMEPLAY, "gameplay"), (PRIORITY_ANALYTICS, "analytics")):
+        latencies = results[priority]["latencies"]
+        total = len(latencies) + results[priority]["shed"]
+        print(
+            f"{name:<10} {label:<10} served {len(latencies) / total:6.1%}  "
+            f"p50 {percentile(latencies, 0.5):7.1f} ms  "
+            f"p99 {percentile(latencies, 0.99):7.1f} ms"
+        )
+
+
+def guarded(database: ThrottledDatabase) -> GuardedDatabase:
+    """A function wrapping the stand-in with the default guard settings.
+
+    Args:
+        database (ThrottledDatabase): The stand-in.
+
+    Returns:
+        GuardedDatabase: The guarded stand-in.
+    """
+
+    return GuardedDatabase(database, AdaptiveLimiter(), CircuitBreaker())
+
+
+async def main() -> None:
+    """The entry point of the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pool", type=int, default=10)
+    parser.add_argument("--query-ms", type=float, default=20.0)
+    parser.add_argument("--rate", type=int, default=1000)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    for rate in (args.rate, args.rate * 3 // 10):
+        print(f"{rate} req/s for {args.seconds:g} s, {args.pool} connections x {args.query_ms:g} ms")
+        report("unguarded", await run_load(
+            ThrottledDatabase(args.pool, args.query_ms / 1000),
+            rate,
+            args.seconds,
+        ))
+        database = guarded(ThrottledDatabase(args.pool, args.query_ms / 1000))
+        report("guarded", await run_load(database, rate, args.seconds))
+        print(f"{'':<10} limiter    {database.limiter.stats()}")
+        print()
+
+    stand_in = ThrottledDatabase(args.pool, args.query_ms / 1000)
+    database = GuardedDatabase(stand_in, AdaptiveLimiter(), CircuitBreaker(reset_seconds=0.5))
+    stand_in.down = True
+    outcomes = []
+    for _ in range(20):
+        try:
+            await database.fetch_val("SELECT 1")
+            outcomes.append("ok")
+        except DatabaseOverloadedError:
+            outcomes.append("shed")
+        except OSError:
+            outcomes.append("error")
+    print("database down:", " ".join(outcomes))
+    print("breaker:", database.breaker.state)
+
+    stand_in.down = False
+    await asyncio.sleep(0.5)
+    await database.fetch_val("SELECT 1")
+    print("after one probe:", database.breaker.state)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,152 @@
+"""A benchmark of injecting container dependencies into FastAPI endpoints.
+
+Two minimal apps expose the same endpoints with no, one, and two
+services plus a cache injected from the real `Container`. One uses the
+original dependency-injector marker, which FastAPI runs in the
+threadpool, the other the awaitable marker from
+`src.api.dependencies.provide`. Requests are driven straight through
+ASGI, so neither the network nor the database is measured.
+
+Run from the `mmorpgapi` directory:
+
+    PYTHONPATH=. python benchmarks/dependency_injection.py
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# The configuration requires a secret, which this benchmark never uses.
+os.environ.setdefault("JWT_SECRET", "benchmark-secret-" + "x" * 32)
+
+from dependency_injector import wiring  # noqa: E402
+from dependency_injector.wiring import inject  # noqa: E402
+from fastapi import Depends, FastAPI  # noqa: E402
+
+from src.api.dependencies.provide import Provide  # noqa: E402
+from src.container import Container  # noqa: E402
+from src.infrastructure.services.iitem import IItemService  # noqa: E402
+from src.infrastructure.services.iplayer import IPlayerService  # noqa: E402
+from src.infrastructure.utils.responsecache import ResponseCache  # noqa: E402
+
+PATHS = ("/none", "/one", "/two")
+
+
+def build_app(marker: type[wiring.Provide]) -> FastAPI:
+    """A function building the app injecting with the given marker.
+
+    Args:
+        marker (type[wiring.Provide]): The `Provide` marker class.
+
+    Returns:
+        FastAPI: The app.
+    """
+
+    app = FastAPI()
+
+    @app.get("/none")
+    async def no_dependencies() -> dict:
+        return {}
+
+    @app.get("/one")
+    @inject
+    async def one_service(
+        service: IItemService = Depends(marker[Container.item_service]),
+    ) -> dict:
+        return {}
+
+    @app.get("/two")
+    @inject
+    async def two_services_and_cache(
+        item_service: IItemService = Depends(marker[Container.item_service]),
+        player_service: IPlayerService = Depends(marker[Container.player_service]),
+        cache: ResponseCache = Depends(marker[Container.response_cache]),
+    ) -> dict:
+        return {}
+
+    return app
+
+
+async def call(app: FastAPI, path: str) -> None:
+    """A function sending a single GET request through ASGI.
+
+    Args:
+        app (FastAPI): The app.
+        path (str): The request path.
+    """
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"benchmark")],
+        "client": ("127.0.0.1", 1),
+        "server": ("benchmark", 80),
+    }
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.start" and message["status"] != 200:
+            raise RuntimeError(f"{path} returned {message['status']}")
+
+    await app(scope, receive, send)
+
+
+async def measure(app: FastAPI, path: str, requests: int, rounds: int) -> float:
+    """A function returning the best mean time of a request.
+
+    Args:
+        app (FastAPI): The app.
+        path (str): The request path.
+        requests (int): The number of requests per round.
+        rounds (int): The number of rounds.
+
+    Returns:
+        float: The best mean time of a request in microseconds.
+    """
+
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(requests):
+            await call(app, path)
+        best = min(best, (time.perf_counter() - started) / requests)
+
+    return best * 1_000_000
+
+
+async def main() -> None:
+    """The entry point of the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    apps = {
+        "threadpool marker": build_app(wiring.Provide),
+        "awaitable marker": build_app(Provide),
+    }
+    container = Container()
+    container.wire(modules=[sys.modules[__name__]])
+
+    print(f"{'':<20}" + "".join(f"{path:>10}" for path in PATHS))
+    for name, app in apps.items():
+        for path in PATHS:
+            await call(app, path)
+        timings = [await measure(app, path, args.requests, args.rounds) for path in PATHS]
+        print(f"{name:<20}" + "".join(f"{timing:>8.0f}us" for timing in timings))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,100 @@
+"""A benchmark of the change notifier fan-out within a single worker.
+
+`--subscribers` subscriptions listen on one topic, each drained by its
+own task the way the websocket endpoint drains it. Changes are published
+one after another, every one waiting until all subscribers received it,
+so the deliveries per second include waking up every consumer task. The
+notifier runs without the LISTEN connection, so Postgres is not measured.
+
+Run from the `mmorpgapi` directory:
+
+    PYTHONPATH=. python benchmarks/notifier_fanout.py
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+# The configuration requires a secret, which this benchmark never uses.
+os.environ.setdefault("JWT_SECRET", "benchmark-secret-" + "x" * 32)
+
+from src.infrastructure.services.notifier import ChangeNotifier, Subscription  # noqa: E402
+
+TOPIC = "player:1"
+
+
+async def run(subscribers: int, events: int) -> tuple[float, int]:
+    """A function publishing the events and timing their delivery.
+
+    Args:
+        subscribers (int): The number of subscriptions on the topic.
+        events (int): The number of published changes.
+
+    Returns:
+        tuple[float, int]: The elapsed seconds and the number of resyncs.
+    """
+
+    notifier = ChangeNotifier()
+    received = 0
+    resyncs = 0
+    delivered = asyncio.Event()
+
+    async def consume(subscription: Subscription) -> None:
+        nonlocal received, resyncs
+        while True:
+            message = await subscription.next_message()
+            if message.startswith('{"resync"'):
+                resyncs += 1
+            received += 1
+            if received == subscribers:
+                delivered.set()
+
+    subscriptions = [notifier.open_subscription() for _ in range(subscribers)]
+    tasks = []
+    for subscription in subscriptions:
+        subscription.subscribe([TOPIC])
+        tasks.append(asyncio.create_task(consume(subscription)))
+    await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    for level in range(events):
+        received = 0
+        delivered.clear()
+        await notifier.publish_many("player", [(1, {"level": level})])
+        await delivered.wait()
+    elapsed = time.perf_counter() - started
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    return elapsed, resyncs
+
+
+async def main() -> None:
+    """The entry point of the benchmark."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--subscribers", type=int, default=10_000)
+    parser.add_argument("--events", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    best = float("inf")
+    resyncs = 0
+    for _ in range(args.rounds):
+        elapsed, round_resyncs = await run(args.subscribers, args.events)
+        best = min(best, elapsed)
+        resyncs += round_resyncs
+
+    deliveries = args.subscribers * args.events
+    print(
+        f"{args.subscribers} subscribers x {args.events} changes: "
+        f"{deliveries / best:,.0f} deliveries/s, "
+        f"{best / args.events * 1000:.1f} ms per change, {resyncs} resyncs"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,75 @@
+"""A module containing dependencies of authenticated endpoints."""
+
+from dependency_injector.wiring import inject
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from src.api.dependencies.provide import Provide
+from src.config import config
+from src.container import Container
+from src.core.domain.user import User
+from src.infrastructure.services.iuser import IUserService
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+@inject
+async def get_current_session(
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+    service: IUserService = Depends(Provide[Container.user_service]),
+) -> tuple[User, str]:
+    """A dependency resolving the user and session of the bearer token.
+
+    Args:
+        credentials (HTTPAuthorizationCredentials | None): The bearer token.
+        service (IUserService, optional): The injected service dependency.
+
+    Raises:
+        HTTPException: 401 if the token is missing, invalid or revoked.
+
+    Returns:
+        tuple[User, str]: The user and the id of the session.
+    """
+
+    if credentials and (session := await service.authorize(credentials.credentials)):
+        return session
+
+    raise HTTPException(
+        status_code=401,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+async def get_current_user(
+    session: tuple[User, str] = Depends(get_current_session),
+) -> User:
+    """A dependency resolving the user of the bearer token.
+
+    Args:
+        session (tuple[User, str]): The user and the id of the session.
+
+    Returns:
+        User: The authenticated user.
+    """
+
+    return session[0]
+
+
+async def get_admin_user(user: User = Depends(get_current_user)) -> User:
+    """A dependency allowing only users listed in `ADMIN_EMAILS`.
+
+    Args:
+        user (User): The authenticated user.
+
+    Raises:
+        HTTPException: 403 if the user is not an admin.
+
+    Returns:
+        User: The authenticated admin.
+    """
+
+    if user.email not in config.ADMIN_EMAILS:
+        raise HTTPException(status_code=403, detail="Admin access required")
+
+    return user
@@ -0,0 +1,34 @@
+"""A module containing dependencies of batch endpoints."""
+
+from fastapi import HTTPException, Query
+
+from src.core.domain.batch import MAX_BATCH_IDS
+
+
+def parse_batch_ids(
+    ids: str = Query(description="Comma separated ids, e.g. `1,2,3`"),
+) -> list[int]:
+    """A dependency parsing the `ids` query parameter.
+
+    Args:
+        ids (str): Comma separated ids.
+
+    Raises:
+        HTTPException: 400 if ids are malformed or too many.
+
+    Returns:
+        list[int]: The parsed ids.
+    """
+
+    try:
+        parsed = [int(part) for part in ids.split(",") if part.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be comma separated integers")
+
+    if not parsed or len(parsed) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Between 1 and {MAX_BATCH_IDS} ids are allowed",
+        )
+
+    return parsed
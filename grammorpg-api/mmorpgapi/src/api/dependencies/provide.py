@@ -0,0 +1,22 @@
+"""A module containing the injection marker of endpoint dependencies."""
+
+from dependency_injector import wiring
+
+
+class Provide(wiring.Provide):
+    """The `Provide` marker of dependency-injector awaited inline by FastAPI.
+
+    FastAPI calls the marker in `Depends(Provide[...])` as a dependency
+    before `@inject` replaces it with the provided object. The original
+    marker is a plain callable, so every injected parameter cost a hop
+    to the threadpool per request; a coroutine runs in the event loop.
+    """
+
+    async def __call__(self) -> "Provide":
+        """The method returning the marker for `@inject` to replace.
+
+        Returns:
+            Provide: The marker itself.
+        """
+
+        return self
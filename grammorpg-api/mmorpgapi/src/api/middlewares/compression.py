@@ -0,0 +1,177 @@
+"""A module containing the response compression middleware."""
+
+import zlib
+
+import brotli  # type: ignore
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.api.responses import negotiate_encoding
+
+
+class _GzipCompressor:
+    """A class wrapping an incremental gzip stream."""
+
+    encoding = "gzip"
+
+    def __init__(self, level: int) -> None:
+        """The initializer of the compressor.
+
+        Args:
+            level (int): The compression level.
+        """
+
+        self._stream = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        """The method compressing the next chunk of the body.
+
+        Args:
+            data (bytes): The chunk.
+            final (bool): Whether it is the last chunk.
+
+        Returns:
+            bytes: The compressed bytes ready to be sent.
+        """
+
+        flush = zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+
+        return self._stream.compress(data) + self._stream.flush(flush)
+
+
+class _BrotliCompressor:
+    """A class wrapping an incremental brotli stream."""
+
+    encoding = "br"
+
+    def __init__(self, quality: int) -> None:
+        """The initializer of the compressor.
+
+        Args:
+            quality (int): The compression quality.
+        """
+
+        self._stream = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        """The method compressing the next chunk of the body.
+
+        Args:
+            data (bytes): The chunk.
+            final (bool): Whether it is the last chunk.
+
+        Returns:
+            bytes: The compressed bytes ready to be sent.
+        """
+
+        compressed = self._stream.process(data)
+
+        return compressed + (self._stream.finish() if final else self._stream.flush())
+
+
+class CompressionMiddleware:
+    """An ASGI middleware compressing responses with brotli or gzip.
+
+    Small bodies are sent as they are. Streamed bodies are compressed
+    chunk by chunk and flushed, so the client does not wait for the end
+    of the stream. Bodies already encoded (e.g. cached gzip) are kept.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        """The initializer of the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+            minimum_size (int): The smallest body worth compressing.
+            gzip_level (int): The gzip compression level.
+            brotli_quality (int): The brotli compression quality.
+        """
+
+        self._app = app
+        self._minimum_size = minimum_size
+        self._gzip_level = gzip_level
+        self._brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """The method handling a single ASGI call.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The receive channel.
+            send (Send): The send channel.
+        """
+
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        accepted = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", ""),
+            (_BrotliCompressor.encoding, _GzipCompressor.encoding),
+        )
+        compressor_class: type[_GzipCompressor] | type[_BrotliCompressor]
+        if accepted == _BrotliCompressor.encoding:
+            compressor_class, level = _BrotliCompressor, self._brotli_quality
+        elif accepted == _GzipCompressor.encoding:
+            compressor_class, level = _GzipCompressor, self._gzip_level
+        else:
+            await self._app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        compressor: _GzipCompressor | _BrotliCompressor | None = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, compressor, passthrough
+
+            if message["type"] == "http.response.start":
+                start = message
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is None:
+                headers = MutableHeaders(raw=start["headers"])
+                if "content-encoding" in headers or (
+                    not more_body and len(body) < self._minimum_size
+                ):
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+
+                compressor = compressor_class(level)
+                headers["Content-Encoding"] = compressor.encoding
+                headers.add_vary_header("Accept-Encoding")
+                etag = headers.get("etag", "")
+                if etag.startswith('"') and etag.endswith('"'):
+                    # A strong ETag names the exact bytes, so the encoded
+                    # body needs its own one.
+                    headers["ETag"] = f'{etag[:-1]}-{compressor.encoding}"'
+
+                if more_body:
+                    del headers["Content-Length"]
+                    message["body"] = compressor.compress(body, final=False)
+                else:
+                    message["body"] = compressor.compress(body, final=True)
+                    headers["Content-Length"] = str(len(message["body"]))
+                await send(start)
+                await send(message)
+                return
+
+            message["body"] = compressor.compress(body, final=not more_body)
+            await send(message)
+
+        await self._app(scope, receive, send_compressed)
@@ -0,0 +1,131 @@
+"""A module containing the request deadline middleware."""
+
+import asyncio
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.utils.deadline import set_deadline
+
+SAFE_METHODS = {"GET", "HEAD"}
+
+
+class DeadlineMiddleware:
+    """An ASGI middleware bounding and cancelling the work of a request.
+
+    The deadline of the most specific path prefix bounds every database
+    statement of the request. A read whose client disconnects before the
+    response is complete is cancelled, together with its statements.
+    Writes are left to finish, so a client going away mid-request does
+    not leave a half-applied change behind.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        deadlines: dict[str, float | None],
+        default: float | None,
+    ) -> None:
+        """The initializer of the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+            deadlines (dict[str, float | None]): The budget in seconds of
+                every path prefix, None for no deadline.
+            default (float | None): The budget of other paths.
+        """
+
+        self._app = app
+        self._default = default
+        self._deadlines = sorted(
+            deadlines.items(),
+            key=lambda rule: len(rule[0]),
+            reverse=True,
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """The method handling a single ASGI call.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The receive channel.
+            send (Send): The send channel.
+        """
+
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        set_deadline(self._match(scope["path"]))
+        if scope["method"] not in SAFE_METHODS:
+            await self._app(scope, receive, send)
+            return
+
+        await self._cancel_on_disconnect(scope, receive, send)
+
+    async def _cancel_on_disconnect(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """A private method running a request until its client disconnects.
+
+        The receive channel is read by a single task forwarding messages
+        to the application, so a disconnect is noticed even while the
+        application is not reading.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The receive channel.
+            send (Send): The send channel.
+        """
+
+        messages: asyncio.Queue[Message] = asyncio.Queue()
+        response_complete = False
+        disconnected = False
+
+        async def tracked_send(message: Message) -> None:
+            nonlocal response_complete
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                response_complete = True
+            await send(message)
+
+        handler = asyncio.create_task(self._app(scope, messages.get, tracked_send))
+
+        async def watch() -> None:
+            nonlocal disconnected
+            while True:
+                message = await receive()
+                messages.put_nowait(message)
+                if message["type"] == "http.disconnect":
+                    # Work left after the response, e.g. background
+                    # tasks, is not abandoned.
+                    if not response_complete and not handler.done():
+                        disconnected = True
+                        handler.cancel()
+                    return
+
+        watcher = asyncio.create_task(watch())
+        try:
+            await handler
+        except asyncio.CancelledError:
+            if not disconnected:
+                raise
+        finally:
+            watcher.cancel()
+
+    def _match(self, path: str) -> float | None:
+        """A private method finding the deadline of the most specific prefix.
+
+        Args:
+            path (str): The request path.
+
+        Returns:
+            float | None: The budget of the path in seconds.
+        """
+
+        for prefix, deadline in self._deadlines:
+            if path == prefix or path.startswith(prefix + "/"):
+                return deadline
+
+        return self._default
@@ -0,0 +1,225 @@
+"""A module containing the idempotent request handling middleware."""
+
+import asyncio
+import hashlib
+
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.api.responses import negotiate_media_type
+from src.core.domain.idempotency import IdempotentResponse
+from src.core.repositories.iidempotency import IIdempotencyRepository
+
+MAX_KEY_LENGTH = 255
+
+
+class IdempotencyMiddleware:
+    """An ASGI middleware replaying responses of retried create requests.
+
+    A request carrying an `Idempotency-Key` header is executed once; its
+    response is stored and returned for every retry with the same key,
+    without reaching the route. Concurrent retries wait for the first one.
+    The key is scoped by the negotiated format, and the replay carries the
+    original headers (e.g. the read-your-writes cookie).
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        repository: IIdempotencyRepository,
+        paths: list[str],
+    ) -> None:
+        """The initializer of the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+            repository (IIdempotencyRepository): The response storage.
+            paths (list[str]): The POST paths handled idempotently.
+        """
+
+        self._app = app
+        self._repository = repository
+        self._paths = frozenset(paths)
+        self._in_flight: dict[str, asyncio.Future] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """The method handling a single ASGI call.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The receive channel.
+            send (Send): The send channel.
+        """
+
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or scope["path"] not in self._paths
+            or (idempotency_key := self._header(scope, b"idempotency-key")) is None
+        ):
+            await self._app(scope, receive, send)
+            return
+
+        if len(idempotency_key) > MAX_KEY_LENGTH:
+            response = JSONResponse(
+                {"detail": "Idempotency-Key is too long"},
+                status_code=400,
+            )
+            await response(scope, receive, send)
+            return
+
+        body = await self._read_body(receive)
+        fingerprint = hashlib.blake2b(body, digest_size=16).digest()
+        authorization = self._header(scope, b"authorization") or ""
+        media_type = negotiate_media_type(self._header(scope, b"accept") or "")
+        key = hashlib.blake2b(
+            f"{scope['path']}:{authorization}:{media_type}:{idempotency_key}".encode(),
+            digest_size=16,
+        ).hexdigest()
+
+        while (stored := await self._repository.get_response(key)) is None:
+            if (in_flight := self._in_flight.get(key)) is None:
+                break
+            await asyncio.shield(in_flight)
+
+        if stored is not None:
+            await self._replay(stored, fingerprint, scope, receive, send)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            await self._execute(key, body, fingerprint, scope, receive, send)
+        finally:
+            del self._in_flight[key]
+            future.set_result(None)
+
+    async def _execute(
+        self,
+        key: str,
+        body: bytes,
+        fingerprint: bytes,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """A private method running the request and storing its response.
+
+        Args:
+            key (str): The storage key.
+            body (bytes): The already consumed request body.
+            fingerprint (bytes): The hash of the request body.
+            scope (Scope): The connection scope.
+            receive (Receive): The receive channel.
+            send (Send): The send channel.
+        """
+
+        body_sent = False
+        status_code = 500
+        headers: list[tuple[bytes, bytes]] = []
+        chunks: list[bytes] = []
+
+        async def replay_body() -> Message:
+            nonlocal body_sent
+            if body_sent:
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def capture(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers.extend(
+                    (bytes(name), bytes(value))
+                    for name, value in message.get("headers", [])
+                )
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        await self._app(scope, replay_body, capture)
+
+        if status_code < 500:
+            await self._repository.save_response(
+                key,
+                IdempotentResponse(
+                    fingerprint=fingerprint,
+                    status_code=status_code,
+                    headers=headers,
+                    body=b"".join(chunks),
+                ),
+            )
+
+    @staticmethod
+    async def _replay(
+        stored: IdempotentResponse,
+        fingerprint: bytes,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """A private method sending the stored response again.
+
+        Args:
+            stored (IdempotentResponse): The stored response.
+            fingerprint (bytes): The hash of the retried request body.
+            scope (Scope): The connection scope.
+            receive (Receive): The receive channel.
+            send (Send): The send channel.
+        """
+
+        if stored.fingerprint != fingerprint:
+            response = JSONResponse(
+                {"detail": "Idempotency-Key was used with a different payload"},
+                status_code=422,
+            )
+            await response(scope, receive, send)
+            return
+
+        # The stored headers already describe the stored body, including
+        # its length, so they are sent unchanged.
+        await send({
+            "type": "http.response.start",
+            "status": stored.status_code,
+            "headers": [*stored.headers, (b"idempotent-replayed", b"true")],
+        })
+        await send({"type": "http.response.body", "body": stored.body})
+
+    @staticmethod
+    async def _read_body(receive: Receive) -> bytes:
+        """A private method consuming the whole request body.
+
+        Args:
+            receive (Receive): The receive channel.
+
+        Returns:
+            bytes: The request body.
+        """
+
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+
+        return b"".join(chunks)
+
+    @staticmethod
+    def _header(scope: Scope, header: bytes) -> str | None:
+        """A private method reading a request header.
+
+        Args:
+            scope (Scope): The connection scope.
+            header (bytes): The lowercase header name.
+
+        Returns:
+            str | None: The header value if present.
+        """
+
+        for name, value in scope["headers"]:
+            if name == header:
+                return value.decode("latin-1")
+
+        return None
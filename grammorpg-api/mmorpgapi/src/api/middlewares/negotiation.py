@@ -0,0 +1,59 @@
+"""A module containing the content negotiation middleware."""
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.api.responses import (
+    negotiate_media_type,
+    reset_response_media_type,
+    set_response_media_type,
+)
+
+
+class ContentNegotiationMiddleware:
+    """An ASGI middleware choosing between JSON and MessagePack responses.
+
+    The format negotiated from the Accept header is used by
+    `NegotiatedResponse` and the response cache of the request.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """The initializer of the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+        """
+
+        self._app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """The method handling a single ASGI call.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The receive channel.
+            send (Send): The send channel.
+        """
+
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        accept = ""
+        for name, value in scope["headers"]:
+            if name == b"accept":
+                accept = value.decode("latin-1")
+                break
+
+        async def send_with_vary(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"vary", b"Accept"),
+                ]
+            await send(message)
+
+        token = set_response_media_type(negotiate_media_type(accept))
+        try:
+            await self._app(scope, receive, send_with_vary)
+        finally:
+            reset_response_media_type(token)
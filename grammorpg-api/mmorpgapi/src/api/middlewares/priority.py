@@ -0,0 +1,58 @@
+"""A module containing the database priority middleware."""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.infrastructure.utils.dbguard import PRIORITY_DEFAULT, set_request_priority
+
+
+class PriorityMiddleware:
+    """An ASGI middleware setting the database priority of a request.
+
+    Under overload, queued database calls of gameplay routes are served
+    before the default ones, and analytics routes are shed first.
+    """
+
+    def __init__(self, app: ASGIApp, priorities: dict[str, int]) -> None:
+        """The initializer of the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+            priorities (dict[str, int]): The priority of every path prefix.
+        """
+
+        self._app = app
+        self._priorities = sorted(
+            priorities.items(),
+            key=lambda rule: len(rule[0]),
+            reverse=True,
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """The method handling a single ASGI call.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The receive channel.
+            send (Send): The send channel.
+        """
+
+        if scope["type"] == "http":
+            set_request_priority(self._match(scope["path"]))
+
+        await self._app(scope, receive, send)
+
+    def _match(self, path: str) -> int:
+        """A private method finding the priority of the most specific prefix.
+
+        Args:
+            path (str): The request path.
+
+        Returns:
+            int: The priority of the path.
+        """
+
+        for prefix, priority in self._priorities:
+            if path == prefix or path.startswith(prefix + "/"):
+                return priority
+
+        return PRIORITY_DEFAULT
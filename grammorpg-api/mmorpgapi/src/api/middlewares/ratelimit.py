@@ -0,0 +1,115 @@
+"""A module containing the rate limiting middleware."""
+
+import math
+import time
+from collections import OrderedDict
+
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.core.repositories.iratelimit import IRateLimitRepository
+from src.infrastructure.utils.token import decode_user_token
+
+
+class RateLimitMiddleware:
+    """An ASGI middleware limiting requests with token buckets.
+
+    Buckets are keyed by the router prefix, the HTTP method and the JWT
+    subject (or the client address for anonymous calls). Decoded tokens
+    are cached with their expiry, so an expired token counts as anonymous.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        repository: IRateLimitRepository,
+        rules: dict[str, tuple[int, float]],
+        max_cached_tokens: int = 10_000,
+    ) -> None:
+        """The initializer of the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+            repository (IRateLimitRepository): The token bucket storage.
+            rules (dict[str, tuple[int, float]]): The bucket capacity and
+                refill rate per second for every router prefix.
+            max_cached_tokens (int): The number of decoded JWTs remembered.
+        """
+
+        self._app = app
+        self._repository = repository
+        self._rules = sorted(rules.items(), key=lambda rule: len(rule[0]), reverse=True)
+        self._subjects: OrderedDict[bytes, tuple[str, float] | None] = OrderedDict()
+        self._max_cached_tokens = max_cached_tokens
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """The method handling a single ASGI call.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The receive channel.
+            send (Send): The send channel.
+        """
+
+        if scope["type"] != "http" or (rule := self._match(scope["path"])) is None:
+            await self._app(scope, receive, send)
+            return
+
+        prefix, (capacity, refill_rate) = rule
+        key = f"{prefix}:{scope['method']}:{self._subject(scope)}"
+        retry_after = await self._repository.take_token(key, capacity, refill_rate)
+
+        if retry_after:
+            response = JSONResponse(
+                {"detail": "Too many requests"},
+                status_code=429,
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+            await response(scope, receive, send)
+            return
+
+        await self._app(scope, receive, send)
+
+    def _match(self, path: str) -> tuple[str, tuple[int, float]] | None:
+        """A private method finding the most specific rule for the path.
+
+        Args:
+            path (str): The request path.
+
+        Returns:
+            tuple[str, tuple[int, float]] | None: The matching rule if exists.
+        """
+
+        for prefix, limits in self._rules:
+            if path == prefix or path.startswith(prefix + "/"):
+                return prefix, limits
+
+        return None
+
+    def _subject(self, scope: Scope) -> str:
+        """A private method identifying the caller of the request.
+
+        Args:
+            scope (Scope): The connection scope.
+
+        Returns:
+            str: The JWT subject or the client address.
+        """
+
+        for name, value in scope["headers"]:
+            if name == b"authorization" and value[:7].lower() == b"bearer ":
+                if value in self._subjects:
+                    self._subjects.move_to_end(value)
+                    claims = self._subjects[value]
+                else:
+                    claims = decode_user_token(value[7:].decode("latin-1"))
+                    self._subjects[value] = claims
+                    if len(self._subjects) > self._max_cached_tokens:
+                        self._subjects.popitem(last=False)
+
+                if claims and claims[1] > time.time():
+                    return f"user:{claims[0]}"
+                break
+
+        client = scope.get("client")
+        return f"ip:{client[0]}" if client else "ip:unknown"
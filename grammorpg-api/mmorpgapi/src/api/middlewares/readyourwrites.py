@@ -0,0 +1,123 @@
+"""A module containing the read-your-writes session middleware."""
+
+import hashlib
+import hmac
+import math
+import time
+from http.cookies import SimpleCookie
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.utils.dbrouter import DatabaseRouter
+
+COOKIE_NAME = "db_sticky_until"
+
+
+class ReadYourWritesMiddleware:
+    """An ASGI middleware keeping a session on the primary after a write.
+
+    The end of the sticky period is carried in a cookie, so the following
+    requests of the same client (handled by any worker) also read from
+    the primary until replicas have caught up. The cookie is signed and
+    capped at one sticky period, so a client cannot pin itself to the
+    primary for good.
+    """
+
+    def __init__(self, app: ASGIApp, secret: str, sticky_seconds: float) -> None:
+        """The initializer of the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+            secret (str): The key signing the cookie.
+            sticky_seconds (float): The longest sticky period.
+        """
+
+        self._app = app
+        self._secret = secret.encode()
+        self._sticky_seconds = sticky_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """The method handling a single ASGI call.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The receive channel.
+            send (Send): The send channel.
+        """
+
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        carried = self._carried_sticky_until(scope)
+        sticky = DatabaseRouter.begin_request(carried)
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and sticky[0] > carried:
+                max_age = max(1, math.ceil(sticky[0] - time.time()))
+                value = f"{sticky[0]:.3f}"
+                cookie = (
+                    f"{COOKIE_NAME}={value}:{self._sign(value)}; Max-Age={max_age}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"set-cookie", cookie.encode("latin-1")),
+                ]
+            await send(message)
+
+        await self._app(scope, receive, send_with_cookie)
+
+    def _carried_sticky_until(self, scope: Scope) -> float:
+        """A private method reading the sticky period from the cookie.
+
+        Args:
+            scope (Scope): The connection scope.
+
+        Returns:
+            float: The end of the sticky period, 0 if absent or invalid.
+        """
+
+        for name, value in scope["headers"]:
+            if name == b"cookie":
+                cookie = SimpleCookie(value.decode("latin-1"))
+                if COOKIE_NAME in cookie:
+                    return self._verify(cookie[COOKIE_NAME].value)
+
+        return 0.0
+
+    def _verify(self, cookie: str) -> float:
+        """A private method checking the signature and range of the cookie.
+
+        Args:
+            cookie (str): The cookie value, the timestamp and its signature.
+
+        Returns:
+            float: The end of the sticky period, 0 if the cookie is invalid.
+        """
+
+        value, _, signature = cookie.partition(":")
+        if not hmac.compare_digest(signature, self._sign(value)):
+            return 0.0
+
+        try:
+            sticky_until = float(value)
+        except ValueError:
+            return 0.0
+
+        if not math.isfinite(sticky_until):
+            return 0.0
+
+        return min(sticky_until, time.time() + self._sticky_seconds)
+
+    def _sign(self, value: str) -> str:
+        """A private method signing the cookie value.
+
+        Args:
+            value (str): The timestamp as sent in the cookie.
+
+        Returns:
+            str: The hex encoded HMAC of the value.
+        """
+
+        return hmac.new(self._secret, value.encode(), hashlib.sha256).hexdigest()
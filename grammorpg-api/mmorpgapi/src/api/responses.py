@@ -0,0 +1,237 @@
+"""A module containing helpers building http responses."""
+
+from contextvars import ContextVar, Token
+from typing import Any, Awaitable, Callable
+
+import msgpack  # type: ignore
+from fastapi import Request, Response
+from pydantic_core import to_json, to_jsonable_python
+
+from src.infrastructure.utils.dbrouter import DatabaseRouter
+from src.infrastructure.utils.responsecache import CachedResponse, ResponseCache
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+MSGPACK_MEDIA_TYPES = {MSGPACK_MEDIA_TYPE, "application/x-msgpack"}
+
+_response_media_type: ContextVar[str] = ContextVar(
+    "response_media_type",
+    default=JSON_MEDIA_TYPE,
+)
+
+
+def negotiate_media_type(accept: str) -> str:
+    """A function choosing the response format from the Accept header.
+
+    Args:
+        accept (str): The value of the Accept header.
+
+    Returns:
+        str: MessagePack if the client prefers it, JSON otherwise.
+    """
+
+    best, best_quality = JSON_MEDIA_TYPE, -1.0
+    for part in accept.split(","):
+        media_type, _, params = part.strip().partition(";")
+        media_type = media_type.strip().lower()
+        if media_type not in MSGPACK_MEDIA_TYPES and media_type not in (
+            JSON_MEDIA_TYPE,
+            "application/*",
+            "*/*",
+        ):
+            continue
+
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+        # An explicit media type wins over a wildcard of the same quality.
+        if media_type.endswith("*") and quality > 0.0:
+            quality -= 0.001
+
+        if quality > best_quality:
+            best = MSGPACK_MEDIA_TYPE if media_type in MSGPACK_MEDIA_TYPES else JSON_MEDIA_TYPE
+            best_quality = quality
+
+    return best if best_quality > 0.0 else JSON_MEDIA_TYPE
+
+
+def set_response_media_type(media_type: str) -> Token:
+    """A function setting the response format of the current request.
+
+    Args:
+        media_type (str): The negotiated media type.
+
+    Returns:
+        Token: The token restoring the previous format.
+    """
+
+    return _response_media_type.set(media_type)
+
+
+def reset_response_media_type(token: Token) -> None:
+    """A function restoring the response format after a request.
+
+    Args:
+        token (Token): The token returned when the format was set.
+    """
+
+    _response_media_type.reset(token)
+
+
+def encode_body(content: Any, media_type: str) -> bytes:
+    """A function encoding response content in the requested format.
+
+    Both encoders work on models, dicts and lists directly and skip
+    the intermediate python `json` module.
+
+    Args:
+        content (Any): The content of the response.
+        media_type (str): The negotiated media type.
+
+    Returns:
+        bytes: The encoded body.
+    """
+
+    if media_type == MSGPACK_MEDIA_TYPE:
+        return msgpack.packb(to_jsonable_python(content), use_bin_type=True)
+
+    return to_json(content)
+
+
+class NegotiatedResponse(Response):
+    """A response encoded as JSON or MessagePack, as negotiated."""
+
+    media_type = JSON_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        """The method encoding the content in the negotiated format.
+
+        Args:
+            content (Any): The content of the response.
+
+        Returns:
+            bytes: The encoded body.
+        """
+
+        self.media_type = _response_media_type.get()
+
+        return encode_body(content, self.media_type)
+
+
+async def cached_response(
+    request: Request,
+    cache: ResponseCache,
+    namespace: str,
+    load: Callable[[], Awaitable[Any]],
+    topic: str | None = None,
+) -> Response:
+    """A function returning an already encoded response when possible.
+
+    On a hit neither the service nor the models are touched. Bodies
+    loaded by a request reading from the primary after a write are kept
+    apart from bodies which may come from a lagging replica.
+
+    Args:
+        request (Request): The http request.
+        cache (ResponseCache): The cache of encoded responses.
+        namespace (str): The data namespace of the route, e.g. `item`.
+        load (Callable[[], Awaitable[Any]]): The call loading the data
+            on a miss; it may raise HTTPException, which is not cached.
+        topic (str | None): The entity of a single entity route, e.g.
+            `item:5`, so the body is dropped only when that entity
+            changes; lists and pages leave it out.
+
+    Returns:
+        Response: The encoded response.
+    """
+
+    media_type = _response_media_type.get()
+    group = topic or namespace
+    key = (
+        group,
+        cache.version(group),
+        request.url.path,
+        request.url.query,
+        media_type,
+        DatabaseRouter.is_sticky(),
+    )
+
+    if (entry := cache.get(key)) is None:
+        entry = cache.put(key, media_type, encode_body(await load(), media_type))
+
+    return encoded_response(request, entry)
+
+
+def negotiate_encoding(accept_encoding: str, available: tuple[str, ...]) -> str | None:
+    """A function choosing the content coding from the Accept-Encoding header.
+
+    Args:
+        accept_encoding (str): The value of the Accept-Encoding header.
+        available (tuple[str, ...]): The codings the server can send, in
+            the order of preference used for ties.
+
+    Returns:
+        str | None: The accepted coding with the highest non-zero
+            quality, None if the body has to be sent as it is.
+    """
+
+    qualities = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+
+        qualities[coding] = quality
+
+    best, best_quality = None, 0.0
+    for coding in available:
+        quality = qualities.get(coding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+
+    return best
+
+
+def encoded_response(request: Request, entry: CachedResponse) -> Response:
+    """A function wrapping an encoded body, compressed if the client accepts it.
+
+    Args:
+        request (Request): The http request.
+        entry (CachedResponse): The encoded body.
+
+    Returns:
+        Response: The http response.
+    """
+
+    accept_encoding = request.headers.get("accept-encoding", "")
+    if entry.gzip_body is not None and negotiate_encoding(accept_encoding, ("gzip",)):
+        return Response(
+            entry.gzip_body,
+            media_type=entry.media_type,
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+
+    if entry.gzip_body is not None:
+        return Response(
+            entry.body,
+            media_type=entry.media_type,
+            headers={"Vary": "Accept-Encoding"},
+        )
+
+    return Response(entry.body, media_type=entry.media_type)
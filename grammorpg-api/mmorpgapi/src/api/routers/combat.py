@@ -0,0 +1,30 @@
+"""Moduł zawierający endpointy walki."""
+
+from dependency_injector.wiring import inject
+from fastapi import APIRouter, Depends
+
+from src.api.dependencies.provide import Provide
+from src.container import Container
+from src.core.domain.combat import CombatIn, CombatOut
+from src.infrastructure.services.icombat import ICombatService
+
+router = APIRouter()
+
+
+@router.post("/resolve", response_model=CombatOut, status_code=200)
+@inject
+async def resolve_combat(
+    combat: CombatIn,
+    service: ICombatService = Depends(Provide[Container.combat_service]),
+) -> dict:
+    """Rozstrzygnięcie rundy jednoczesnych ataków.
+
+    Args:
+        combat (CombatIn): Ataki rundy.
+        service (ICombatService): Serwis walki.
+
+    Returns:
+        dict: Obrażenia ataków, nowe hp zmienionych playerów i brakujące ID.
+    """
+    result = await service.resolve(combat)
+    return result.model_dump()
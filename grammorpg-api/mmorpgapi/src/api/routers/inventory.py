@@ -1,10 +1,18 @@
+from datetime import datetime, timedelta, timezone
 from typing import Iterable
-from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from dependency_injector.wiring import inject
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
+from src.api.dependencies.batch import parse_batch_ids
+from src.api.dependencies.provide import Provide
+from src.api.responses import cached_response
 from src.container import Container
-from src.core.domain.inventory import Inventory, InventoryIn
+from src.core.domain.batch import BatchIdsIn
+from src.core.domain.inventory import Inventory, InventoryBatch, InventoryIn, InventoryPage
+from src.core.domain.ledger import InventoryBalance, LedgerEntry
 from src.infrastructure.services.iinventory import IInventoryService
+from src.infrastructure.services.iledger import ILedgerService
+from src.infrastructure.utils.responsecache import ResponseCache
 
 router = APIRouter()
 
@@ -36,45 +44,181 @@ async def create_inventory(
 @router.get("/all", response_model=Iterable[Inventory], status_code=200)
 @inject
 async def get_all_inventory(
+    request: Request,
     service: IInventoryService = Depends(Provide[Container.inventory_service]),
-) -> Iterable:
+    cache: ResponseCache = Depends(Provide[Container.response_cache]),
+) -> Response:
     """An endpoint for getting all inventories.
 
     Args:
+        request (Request): The http request.
+        service (IInventoryService, optional): The injected service dependency.
+        cache (ResponseCache, optional): The injected cache of encoded responses.
+
+    Returns:
+        Response: The encoded inventory attributes collection.
+    """
+
+    return await cached_response(request, cache, "inventory", service.get_all_inventory)
+
+
+@router.get("/page", response_model=InventoryPage, status_code=200)
+@inject
+async def get_inventory_page(
+    request: Request,
+    after_id: int = 0,
+    limit: int = Query(default=100, ge=1, le=1000),
+    service: IInventoryService = Depends(Provide[Container.inventory_service]),
+    cache: ResponseCache = Depends(Provide[Container.response_cache]),
+) -> Response:
+    """An endpoint for getting a page of inventories ordered by id.
+
+    Args:
+        request (Request): The http request.
+        after_id (int): The id of the last inventory of the previous page.
+        limit (int): The maximum number of inventories on the page.
+        service (IInventoryService, optional): The injected service dependency.
+        cache (ResponseCache, optional): The injected cache of encoded responses.
+
+    Returns:
+        Response: The encoded page with the id the next page starts after.
+    """
+
+    return await cached_response(
+        request,
+        cache,
+        "inventory",
+        lambda: service.get_inventory_page(after_id, limit),
+    )
+
+
+@router.get("/batch", response_model=InventoryBatch, status_code=200)
+@inject
+async def get_inventories_batch(
+    ids: list[int] = Depends(parse_batch_ids),
+    service: IInventoryService = Depends(Provide[Container.inventory_service]),
+) -> dict:
+    """An endpoint for getting many inventories by ids in one call.
+
+    Args:
+        ids (list[int]): The ids of the inventories, e.g. `?ids=1,2,3`.
+        service (IInventoryService, optional): The injected service dependency.
+
+    Returns:
+        dict: The inventories in the order of the ids and missing ids.
+    """
+
+    batch = await service.get_inventories_by_ids(ids)
+
+    return batch.model_dump()
+
+
+@router.post("/batch", response_model=InventoryBatch, status_code=200)
+@inject
+async def post_inventories_batch(
+    batch_ids: BatchIdsIn,
+    service: IInventoryService = Depends(Provide[Container.inventory_service]),
+) -> dict:
+    """An endpoint for getting many inventories by ids sent in the body.
+
+    Args:
+        batch_ids (BatchIdsIn): The ids of the inventories.
         service (IInventoryService, optional): The injected service dependency.
 
     Returns:
-        Iterable: The inventory attributes collection.
+        dict: The inventories in the order of the ids and missing ids.
     """
 
-    inventory = await service.get_all_inventory()
+    batch = await service.get_inventories_by_ids(batch_ids.ids)
 
-    return inventory
+    return batch.model_dump()
 
 
 @router.get("/{inventory_id}", response_model=Inventory, status_code=200)
 @inject
 async def get_inventory_by_id(
     inventory_id: int,
+    request: Request,
     service: IInventoryService = Depends(Provide[Container.inventory_service]),
-) -> dict:
+    cache: ResponseCache = Depends(Provide[Container.response_cache]),
+) -> Response:
     """An endpoint for getting inventory details by id.
 
     Args:
         inventory_id (int): The id of the inventory.
+        request (Request): The http request.
         service (IInventoryService, optional): The injected service dependency.
+        cache (ResponseCache, optional): The injected cache of encoded responses.
 
     Raises:
         HTTPException: 404 if inventory does not exist.
 
     Returns:
-        dict: The requested inventory attributes.
+        Response: The encoded inventory attributes.
     """
 
-    if inventory := await service.get_inventory_by_id(inventory_id):
-        return inventory.model_dump()
+    async def load() -> Inventory:
+        if inventory := await service.get_inventory_by_id(inventory_id):
+            return inventory
 
-    raise HTTPException(status_code=404, detail="Inventory not found")
+        raise HTTPException(status_code=404, detail="Inventory not found")
+
+    return await cached_response(
+        request,
+        cache,
+        "inventory",
+        load,
+        topic=f"inventory:{inventory_id}",
+    )
+
+
+@router.get("/{inventory_id}/ledger", response_model=Iterable[LedgerEntry], status_code=200)
+@inject
+async def get_inventory_ledger(
+    inventory_id: int,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    limit: int = Query(default=100, ge=1, le=1000),
+    ledger: ILedgerService = Depends(Provide[Container.ledger_service]),
+) -> Iterable:
+    """An endpoint for getting the recorded changes of an inventory.
+
+    Args:
+        inventory_id (int): The id of the inventory.
+        since (datetime | None): The start of the range, 30 days ago by default.
+        until (datetime | None): The end of the range, now by default.
+        limit (int): The largest number of entries.
+        ledger (ILedgerService, optional): The injected ledger dependency.
+
+    Returns:
+        Iterable: The ledger entries, newest first.
+    """
+
+    until = until or datetime.now(timezone.utc)
+    since = since or until - timedelta(days=30)
+
+    return await ledger.get_history(inventory_id, since, until, limit)
+
+
+@router.get("/{inventory_id}/balance", response_model=InventoryBalance, status_code=200)
+@inject
+async def get_inventory_balance(
+    inventory_id: int,
+    ledger: ILedgerService = Depends(Provide[Container.ledger_service]),
+) -> dict:
+    """An endpoint for getting the inventory state rebuilt from the ledger.
+
+    Args:
+        inventory_id (int): The id of the inventory.
+        ledger (ILedgerService, optional): The injected ledger dependency.
+
+    Returns:
+        dict: The state from the last snapshot and the later entries.
+    """
+
+    balance = await ledger.get_balance(inventory_id)
+
+    return balance.model_dump()
 
 
 @router.put("/{inventory_id}", response_model=Inventory, status_code=201)
@@ -122,13 +266,16 @@ async def delete_inventory(
 
     Raises:
         HTTPException: 404 if inventory does not exist.
+        HTTPException: 400 if inventory is used by a player and cascade is off.
 
     Returns:
         None: Empty if operation finished.
     """
 
-    if await service.get_inventory_by_id(inventory_id=inventory_id):
-        await service.remove_inventory(inventory_id)
-        return
+    try:
+        if await service.remove_inventory(inventory_id):
+            return
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     raise HTTPException(status_code=404, detail="Inventory not found")
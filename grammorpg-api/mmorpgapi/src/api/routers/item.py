@@ -1,12 +1,19 @@
 """A module containing item endpoints."""
 
 from typing import Iterable
-from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from dependency_injector.wiring import inject
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 
+from src.api.dependencies.batch import parse_batch_ids
+from src.api.dependencies.provide import Provide
+from src.api.responses import cached_response, negotiate_encoding
 from src.container import Container
-from src.core.domain.item import Item, ItemIn
+from src.core.domain.batch import BatchIdsIn
+from src.core.domain.item import Item, ItemBatch, ItemChanges, ItemIn
+from src.core.domain.name import NameAvailability
 from src.infrastructure.services.iitem import IItemService
+from src.infrastructure.utils.catalog import catalog_etag, etag_matches
+from src.infrastructure.utils.responsecache import ResponseCache
 
 router = APIRouter()
 
@@ -38,45 +45,174 @@ async def create_item(
 @router.get("/all", response_model=Iterable[Item], status_code=200)
 @inject
 async def get_all_items(
+    request: Request,
     service: IItemService = Depends(Provide[Container.item_service]),
-) -> Iterable:
+    cache: ResponseCache = Depends(Provide[Container.response_cache]),
+) -> Response:
     """An endpoint for getting all items.
 
     Args:
+        request (Request): The http request.
         service (IItemService, optional): The injected service dependency.
+        cache (ResponseCache, optional): The injected cache of encoded responses.
 
     Returns:
-        Iterable: The item attributes collection.
+        Response: The encoded item attributes collection.
     """
 
-    items = await service.get_all_items()
+    return await cached_response(request, cache, "item", service.get_all_items)
 
-    return items
+
+@router.get("/catalog", status_code=200)
+@inject
+async def get_item_catalog(
+    request: Request,
+    service: IItemService = Depends(Provide[Container.item_service]),
+) -> Response:
+    """An endpoint for downloading the versioned item catalog.
+
+    Args:
+        request (Request): The http request.
+        service (IItemService, optional): The injected service dependency.
+
+    Returns:
+        Response: 304 if the client has the current version, otherwise
+            the (gzipped when accepted) catalog with its ETag.
+    """
+
+    encoding = negotiate_encoding(request.headers.get("accept-encoding", ""), ("gzip",))
+    version = await service.get_catalog_version()
+    current = {catalog_etag(version, coding) for coding in (None, "gzip", "br")}
+    if etag_matches(request.headers.get("if-none-match", ""), current):
+        return Response(
+            status_code=304,
+            headers={"ETag": catalog_etag(version, encoding), "Vary": "Accept-Encoding"},
+        )
+
+    snapshot = await service.get_catalog_snapshot()
+    headers = {"ETag": catalog_etag(snapshot.version, encoding), "Vary": "Accept-Encoding"}
+
+    if encoding:
+        headers["Content-Encoding"] = encoding
+        return Response(snapshot.gzip_body, media_type="application/json", headers=headers)
+
+    return Response(snapshot.body, media_type="application/json", headers=headers)
+
+
+@router.get("/changes", response_model=ItemChanges, status_code=200)
+@inject
+async def get_item_changes(
+    since: int,
+    service: IItemService = Depends(Provide[Container.item_service]),
+) -> dict:
+    """An endpoint for getting catalog changes made after a version.
+
+    Args:
+        since (int): The catalog version known by the client.
+        service (IItemService, optional): The injected service dependency.
+
+    Returns:
+        dict: The latest change of every changed item and the new version.
+    """
+
+    changes = await service.get_catalog_changes(since)
+
+    return changes.model_dump()
+
+
+@router.get("/batch", response_model=ItemBatch, status_code=200)
+@inject
+async def get_items_batch(
+    ids: list[int] = Depends(parse_batch_ids),
+    service: IItemService = Depends(Provide[Container.item_service]),
+) -> dict:
+    """An endpoint for getting many items by ids in one call.
+
+    Args:
+        ids (list[int]): The ids of the items, e.g. `?ids=1,2,3`.
+        service (IItemService, optional): The injected service dependency.
+
+    Returns:
+        dict: The items in the order of the ids and missing ids.
+    """
+
+    batch = await service.get_items_by_ids(ids)
+
+    return batch.model_dump()
+
+
+@router.post("/batch", response_model=ItemBatch, status_code=200)
+@inject
+async def post_items_batch(
+    batch_ids: BatchIdsIn,
+    service: IItemService = Depends(Provide[Container.item_service]),
+) -> dict:
+    """An endpoint for getting many items by ids sent in the body.
+
+    Args:
+        batch_ids (BatchIdsIn): The ids of the items.
+        service (IItemService, optional): The injected service dependency.
+
+    Returns:
+        dict: The items in the order of the ids and missing ids.
+    """
+
+    batch = await service.get_items_by_ids(batch_ids.ids)
+
+    return batch.model_dump()
+
+
+@router.get("/name-available", response_model=NameAvailability, status_code=200)
+@inject
+async def is_item_name_available(
+    name: str,
+    service: IItemService = Depends(Provide[Container.item_service]),
+) -> dict:
+    """An endpoint checking whether no item has the name.
+
+    Args:
+        name (str): The checked name.
+        service (IItemService, optional): The injected service dependency.
+
+    Returns:
+        dict: The name and whether it is free.
+    """
+
+    available = await service.is_name_available(name)
+
+    return NameAvailability(name=name, available=available).model_dump()
 
 
 @router.get("/{item_id}", response_model=Item, status_code=200)
 @inject
 async def get_item_by_id(
     item_id: int,
+    request: Request,
     service: IItemService = Depends(Provide[Container.item_service]),
-) -> dict:
+    cache: ResponseCache = Depends(Provide[Container.response_cache]),
+) -> Response:
     """An endpoint for getting item details by id.
 
     Args:
         item_id (int): The id of the item.
+        request (Request): The http request.
         service (IItemService, optional): The injected service dependency.
+        cache (ResponseCache, optional): The injected cache of encoded responses.
 
     Raises:
         HTTPException: 404 if item does not exist.
 
     Returns:
-        dict: The requested item attributes.
+        Response: The encoded item attributes.
     """
 
-    if item := await service.get_item_by_id(item_id):
-        return item.model_dump()
+    async def load() -> Item:
+        if item := await service.get_item_by_id(item_id):
+            return item
 
-    raise HTTPException(status_code=404, detail="Item not found")
+        raise HTTPException(status_code=404, detail="Item not found")
+
+    return await cached_response(request, cache, "item", load, topic=f"item:{item_id}")
 
 
 @router.put("/{item_id}", response_model=Item, status_code=201)
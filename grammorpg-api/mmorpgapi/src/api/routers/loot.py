@@ -0,0 +1,146 @@
+"""Moduł zawierający endpointy tabel łupów."""
+
+from dependency_injector.wiring import inject
+from fastapi import APIRouter, Depends, HTTPException
+
+from src.api.dependencies.provide import Provide
+from src.container import Container
+from src.core.domain.loot import LootRollIn, LootRollOut, LootTable, LootTableIn
+from src.infrastructure.services.iloot import ILootService
+
+router = APIRouter()
+
+
+@router.post("/create", response_model=LootTable, status_code=201)
+@inject
+async def create_loot_table(
+    loot_table: LootTableIn,
+    service: ILootService = Depends(Provide[Container.loot_service]),
+) -> dict:
+    """Dodanie nowej tabeli łupów.
+
+    Args:
+        loot_table (LootTableIn): Atrybuty i pozycje tabeli łupów.
+        service (ILootService): Serwis tabel łupów.
+
+    Raises:
+        HTTPException: 400 jeśli nazwa jest zajęta, przedmiot się powtarza
+            lub nie istnieje.
+
+    Returns:
+        dict: Utworzona tabela łupów.
+    """
+    try:
+        new_loot_table = await service.add_loot_table(loot_table)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return new_loot_table.model_dump()
+
+
+@router.post("/roll", response_model=LootRollOut, status_code=200)
+@inject
+async def roll_loot(
+    roll: LootRollIn,
+    service: ILootService = Depends(Provide[Container.loot_service]),
+) -> dict:
+    """Wylosowanie łupów i dopisanie ich do inventory.
+
+    Args:
+        roll (LootRollIn): Tabela łupów, inventory i liczba losowań.
+        service (ILootService): Serwis tabel łupów.
+
+    Raises:
+        HTTPException: 404 jeśli tabela łupów nie istnieje.
+        HTTPException: 400 jeśli tabela łupów nie ma żadnych pozycji.
+
+    Returns:
+        dict: Łupy przyznane każdemu inventory oraz brakujące ID.
+    """
+    try:
+        result = await service.roll(roll)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if result is None:
+        raise HTTPException(status_code=404, detail="Loot table not found")
+
+    return result.model_dump()
+
+
+@router.get("/{loot_table_id}", response_model=LootTable, status_code=200)
+@inject
+async def get_loot_table_by_id(
+    loot_table_id: int,
+    service: ILootService = Depends(Provide[Container.loot_service]),
+) -> dict:
+    """Endpoint pobierający tabelę łupów po ID.
+
+    Args:
+        loot_table_id (int): ID tabeli łupów.
+        service (ILootService, optional): Wstrzykiwana zależność serwisu.
+
+    Raises:
+        HTTPException: 404 jeśli tabela łupów nie istnieje.
+
+    Returns:
+        dict: Atrybuty i pozycje tabeli łupów.
+    """
+    if loot_table := await service.get_loot_table(loot_table_id):
+        return loot_table.model_dump()
+
+    raise HTTPException(status_code=404, detail="Loot table not found")
+
+
+@router.put("/{loot_table_id}", response_model=LootTable, status_code=201)
+@inject
+async def update_loot_table(
+    loot_table_id: int,
+    updated_loot_table: LootTableIn,
+    service: ILootService = Depends(Provide[Container.loot_service]),
+) -> dict:
+    """Endpoint zastępujący tabelę łupów.
+
+    Args:
+        loot_table_id (int): ID tabeli łupów.
+        updated_loot_table (LootTableIn): Nowe atrybuty i pozycje tabeli łupów.
+        service (ILootService, optional): Wstrzykiwana zależność serwisu.
+
+    Raises:
+        HTTPException: 404 jeśli tabela łupów nie istnieje.
+        HTTPException: 400 jeśli nazwa jest zajęta, przedmiot się powtarza
+            lub nie istnieje.
+
+    Returns:
+        dict: Zaktualizowana tabela łupów.
+    """
+    try:
+        new_loot_table = await service.update_loot_table(loot_table_id, updated_loot_table)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if new_loot_table is None:
+        raise HTTPException(status_code=404, detail="Loot table not found")
+
+    return new_loot_table.model_dump()
+
+
+@router.delete("/{loot_table_id}", status_code=204)
+@inject
+async def delete_loot_table(
+    loot_table_id: int,
+    service: ILootService = Depends(Provide[Container.loot_service]),
+) -> None:
+    """Endpoint usuwający tabelę łupów.
+
+    Args:
+        loot_table_id (int): ID tabeli łupów.
+        service (ILootService, optional): Wstrzykiwana zależność serwisu.
+
+    Raises:
+        HTTPException: 404 jeśli tabela łupów nie istnieje.
+
+    Returns:
+        None: Pusta odpowiedź po zakończeniu operacji.
+    """
+    if not await service.delete_loot_table(loot_table_id):
+        raise HTTPException(status_code=404, detail="Loot table not found")
@@ -0,0 +1,108 @@
+"""Moduł zawierający endpointy rynku przedmiotów."""
+
+from dependency_injector.wiring import inject
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from src.api.dependencies.provide import Provide
+from src.container import Container
+from src.core.domain.market import (
+    BestPrices,
+    MarketOrderIn,
+    MarketOrderOut,
+    OrderBookOut,
+    StaleOrderBookError,
+)
+from src.infrastructure.services.imarket import IMarketService
+
+router = APIRouter()
+
+
+@router.post("/order", response_model=MarketOrderOut, status_code=201)
+@inject
+async def place_order(
+    order: MarketOrderIn,
+    service: IMarketService = Depends(Provide[Container.market_service]),
+) -> dict:
+    """Złożenie zlecenia kupna lub sprzedaży z limitem ceny.
+
+    Args:
+        order (MarketOrderIn): Dane zlecenia.
+        service (IMarketService): Serwis rynku.
+
+    Raises:
+        HTTPException: 400 jeśli przedmiot lub inventory nie istnieje lub
+            brakuje środków.
+        HTTPException: 409 jeśli księga zleceń jest zmieniana równolegle.
+
+    Returns:
+        dict: Zapisane zlecenie i zawarte transakcje.
+    """
+    try:
+        result = await service.place_order(order)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except StaleOrderBookError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return result.model_dump()
+
+
+@router.delete("/order/{order_id}", status_code=204)
+@inject
+async def cancel_order(
+    order_id: int,
+    service: IMarketService = Depends(Provide[Container.market_service]),
+) -> None:
+    """Anulowanie otwartego zlecenia i zwrot depozytu.
+
+    Args:
+        order_id (int): ID zlecenia.
+        service (IMarketService): Serwis rynku.
+
+    Raises:
+        HTTPException: 404 jeśli zlecenie nie istnieje lub nie jest otwarte.
+
+    Returns:
+        None: Pusta odpowiedź po zakończeniu operacji.
+    """
+    if await service.cancel_order(order_id) is None:
+        raise HTTPException(status_code=404, detail="Open order not found")
+
+
+@router.get("/{item_id}/book", response_model=OrderBookOut, status_code=200)
+@inject
+async def get_order_book(
+    item_id: int,
+    levels: int = Query(default=10, ge=1, le=100),
+    service: IMarketService = Depends(Provide[Container.market_service]),
+) -> dict:
+    """Endpoint pobierający zagregowaną księgę zleceń przedmiotu.
+
+    Args:
+        item_id (int): ID przedmiotu.
+        levels (int): Liczba poziomów cenowych każdej strony.
+        service (IMarketService, optional): Wstrzykiwana zależność serwisu.
+
+    Returns:
+        dict: Najlepsze poziomy cenowe kupna i sprzedaży.
+    """
+    book = await service.get_order_book(item_id, levels)
+    return book.model_dump()
+
+
+@router.get("/{item_id}/best", response_model=BestPrices, status_code=200)
+@inject
+async def get_best_prices(
+    item_id: int,
+    service: IMarketService = Depends(Provide[Container.market_service]),
+) -> dict:
+    """Endpoint pobierający najlepsze ceny kupna i sprzedaży przedmiotu.
+
+    Args:
+        item_id (int): ID przedmiotu.
+        service (IMarketService, optional): Wstrzykiwana zależność serwisu.
+
+    Returns:
+        dict: Najwyższa cena kupna i najniższa cena sprzedaży.
+    """
+    prices = await service.get_best_prices(item_id)
+    return prices.model_dump()
@@ -0,0 +1,200 @@
+"""A module containing runtime metrics endpoints."""
+
+from dependency_injector.wiring import inject
+from fastapi import APIRouter, Depends
+
+from src.api.dependencies.provide import Provide
+from src.container import Container
+from src.db import db_router, shard_router
+from src.infrastructure.services.iledger import ILedgerService
+from src.infrastructure.services.iregeneration import IRegenerationService
+from src.infrastructure.utils.looplag import LoopLagMonitor
+from src.infrastructure.utils.loottable import LootTableCache
+from src.infrastructure.utils.namefilter import NameRegistry
+from src.infrastructure.utils.recipe import RecipeCache
+from src.infrastructure.utils.responsecache import ResponseCache
+from src.infrastructure.utils.session import SessionStore
+from src.infrastructure.utils.singleflight import SingleFlight
+from src.infrastructure.utils.usercache import UserCache
+
+router = APIRouter()
+
+
+@router.get("/single-flight", status_code=200)
+@inject
+async def get_single_flight_stats(
+    limit: int = 20,
+    single_flight: SingleFlight = Depends(Provide[Container.single_flight]),
+) -> list[dict]:
+    """An endpoint for getting the keys with the most coalesced reads.
+
+    Args:
+        limit (int): The number of keys to be returned.
+        single_flight (SingleFlight, optional): The injected dependency.
+
+    Returns:
+        list[dict]: The per key number of calls and coalesced calls.
+    """
+
+    return single_flight.stats(limit)
+
+
+@router.get("/response-cache", status_code=200)
+@inject
+async def get_response_cache_stats(
+    cache: ResponseCache = Depends(Provide[Container.response_cache]),
+) -> dict:
+    """An endpoint for getting the metrics of the response cache.
+
+    Args:
+        cache (ResponseCache, optional): The injected dependency.
+
+    Returns:
+        dict: The number of entries, used bytes, hits and misses.
+    """
+
+    return cache.stats()
+
+
+@router.get("/ledger", status_code=200)
+@inject
+async def get_ledger_stats(
+    ledger: ILedgerService = Depends(Provide[Container.ledger_service]),
+) -> dict:
+    """An endpoint for getting the metrics of the inventory ledger writer.
+
+    Args:
+        ledger (ILedgerService, optional): The injected dependency.
+
+    Returns:
+        dict: The number of pending and written entries and failed batches.
+    """
+
+    return ledger.stats()
+
+
+@router.get("/loot-tables", status_code=200)
+@inject
+async def get_loot_table_stats(
+    cache: LootTableCache = Depends(Provide[Container.loot_table_cache]),
+) -> dict:
+    """An endpoint for getting the metrics of the compiled loot tables.
+
+    Args:
+        cache (LootTableCache, optional): The injected dependency.
+
+    Returns:
+        dict: The number of compiled tables, hits and misses.
+    """
+
+    return cache.stats()
+
+
+@router.get("/recipes", status_code=200)
+@inject
+async def get_recipe_stats(
+    cache: RecipeCache = Depends(Provide[Container.recipe_cache]),
+) -> dict:
+    """An endpoint for getting the metrics of the compiled recipes.
+
+    Args:
+        cache (RecipeCache, optional): The injected dependency.
+
+    Returns:
+        dict: The number of compiled recipes, hits and misses.
+    """
+
+    return cache.stats()
+
+
+@router.get("/sessions", status_code=200)
+@inject
+async def get_session_stats(
+    sessions: SessionStore = Depends(Provide[Container.session_store]),
+    users: UserCache = Depends(Provide[Container.user_cache]),
+) -> dict:
+    """An endpoint for getting the metrics of the authenticated path.
+
+    Args:
+        sessions (SessionStore, optional): The injected dependency.
+        users (UserCache, optional): The injected dependency.
+
+    Returns:
+        dict: The revoked sessions store and user cache metrics.
+    """
+
+    return {"sessions": sessions.stats(), "users": users.stats()}
+
+
+@router.get("/names", status_code=200)
+@inject
+async def get_name_filter_stats(
+    names: NameRegistry = Depends(Provide[Container.name_registry]),
+) -> dict:
+    """An endpoint for getting the metrics of the taken name filters.
+
+    Args:
+        names (NameRegistry, optional): The injected dependency.
+
+    Returns:
+        dict: The filter sizes and the checks answered without a query.
+    """
+
+    return names.stats()
+
+
+@router.get("/database", status_code=200)
+async def get_database_stats() -> dict:
+    """An endpoint for getting the overload protection metrics.
+
+    Returns:
+        dict: The concurrency limit, queue and circuit of every database.
+    """
+
+    return db_router.stats()
+
+
+@router.get("/shards", status_code=200)
+async def get_shard_stats() -> dict:
+    """An endpoint for getting the buckets and guard metrics of every shard.
+
+    Returns:
+        dict: The metrics of every shard by its host.
+    """
+
+    return shard_router.stats()
+
+
+@router.get("/regeneration", status_code=200)
+@inject
+async def get_regeneration_stats(
+    service: IRegenerationService = Depends(Provide[Container.regeneration_service]),
+) -> dict:
+    """An endpoint for getting the metrics of the hp regeneration.
+
+    Args:
+        service (IRegenerationService, optional): The injected dependency.
+
+    Returns:
+        dict: The leadership, the numbers of ticks, chunks and players
+            and the tick durations.
+    """
+
+    return service.stats()
+
+
+@router.get("/loop-lag", status_code=200)
+@inject
+async def get_loop_lag_stats(
+    monitor: LoopLagMonitor = Depends(Provide[Container.loop_lag_monitor]),
+) -> dict:
+    """An endpoint for getting the event loop lag of the worker.
+
+    Args:
+        monitor (LoopLagMonitor, optional): The injected dependency.
+
+    Returns:
+        dict: The recent lag percentiles, the max lag and the stalls.
+    """
+
+    return monitor.stats()
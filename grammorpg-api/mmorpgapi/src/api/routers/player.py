@@ -1,12 +1,25 @@
 """Moduł zawierający endpointy dla playera."""
 
 from typing import Iterable
-from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
+from dependency_injector.wiring import inject
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
+from src.api.dependencies.auth import get_admin_user
+from src.api.dependencies.batch import parse_batch_ids
+from src.api.dependencies.provide import Provide
+from src.api.responses import cached_response
 from src.container import Container
-from src.core.domain.player import Player, PlayerIn
+from src.core.domain.batch import BatchIdsIn
+from src.core.domain.character import (
+    Character,
+    CharacterIn,
+    CharacterPurge,
+    CharacterPurgeIn,
+)
+from src.core.domain.name import NameAvailability
+from src.core.domain.player import Player, PlayerBatch, PlayerIn, PlayerPage
 from src.infrastructure.services.iplayer import IPlayerService
+from src.infrastructure.utils.responsecache import ResponseCache
 
 router = APIRouter()
 
@@ -36,45 +49,198 @@ async def create_player(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/character", response_model=Character, status_code=201)
+@inject
+async def create_character(
+    character: CharacterIn,
+    service: IPlayerService = Depends(Provide[Container.player_service]),
+) -> dict:
+    """Utworzenie playera wraz z nowym inventory w jednej transakcji.
+
+    Args:
+        character (CharacterIn): Dane playera i inventory.
+        service (IPlayerService): Serwis playerów.
+
+    Raises:
+        HTTPException: Jeśli player z tą nazwą już istnieje.
+
+    Returns:
+        dict: Utworzony player i jego inventory.
+    """
+    try:
+        new_character = await service.create_character(character)
+        return new_character.model_dump()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post(
+    "/purge",
+    response_model=CharacterPurge,
+    status_code=200,
+    dependencies=[Depends(get_admin_user)],
+)
+@inject
+async def purge_inactive_players(
+    purge: CharacterPurgeIn,
+    service: IPlayerService = Depends(Provide[Container.player_service]),
+) -> dict:
+    """Trwałe usunięcie playerów nieaktywnych od podanej daty.
+
+    Dostępne tylko dla administratorów z `ADMIN_EMAILS`.
+
+    Args:
+        purge (CharacterPurgeIn): Granica nieaktywności i rozmiar paczki.
+        service (IPlayerService): Serwis playerów.
+
+    Raises:
+        HTTPException: Jeśli granica nieaktywności jest zbyt świeża.
+
+    Returns:
+        dict: Liczba usuniętych playerów, inventory i paczek.
+    """
+    try:
+        result = await service.purge_inactive_players(purge)
+        return result.model_dump()
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/all", response_model=Iterable[Player], status_code=200)
 @inject
 async def get_all_players(
+    request: Request,
     service: IPlayerService = Depends(Provide[Container.player_service]),
-) -> Iterable:
+    cache: ResponseCache = Depends(Provide[Container.response_cache]),
+) -> Response:
     """Endpoint pobierający wszystkich playerów.
 
     Args:
+        request (Request): Żądanie http.
         service (IPlayerService, optional): Wstrzykiwana zależność serwisu.
+        cache (ResponseCache, optional): Wstrzykiwany cache zakodowanych odpowiedzi.
 
     Returns:
-        Iterable: Kolekcja playerów.
+        Response: Zakodowana kolekcja playerów.
     """
-    players = await service.get_all_players()
-    return players
+    return await cached_response(request, cache, "player", service.get_all_players)
+
+
+@router.get("/page", response_model=PlayerPage, status_code=200)
+@inject
+async def get_players_page(
+    request: Request,
+    after_id: int = 0,
+    limit: int = Query(default=100, ge=1, le=1000),
+    service: IPlayerService = Depends(Provide[Container.player_service]),
+    cache: ResponseCache = Depends(Provide[Container.response_cache]),
+) -> Response:
+    """Endpoint pobierający stronę playerów posortowanych po ID.
+
+    Args:
+        request (Request): Żądanie http.
+        after_id (int): ID ostatniego playera poprzedniej strony.
+        limit (int): Maksymalna liczba playerów na stronie.
+        service (IPlayerService, optional): Wstrzykiwana zależność serwisu.
+        cache (ResponseCache, optional): Wstrzykiwany cache zakodowanych odpowiedzi.
+
+    Returns:
+        Response: Zakodowana strona playerów z ID następnej strony.
+    """
+    return await cached_response(
+        request,
+        cache,
+        "player",
+        lambda: service.get_players_page(after_id, limit),
+    )
+
+
+@router.get("/batch", response_model=PlayerBatch, status_code=200)
+@inject
+async def get_players_batch(
+    ids: list[int] = Depends(parse_batch_ids),
+    service: IPlayerService = Depends(Provide[Container.player_service]),
+) -> dict:
+    """Endpoint pobierający wielu playerów po ID w jednym wywołaniu.
+
+    Args:
+        ids (list[int]): ID playerów, np. `?ids=1,2,3`.
+        service (IPlayerService, optional): Wstrzykiwana zależność serwisu.
+
+    Returns:
+        dict: Playerzy w kolejności ID oraz brakujące ID.
+    """
+    batch = await service.get_players_by_ids(ids)
+    return batch.model_dump()
+
+
+@router.post("/batch", response_model=PlayerBatch, status_code=200)
+@inject
+async def post_players_batch(
+    batch_ids: BatchIdsIn,
+    service: IPlayerService = Depends(Provide[Container.player_service]),
+) -> dict:
+    """Endpoint pobierający wielu playerów po ID przesłanych w treści.
+
+    Args:
+        batch_ids (BatchIdsIn): ID playerów.
+        service (IPlayerService, optional): Wstrzykiwana zależność serwisu.
+
+    Returns:
+        dict: Playerzy w kolejności ID oraz brakujące ID.
+    """
+    batch = await service.get_players_by_ids(batch_ids.ids)
+    return batch.model_dump()
+
+
+@router.get("/name-available", response_model=NameAvailability, status_code=200)
+@inject
+async def is_player_name_available(
+    name: str,
+    service: IPlayerService = Depends(Provide[Container.player_service]),
+) -> dict:
+    """Endpoint sprawdzający, czy nazwa playera jest wolna.
+
+    Args:
+        name (str): Sprawdzana nazwa.
+        service (IPlayerService, optional): Wstrzykiwana zależność serwisu.
+
+    Returns:
+        dict: Nazwa i informacja, czy jest wolna.
+    """
+    available = await service.is_name_available(name)
+    return NameAvailability(name=name, available=available).model_dump()
 
 
 @router.get("/{player_id}", response_model=Player, status_code=200)
 @inject
 async def get_player_by_id(
     player_id: int,
+    request: Request,
     service: IPlayerService = Depends(Provide[Container.player_service]),
-) -> dict:
+    cache: ResponseCache = Depends(Provide[Container.response_cache]),
+) -> Response:
     """Endpoint pobierający dane playera po ID.
 
     Args:
         player_id (int): ID playera.
+        request (Request): Żądanie http.
         service (IPlayerService, optional): Wstrzykiwana zależność serwisu.
+        cache (ResponseCache, optional): Wstrzykiwany cache zakodowanych odpowiedzi.
 
     Raises:
         HTTPException: 404 jeśli player nie istnieje.
 
     Returns:
-        dict: Atrybuty playera.
+        Response: Zakodowane atrybuty playera.
     """
-    if player := await service.get_player_by_id(player_id):
-        return player.model_dump()
+    async def load() -> Player:
+        if player := await service.get_player_by_id(player_id):
+            return player
 
-    raise HTTPException(status_code=404, detail="Player not found")
+        raise HTTPException(status_code=404, detail="Player not found")
+
+    return await cached_response(request, cache, "player", load, topic=f"player:{player_id}")
 
 
 @router.put("/{player_id}", response_model=Player, status_code=201)
@@ -93,15 +259,19 @@ async def update_player(
 
     Raises:
         HTTPException: 404 jeśli player nie istnieje.
+        HTTPException: 400 jeśli nowa nazwa jest już zajęta.
 
     Returns:
         dict: Zaktualizowane dane playera.
     """
     if await service.get_player_by_id(player_id=player_id):
-        new_updated_player = await service.update_player(
-            player_id=player_id,
-            data=updated_player,
-        )
+        try:
+            new_updated_player = await service.update_player(
+                player_id=player_id,
+                data=updated_player,
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         return new_updated_player.model_dump() if new_updated_player else {}
 
     raise HTTPException(status_code=404, detail="Player not found")
@@ -125,8 +295,7 @@ async def delete_player(
     Returns:
         None: Puste, jeśli operacja zakończona sukcesem.
     """
-    if await service.get_player_by_id(player_id=player_id):
-        await service.delete_player(player_id)
+    if await service.delete_player(player_id):
         return
 
     raise HTTPException(status_code=404, detail="Player not found")
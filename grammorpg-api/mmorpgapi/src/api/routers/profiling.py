@@ -0,0 +1,90 @@
+"""A module containing admin profiling endpoints."""
+
+from typing import Literal
+
+from dependency_injector.wiring import inject
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from src.api.dependencies.auth import get_admin_user
+from src.api.dependencies.provide import Provide
+from src.container import Container
+from src.infrastructure.utils.profiler import (
+    HeapProfiler,
+    ProfilerError,
+    SamplingProfiler,
+    folded,
+)
+
+router = APIRouter(dependencies=[Depends(get_admin_user)])
+
+
+@router.get("/cpu", response_class=PlainTextResponse, status_code=200)
+@inject
+async def get_cpu_profile(
+    seconds: float = Query(default=10.0, gt=0),
+    interval: float = Query(default=0.005, ge=0.001, le=1.0),
+    idle: bool = False,
+    profiler: SamplingProfiler = Depends(Provide[Container.sampling_profiler]),
+) -> PlainTextResponse:
+    """An endpoint sampling the CPU stacks of the worker for some seconds.
+
+    Args:
+        seconds (float): The duration of the capture.
+        interval (float): The CPU time between samples.
+        idle (bool): Whether to keep samples taken in the selector.
+        profiler (SamplingProfiler, optional): The injected dependency.
+
+    Raises:
+        HTTPException: 409 if another capture is running or sampling is
+            not available in this worker.
+
+    Returns:
+        PlainTextResponse: The samples per stack in the folded format,
+            e.g. for `flamegraph.pl` or speedscope.
+    """
+
+    try:
+        stacks = await profiler.capture(seconds, interval, idle)
+    except ProfilerError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    return PlainTextResponse(folded(stacks))
+
+
+@router.get("/heap", status_code=200)
+@inject
+async def get_heap_snapshot(
+    seconds: float = Query(default=10.0, gt=0),
+    format: Literal["top", "folded"] = "top",
+    limit: int = Query(default=25, ge=1, le=1000),
+    profiler: HeapProfiler = Depends(Provide[Container.heap_profiler]),
+) -> object:
+    """An endpoint taking a tracemalloc snapshot of live allocations.
+
+    If tracing was not started at boot, allocations are traced only
+    for the given seconds.
+
+    Args:
+        seconds (float): How long to trace if tracing is not running.
+        format (Literal["top", "folded"]): The top allocating lines or
+            the bytes per allocation stack for a flamegraph.
+        limit (int): The number of top allocating lines.
+        profiler (HeapProfiler, optional): The injected dependency.
+
+    Raises:
+        HTTPException: 409 if another snapshot is being traced.
+
+    Returns:
+        object: The top allocators or the folded stacks as text.
+    """
+
+    try:
+        snapshot = await profiler.snapshot(seconds)
+    except ProfilerError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+    if format == "folded":
+        return PlainTextResponse(folded(profiler.stacks(snapshot)))
+
+    return profiler.top(snapshot, limit)
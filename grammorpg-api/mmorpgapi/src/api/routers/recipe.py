@@ -0,0 +1,145 @@
+"""Moduł zawierający endpointy receptur."""
+
+from dependency_injector.wiring import inject
+from fastapi import APIRouter, Depends, HTTPException
+
+from src.api.dependencies.provide import Provide
+from src.container import Container
+from src.core.domain.recipe import CraftIn, CraftOut, Recipe, RecipeIn
+from src.infrastructure.services.irecipe import IRecipeService
+
+router = APIRouter()
+
+
+@router.post("/create", response_model=Recipe, status_code=201)
+@inject
+async def create_recipe(
+    recipe: RecipeIn,
+    service: IRecipeService = Depends(Provide[Container.recipe_service]),
+) -> dict:
+    """Dodanie nowej receptury.
+
+    Args:
+        recipe (RecipeIn): Atrybuty, wejścia i wyjścia receptury.
+        service (IRecipeService): Serwis receptur.
+
+    Raises:
+        HTTPException: 400 jeśli nazwa jest zajęta lub przedmiot nie istnieje.
+
+    Returns:
+        dict: Utworzona receptura.
+    """
+    try:
+        new_recipe = await service.add_recipe(recipe)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return new_recipe.model_dump()
+
+
+@router.post("/craft", response_model=CraftOut, status_code=200)
+@inject
+async def craft(
+    data: CraftIn,
+    service: IRecipeService = Depends(Provide[Container.recipe_service]),
+) -> dict:
+    """Wytworzenie przedmiotów według receptury.
+
+    Args:
+        data (CraftIn): Receptura, inventory i liczba wytworzeń.
+        service (IRecipeService): Serwis receptur.
+
+    Raises:
+        HTTPException: 404 jeśli receptura nie istnieje.
+        HTTPException: 400 jeśli inventory nie istnieje lub brakuje w nim
+            pieniędzy albo przedmiotów.
+
+    Returns:
+        dict: Inventory po wytworzeniu.
+    """
+    try:
+        result = await service.craft(data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if result is None:
+        raise HTTPException(status_code=404, detail="Recipe not found")
+
+    return result.model_dump()
+
+
+@router.get("/{recipe_id}", response_model=Recipe, status_code=200)
+@inject
+async def get_recipe_by_id(
+    recipe_id: int,
+    service: IRecipeService = Depends(Provide[Container.recipe_service]),
+) -> dict:
+    """Endpoint pobierający recepturę po ID.
+
+    Args:
+        recipe_id (int): ID receptury.
+        service (IRecipeService, optional): Wstrzykiwana zależność serwisu.
+
+    Raises:
+        HTTPException: 404 jeśli receptura nie istnieje.
+
+    Returns:
+        dict: Atrybuty, wejścia i wyjścia receptury.
+    """
+    if recipe := await service.get_recipe(recipe_id):
+        return recipe.model_dump()
+
+    raise HTTPException(status_code=404, detail="Recipe not found")
+
+
+@router.put("/{recipe_id}", response_model=Recipe, status_code=201)
+@inject
+async def update_recipe(
+    recipe_id: int,
+    updated_recipe: RecipeIn,
+    service: IRecipeService = Depends(Provide[Container.recipe_service]),
+) -> dict:
+    """Endpoint zastępujący recepturę.
+
+    Args:
+        recipe_id (int): ID receptury.
+        updated_recipe (RecipeIn): Nowe atrybuty, wejścia i wyjścia receptury.
+        service (IRecipeService, optional): Wstrzykiwana zależność serwisu.
+
+    Raises:
+        HTTPException: 404 jeśli receptura nie istnieje.
+        HTTPException: 400 jeśli nazwa jest zajęta lub przedmiot nie istnieje.
+
+    Returns:
+        dict: Zaktualizowana receptura.
+    """
+    try:
+        new_recipe = await service.update_recipe(recipe_id, updated_recipe)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if new_recipe is None:
+        raise HTTPException(status_code=404, detail="Recipe not found")
+
+    return new_recipe.model_dump()
+
+
+@router.delete("/{recipe_id}", status_code=204)
+@inject
+async def delete_recipe(
+    recipe_id: int,
+    service: IRecipeService = Depends(Provide[Container.recipe_service]),
+) -> None:
+    """Endpoint usuwający recepturę.
+
+    Args:
+        recipe_id (int): ID receptury.
+        service (IRecipeService, optional): Wstrzykiwana zależność serwisu.
+
+    Raises:
+        HTTPException: 404 jeśli receptura nie istnieje.
+
+    Returns:
+        None: Pusta odpowiedź po zakończeniu operacji.
+    """
+    if not await service.delete_recipe(recipe_id):
+        raise HTTPException(status_code=404, detail="Recipe not found")
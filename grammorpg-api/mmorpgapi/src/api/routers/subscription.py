@@ -0,0 +1,223 @@
+"""A module containing change subscription endpoints."""
+
+import asyncio
+
+from dependency_injector.wiring import inject
+from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, status
+
+from src.api.dependencies.provide import Provide
+from src.container import Container
+from src.infrastructure.services.iinventory import IInventoryService
+from src.infrastructure.services.inotifier import IChangeNotifier, ISubscription
+from src.infrastructure.services.iplayer import IPlayerService
+from src.infrastructure.services.iuser import IUserService
+
+router = APIRouter()
+
+TOPIC_PREFIXES = ("player:", "inventory:")
+MAX_TOPICS = 100
+
+
+@router.websocket("/ws")
+@inject
+async def subscribe_changes(
+    websocket: WebSocket,
+    notifier: IChangeNotifier = Depends(Provide[Container.change_notifier]),
+    user_service: IUserService = Depends(Provide[Container.user_service]),
+    player_service: IPlayerService = Depends(Provide[Container.player_service]),
+    inventory_service: IInventoryService = Depends(Provide[Container.inventory_service]),
+) -> None:
+    """An endpoint pushing player and inventory deltas to the client.
+
+    The client authenticates with a bearer token, in the Authorization
+    header or, for browsers, in the `token` query parameter. It sends
+    `{"subscribe": ["player:1", "inventory:3"]}` or `{"unsubscribe": [...]}`
+    messages and receives `{"topic", "changes"}` events. A `{"resync": [...]}`
+    event means the client was too slow and has to refetch the listed topics.
+
+    Args:
+        websocket (WebSocket): The websocket connection.
+        notifier (IChangeNotifier, optional): The injected notifier dependency.
+        user_service (IUserService, optional): The injected user service.
+        player_service (IPlayerService, optional): The injected player service.
+        inventory_service (IInventoryService, optional): The injected
+            inventory service.
+    """
+
+    token = _bearer_token(websocket)
+    if token is None or await user_service.authorize(token) is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    subscription = notifier.open_subscription()
+
+    authorize = _TopicAuthorizer(token, user_service, player_service, inventory_service)
+    reader = asyncio.create_task(_read_commands(websocket, subscription, authorize))
+    writer = asyncio.create_task(_write_events(websocket, subscription))
+
+    try:
+        await asyncio.wait({reader, writer}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        reader.cancel()
+        writer.cancel()
+        notifier.close_subscription(subscription)
+
+
+class _TopicAuthorizer:
+    """A private class deciding which topics a client may subscribe to.
+
+    Players and inventories have no owner in the schema, and their read
+    routes are public, so an authenticated client may follow any existing
+    one, up to `MAX_TOPICS` at a time. The token is checked again with
+    every subscription, so a revoked or expired session stops gaining
+    topics.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        user_service: IUserService,
+        player_service: IPlayerService,
+        inventory_service: IInventoryService,
+    ) -> None:
+        """The initializer of the topic authorizer.
+
+        Args:
+            token (str): The bearer token of the client.
+            user_service (IUserService): The user service.
+            player_service (IPlayerService): The player service.
+            inventory_service (IInventoryService): The inventory service.
+        """
+
+        self._token = token
+        self._user_service = user_service
+        self._player_service = player_service
+        self._inventory_service = inventory_service
+        self.topics: set[str] = set()
+
+    async def __call__(self, topics: list[str]) -> list[str] | None:
+        """The method filtering the topics the client may subscribe to.
+
+        Args:
+            topics (list[str]): The requested topics.
+
+        Returns:
+            list[str] | None: The allowed topics, None if the session
+                is no longer valid.
+        """
+
+        if await self._user_service.authorize(self._token) is None:
+            return None
+
+        allowed = []
+        for topic in topics:
+            if topic in self.topics or len(self.topics) >= MAX_TOPICS:
+                continue
+            if await self._exists(topic):
+                self.topics.add(topic)
+                allowed.append(topic)
+
+        return allowed
+
+    async def _exists(self, topic: str) -> bool:
+        """A private method checking that the topic names an existing entity.
+
+        Args:
+            topic (str): The topic, e.g. `player:1`.
+
+        Returns:
+            bool: True if the player or inventory exists.
+        """
+
+        entity, _, entity_id = topic.partition(":")
+        if not entity_id.isdigit():
+            return False
+
+        if entity == "player":
+            return await self._player_service.get_player_by_id(int(entity_id)) is not None
+
+        return await self._inventory_service.get_inventory_by_id(int(entity_id)) is not None
+
+
+async def _read_commands(
+    websocket: WebSocket,
+    subscription: ISubscription,
+    authorize: _TopicAuthorizer,
+) -> None:
+    """A private loop applying subscription commands sent by the client.
+
+    Args:
+        websocket (WebSocket): The websocket connection.
+        subscription (ISubscription): The subscription of the client.
+        authorize (_TopicAuthorizer): The filter of requested topics.
+    """
+
+    try:
+        while True:
+            command = await websocket.receive_json()
+            if not isinstance(command, dict):
+                continue
+
+            unsubscribed = _valid_topics(command.get("unsubscribe"))
+            subscription.unsubscribe(unsubscribed)
+            authorize.topics.difference_update(unsubscribed)
+
+            if subscribed := _valid_topics(command.get("subscribe")):
+                if (allowed := await authorize(subscribed)) is None:
+                    await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+                    return
+                subscription.subscribe(allowed)
+    except (WebSocketDisconnect, ValueError):
+        return
+
+
+async def _write_events(websocket: WebSocket, subscription: ISubscription) -> None:
+    """A private loop sending buffered events to the client.
+
+    Args:
+        websocket (WebSocket): The websocket connection.
+        subscription (ISubscription): The subscription of the client.
+    """
+
+    try:
+        while True:
+            await websocket.send_text(await subscription.next_message())
+    except (WebSocketDisconnect, RuntimeError):
+        return
+
+
+def _bearer_token(websocket: WebSocket) -> str | None:
+    """A private function reading the bearer token of the connection.
+
+    Args:
+        websocket (WebSocket): The websocket connection.
+
+    Returns:
+        str | None: The token, None if it is missing.
+    """
+
+    scheme, _, token = websocket.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        return token
+
+    return websocket.query_params.get("token") or None
+
+
+def _valid_topics(topics: object) -> list[str]:
+    """A private function filtering topics supported by the endpoint.
+
+    Args:
+        topics (object): The raw value sent by the client.
+
+    Returns:
+        list[str]: The supported topics.
+    """
+
+    if not isinstance(topics, list):
+        return []
+
+    return [
+        topic for topic in topics
+        if isinstance(topic, str) and topic.startswith(TOPIC_PREFIXES)
+    ]
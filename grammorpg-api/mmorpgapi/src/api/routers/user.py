@@ -0,0 +1,121 @@
+"""A module containing user endpoints."""
+
+from dependency_injector.wiring import inject
+from fastapi import APIRouter, Depends, HTTPException
+
+from src.api.dependencies.auth import get_current_session, get_current_user
+from src.api.dependencies.provide import Provide
+from src.container import Container
+from src.core.domain.user import RefreshIn, User, UserIn
+from src.infrastructure.dto.tokendto import TokenDTO
+from src.infrastructure.dto.userdto import UserDTO
+from src.infrastructure.services.iuser import IUserService
+
+router = APIRouter()
+
+
+@router.post("/register", response_model=UserDTO, status_code=201)
+@inject
+async def register_user(
+    user: UserIn,
+    service: IUserService = Depends(Provide[Container.user_service]),
+) -> dict:
+    """An endpoint for registering a new user.
+
+    Args:
+        user (UserIn): The user input data.
+        service (IUserService, optional): The injected user service.
+
+    Raises:
+        HTTPException: 400 if the e-mail is already used.
+
+    Returns:
+        dict: The new user attributes.
+    """
+
+    try:
+        new_user = await service.register_user(user)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return UserDTO(**dict(new_user)).model_dump() if new_user else {}
+
+
+@router.post("/token", response_model=TokenDTO, status_code=200)
+@inject
+async def authenticate_user(
+    user: UserIn,
+    service: IUserService = Depends(Provide[Container.user_service]),
+) -> dict:
+    """An endpoint for logging in and opening a session.
+
+    Args:
+        user (UserIn): The user credentials.
+        service (IUserService, optional): The injected user service.
+
+    Raises:
+        HTTPException: 401 if the credentials are incorrect.
+
+    Returns:
+        dict: The access and refresh tokens.
+    """
+
+    if token_details := await service.authenticate_user(user):
+        return token_details.model_dump()
+
+    raise HTTPException(status_code=401, detail="Provided incorrect credentials")
+
+
+@router.post("/refresh", response_model=TokenDTO, status_code=200)
+@inject
+async def refresh_tokens(
+    data: RefreshIn,
+    service: IUserService = Depends(Provide[Container.user_service]),
+) -> dict:
+    """An endpoint exchanging a refresh token for new tokens.
+
+    Args:
+        data (RefreshIn): The refresh token of the session.
+        service (IUserService, optional): The injected user service.
+
+    Raises:
+        HTTPException: 401 if the refresh token is invalid, used or revoked.
+
+    Returns:
+        dict: The new access and refresh tokens.
+    """
+
+    if token_details := await service.refresh_tokens(data.refresh_token):
+        return token_details.model_dump()
+
+    raise HTTPException(status_code=401, detail="Invalid refresh token")
+
+
+@router.post("/logout", status_code=204)
+@inject
+async def logout(
+    session: tuple[User, str] = Depends(get_current_session),
+    service: IUserService = Depends(Provide[Container.user_service]),
+) -> None:
+    """An endpoint revoking the session of the bearer token.
+
+    Args:
+        session (tuple[User, str]): The authenticated user and session.
+        service (IUserService, optional): The injected user service.
+    """
+
+    await service.logout(session[1])
+
+
+@router.get("/me", response_model=UserDTO, status_code=200)
+async def get_me(user: User = Depends(get_current_user)) -> dict:
+    """An endpoint for getting the authenticated user.
+
+    Args:
+        user (User): The authenticated user.
+
+    Returns:
+        dict: The user attributes.
+    """
+
+    return UserDTO(**user.model_dump()).model_dump()
@@ -1,6 +1,7 @@
 """A module providing configuration variables."""
 
 from typing import Optional
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -11,10 +12,184 @@ class BaseConfig(BaseSettings):
 
 class AppConfig(BaseConfig):
     """A class containing app's configuration."""
+    # Signs access tokens and the read-your-writes cookie; there is no
+    # default, so the app refuses to start without a secret of its own.
+    JWT_SECRET: str
     DB_HOST: Optional[str] = None
     DB_NAME: Optional[str] = None
     DB_USER: Optional[str] = None
     DB_PASSWORD: Optional[str] = None
+    DB_FORCE_ROLLBACK: bool = True
+    DB_REPLICA_HOSTS: list[str] = []
+    DB_REPLICA_STICKY_SECONDS: float = 5.0
+    DB_REPLICA_CHECK_SECONDS: float = 5.0
+    # Players and inventories are placed in SHARD_BUCKETS buckets by
+    # `id % SHARD_BUCKETS`, and buckets on DB_HOST and SHARD_HOSTS by a
+    # consistent hash ring. With sharding enabled new ids carry their
+    # bucket, so it can be turned on before adding the first shard.
+    SHARDING_ENABLED: bool = False
+    SHARD_HOSTS: list[str] = []
+    SHARD_BUCKETS: int = 64
+    SHARD_VIRTUAL_NODES: int = 64
+    # The marketplace settles trades in one transaction on the main
+    # database, so it has to be disabled once inventories are spread
+    # over SHARD_HOSTS.
+    MARKET_ENABLED: bool = True
+    # "memory" keeps items, inventories and players in the worker, e.g.
+    # for tests and benchmarks; the snapshot is loaded at startup and
+    # written at shutdown when a path is set.
+    REPOSITORY_BACKEND: str = "postgres"
+    MEMORY_SNAPSHOT_PATH: Optional[str] = None
+    DB_GUARD_ENABLED: bool = True
+    DB_LIMIT_INITIAL: int = 10
+    DB_LIMIT_MIN: int = 1
+    DB_LIMIT_MAX: int = 50
+    DB_TARGET_LATENCY_SECONDS: float = 0.05
+    DB_MAX_QUEUE: int = 500
+    # The longest queue wait of priority 0 (gameplay), 1 (default)
+    # and 2 (analytics).
+    DB_QUEUE_TIMEOUTS: list[float] = [1.0, 0.5, 0.1]
+    DB_BREAKER_FAILURES: int = 5
+    DB_BREAKER_RESET_SECONDS: float = 5.0
+    DB_ROUTE_PRIORITIES: dict[str, int] = {
+        "/combat": 0,
+        "/inventory": 0,
+        "/loot": 0,
+        "/market": 0,
+        "/player": 0,
+        "/recipe": 0,
+        "/inventory/all": 2,
+        "/item/all": 2,
+        "/item/changes": 2,
+        "/metrics": 2,
+        "/player/all": 2,
+        "/player/purge": 2,
+    }
+    # The time budget in seconds of database statements of a request,
+    # by the most specific path prefix; None for no deadline.
+    DEADLINES_ENABLED: bool = True
+    REQUEST_DEADLINE_SECONDS: float | None = 10.0
+    REQUEST_DEADLINES: dict[str, float | None] = {
+        "/combat": 2.0,
+        "/loot": 2.0,
+        "/market": 2.0,
+        "/inventory/all": 5.0,
+        "/item/all": 5.0,
+        "/item/changes": 5.0,
+        "/metrics": 5.0,
+        "/player/all": 5.0,
+        "/player/purge": None,
+    }
+
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_STORE: str = "memory"
+    RATE_LIMIT_RULES: dict[str, tuple[int, float]] = {
+        "/item": (120, 20.0),
+        "/inventory": (60, 10.0),
+        "/player": (60, 10.0),
+        "/combat": (30, 5.0),
+        "/loot": (60, 10.0),
+        "/market": (120, 20.0),
+        "/recipe": (60, 10.0),
+        "/user": (20, 2.0),
+    }
+
+    IDEMPOTENCY_ENABLED: bool = True
+    IDEMPOTENCY_TTL_SECONDS: float = 86400
+    # "memory" keeps responses per worker, so a retry is replayed only
+    # by the worker which served the first attempt; run more than one
+    # worker with "postgres".
+    IDEMPOTENCY_STORE: str = "memory"
+    IDEMPOTENT_PATHS: list[str] = [
+        "/item/create",
+        "/inventory/create",
+        "/player/create",
+        "/player/character",
+        "/loot/create",
+        "/loot/roll",
+        "/market/order",
+        "/recipe/create",
+        "/recipe/craft",
+        "/user/register",
+    ]
+    RESPONSE_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    RESPONSE_CACHE_TTL_SECONDS: float = 60.0
+    SOFT_DELETE: bool = False
+    INVENTORY_DELETE_CASCADE: bool = True
+    PURGE_MIN_INACTIVE_DAYS: int = 30
+    LEDGER_BATCH_SIZE: int = 500
+    LEDGER_FLUSH_SECONDS: float = 0.05
+    LEDGER_SNAPSHOT_SECONDS: float = 600.0
+    LEDGER_SNAPSHOT_LAG_SECONDS: float = 60.0
+    LEDGER_RETENTION_DAYS: int = 365
+    REGENERATION_ENABLED: bool = True
+    REGENERATION_TICK_SECONDS: float = 5.0
+    REGENERATION_AMOUNT: int = 1
+    REGENERATION_CHUNK_SIZE: int = 1000
+    REGENERATION_MAX_CHUNKS_PER_TICK: int = 50
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_BYTES: int = 1024
+    USER_CACHE_MAX_ENTRIES: int = 10000
+    USER_CACHE_TTL_SECONDS: float = 300.0
+    NAME_FILTER_CAPACITY: int = 1_000_000
+    NAME_FILTER_ERROR_RATE: float = 0.01
+    # The /profiling endpoints are mounted only when enabled and serve
+    # only authenticated users with one of the ADMIN_EMAILS.
+    PROFILING_ENABLED: bool = False
+    PROFILING_MAX_SECONDS: float = 60.0
+    ADMIN_EMAILS: list[str] = []
+    TRACEMALLOC_ENABLED: bool = False
+    TRACEMALLOC_FRAMES: int = 25
+    LOOP_LAG_ENABLED: bool = True
+    LOOP_LAG_INTERVAL_SECONDS: float = 0.5
+    LOOP_LAG_STALL_SECONDS: float = 0.1
+
+    @field_validator("JWT_SECRET")
+    @classmethod
+    def check_jwt_secret(cls, secret: str) -> str:
+        """A validator rejecting secrets too short to sign tokens safely.
+
+        Args:
+            secret (str): The HMAC secret of access tokens.
+
+        Raises:
+            ValueError: If the secret is shorter than 32 characters.
+
+        Returns:
+            str: The validated secret.
+        """
+
+        if len(secret) < 32:
+            raise ValueError("JWT_SECRET must be at least 32 characters long.")
+
+        return secret
+
+    @field_validator("RATE_LIMIT_RULES")
+    @classmethod
+    def check_rate_limit_rules(
+        cls,
+        rules: dict[str, tuple[int, float]],
+    ) -> dict[str, tuple[int, float]]:
+        """A validator rejecting token buckets which could never refill.
+
+        Args:
+            rules (dict[str, tuple[int, float]]): The bucket capacity and
+                refill rate per second for every router prefix.
+
+        Raises:
+            ValueError: If a capacity or a refill rate is not positive.
+
+        Returns:
+            dict[str, tuple[int, float]]: The validated rules.
+        """
+
+        for prefix, (capacity, refill_rate) in rules.items():
+            if capacity < 1 or refill_rate <= 0:
+                raise ValueError(
+                    f"Rate limit of {prefix} needs a positive capacity and refill rate."
+                )
+
+        return rules
 
 
 config = AppConfig()
\ No newline at end of file
@@ -1,17 +1,248 @@
 """Module providing containers injecting dependencies."""
 
+import numpy as np
 from dependency_injector.containers import DeclarativeContainer
-from dependency_injector.providers import Factory, Singleton
+from dependency_injector.providers import Object, Selector, Singleton
 
+from src.config import config
+from src.infrastructure.repositories.idempotencydb import IdempotencyRepository
+from src.infrastructure.repositories.idempotencymemory import (
+    IdempotencyMemoryRepository,
+)
+from src.infrastructure.repositories.inventorydb import InventoryRepository
+from src.infrastructure.repositories.inventorymemory import (
+    InventoryMemoryRepository,
+)
 from src.infrastructure.repositories.itemdb import ItemRepository
+from src.infrastructure.repositories.itemmemory import ItemMemoryRepository
+from src.infrastructure.repositories.ledgerdb import LedgerRepository
+from src.infrastructure.repositories.lootdb import LootRepository
+from src.infrastructure.repositories.marketdb import MarketRepository
+from src.infrastructure.repositories.playerdb import PlayerRepository
+from src.infrastructure.repositories.playermemory import PlayerMemoryRepository
+from src.infrastructure.repositories.ratelimitdb import RateLimitRepository
+from src.infrastructure.repositories.ratelimitmemory import (
+    RateLimitMemoryRepository,
+)
+from src.infrastructure.repositories.recipedb import RecipeRepository
+from src.infrastructure.repositories.sessiondb import SessionRepository
+from src.infrastructure.repositories.userdb import UserRepository
+from src.infrastructure.services.combat import CombatService
+from src.infrastructure.services.inventory import InventoryService
 from src.infrastructure.services.item import ItemService
+from src.infrastructure.services.ledger import LedgerService
+from src.infrastructure.services.loot import LootService
+from src.infrastructure.services.market import MarketService
+from src.infrastructure.services.notifier import ChangeNotifier
+from src.infrastructure.services.player import PlayerService
+from src.infrastructure.services.recipe import RecipeService
+from src.infrastructure.services.regeneration import RegenerationService
+from src.infrastructure.services.user import UserService
+from src.infrastructure.utils.catalog import CatalogCache
+from src.infrastructure.utils.looplag import LoopLagMonitor
+from src.infrastructure.utils.loottable import LootTableCache
+from src.infrastructure.utils.memorystore import MemoryStore
+from src.infrastructure.utils.namefilter import NameRegistry
+from src.infrastructure.utils.profiler import HeapProfiler, SamplingProfiler
+from src.infrastructure.utils.recipe import RecipeCache
+from src.infrastructure.utils.responsecache import ResponseCache
+from src.infrastructure.utils.session import SessionStore
+from src.infrastructure.utils.singleflight import SingleFlight
+from src.infrastructure.utils.usercache import UserCache
 
 
 class Container(DeclarativeContainer):
     """Container class for dependency injecting purposes."""
-    item_repository = Singleton(ItemRepository)
+    change_notifier = Singleton(ChangeNotifier)
+    single_flight = Singleton(SingleFlight)
+    catalog_cache = Singleton(CatalogCache)
+    loot_table_cache = Singleton(LootTableCache)
+    recipe_cache = Singleton(RecipeCache)
+    session_store = Singleton(SessionStore)
+    name_registry = Singleton(
+        NameRegistry,
+        capacity=config.NAME_FILTER_CAPACITY,
+        error_rate=config.NAME_FILTER_ERROR_RATE,
+    )
+    user_cache = Singleton(
+        UserCache,
+        max_entries=config.USER_CACHE_MAX_ENTRIES,
+        ttl_seconds=config.USER_CACHE_TTL_SECONDS,
+    )
+    random_generator = Singleton(np.random.default_rng)
+    loop_lag_monitor = Singleton(
+        LoopLagMonitor,
+        interval_seconds=config.LOOP_LAG_INTERVAL_SECONDS,
+        stall_seconds=config.LOOP_LAG_STALL_SECONDS,
+    )
+    sampling_profiler = Singleton(
+        SamplingProfiler,
+        max_seconds=config.PROFILING_MAX_SECONDS,
+    )
+    heap_profiler = Singleton(
+        HeapProfiler,
+        frames=config.TRACEMALLOC_FRAMES,
+        max_seconds=config.PROFILING_MAX_SECONDS,
+    )
+    response_cache = Singleton(
+        ResponseCache,
+        max_bytes=config.RESPONSE_CACHE_MAX_BYTES,
+        ttl_seconds=config.RESPONSE_CACHE_TTL_SECONDS,
+    )
+
+    memory_store = Singleton(MemoryStore, snapshot_path=config.MEMORY_SNAPSHOT_PATH)
+
+    item_repository = Selector(
+        Object(config.REPOSITORY_BACKEND),
+        memory=Singleton(ItemMemoryRepository, store=memory_store),
+        postgres=Singleton(ItemRepository),
+    )
+    inventory_repository = Selector(
+        Object(config.REPOSITORY_BACKEND),
+        memory=Singleton(
+            InventoryMemoryRepository,
+            store=memory_store,
+            soft_delete=config.SOFT_DELETE,
+            cascade=config.INVENTORY_DELETE_CASCADE,
+        ),
+        postgres=Singleton(
+            InventoryRepository,
+            soft_delete=config.SOFT_DELETE,
+            cascade=config.INVENTORY_DELETE_CASCADE,
+        ),
+    )
+    player_repository = Selector(
+        Object(config.REPOSITORY_BACKEND),
+        memory=Singleton(
+            PlayerMemoryRepository,
+            store=memory_store,
+            soft_delete=config.SOFT_DELETE,
+            cascade=config.INVENTORY_DELETE_CASCADE,
+        ),
+        postgres=Singleton(
+            PlayerRepository,
+            soft_delete=config.SOFT_DELETE,
+            cascade=config.INVENTORY_DELETE_CASCADE,
+        ),
+    )
+
+    ledger_repository = Singleton(LedgerRepository)
+    loot_repository = Singleton(LootRepository)
+    market_repository = Singleton(MarketRepository)
+    recipe_repository = Singleton(RecipeRepository)
+    user_repository = Singleton(UserRepository)
+    session_repository = Singleton(SessionRepository)
+
+    rate_limit_repository = Selector(
+        Object(config.RATE_LIMIT_STORE),
+        memory=Singleton(RateLimitMemoryRepository),
+        postgres=Singleton(RateLimitRepository),
+    )
+    idempotency_repository = Selector(
+        Object(config.IDEMPOTENCY_STORE),
+        memory=Singleton(
+            IdempotencyMemoryRepository,
+            ttl_seconds=config.IDEMPOTENCY_TTL_SECONDS,
+        ),
+        postgres=Singleton(
+            IdempotencyRepository,
+            ttl_seconds=config.IDEMPOTENCY_TTL_SECONDS,
+        ),
+    )
+
+    ledger_service = Singleton(
+        LedgerService,
+        repository=ledger_repository,
+        notifier=change_notifier,
+        batch_size=config.LEDGER_BATCH_SIZE,
+        flush_seconds=config.LEDGER_FLUSH_SECONDS,
+        snapshot_seconds=config.LEDGER_SNAPSHOT_SECONDS,
+        snapshot_lag_seconds=config.LEDGER_SNAPSHOT_LAG_SECONDS,
+        retention_days=config.LEDGER_RETENTION_DAYS,
+    )
 
-    item_service = Factory(
+    regeneration_service = Singleton(
+        RegenerationService,
+        repository=player_repository,
+        notifier=change_notifier,
+        single_flight=single_flight,
+        tick_seconds=config.REGENERATION_TICK_SECONDS,
+        amount=config.REGENERATION_AMOUNT,
+        chunk_size=config.REGENERATION_CHUNK_SIZE,
+        max_chunks_per_tick=config.REGENERATION_MAX_CHUNKS_PER_TICK,
+    )
+
+    market_service = Singleton(
+        MarketService,
+        repository=market_repository,
+        notifier=change_notifier,
+        single_flight=single_flight,
+        ledger=ledger_service,
+    )
+
+    # Services keep no state of their own, only shared dependencies,
+    # so a single instance serves every request.
+    item_service = Singleton(
         ItemService,
         repository=item_repository,
+        notifier=change_notifier,
+        single_flight=single_flight,
+        catalog_cache=catalog_cache,
+        names=name_registry,
+    )
+
+    inventory_service = Singleton(
+        InventoryService,
+        repository=inventory_repository,
+        notifier=change_notifier,
+        single_flight=single_flight,
+        ledger=ledger_service,
+    )
+
+    player_service = Singleton(
+        PlayerService,
+        repository=player_repository,
+        notifier=change_notifier,
+        single_flight=single_flight,
+        ledger=ledger_service,
+        names=name_registry,
+        purge_min_inactive_days=config.PURGE_MIN_INACTIVE_DAYS,
+    )
+
+    combat_service = Singleton(
+        CombatService,
+        repository=player_repository,
+        notifier=change_notifier,
+        single_flight=single_flight,
+    )
+
+    loot_service = Singleton(
+        LootService,
+        repository=loot_repository,
+        inventory_repository=inventory_repository,
+        cache=loot_table_cache,
+        notifier=change_notifier,
+        single_flight=single_flight,
+        ledger=ledger_service,
+        rng=random_generator,
+    )
+
+    recipe_service = Singleton(
+        RecipeService,
+        repository=recipe_repository,
+        inventory_repository=inventory_repository,
+        cache=recipe_cache,
+        notifier=change_notifier,
+        single_flight=single_flight,
+        ledger=ledger_service,
+    )
+
+    user_service = Singleton(
+        UserService,
+        repository=user_repository,
+        session_repository=session_repository,
+        sessions=session_store,
+        cache=user_cache,
+        notifier=change_notifier,
+        single_flight=single_flight,
     )
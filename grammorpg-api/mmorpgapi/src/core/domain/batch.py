@@ -0,0 +1,10 @@
+"""Moduł zawierający modele zapytań wsadowych."""
+
+from pydantic import BaseModel, Field
+
+MAX_BATCH_IDS = 1000
+
+
+class BatchIdsIn(BaseModel):
+    """Wejściowy model listy ID pobieranych wsadowo"""
+    ids: list[int] = Field(min_length=1, max_length=MAX_BATCH_IDS)
@@ -0,0 +1,39 @@
+"""Moduł zawierający logikę biznesową postaci (playera wraz z inventory)."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+from src.core.domain.inventory import Inventory, InventoryIn
+from src.core.domain.player import Player, PlayerBaseIn
+
+
+class CharacterIn(BaseModel):
+    """Wejściowy model postaci"""
+    player: PlayerBaseIn
+    inventory: InventoryIn
+
+
+class Character(BaseModel):
+    """Klasowy model postaci"""
+    player: Player
+    inventory: Inventory
+
+
+class CharacterPurgeIn(BaseModel):
+    """Wejściowy model usuwania nieaktywnych postaci"""
+    inactive_before: datetime
+    batch_size: int = Field(default=1000, ge=1, le=10_000)
+
+
+class CharacterPurgeBatch(BaseModel):
+    """Model jednej paczki usuniętych postaci"""
+    player_ids: list[int]
+    inventory_ids: list[int]
+
+
+class CharacterPurge(BaseModel):
+    """Model podsumowania usuwania postaci"""
+    players: int
+    inventories: int
+    batches: int
@@ -0,0 +1,23 @@
+"""Moduł zawierający logikę biznesową walki."""
+
+from pydantic import BaseModel, Field
+
+
+class AttackIn(BaseModel):
+    """Wejściowy model ataku (ujemna moc leczy cel)"""
+    attacker_id: int
+    target_id: int
+    power: float = Field(default=1.0, ge=-10.0, le=10.0)
+
+
+class CombatIn(BaseModel):
+    """Wejściowy model rundy walki"""
+    attacks: list[AttackIn] = Field(min_length=1, max_length=10_000)
+
+
+class CombatOut(BaseModel):
+    """Kolumnowy model wyniku rundy walki"""
+    damage: list[int]
+    player_ids: list[int]
+    hp: list[int]
+    missing: list[int]
@@ -0,0 +1,11 @@
+"""Moduł zawierający model zapamiętanej odpowiedzi idempotentnej."""
+
+from pydantic import BaseModel
+
+
+class IdempotentResponse(BaseModel):
+    """Model odpowiedzi zapamiętanej dla klucza `Idempotency-Key`"""
+    fingerprint: bytes
+    status_code: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
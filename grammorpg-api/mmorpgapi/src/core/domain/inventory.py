@@ -15,3 +15,20 @@ class Inventory(InventoryIn):
 
     model_config = ConfigDict(from_attributes=True, extra="ignore")
 
+
+class InventoryUpdate(BaseModel):
+    """Model pozycji inventory przed i po aktualizacji"""
+    before: Inventory
+    after: Inventory
+
+
+class InventoryBatch(BaseModel):
+    """Model wsadowo pobranych pozycji inventory"""
+    inventories: list[Inventory]
+    missing: list[int]
+
+
+class InventoryPage(BaseModel):
+    """Model strony pozycji inventory posortowanych po ID"""
+    inventories: list[Inventory]
+    next_after_id: int | None
@@ -13,3 +13,28 @@ class Item(ItemIn):
     id: int
 
     model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+
+class ItemBatch(BaseModel):
+    """Model wsadowo pobranych itemów"""
+    items: list[Item]
+    missing: list[int]
+
+
+class ItemCatalog(BaseModel):
+    """Model wersjonowanego katalogu itemów"""
+    version: int
+    items: list[Item]
+
+
+class ItemChange(BaseModel):
+    """Model ostatniej zmiany itemu w katalogu"""
+    id: int
+    name: str | None
+    deleted: bool
+
+
+class ItemChanges(BaseModel):
+    """Model zmian katalogu od wskazanej wersji"""
+    version: int
+    changes: list[ItemChange]
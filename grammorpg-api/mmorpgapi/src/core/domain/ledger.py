@@ -0,0 +1,32 @@
+"""Moduł zawierający modele dziennika zmian inventory."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+MONEY_ITEM_ID = 0
+
+
+class LedgerEntryIn(BaseModel):
+    """Wejściowy model wpisu dziennika (`item_id` 0 oznacza pieniądze)"""
+    inventory_id: int
+    item_id: int
+    delta: int
+    reason: str
+
+
+class LedgerEntry(LedgerEntryIn):
+    """Klasowy model wpisu dziennika"""
+    id: int
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+
+class InventoryBalance(BaseModel):
+    """Model stanu inventory odtworzonego z migawki i dziennika"""
+    inventory_id: int
+    money: int
+    items: dict[int, int]
+    snapshot_at: datetime | None
+    tail_entries: int
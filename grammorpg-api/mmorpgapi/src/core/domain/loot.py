@@ -0,0 +1,44 @@
+"""Moduł zawierający logikę biznesową tabel łupów."""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class LootEntryIn(BaseModel):
+    """Wejściowy model pozycji tabeli łupów"""
+    item_id: int
+    weight: float = Field(gt=0)
+
+
+class LootTableIn(BaseModel):
+    """Wejściowy model tabeli łupów (`empty_weight` to waga braku łupu)"""
+    name: str
+    empty_weight: float = Field(default=0.0, ge=0)
+    entries: list[LootEntryIn] = Field(min_length=1, max_length=10_000)
+
+
+class LootTable(LootTableIn):
+    """Klasowy model tabeli łupów (usunięcie przedmiotu usuwa jego pozycje)"""
+    id: int
+    entries: list[LootEntryIn]
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+
+class LootRollIn(BaseModel):
+    """Wejściowy model losowania łupów do wielu inventory"""
+    loot_table_id: int
+    inventory_ids: list[int] = Field(min_length=1, max_length=1000)
+    rolls: int = Field(default=1, ge=1, le=1000)
+
+
+class LootDrop(BaseModel):
+    """Kolumnowy model łupów przyznanych jednemu inventory"""
+    inventory_id: int
+    item_ids: list[int]
+    quantities: list[int]
+
+
+class LootRollOut(BaseModel):
+    """Model wyniku losowania łupów"""
+    drops: list[LootDrop]
+    missing: list[int]
@@ -0,0 +1,99 @@
+"""Moduł zawierający logikę biznesową rynku przedmiotów."""
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.core.domain.inventory import Inventory
+
+OrderSide = Literal["buy", "sell"]
+
+
+class StaleOrderBookError(RuntimeError):
+    """Wyjątek zgłaszany, gdy księga zleceń zmieniła się w innym workerze"""
+
+
+class MarketOrderIn(BaseModel):
+    """Wejściowy model zlecenia z limitem ceny za sztukę"""
+    inventory_id: int
+    item_id: int
+    side: OrderSide
+    price: int = Field(gt=0, le=1_000_000)
+    quantity: int = Field(gt=0, le=1000)
+
+
+class MarketOrder(MarketOrderIn):
+    """Klasowy model zlecenia"""
+    id: int
+    remaining: int
+    status: str
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+
+class MarketFill(BaseModel):
+    """Model dopasowania zlecenia z księgi do nowego zlecenia"""
+    order_id: int
+    inventory_id: int
+    price: int
+    quantity: int
+
+
+class MarketTrade(BaseModel):
+    """Klasowy model transakcji"""
+    item_id: int
+    buy_order_id: int
+    sell_order_id: int
+    price: int
+    quantity: int
+
+
+class MarketSettlement(BaseModel):
+    """Model rozliczenia zlecenia wraz z nowym stanem inventory"""
+    order: MarketOrder
+    trades: list[MarketTrade]
+    version: int
+    inventories: list[Inventory]
+
+
+class MarketCancellation(BaseModel):
+    """Model anulowania zlecenia wraz z nowym stanem inventory"""
+    order: MarketOrder
+    version: int
+    inventory: Inventory | None
+
+
+class OrderBookState(BaseModel):
+    """Model otwartych zleceń przedmiotu w danej wersji księgi"""
+    item_id: int
+    version: int
+    orders: list[MarketOrder]
+
+
+class MarketOrderOut(BaseModel):
+    """Model wyniku złożenia zlecenia"""
+    order: MarketOrder
+    trades: list[MarketTrade]
+
+
+class PriceLevel(BaseModel):
+    """Model poziomu cenowego księgi"""
+    price: int
+    quantity: int
+
+
+class OrderBookOut(BaseModel):
+    """Model zagregowanej księgi zleceń przedmiotu"""
+    item_id: int
+    version: int
+    bids: list[PriceLevel]
+    asks: list[PriceLevel]
+
+
+class BestPrices(BaseModel):
+    """Model najlepszych cen kupna i sprzedaży przedmiotu"""
+    item_id: int
+    bid: int | None
+    ask: int | None
@@ -0,0 +1,9 @@
+"""Moduł zawierający modele dostępności nazw."""
+
+from pydantic import BaseModel
+
+
+class NameAvailability(BaseModel):
+    """Model odpowiedzi o dostępności nazwy"""
+    name: str
+    available: bool
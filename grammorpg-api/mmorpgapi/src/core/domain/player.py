@@ -3,12 +3,16 @@
 from pydantic import BaseModel, ConfigDict
 
 
-class PlayerIn(BaseModel):
-    """Wejściowy model playera"""
+class PlayerBaseIn(BaseModel):
+    """Wejściowy model atrybutów playera bez inventory"""
     name: str
     strength: int
     hp: int
     maxhp: int
+
+
+class PlayerIn(PlayerBaseIn):
+    """Wejściowy model playera"""
     connectedinventory: int
 
 
@@ -17,3 +21,15 @@ class Player(PlayerIn):
     id: int
 
     model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+
+class PlayerBatch(BaseModel):
+    """Model wsadowo pobranych playerów"""
+    players: list[Player]
+    missing: list[int]
+
+
+class PlayerPage(BaseModel):
+    """Model strony playerów posortowanych po ID"""
+    players: list[Player]
+    next_after_id: int | None
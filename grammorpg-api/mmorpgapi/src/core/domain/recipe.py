@@ -0,0 +1,41 @@
+"""Moduł zawierający logikę biznesową receptur."""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.core.domain.inventory import Inventory
+
+
+class RecipeItemIn(BaseModel):
+    """Wejściowy model przedmiotu zużywanego lub wytwarzanego przez recepturę"""
+    item_id: int
+    quantity: int = Field(gt=0, le=1000)
+
+
+class RecipeIn(BaseModel):
+    """Wejściowy model receptury"""
+    name: str
+    money: int = Field(default=0, ge=0)
+    inputs: list[RecipeItemIn] = Field(default=[], max_length=100)
+    outputs: list[RecipeItemIn] = Field(min_length=1, max_length=100)
+
+
+class Recipe(RecipeIn):
+    """Klasowy model receptury (usunięcie przedmiotu usuwa jego pozycje)"""
+    id: int
+    outputs: list[RecipeItemIn]
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+
+class CraftIn(BaseModel):
+    """Wejściowy model wytwarzania według receptury"""
+    recipe_id: int
+    inventory_id: int
+    times: int = Field(default=1, ge=1, le=1000)
+
+
+class CraftOut(BaseModel):
+    """Model wyniku wytwarzania"""
+    recipe_id: int
+    times: int
+    inventory: Inventory
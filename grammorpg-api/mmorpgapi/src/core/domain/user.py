@@ -1,7 +1,9 @@
 """Moduł zawierający logikę biznesową usera."""
 
 
-from pydantic import BaseModel, ConfigDict, UUID1
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, UUID4
 
 
 class UserIn(BaseModel):
@@ -12,6 +14,21 @@ class UserIn(BaseModel):
 
 class User(UserIn):
     """Klasowy model usera"""
-    id: UUID1
+    id: UUID4
+
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+
+class RefreshIn(BaseModel):
+    """Wejściowy model odświeżenia tokenu"""
+    refresh_token: str
+
+
+class UserSession(BaseModel):
+    """Model sesji usera"""
+    id: UUID4
+    user_id: UUID4
+    expires_at: datetime
+    revoked_at: datetime | None = None
 
-    model_config = ConfigDict(from_attributes=True, extra="ignore")
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
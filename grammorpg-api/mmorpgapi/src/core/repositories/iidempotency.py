@@ -0,0 +1,29 @@
+"""Abstrakcje repozytorium odpowiedzi idempotentnych."""
+
+from abc import ABC, abstractmethod
+
+from src.core.domain.idempotency import IdempotentResponse
+
+
+class IIdempotencyRepository(ABC):
+    """Abstrakcyjna klasa repozytorium odpowiedzi idempotentnych"""
+
+    @abstractmethod
+    async def get_response(self, key: str) -> IdempotentResponse | None:
+        """Abstrakcyjna metoda pobierania zapamiętanej odpowiedzi
+
+        Args:
+            key (str): Klucz idempotencji
+
+        Returns:
+            IdempotentResponse | None: Odpowiedź, jeśli nie wygasła
+        """
+
+    @abstractmethod
+    async def save_response(self, key: str, response: IdempotentResponse) -> None:
+        """Abstrakcyjna metoda zapamiętania odpowiedzi
+
+        Args:
+            key (str): Klucz idempotencji
+            response (IdempotentResponse): Odpowiedź do zapamiętania
+        """
@@ -1,9 +1,9 @@
 """Abstrakcyjne repozytorium inventory."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Iterable
 
-from src.core.domain.inventory import InventoryIn
+from src.core.domain.inventory import Inventory, InventoryBatch, InventoryIn, InventoryUpdate
 
 
 class IInventoryRepository(ABC):
@@ -21,7 +21,11 @@ class IInventoryRepository(ABC):
         """
 
     @abstractmethod
-    async def update_inventory(self, inventory_id: int, data: InventoryIn) -> Any | None:
+    async def update_inventory(
+        self,
+        inventory_id: int,
+        data: InventoryIn,
+    ) -> InventoryUpdate | None:
         """Abstrakcyjna metoda aktualizacji pozycji inventory
 
         Args:
@@ -29,18 +33,61 @@ class IInventoryRepository(ABC):
             data (InventoryIn): Zaktualizowane atrybuty pozycji inventory
 
         Returns:
-            Any | None: Zaktualizowana pozycja inventory lub None, jeśli operacja się nie powiodła
+            InventoryUpdate | None: Pozycja inventory przed i po aktualizacji
+                lub None, jeśli nie istnieje
         """
 
     @abstractmethod
-    async def remove_inventory(self, inventory_id: int) -> bool:
+    async def add_items(
+        self,
+        inventory_ids: list[int],
+        itemlists: list[str],
+    ) -> list[tuple[int, str]]:
+        """Abstrakcyjna metoda dopisywania przedmiotów do wielu inventory naraz
+
+        Args:
+            inventory_ids (list[int]): Lista unikalnych ID inventory
+            itemlists (list[str]): Przedmioty dopisywane do każdego inventory
+
+        Returns:
+            list[tuple[int, str]]: ID i nowa lista przedmiotów istniejących inventory
+        """
+
+    @abstractmethod
+    async def exchange_items(
+        self,
+        inventory_id: int,
+        money: int,
+        consumed: dict[int, int],
+        produced: dict[int, int],
+    ) -> Inventory | None:
+        """Abstrakcyjna metoda atomowej wymiany pieniędzy i przedmiotów inventory
+
+        Args:
+            inventory_id (int): ID inventory
+            money (int): Zużywane pieniądze
+            consumed (dict[int, int]): Zużywane ilości według ID przedmiotu
+            produced (dict[int, int]): Wytwarzane ilości według ID przedmiotu
+
+        Returns:
+            Inventory | None: Inventory po wymianie lub None, jeśli nie istnieje
+                albo brakuje w nim pieniędzy lub przedmiotów
+        """
+
+    @abstractmethod
+    async def remove_inventory(self, inventory_id: int) -> list[int] | None:
         """Abstrakcyjna metoda usuwania pozycji inventory
 
         Args:
             inventory_id (int): ID pozycji inventory do usunięcia
 
+        Raises:
+            ValueError: Jeśli inventory jest używane przez playera, a kaskada
+                jest wyłączona
+
         Returns:
-            bool: Powodzenie operacji usuwania
+            list[int] | None: ID playerów usuniętych razem z inventory lub
+                None, jeśli inventory nie istnieje
         """
 
     @abstractmethod
@@ -54,3 +101,34 @@ class IInventoryRepository(ABC):
             Any | None: Pozycja inventory, jeśli istnieje, lub None w przeciwnym wypadku
         """
 
+    @abstractmethod
+    async def get_many_by_ids(self, inventory_ids: list[int]) -> InventoryBatch:
+        """Abstrakcyjna metoda pobierania wielu pozycji inventory jednym zapytaniem
+
+        Args:
+            inventory_ids (list[int]): Lista ID pozycji inventory
+
+        Returns:
+            InventoryBatch: Pozycje inventory w kolejności ID oraz brakujące ID
+        """
+
+    @abstractmethod
+    async def get_all_inventory(self) -> Iterable[Any]:
+        """Abstrakcyjna metoda pobierania wszystkich pozycji inventory
+
+        Returns:
+            Iterable[Any]: Kolekcja wszystkich pozycji inventory
+        """
+
+    @abstractmethod
+    async def get_inventory_page(self, after_id: int, limit: int) -> Iterable[Any]:
+        """Abstrakcyjna metoda pobierania strony pozycji inventory po ID
+
+        Args:
+            after_id (int): ID ostatniej pozycji poprzedniej strony
+            limit (int): Maksymalna liczba pozycji na stronie
+
+        Returns:
+            Iterable[Any]: Pozycje inventory posortowane po ID
+        """
+
@@ -3,7 +3,7 @@
 from abc import ABC, abstractmethod
 from typing import Any, Iterable
 
-from src.core.domain.item import ItemIn
+from src.core.domain.item import ItemBatch, ItemCatalog, ItemChanges, ItemIn
 
 
 class IItemRepository(ABC):
@@ -28,6 +28,44 @@ class IItemRepository(ABC):
             Iterable[Any]: Zwraca kolekcję wszystkich itemów
         """
 
+    @abstractmethod
+    async def get_many_by_ids(self, item_ids: list[int]) -> ItemBatch:
+        """Abstrakcyjna metoda pobierania wielu itemów jednym zapytaniem
+
+        Args:
+            item_ids (list[int]): Lista id itemów
+
+        Returns:
+            ItemBatch: Itemy w kolejności id oraz brakujące id
+        """
+
+    @abstractmethod
+    async def get_catalog_version(self) -> int:
+        """Abstrakcyjna metoda pobierania bieżącej wersji katalogu
+
+        Returns:
+            int: Wersja ostatniej zmiany itemów
+        """
+
+    @abstractmethod
+    async def get_catalog(self) -> ItemCatalog:
+        """Abstrakcyjna metoda pobierania spójnego katalogu itemów z wersją
+
+        Returns:
+            ItemCatalog: Katalog itemów
+        """
+
+    @abstractmethod
+    async def get_changes_since(self, version: int) -> ItemChanges:
+        """Abstrakcyjna metoda pobierania zmian katalogu od wersji
+
+        Args:
+            version (int): Wersja znana klientowi
+
+        Returns:
+            ItemChanges: Ostatnia zmiana każdego itemu i nowa wersja
+        """
+
     @abstractmethod
     async def get_item_by_name(self, name: str) -> Any | None:
         """Abstrakcyjna metoda pobierania pozycji item po name
@@ -39,6 +77,14 @@ class IItemRepository(ABC):
             Any | None: Item jeśli istnieje
         """
 
+    @abstractmethod
+    async def get_all_names(self) -> list[str]:
+        """Abstrakcyjna metoda pobierania nazw wszystkich itemów
+
+        Returns:
+            list[str]: Zajęte nazwy itemów
+        """
+
     @abstractmethod
     async def add_item(self, data: ItemIn) -> Any | None:
         """Abstrakcyjna metoda dodawania pozycji item
@@ -63,12 +109,12 @@ class IItemRepository(ABC):
         """
 
     @abstractmethod
-    async def delete_item(self, item_id: int) -> bool:
+    async def delete_item(self, item_id: int) -> str | None:
         """Abstrakcyjna metoda usuwania pozycji item
 
         Args:
             item_id (int): ID itemu
 
         Returns:
-            bool: Powodzenie operacji
+            str | None: Nazwa usuniętego itemu lub None, jeśli nie istniał
         """
@@ -0,0 +1,81 @@
+"""Moduł zawierający abstrakcje repozytorium dziennika inventory."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Iterable
+
+from src.core.domain.ledger import InventoryBalance, LedgerEntry, LedgerEntryIn
+
+
+class ILedgerRepository(ABC):
+    """Abstrakcyjna klasa repozytorium dziennika inventory"""
+
+    @abstractmethod
+    async def append_entries(self, entries: list[LedgerEntryIn]) -> None:
+        """Abstrakcyjna metoda dopisywania paczki wpisów do dziennika
+
+        Args:
+            entries (list[LedgerEntryIn]): Wpisy do dopisania
+        """
+
+    @abstractmethod
+    async def get_entries(
+        self,
+        inventory_id: int,
+        since: datetime,
+        until: datetime,
+        limit: int,
+    ) -> Iterable[LedgerEntry]:
+        """Abstrakcyjna metoda pobierania historii inventory
+
+        Args:
+            inventory_id (int): ID inventory
+            since (datetime): Początek zakresu
+            until (datetime): Koniec zakresu
+            limit (int): Maksymalna liczba wpisów
+
+        Returns:
+            Iterable[LedgerEntry]: Wpisy od najnowszego
+        """
+
+    @abstractmethod
+    async def get_balance(self, inventory_id: int) -> InventoryBalance:
+        """Abstrakcyjna metoda odtwarzania stanu inventory
+
+        Args:
+            inventory_id (int): ID inventory
+
+        Returns:
+            InventoryBalance: Stan z ostatniej migawki i późniejszych wpisów
+        """
+
+    @abstractmethod
+    async def create_snapshots(self, cutoff: datetime) -> int:
+        """Abstrakcyjna metoda zapisywania migawek zmienionych inventory
+
+        Args:
+            cutoff (datetime): Granica wpisów objętych migawką
+
+        Returns:
+            int: Liczba zapisanych wierszy migawek
+        """
+
+    @abstractmethod
+    async def ensure_partitions(self, now: datetime, months_ahead: int) -> None:
+        """Abstrakcyjna metoda tworzenia partycji dziennika na kolejne miesiące
+
+        Args:
+            now (datetime): Bieżący czas
+            months_ahead (int): Liczba miesięcy tworzonych z wyprzedzeniem
+        """
+
+    @abstractmethod
+    async def drop_partitions(self, older_than: datetime) -> list[str]:
+        """Abstrakcyjna metoda usuwania starych partycji objętych migawkami
+
+        Args:
+            older_than (datetime): Granica wieku partycji
+
+        Returns:
+            list[str]: Nazwy usuniętych partycji
+        """
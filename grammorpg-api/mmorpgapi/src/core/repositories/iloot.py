@@ -0,0 +1,61 @@
+"""Moduł zawierający abstrakcje repozytorium tabel łupów."""
+
+from abc import ABC, abstractmethod
+
+from src.core.domain.loot import LootTable, LootTableIn
+
+
+class ILootRepository(ABC):
+    """Abstrakcyjna klasa repozytorium tabel łupów"""
+
+    @abstractmethod
+    async def add_loot_table(self, data: LootTableIn) -> LootTable:
+        """Abstrakcyjna metoda dodawania tabeli łupów
+
+        Args:
+            data (LootTableIn): Atrybuty i pozycje tabeli łupów
+
+        Raises:
+            ValueError: Jeśli nazwa jest zajęta lub przedmiot nie istnieje
+
+        Returns:
+            LootTable: Nowo utworzona tabela łupów
+        """
+
+    @abstractmethod
+    async def update_loot_table(self, table_id: int, data: LootTableIn) -> LootTable | None:
+        """Abstrakcyjna metoda zastępowania tabeli łupów
+
+        Args:
+            table_id (int): ID tabeli łupów
+            data (LootTableIn): Nowe atrybuty i pozycje tabeli łupów
+
+        Raises:
+            ValueError: Jeśli nazwa jest zajęta lub przedmiot nie istnieje
+
+        Returns:
+            LootTable | None: Zaktualizowana tabela łupów, jeśli istnieje
+        """
+
+    @abstractmethod
+    async def remove_loot_table(self, table_id: int) -> bool:
+        """Abstrakcyjna metoda usuwania tabeli łupów
+
+        Args:
+            table_id (int): ID tabeli łupów
+
+        Returns:
+            bool: Powodzenie operacji usuwania
+        """
+
+    @abstractmethod
+    async def get_loot_table(self, table_id: int, primary: bool = False) -> LootTable | None:
+        """Abstrakcyjna metoda pobierania tabeli łupów wraz z pozycjami
+
+        Args:
+            table_id (int): ID tabeli łupów
+            primary (bool): Czy czytać z bazy głównej
+
+        Returns:
+            LootTable | None: Tabela łupów, jeśli istnieje
+        """
@@ -0,0 +1,67 @@
+"""Moduł zawierający abstrakcje repozytorium rynku przedmiotów."""
+
+from abc import ABC, abstractmethod
+
+from src.core.domain.market import (
+    MarketCancellation,
+    MarketFill,
+    MarketOrderIn,
+    MarketSettlement,
+    OrderBookState,
+)
+
+
+class IMarketRepository(ABC):
+    """Abstrakcyjna klasa repozytorium rynku przedmiotów"""
+
+    @abstractmethod
+    async def get_order_books(self) -> list[OrderBookState]:
+        """Abstrakcyjna metoda pobierania otwartych zleceń wszystkich przedmiotów
+
+        Returns:
+            list[OrderBookState]: Wersja i otwarte zlecenia każdej księgi
+        """
+
+    @abstractmethod
+    async def get_order_book(self, item_id: int) -> OrderBookState:
+        """Abstrakcyjna metoda pobierania otwartych zleceń przedmiotu
+
+        Args:
+            item_id (int): ID przedmiotu
+
+        Returns:
+            OrderBookState: Wersja i otwarte zlecenia księgi
+        """
+
+    @abstractmethod
+    async def settle_order(
+        self,
+        data: MarketOrderIn,
+        fills: list[MarketFill],
+        expected_version: int,
+    ) -> MarketSettlement:
+        """Abstrakcyjna metoda atomowego złożenia i rozliczenia zlecenia
+
+        Args:
+            data (MarketOrderIn): Nowe zlecenie
+            fills (list[MarketFill]): Dopasowane zlecenia z księgi
+            expected_version (int): Wersja księgi, na której dopasowano zlecenie
+
+        Raises:
+            ValueError: Jeśli inventory nie istnieje lub brakuje środków
+            StaleOrderBookError: Jeśli księga zmieniła się od tej wersji
+
+        Returns:
+            MarketSettlement: Zlecenie, transakcje, nowa wersja i inventory
+        """
+
+    @abstractmethod
+    async def cancel_order(self, order_id: int) -> MarketCancellation | None:
+        """Abstrakcyjna metoda anulowania zlecenia i zwrotu depozytu
+
+        Args:
+            order_id (int): ID zlecenia
+
+        Returns:
+            MarketCancellation | None: Anulowane zlecenie, jeśli było otwarte
+        """
@@ -1,9 +1,11 @@
 """Moduł zawierający abstrakcje repozytorium player."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from datetime import datetime
+from typing import Any, Iterable
 
-from src.core.domain.player import PlayerIn
+from src.core.domain.character import Character, CharacterIn, CharacterPurgeBatch
+from src.core.domain.player import PlayerBatch, PlayerIn
 
 
 class IPlayerRepository(ABC):
@@ -20,6 +22,20 @@ class IPlayerRepository(ABC):
             Any | None: Nowo utworzony player lub None, jeśli operacja się nie powiodła
         """
 
+    @abstractmethod
+    async def add_character(self, data: CharacterIn) -> Character:
+        """Abstrakcyjna metoda dodawania playera wraz z jego inventory
+
+        Args:
+            data (CharacterIn): Atrybuty playera i inventory
+
+        Raises:
+            ValueError: Jeśli nazwa playera jest już zajęta
+
+        Returns:
+            Character: Nowo utworzony player i jego inventory
+        """
+
     @abstractmethod
     async def update_player(self, player_id: int, data: PlayerIn) -> Any | None:
         """Abstrakcyjna metoda aktualizacji playera
@@ -33,14 +49,79 @@ class IPlayerRepository(ABC):
         """
 
     @abstractmethod
-    async def remove_player(self, player_id: int) -> bool:
+    async def remove_player(self, player_id: int) -> str | None:
         """Abstrakcyjna metoda usuwania playera
 
         Args:
             player_id (int): ID playera do usunięcia
 
         Returns:
-            bool: Powodzenie operacji usuwania
+            str | None: Nazwa usuniętego playera lub None, jeśli nie istniał
+        """
+
+    @abstractmethod
+    async def purge_inactive_players(
+        self,
+        inactive_before: datetime,
+        limit: int,
+    ) -> CharacterPurgeBatch:
+        """Abstrakcyjna metoda trwałego usuwania paczki nieaktywnych playerów
+
+        Args:
+            inactive_before (datetime): Granica nieaktywności
+            limit (int): Maksymalna liczba playerów w paczce
+
+        Returns:
+            CharacterPurgeBatch: ID usuniętych playerów i inventory
+        """
+
+    @abstractmethod
+    async def get_combat_stats(
+        self,
+        player_ids: list[int],
+    ) -> list[tuple[int, int, int, int]]:
+        """Abstrakcyjna metoda pobierania statystyk walki playerów
+
+        Args:
+            player_ids (list[int]): Lista unikalnych ID playerów
+
+        Returns:
+            list[tuple[int, int, int, int]]: ID, strength, hp i maxhp
+                istniejących playerów, posortowane po ID
+        """
+
+    @abstractmethod
+    async def apply_hp_deltas(
+        self,
+        player_ids: list[int],
+        damage: list[int],
+    ) -> list[tuple[int, int]]:
+        """Abstrakcyjna metoda odejmowania obrażeń od hp wielu playerów
+
+        Args:
+            player_ids (list[int]): Lista unikalnych ID playerów
+            damage (list[int]): Obrażenia każdego playera (ujemne leczą)
+
+        Returns:
+            list[tuple[int, int]]: ID i nowe hp zmienionych playerów
+        """
+
+    @abstractmethod
+    async def regenerate_hp(
+        self,
+        amount: int,
+        after_id: int,
+        limit: int,
+    ) -> list[tuple[int, int]]:
+        """Abstrakcyjna metoda regeneracji hp paczki playerów
+
+        Args:
+            amount (int): Liczba hp dodawana każdemu playerowi
+            after_id (int): ID, po którym zaczyna się paczka
+            limit (int): Maksymalna liczba playerów w paczce
+
+        Returns:
+            list[tuple[int, int]]: ID i nowe hp zregenerowanych playerów
         """
 
     @abstractmethod
@@ -54,6 +135,37 @@ class IPlayerRepository(ABC):
             Any | None: Player, jeśli istnieje, lub None w przeciwnym wypadku
         """
 
+    @abstractmethod
+    async def get_many_by_ids(self, player_ids: list[int]) -> PlayerBatch:
+        """Abstrakcyjna metoda pobierania wielu playerów jednym zapytaniem
+
+        Args:
+            player_ids (list[int]): Lista ID playerów
+
+        Returns:
+            PlayerBatch: Playerzy w kolejności ID oraz brakujące ID
+        """
+
+    @abstractmethod
+    async def get_all_players(self) -> Iterable[Any]:
+        """Abstrakcyjna metoda pobierania wszystkich playerów
+
+        Returns:
+            Iterable[Any]: Kolekcja wszystkich playerów
+        """
+
+    @abstractmethod
+    async def get_players_page(self, after_id: int, limit: int) -> Iterable[Any]:
+        """Abstrakcyjna metoda pobierania strony playerów po ID
+
+        Args:
+            after_id (int): ID ostatniego playera poprzedniej strony
+            limit (int): Maksymalna liczba playerów na stronie
+
+        Returns:
+            Iterable[Any]: Playerzy posortowani po ID
+        """
+
     @abstractmethod
     async def get_player_by_name(self, name: str) -> Any | None:
         """Abstrakcyjna metoda pobierania playera po nazwie
@@ -63,4 +175,12 @@ class IPlayerRepository(ABC):
 
         Returns:
             Any | None: Player, jeśli istnieje, lub None w przeciwnym wypadku
+        """
+
+    @abstractmethod
+    async def get_all_names(self) -> list[str]:
+        """Abstrakcyjna metoda pobierania nazw wszystkich playerów
+
+        Returns:
+            list[str]: Zajęte nazwy playerów
         """
\ No newline at end of file
@@ -0,0 +1,21 @@
+"""Abstrakcje repozytorium limitów zapytań."""
+
+from abc import ABC, abstractmethod
+
+
+class IRateLimitRepository(ABC):
+    """Abstrakcyjna klasa repozytorium kubełków tokenów"""
+
+    @abstractmethod
+    async def take_token(self, key: str, capacity: int, refill_rate: float) -> float:
+        """Abstrakcyjna metoda pobrania jednego tokenu z kubełka
+
+        Args:
+            key (str): Klucz kubełka
+            capacity (int): Pojemność kubełka
+            refill_rate (float): Liczba tokenów odnawianych na sekundę
+
+        Returns:
+            float: 0 jeśli token pobrano, w przeciwnym razie liczba sekund
+                do pojawienia się kolejnego tokenu
+        """
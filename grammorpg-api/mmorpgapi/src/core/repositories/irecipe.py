@@ -0,0 +1,70 @@
+"""Moduł zawierający abstrakcje repozytorium receptur."""
+
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+from src.core.domain.recipe import Recipe, RecipeIn
+
+
+class IRecipeRepository(ABC):
+    """Abstrakcyjna klasa repozytorium receptur"""
+
+    @abstractmethod
+    async def add_recipe(self, data: RecipeIn) -> Recipe:
+        """Abstrakcyjna metoda dodawania receptury
+
+        Args:
+            data (RecipeIn): Atrybuty, wejścia i wyjścia receptury
+
+        Raises:
+            ValueError: Jeśli nazwa jest zajęta lub przedmiot nie istnieje
+
+        Returns:
+            Recipe: Nowo utworzona receptura
+        """
+
+    @abstractmethod
+    async def update_recipe(self, recipe_id: int, data: RecipeIn) -> Recipe | None:
+        """Abstrakcyjna metoda zastępowania receptury
+
+        Args:
+            recipe_id (int): ID receptury
+            data (RecipeIn): Nowe atrybuty, wejścia i wyjścia receptury
+
+        Raises:
+            ValueError: Jeśli nazwa jest zajęta lub przedmiot nie istnieje
+
+        Returns:
+            Recipe | None: Zaktualizowana receptura, jeśli istnieje
+        """
+
+    @abstractmethod
+    async def remove_recipe(self, recipe_id: int) -> bool:
+        """Abstrakcyjna metoda usuwania receptury
+
+        Args:
+            recipe_id (int): ID receptury
+
+        Returns:
+            bool: Powodzenie operacji usuwania
+        """
+
+    @abstractmethod
+    async def get_recipe(self, recipe_id: int, primary: bool = False) -> Recipe | None:
+        """Abstrakcyjna metoda pobierania receptury
+
+        Args:
+            recipe_id (int): ID receptury
+            primary (bool): Czy czytać z bazy głównej
+
+        Returns:
+            Recipe | None: Receptura, jeśli istnieje
+        """
+
+    @abstractmethod
+    async def get_all_recipes(self) -> Iterable[Recipe]:
+        """Abstrakcyjna metoda pobierania wszystkich receptur
+
+        Returns:
+            Iterable[Recipe]: Kolekcja receptur
+        """
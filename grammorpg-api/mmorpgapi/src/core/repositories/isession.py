@@ -0,0 +1,87 @@
+"""Abstrakcyjne repozytorium sesji user"""
+
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from pydantic import UUID4
+
+from src.core.domain.user import UserSession
+
+
+class ISessionRepository(ABC):
+    """Abstrakcyjna klasa repozytorium sesji user"""
+
+    @abstractmethod
+    async def add_session(
+        self,
+        session_id: UUID4,
+        user_id: UUID4,
+        refresh_hash: str,
+        expires_at: datetime,
+    ) -> UserSession:
+        """Metoda zapisująca nową sesję
+
+        Args:
+            session_id (UUID4): ID sesji
+            user_id (UUID4): UUID user
+            refresh_hash (str): Hash tokenu odświeżającego
+            expires_at (datetime): Koniec ważności tokenu odświeżającego
+
+        Returns:
+            UserSession: Nowa sesja
+        """
+
+    @abstractmethod
+    async def rotate_session(
+        self,
+        session_id: UUID4,
+        refresh_hash: str,
+        new_refresh_hash: str,
+        expires_at: datetime,
+    ) -> UserSession | None:
+        """Metoda wymieniająca token odświeżający aktywnej sesji
+
+        Args:
+            session_id (UUID4): ID sesji
+            refresh_hash (str): Hash przedstawionego tokenu odświeżającego
+            new_refresh_hash (str): Hash nowego tokenu odświeżającego
+            expires_at (datetime): Nowy koniec ważności tokenu
+
+        Returns:
+            UserSession | None: Sesja po wymianie lub None, jeśli nie istnieje,
+                wygasła, została unieważniona lub token nie pasuje
+        """
+
+    @abstractmethod
+    async def revoke_session(self, session_id: UUID4) -> UserSession | None:
+        """Metoda unieważniająca sesję
+
+        Args:
+            session_id (UUID4): ID sesji
+
+        Returns:
+            UserSession | None: Unieważniona sesja, jeśli była aktywna
+        """
+
+    @abstractmethod
+    async def get_session(self, session_id: UUID4) -> UserSession | None:
+        """Metoda pobierająca sesję po ID
+
+        Args:
+            session_id (UUID4): ID sesji
+
+        Returns:
+            UserSession | None: Sesja, jeśli istnieje
+        """
+
+    @abstractmethod
+    async def get_revoked_since(self, since: datetime) -> list[UserSession]:
+        """Metoda pobierająca sesje unieważnione od podanej chwili
+
+        Args:
+            since (datetime): Najstarsza chwila unieważnienia
+
+        Returns:
+            list[UserSession]: Sesje od najdawniej unieważnionej
+        """
@@ -4,7 +4,7 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
-from pydantic import UUID5
+from pydantic import UUID4
 
 from src.core.domain.user import UserIn
 
@@ -17,18 +17,21 @@ class IUserRepository(ABC):
         """Metoda rejestrująca user
 
         Args:
-            user (UserIn): Dane user
+            user (UserIn): Dane user z zahashowanym hasłem
+
+        Raises:
+            ValueError: Jeśli email jest zajęty
 
         Returns:
             Any | None: Nowy obiekt user
         """
 
     @abstractmethod
-    async def get_by_uuid(self, uuid: UUID5) -> Any | None:
+    async def get_by_uuid(self, uuid: UUID4) -> Any | None:
         """Metoda pobrania user przez uuid
 
         Args:
-            uuid (UUID5): UUID user.
+            uuid (UUID4): UUID user.
 
         Returns:
             Any | None: Obiekt user.
@@ -43,4 +46,4 @@ class IUserRepository(ABC):
 
         Returns:
             Any | None: Obiekt user.
-        """
\ No newline at end of file
+        """
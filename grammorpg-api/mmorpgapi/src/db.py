@@ -1,17 +1,27 @@
 import asyncio
+import hashlib
 
+import asyncpg  # type: ignore
 import databases
 import sqlalchemy
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.exc import OperationalError, DatabaseError
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.ext.mutable import MutableList
+from sqlalchemy.schema import CreateColumn, CreateIndex
 from asyncpg.exceptions import (    
     CannotConnectNowError,
     ConnectionDoesNotExistError,
 )
 
 from src.config import config
+from src.infrastructure.utils.dbguard import (
+    AdaptiveLimiter,
+    CircuitBreaker,
+    GuardedDatabase,
+)
+from src.infrastructure.utils.dbrouter import DatabaseRouter
+from src.infrastructure.utils.sharding import ShardRouter
 
 metadata = sqlalchemy.MetaData()
 
@@ -20,6 +30,26 @@ item_table = sqlalchemy.Table(
     metadata,
     sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
     sqlalchemy.Column("name", sqlalchemy.String),
+    sqlalchemy.Index("ix_items_name", "name"),
+)
+
+item_change_table = sqlalchemy.Table(
+    "item_changes",
+    metadata,
+    sqlalchemy.Column("version", sqlalchemy.BigInteger, primary_key=True, autoincrement=False),
+    sqlalchemy.Column("item_id", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Column("name", sqlalchemy.String),
+    sqlalchemy.Column("deleted", sqlalchemy.Boolean, nullable=False),
+)
+
+# Jedyny wiersz z numerem ostatniej wersji katalogu; jego blokada
+# szereguje zapisy przedmiotów, więc wersje rosną w kolejności commitów.
+catalog_version_table = sqlalchemy.Table(
+    "catalog_version",
+    metadata,
+    sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True, autoincrement=False),
+    sqlalchemy.Column("version", sqlalchemy.BigInteger, nullable=False),
+    sqlalchemy.CheckConstraint("id = 1", name="ck_catalog_version_single_row"),
 )
 
 inventory_table = sqlalchemy.Table(
@@ -28,6 +58,15 @@ inventory_table = sqlalchemy.Table(
     sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
     sqlalchemy.Column("money", sqlalchemy.Integer),
     sqlalchemy.Column("itemlist", sqlalchemy.String),
+    sqlalchemy.Column("deleted_at", sqlalchemy.DateTime(timezone=True)),
+)
+
+# Globalna rezerwacja nazw playerów w bazie głównej; unikalny indeks
+# nazw w tabeli `players` obejmuje tylko jeden shard.
+player_name_table = sqlalchemy.Table(
+    "player_names",
+    metadata,
+    sqlalchemy.Column("name", sqlalchemy.String, primary_key=True),
 )
 
 player_table = sqlalchemy.Table(
@@ -39,6 +78,25 @@ player_table = sqlalchemy.Table(
     sqlalchemy.Column("hp", sqlalchemy.Integer),
     sqlalchemy.Column("maxhp", sqlalchemy.Integer),
     sqlalchemy.Column("connectedinventory", sqlalchemy.Integer, sqlalchemy.ForeignKey("inventory.id")),
+    sqlalchemy.Column(
+        "last_active_at",
+        sqlalchemy.DateTime(timezone=True),
+        server_default=sqlalchemy.func.now(),
+    ),
+    sqlalchemy.Column("deleted_at", sqlalchemy.DateTime(timezone=True)),
+    sqlalchemy.Index(
+        "ix_players_name",
+        "name",
+        unique=True,
+        postgresql_where=sqlalchemy.text("deleted_at IS NULL"),
+    ),
+    sqlalchemy.Index("ix_players_connectedinventory", "connectedinventory"),
+    sqlalchemy.Index("ix_players_last_active_at", "last_active_at"),
+    sqlalchemy.Index(
+        "ix_players_regenerating",
+        "id",
+        postgresql_where=sqlalchemy.text("hp < maxhp AND deleted_at IS NULL"),
+    ),
 )
 
 user_table = sqlalchemy.Table(
@@ -49,11 +107,269 @@ user_table = sqlalchemy.Table(
     sqlalchemy.Column("password", sqlalchemy.String),
 )
 
-db_uri = (
-    f"postgresql+asyncpg://{config.DB_USER}:{config.DB_PASSWORD}"
-    f"@{config.DB_HOST}/{config.DB_NAME}"
+user_session_table = sqlalchemy.Table(
+    "user_sessions",
+    metadata,
+    sqlalchemy.Column("id", UUID(as_uuid=True), primary_key=True),
+    sqlalchemy.Column(
+        "user_id",
+        UUID(as_uuid=True),
+        sqlalchemy.ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    ),
+    sqlalchemy.Column("refresh_hash", sqlalchemy.String, nullable=False),
+    sqlalchemy.Column("expires_at", sqlalchemy.DateTime(timezone=True), nullable=False),
+    sqlalchemy.Column("revoked_at", sqlalchemy.DateTime(timezone=True), nullable=True),
+    # Przy starcie wczytywane są tylko niedawno unieważnione sesje.
+    sqlalchemy.Index(
+        "ix_user_sessions_revoked_at",
+        "revoked_at",
+        postgresql_where=sqlalchemy.text("revoked_at IS NOT NULL"),
+    ),
+)
+
+inventory_ledger_table = sqlalchemy.Table(
+    "inventory_ledger",
+    metadata,
+    sqlalchemy.Column("id", sqlalchemy.BigInteger, sqlalchemy.Identity(), primary_key=True),
+    sqlalchemy.Column(
+        "created_at",
+        sqlalchemy.DateTime(timezone=True),
+        primary_key=True,
+        server_default=sqlalchemy.func.now(),
+    ),
+    sqlalchemy.Column("inventory_id", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Column("item_id", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Column("delta", sqlalchemy.BigInteger, nullable=False),
+    sqlalchemy.Column("reason", sqlalchemy.String, nullable=False),
+    sqlalchemy.Index("ix_inventory_ledger_inventory", "inventory_id", "created_at"),
+    postgresql_partition_by="RANGE (created_at)",
+)
+
+inventory_snapshot_table = sqlalchemy.Table(
+    "inventory_snapshots",
+    metadata,
+    sqlalchemy.Column("inventory_id", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column("covered_until", sqlalchemy.DateTime(timezone=True), primary_key=True),
+    sqlalchemy.Column("item_id", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column("quantity", sqlalchemy.BigInteger, nullable=False),
+)
+
+loot_table_table = sqlalchemy.Table(
+    "loot_tables",
+    metadata,
+    sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column("name", sqlalchemy.String, nullable=False, unique=True),
+    sqlalchemy.Column("empty_weight", sqlalchemy.Float, nullable=False),
+)
+
+loot_entry_table = sqlalchemy.Table(
+    "loot_entries",
+    metadata,
+    sqlalchemy.Column(
+        "loot_table_id",
+        sqlalchemy.Integer,
+        sqlalchemy.ForeignKey("loot_tables.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    sqlalchemy.Column(
+        "item_id",
+        sqlalchemy.Integer,
+        sqlalchemy.ForeignKey("items.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    sqlalchemy.Column("weight", sqlalchemy.Float, nullable=False),
+    sqlalchemy.Index("ix_loot_entries_item_id", "item_id"),
+)
+
+market_book_table = sqlalchemy.Table(
+    "market_books",
+    metadata,
+    sqlalchemy.Column(
+        "item_id",
+        sqlalchemy.Integer,
+        sqlalchemy.ForeignKey("items.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    sqlalchemy.Column("version", sqlalchemy.BigInteger, nullable=False),
+)
+
+market_order_table = sqlalchemy.Table(
+    "market_orders",
+    metadata,
+    sqlalchemy.Column("id", sqlalchemy.BigInteger, primary_key=True),
+    sqlalchemy.Column("inventory_id", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Column("item_id", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Column("side", sqlalchemy.String(4), nullable=False),
+    sqlalchemy.Column("price", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Column("quantity", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Column("remaining", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Column("status", sqlalchemy.String(9), nullable=False),
+    sqlalchemy.Column(
+        "created_at",
+        sqlalchemy.DateTime(timezone=True),
+        nullable=False,
+        server_default=sqlalchemy.func.now(),
+    ),
+    sqlalchemy.Index(
+        "ix_market_orders_open",
+        "item_id",
+        "id",
+        postgresql_where=sqlalchemy.text("status = 'open'"),
+    ),
+)
+
+recipe_table = sqlalchemy.Table(
+    "recipes",
+    metadata,
+    sqlalchemy.Column("id", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column("name", sqlalchemy.String, nullable=False, unique=True),
+    sqlalchemy.Column("money", sqlalchemy.Integer, nullable=False),
+)
+
+recipe_item_table = sqlalchemy.Table(
+    "recipe_items",
+    metadata,
+    sqlalchemy.Column(
+        "recipe_id",
+        sqlalchemy.Integer,
+        sqlalchemy.ForeignKey("recipes.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    sqlalchemy.Column("produced", sqlalchemy.Boolean, primary_key=True),
+    sqlalchemy.Column(
+        "item_id",
+        sqlalchemy.Integer,
+        sqlalchemy.ForeignKey("items.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    sqlalchemy.Column("quantity", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Index("ix_recipe_items_item_id", "item_id"),
+)
+
+market_trade_table = sqlalchemy.Table(
+    "market_trades",
+    metadata,
+    sqlalchemy.Column("id", sqlalchemy.BigInteger, primary_key=True),
+    sqlalchemy.Column("item_id", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Column("buy_order_id", sqlalchemy.BigInteger, nullable=False),
+    sqlalchemy.Column("sell_order_id", sqlalchemy.BigInteger, nullable=False),
+    sqlalchemy.Column("price", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Column("quantity", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Column(
+        "created_at",
+        sqlalchemy.DateTime(timezone=True),
+        nullable=False,
+        server_default=sqlalchemy.func.now(),
+    ),
+)
+
+rate_limit_table = sqlalchemy.Table(
+    "rate_limit_buckets",
+    metadata,
+    sqlalchemy.Column("key", sqlalchemy.String, primary_key=True),
+    sqlalchemy.Column("tokens", sqlalchemy.Float),
+    sqlalchemy.Column("updated_at", sqlalchemy.Float),
+    sqlalchemy.Column("allowed", sqlalchemy.Boolean),
+    prefixes=["UNLOGGED"],
 )
 
+idempotency_table = sqlalchemy.Table(
+    "idempotency_responses",
+    metadata,
+    sqlalchemy.Column("key", sqlalchemy.String, primary_key=True),
+    sqlalchemy.Column("fingerprint", sqlalchemy.LargeBinary, nullable=False),
+    sqlalchemy.Column("status_code", sqlalchemy.Integer, nullable=False),
+    sqlalchemy.Column("headers", sqlalchemy.JSON, nullable=False),
+    sqlalchemy.Column("body", sqlalchemy.LargeBinary, nullable=False),
+    sqlalchemy.Column(
+        "expires_at",
+        sqlalchemy.DateTime(timezone=True),
+        nullable=False,
+        index=True,
+    ),
+)
+
+# Usuwa z listy przedmiotów podane ilości (pierwsze wystąpienia zostają
+# usunięte, kolejność reszty zachowana) lub zwraca NULL, gdy czegoś brakuje.
+# Stan istniejącego indeksu: odcisk definicji z komentarza, unikalność
+# i częściowość (indeks z warunkiem WHERE).
+INDEX_DEFINITION_QUERY = sqlalchemy.text(
+    """
+    SELECT
+        obj_description(i.indexrelid, 'pg_class') AS fingerprint,
+        i.indisunique AS is_unique,
+        i.indpred IS NOT NULL AS is_partial
+    FROM pg_index i
+    WHERE i.indexrelid = to_regclass(:name)
+    """
+)
+
+ITEMLIST_CONSUME_FUNCTION = """
+CREATE OR REPLACE FUNCTION itemlist_consume(
+    itemlist text,
+    item_ids integer[],
+    quantities integer[]
+) RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    WITH tokens AS (
+        SELECT
+            trim(listed.token) AS token,
+            listed.ordinal,
+            row_number() OVER (
+                PARTITION BY trim(listed.token)
+                ORDER BY listed.ordinal
+            ) AS occurrence
+        FROM unnest(string_to_array(coalesce(itemlist, ''), ','))
+            WITH ORDINALITY AS listed(token, ordinal)
+    ),
+    needed AS (
+        SELECT CAST(required.item_id AS text) AS token, sum(required.quantity) AS quantity
+        FROM unnest(item_ids, quantities) AS required(item_id, quantity)
+        GROUP BY required.item_id
+    )
+    SELECT CASE
+        WHEN EXISTS (
+            SELECT 1
+            FROM needed
+            WHERE needed.quantity > (
+                SELECT count(*) FROM tokens WHERE tokens.token = needed.token
+            )
+        ) THEN NULL
+        ELSE coalesce(
+            (
+                SELECT string_agg(tokens.token, ',' ORDER BY tokens.ordinal)
+                FROM tokens
+                LEFT JOIN needed ON needed.token = tokens.token
+                WHERE tokens.occurrence > coalesce(needed.quantity, 0)
+                    AND tokens.token <> ''
+            ),
+            ''
+        )
+    END
+$$
+"""
+
+# Tabele rozpraszane między shardy, w kolejności tworzenia.
+SHARDED_TABLES = [inventory_table, player_table]
+
+
+def host_uri(host: str | None, driver: str = "postgresql+asyncpg") -> str:
+    """Adres bazy danych na podanym hoście.
+
+    Args:
+        host (str | None): Host bazy danych.
+        driver (str): Sterownik SQLAlchemy.
+
+    Returns:
+        str: Adres bazy danych.
+    """
+    return f"{driver}://{config.DB_USER}:{config.DB_PASSWORD}@{host}/{config.DB_NAME}"
+
+
+db_uri = host_uri(config.DB_HOST)
+
 engine = create_async_engine(
     db_uri,
     echo=True,
@@ -63,7 +379,73 @@ engine = create_async_engine(
 
 database = databases.Database(
     db_uri,
-    force_rollback=True,
+    force_rollback=config.DB_FORCE_ROLLBACK,
+)
+
+replica_databases = [
+    databases.Database(host_uri(replica_host))
+    for replica_host in config.DB_REPLICA_HOSTS
+]
+
+
+
+def _guarded(source: databases.Database) -> databases.Database | GuardedDatabase:
+    """Owinięcie bazy ogranicznikiem współbieżności, bezpiecznikiem
+    i limitem czasu żądania.
+
+    Args:
+        source (databases.Database): Baza główna lub replika.
+
+    Returns:
+        databases.Database | GuardedDatabase: Baza chroniona przed
+            przeciążeniem, jeśli ochrona jest włączona.
+    """
+    if not config.DB_GUARD_ENABLED:
+        return GuardedDatabase(source) if config.DEADLINES_ENABLED else source
+
+    return GuardedDatabase(
+        source,
+        AdaptiveLimiter(
+            initial_limit=config.DB_LIMIT_INITIAL,
+            min_limit=config.DB_LIMIT_MIN,
+            max_limit=config.DB_LIMIT_MAX,
+            target_latency=config.DB_TARGET_LATENCY_SECONDS,
+            max_queue=config.DB_MAX_QUEUE,
+            queue_timeouts=tuple(config.DB_QUEUE_TIMEOUTS),
+        ),
+        CircuitBreaker(
+            failure_threshold=config.DB_BREAKER_FAILURES,
+            reset_seconds=config.DB_BREAKER_RESET_SECONDS,
+        ),
+    )
+
+
+db_router = DatabaseRouter(
+    _guarded(database),
+    [_guarded(replica) for replica in replica_databases],
+    sticky_seconds=config.DB_REPLICA_STICKY_SECONDS,
+    check_seconds=config.DB_REPLICA_CHECK_SECONDS,
+)
+
+shard_hosts = config.SHARD_HOSTS if config.SHARDING_ENABLED else []
+
+shard_router = ShardRouter(
+    {
+        str(config.DB_HOST): db_router,
+        **{
+            shard_host: DatabaseRouter(
+                _guarded(databases.Database(
+                    host_uri(shard_host),
+                    force_rollback=config.DB_FORCE_ROLLBACK,
+                )),
+                [],
+            )
+            for shard_host in shard_hosts
+        },
+    },
+    buckets=config.SHARD_BUCKETS,
+    virtual_nodes=config.SHARD_VIRTUAL_NODES,
+    enabled=config.SHARDING_ENABLED,
 )
 
 
@@ -79,6 +461,10 @@ async def init_db(retries: int = 5, delay: int = 5) -> None:
         try:
             async with engine.begin() as conn:
                 await conn.run_sync(metadata.create_all)
+                await conn.run_sync(_add_missing_columns)
+                await conn.run_sync(_create_missing_indexes)
+                await conn.run_sync(_create_functions)
+                await conn.run_sync(_init_catalog_version)
             return
         except (
             OperationalError,
@@ -90,3 +476,130 @@ async def init_db(retries: int = 5, delay: int = 5) -> None:
             await asyncio.sleep(delay)
 
     raise ConnectionError("Could not connect to DB after several retries.")
+
+
+async def init_shards(hosts: list[str] | None = None) -> None:
+    """Utworzenie tabel playerów i inventory w dodatkowych shardach.
+
+    Args:
+        hosts (list[str] | None): Hosty shardów, domyślnie `SHARD_HOSTS`.
+    """
+    for shard_host in shard_hosts if hosts is None else hosts:
+        shard_engine = create_async_engine(host_uri(shard_host), future=True)
+        try:
+            async with shard_engine.begin() as conn:
+                await conn.run_sync(create_sharded_tables)
+        finally:
+            await shard_engine.dispose()
+
+
+def create_sharded_tables(connection: sqlalchemy.Connection) -> None:
+    """Utworzenie tabel rozpraszanych między shardy wraz z funkcjami.
+
+    Args:
+        connection (sqlalchemy.Connection): Synchroniczne połączenie z DB.
+    """
+    metadata.create_all(connection, tables=SHARDED_TABLES)
+    _add_missing_columns(connection, SHARDED_TABLES)
+    _create_missing_indexes(connection, SHARDED_TABLES)
+    _create_functions(connection)
+
+
+def _add_missing_columns(
+    connection: sqlalchemy.Connection,
+    tables: list[sqlalchemy.Table] | None = None,
+) -> None:
+    """Dodanie kolumn dodanych do już istniejących tabel.
+
+    Args:
+        connection (sqlalchemy.Connection): Synchroniczne połączenie z DB.
+        tables (list[sqlalchemy.Table] | None): Tabele, domyślnie wszystkie.
+    """
+    inspector = sqlalchemy.inspect(connection)
+    for table in tables or metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing:
+                definition = CreateColumn(column).compile(dialect=connection.dialect)
+                connection.execute(sqlalchemy.text(
+                    f"ALTER TABLE {table.name} ADD COLUMN IF NOT EXISTS {definition}"
+                ))
+
+
+def _create_missing_indexes(
+    connection: sqlalchemy.Connection,
+    tables: list[sqlalchemy.Table] | None = None,
+) -> None:
+    """Utworzenie indeksów dodanych do już istniejących tabel
+    i odtworzenie indeksów, których definicja się zmieniła.
+
+    `create_all` pomija istniejące tabele razem z ich indeksami, a indeks
+    o istniejącej nazwie nie jest porównywany z definicją. Odcisk definicji
+    jest więc zapisywany w komentarzu indeksu. Indeks z innym odciskiem
+    jest usuwany i tworzony od nowa; indeks sprzed odcisków tylko wtedy,
+    gdy różni się unikalnością lub częściowością.
+
+    Args:
+        connection (sqlalchemy.Connection): Synchroniczne połączenie z DB.
+        tables (list[sqlalchemy.Table] | None): Tabele, domyślnie wszystkie.
+    """
+    for table in tables or metadata.sorted_tables:
+        for index in table.indexes:
+            definition = CreateIndex(index).compile(dialect=connection.dialect)
+            fingerprint = hashlib.sha1(str(definition).encode()).hexdigest()
+            existing = connection.execute(INDEX_DEFINITION_QUERY, {"name": index.name}).first()
+
+            if existing is None:
+                index.create(connection)
+            elif existing.fingerprint == fingerprint:
+                continue
+            elif existing.fingerprint is not None or (
+                existing.is_unique != bool(index.unique)
+                or existing.is_partial != (index.dialect_options["postgresql"]["where"] is not None)
+            ):
+                print(f"Recreating index {index.name} with a changed definition.")
+                index.drop(connection)
+                index.create(connection)
+
+            connection.execute(sqlalchemy.text(
+                f"COMMENT ON INDEX {index.name} IS '{fingerprint}'"
+            ))
+
+
+def _create_functions(connection: sqlalchemy.Connection) -> None:
+    """Utworzenie lub podmiana funkcji SQL używanych przez repozytoria.
+
+    Args:
+        connection (sqlalchemy.Connection): Synchroniczne połączenie z DB.
+    """
+    connection.execute(sqlalchemy.text(ITEMLIST_CONSUME_FUNCTION))
+
+
+def _init_catalog_version(connection: sqlalchemy.Connection) -> None:
+    """Utworzenie wiersza licznika wersji katalogu przedmiotów.
+
+    Licznik startuje od najnowszej zapisanej zmiany, więc wersje znane
+    już klientom pozostają ważne.
+
+    Args:
+        connection (sqlalchemy.Connection): Synchroniczne połączenie z DB.
+    """
+    connection.execute(sqlalchemy.text(
+        "INSERT INTO catalog_version (id, version) "
+        "SELECT 1, coalesce(max(version), 0) FROM item_changes "
+        "ON CONFLICT (id) DO NOTHING"
+    ))
+
+
+async def connect_raw() -> asyncpg.Connection:
+    """Otwarcie dedykowanego połączenia asyncpg poza pulą `database`.
+
+    Returns:
+        asyncpg.Connection: Nowe połączenie z DB.
+    """
+    return await asyncpg.connect(
+        host=config.DB_HOST,
+        database=config.DB_NAME,
+        user=config.DB_USER,
+        password=config.DB_PASSWORD,
+    )
@@ -0,0 +1,19 @@
+"""A module containing DTO models for user tokens."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+
+class TokenDTO(BaseModel):
+    """A DTO model for the issued tokens."""
+    token_type: str = "bearer"
+    user_token: str
+    expires: datetime
+    refresh_token: str
+    refresh_expires: datetime
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
@@ -0,0 +1,101 @@
+"""Module containing shared idempotency database repository implementation."""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.core.domain.idempotency import IdempotentResponse
+from src.core.repositories.iidempotency import IIdempotencyRepository
+from src.db import db_router, idempotency_table
+
+# The number of expired responses deleted along with every save.
+EVICT_BATCH = 100
+
+
+class IdempotencyRepository(IIdempotencyRepository):
+    """A class implementing replayable responses shared by all workers."""
+
+    def __init__(self, ttl_seconds: float = 86400) -> None:
+        """The initializer of the `idempotency repository`.
+
+        Args:
+            ttl_seconds (float): How long a response can be replayed.
+        """
+
+        self._ttl = timedelta(seconds=ttl_seconds)
+
+    async def get_response(self, key: str) -> IdempotentResponse | None:
+        """The method getting a stored response.
+
+        The primary is read, because a retry usually follows the first
+        attempt closer than replicas catch up.
+
+        Args:
+            key (str): The idempotency key.
+
+        Returns:
+            IdempotentResponse | None: The response if not expired.
+        """
+
+        query = (
+            idempotency_table.select()
+            .where(idempotency_table.c.key == key)
+            .where(idempotency_table.c.expires_at > func.now())
+        )
+        stored = await db_router.primary.fetch_one(query)
+
+        if stored is None:
+            return None
+
+        return IdempotentResponse(
+            fingerprint=stored["fingerprint"],
+            status_code=stored["status_code"],
+            headers=[
+                (name.encode("latin-1"), value.encode("latin-1"))
+                for name, value in stored["headers"]
+            ],
+            body=stored["body"],
+        )
+
+    async def save_response(self, key: str, response: IdempotentResponse) -> None:
+        """The method storing a response.
+
+        A live response stored by another worker is kept, so every retry
+        replays the first one; an expired one is replaced.
+
+        Args:
+            key (str): The idempotency key.
+            response (IdempotentResponse): The response to be replayed.
+        """
+
+        query = insert(idempotency_table).values(
+            key=key,
+            fingerprint=response.fingerprint,
+            status_code=response.status_code,
+            headers=[
+                [name.decode("latin-1"), value.decode("latin-1")]
+                for name, value in response.headers
+            ],
+            body=response.body,
+            expires_at=datetime.now(timezone.utc) + self._ttl,
+        )
+        query = query.on_conflict_do_update(
+            index_elements=[idempotency_table.c.key],
+            set_={
+                column: query.excluded[column]
+                for column in ("fingerprint", "status_code", "headers", "body", "expires_at")
+            },
+            where=idempotency_table.c.expires_at <= func.now(),
+        )
+
+        await db_router.primary.execute(query)
+        await db_router.primary.execute(
+            idempotency_table.delete().where(
+                idempotency_table.c.key.in_(
+                    select(idempotency_table.c.key)
+                    .where(idempotency_table.c.expires_at <= func.now())
+                    .limit(EVICT_BATCH)
+                )
+            )
+        )
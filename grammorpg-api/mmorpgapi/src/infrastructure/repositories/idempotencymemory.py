@@ -0,0 +1,72 @@
+"""Module containing in-process idempotency repository implementation."""
+
+import time
+from collections import OrderedDict
+
+from src.core.domain.idempotency import IdempotentResponse
+from src.core.repositories.iidempotency import IIdempotencyRepository
+
+
+class IdempotencyMemoryRepository(IIdempotencyRepository):
+    """A class implementing a TTL bounded store of replayable responses."""
+
+    _responses: OrderedDict[str, tuple[float, IdempotentResponse]]
+
+    def __init__(self, ttl_seconds: float = 86400, max_entries: int = 100_000) -> None:
+        """The initializer of the `idempotency repository`.
+
+        Args:
+            ttl_seconds (float): How long a response can be replayed.
+            max_entries (int): The number of responses kept at most.
+        """
+
+        self._responses = OrderedDict()
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+
+    async def get_response(self, key: str) -> IdempotentResponse | None:
+        """The method getting a stored response.
+
+        Args:
+            key (str): The idempotency key.
+
+        Returns:
+            IdempotentResponse | None: The response if not expired.
+        """
+
+        self._evict(time.monotonic())
+        entry = self._responses.get(key)
+
+        return entry[1] if entry else None
+
+    async def save_response(self, key: str, response: IdempotentResponse) -> None:
+        """The method storing a response.
+
+        Args:
+            key (str): The idempotency key.
+            response (IdempotentResponse): The response to be replayed.
+        """
+
+        now = time.monotonic()
+        self._evict(now)
+
+        self._responses.pop(key, None)
+        self._responses[key] = (now + self._ttl_seconds, response)
+        if len(self._responses) > self._max_entries:
+            self._responses.popitem(last=False)
+
+    def _evict(self, now: float) -> None:
+        """A private method dropping expired responses.
+
+        Entries are kept in insertion order with the same TTL, so the
+        expired ones are always at the front.
+
+        Args:
+            now (float): The current monotonic time.
+        """
+
+        while self._responses:
+            expires, _ = next(iter(self._responses.values()))
+            if expires > now:
+                return
+            self._responses.popitem(last=False)
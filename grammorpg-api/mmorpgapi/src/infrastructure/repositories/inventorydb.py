@@ -1,12 +1,33 @@
-from typing import Any
-from asyncpg import Record  # type: ignore
+import asyncio
+from typing import Any, Iterable
+from asyncpg import ForeignKeyViolationError, Record  # type: ignore
+from sqlalchemy import Integer, String, Table, any_, bindparam, exists, false, func, select
+from sqlalchemy.dialects.postgresql import ARRAY
 
-from src.core.domain.inventory import InventoryIn, Inventory
+from src.core.domain.inventory import InventoryBatch, InventoryIn, Inventory, InventoryUpdate
 from src.core.repositories.iinventory import IInventoryRepository
-from src.db import inventory_table, database
+from src.db import inventory_table, player_table, shard_router
+from src.infrastructure.repositories.playernamedb import release_player_names
+from src.infrastructure.utils.itemlist import format_itemlist
+from src.infrastructure.utils.sharding import merge_sorted
 
 class InventoryRepository(IInventoryRepository):
-    """Klasowe repozytorium do zarządzania pozycjami inventory"""
+    """Klasowe repozytorium do zarządzania pozycjami inventory
+
+    Inventory jest przechowywane w shardzie swojego kubełka razem
+    z playerami, którzy z niego korzystają.
+    """
+
+    def __init__(self, soft_delete: bool = False, cascade: bool = True) -> None:
+        """Inicjalizator repozytorium inventory
+
+        Args:
+            soft_delete (bool): Czy usuwanie tylko oznacza wiersze jako usunięte
+            cascade (bool): Czy usunięcie inventory usuwa również jego playerów
+        """
+
+        self._soft_delete = soft_delete
+        self._cascade = cascade
 
     async def add_inventory(self, data: InventoryIn) -> Any | None:
         """Dodaje nową pozycję inventory do bazy danych
@@ -18,52 +39,244 @@ class InventoryRepository(IInventoryRepository):
             Any | None: Nowo utworzona pozycja inventory lub None, jeśli operacja się nie powiodła
         """
 
-        query = inventory_table.insert().values(**data.model_dump())
-        new_inventory_id = await database.execute(query)
-        new_inventory = await self._get_by_id(new_inventory_id)
+        bucket = shard_router.new_bucket()
+        values = data.model_dump()
+        if (new_id := shard_router.new_id(inventory_table, bucket)) is not None:
+            values["id"] = new_id
+        query = inventory_table.insert().values(**values).returning(*inventory_table.c)
+        new_inventory = await shard_router.for_bucket(bucket).writer().fetch_one(query)
 
         return Inventory(**dict(new_inventory)) if new_inventory else None
 
-    async def update_inventory(self, inventory_id: int, data: InventoryIn) -> Any | None:
-        """Aktualizuje istniejącą pozycję inventory
+    async def update_inventory(
+        self,
+        inventory_id: int,
+        data: InventoryIn,
+    ) -> InventoryUpdate | None:
+        """Aktualizuje istniejącą pozycję inventory jednym zapytaniem
+
+        Poprzedni stan jest blokowany i zwracany przez to samo polecenie
+        na bazie głównej, więc odpowiada dokładnie nadpisanemu wierszowi.
 
         Args:
             inventory_id (int): ID pozycji inventory do zaktualizowania
             data (InventoryIn): Zaktualizowane atrybuty pozycji inventory
 
         Returns:
-            Any | None: Zaktualizowana pozycja inventory lub None, jeśli operacja się nie powiodła
+            InventoryUpdate | None: Pozycja inventory przed i po aktualizacji
+                lub None, jeśli nie istnieje
+        """
+
+        old = (
+            select(inventory_table)
+            .where(
+                inventory_table.c.id == inventory_id,
+                inventory_table.c.deleted_at.is_(None),
+            )
+            .with_for_update()
+            .subquery("old")
+        )
+        query = (
+            inventory_table.update()
+            .where(inventory_table.c.id == old.c.id)
+            .values(**data.model_dump())
+            .returning(
+                *(column.label(f"old_{column.name}") for column in old.c),
+                *inventory_table.c,
+            )
+        )
+        row = await shard_router.for_id(inventory_id).writer().fetch_one(query)
+        if not row:
+            return None
+
+        row = dict(row)
+        return InventoryUpdate(
+            before=Inventory(**{column.name: row[f"old_{column.name}"] for column in old.c}),
+            after=Inventory(**row),
+        )
+
+    async def add_items(
+        self,
+        inventory_ids: list[int],
+        itemlists: list[str],
+    ) -> list[tuple[int, str]]:
+        """Dopisuje przedmioty do wielu inventory jednym zapytaniem
+
+        Przedmioty są doklejane do bieżącej listy w bazie, więc równoległe
+        zapisy nie są nadpisywane, a obie tablice są przekazywane jako dwa
+        parametry `unnest` niezależnie od liczby inventory.
+
+        Args:
+            inventory_ids (list[int]): Lista unikalnych ID inventory
+            itemlists (list[str]): Przedmioty dopisywane do każdego inventory
+
+        Returns:
+            list[tuple[int, str]]: ID i nowa lista przedmiotów istniejących inventory
         """
 
-        if await self._get_by_id(inventory_id):
+        itemlist_by_id = dict(zip(inventory_ids, itemlists))
+
+        async def add(shard: Any, ids: list[int]) -> list[Record]:
+            added = func.unnest(
+                bindparam("ids", ids, type_=ARRAY(Integer)),
+                bindparam(
+                    "itemlists",
+                    [itemlist_by_id[inventory_id] for inventory_id in ids],
+                    type_=ARRAY(String),
+                ),
+            ).table_valued("id", "itemlist").render_derived(name="v")
             query = (
                 inventory_table.update()
-                .where(inventory_table.c.id == inventory_id)
-                .values(**data.model_dump())
+                .where(
+                    inventory_table.c.id == added.c.id,
+                    inventory_table.c.deleted_at.is_(None),
+                )
+                .values(
+                    itemlist=func.concat_ws(
+                        ",",
+                        func.nullif(inventory_table.c.itemlist, ""),
+                        func.nullif(added.c.itemlist, ""),
+                    ),
+                )
+                .returning(inventory_table.c.id, inventory_table.c.itemlist)
             )
-            await database.execute(query)
+            return await shard.writer().fetch_all(query)
 
-            inventory = await self._get_by_id(inventory_id)
-            return Inventory(**dict(inventory)) if inventory else None
+        results = await asyncio.gather(*(
+            add(shard, ids) for shard, ids in shard_router.group(inventory_ids)
+        ))
 
-        return None
+        return [(row["id"], row["itemlist"]) for rows in results for row in rows]
 
-    async def remove_inventory(self, inventory_id: int) -> bool:
-        """Usuwa pozycję inventory z bazy danych
+    async def exchange_items(
+        self,
+        inventory_id: int,
+        money: int,
+        consumed: dict[int, int],
+        produced: dict[int, int],
+    ) -> Inventory | None:
+        """Wymienia pieniądze i przedmioty inventory jednym warunkowym zapytaniem
+
+        Zużywane przedmioty są usuwane funkcją `itemlist_consume` po stronie
+        bazy, a wytworzone doklejane do wyniku, więc nie ma odczytu przed
+        zapisem. Warunek w WHERE odrzuca zapis, gdy brakuje pieniędzy lub
+        któregokolwiek przedmiotu, a blokada wiersza serializuje wymiany.
+
+        Args:
+            inventory_id (int): ID inventory
+            money (int): Zużywane pieniądze
+            consumed (dict[int, int]): Zużywane ilości według ID przedmiotu
+            produced (dict[int, int]): Wytwarzane ilości według ID przedmiotu
+
+        Returns:
+            Inventory | None: Inventory po wymianie lub None, jeśli nie istnieje
+                albo brakuje w nim pieniędzy lub przedmiotów
+        """
+
+        remaining = func.itemlist_consume(
+            inventory_table.c.itemlist,
+            bindparam("consumed_ids", list(consumed), type_=ARRAY(Integer)),
+            bindparam("consumed_quantities", list(consumed.values()), type_=ARRAY(Integer)),
+            type_=String,
+        )
+        query = (
+            inventory_table.update()
+            .where(
+                inventory_table.c.id == inventory_id,
+                inventory_table.c.deleted_at.is_(None),
+                inventory_table.c.money >= money,
+                remaining.is_not(None),
+            )
+            .values(
+                money=inventory_table.c.money - money,
+                itemlist=func.concat_ws(
+                    ",",
+                    func.nullif(remaining, ""),
+                    func.nullif(format_itemlist(produced), ""),
+                ),
+            )
+            .returning(inventory_table)
+        )
+        row = await shard_router.for_id(inventory_id).writer().fetch_one(query)
+
+        return Inventory(**dict(row)) if row else None
+
+    async def remove_inventory(self, inventory_id: int) -> list[int] | None:
+        """Usuwa pozycję inventory z bazy danych jednym zapytaniem
+
+        Playerzy korzystający z inventory są blokowani i, przy włączonej
+        kaskadzie, usuwani w tym samym poleceniu. Bez kaskady inventory
+        używane przez playera nie jest usuwane.
 
         Args:
             inventory_id (int): ID pozycji inventory do usunięcia
 
+        Raises:
+            ValueError: Jeśli inventory jest używane przez playera, a kaskada
+                jest wyłączona
+
         Returns:
-            bool: Powodzenie operacji usuwania
+            list[int] | None: ID playerów usuniętych razem z inventory lub
+                None, jeśli inventory nie istnieje
         """
 
-        if await self._get_by_id(inventory_id):
-            query = inventory_table.delete().where(inventory_table.c.id == inventory_id)
-            await database.execute(query)
-            return True
+        referencing_query = (
+            select(player_table.c.id, player_table.c.name, player_table.c.deleted_at)
+            .where(player_table.c.connectedinventory == inventory_id)
+            .with_for_update()
+        )
+        if self._soft_delete:
+            referencing_query = referencing_query.where(player_table.c.deleted_at.is_(None))
+        referencing = referencing_query.cte("referencing")
+
+        removed_query = self._remove_query(inventory_table).where(
+            inventory_table.c.id == inventory_id,
+            inventory_table.c.deleted_at.is_(None),
+        )
+        if self._cascade:
+            removed = removed_query.returning(inventory_table.c.id).cte("removed")
+            removed_players = (
+                self._remove_query(player_table)
+                .where(
+                    player_table.c.id.in_(select(referencing.c.id)),
+                    exists(select(removed.c.id)),
+                )
+                .returning(player_table.c.id)
+                .cte("removed_players")
+            )
+            player_ids = select(func.array_agg(removed_players.c.id))
+            names = select(func.array_agg(referencing.c.name)).where(
+                referencing.c.id.in_(select(removed_players.c.id)),
+                referencing.c.deleted_at.is_(None),
+            )
+        else:
+            removed = (
+                removed_query.where(~exists(select(referencing.c.id)))
+                .returning(inventory_table.c.id)
+                .cte("removed")
+            )
+            player_ids = select(func.array_agg(referencing.c.id))
+            names = select(func.array_agg(referencing.c.name)).where(false())
+
+        query = select(
+            exists(select(removed.c.id)).label("removed"),
+            player_ids.scalar_subquery().label("player_ids"),
+            names.scalar_subquery().label("names"),
+        )
+
+        try:
+            row = await shard_router.for_id(inventory_id).writer().fetch_one(query)
+        except ForeignKeyViolationError:
+            raise ValueError(f"Inventory with ID {inventory_id} is used by a player.")
+
+        if row["removed"]:
+            await release_player_names(row["names"] or [])
+            return row["player_ids"] or []
 
-        return False
+        if row["player_ids"]:
+            raise ValueError(f"Inventory with ID {inventory_id} is used by a player.")
+
+        return None
 
     async def show_inventory_by_id(self, inventory_id: int) -> Any | None:
         """Pobiera pozycję inventory po jej ID
@@ -78,11 +291,89 @@ class InventoryRepository(IInventoryRepository):
         inventory = await self._get_by_id(inventory_id)
         return Inventory(**dict(inventory)) if inventory else None
 
-    async def _get_by_id(self, inventory_id: int) -> Record | None:
+    async def get_all_inventory(self) -> Iterable[Any]:
+        """Pobiera wszystkie pozycje inventory
+
+        Returns:
+            Iterable[Any]: Kolekcja wszystkich pozycji inventory
+        """
+
+        query = (
+            inventory_table.select()
+            .where(inventory_table.c.deleted_at.is_(None))
+            .order_by(inventory_table.c.id.asc())
+        )
+        results = await shard_router.gather(lambda shard: shard.reader().fetch_all(query))
+        inventories = merge_sorted(results, key=lambda inventory: inventory["id"])
+
+        return [Inventory(**dict(inventory)) for inventory in inventories]
+
+    async def get_inventory_page(self, after_id: int, limit: int) -> Iterable[Any]:
+        """Pobiera stronę pozycji inventory o ID większym niż `after_id`
+
+        Każdy shard zwraca co najwyżej `limit` kolejnych pozycji, a strona
+        to pierwsze `limit` ID po scaleniu, więc żadna pozycja nie jest
+        pominięta ani powtórzona między stronami.
+
+        Args:
+            after_id (int): ID ostatniej pozycji poprzedniej strony
+            limit (int): Maksymalna liczba pozycji na stronie
+
+        Returns:
+            Iterable[Any]: Pozycje inventory posortowane po ID
+        """
+
+        query = (
+            inventory_table.select()
+            .where(inventory_table.c.id > after_id, inventory_table.c.deleted_at.is_(None))
+            .order_by(inventory_table.c.id.asc())
+            .limit(limit)
+        )
+        results = await shard_router.gather(lambda shard: shard.reader().fetch_all(query))
+        inventories = merge_sorted(results, key=lambda inventory: inventory["id"])[:limit]
+
+        return [Inventory(**dict(inventory)) for inventory in inventories]
+
+    async def get_many_by_ids(self, inventory_ids: list[int]) -> InventoryBatch:
+        """Pobiera wiele pozycji inventory jednym zapytaniem
+
+        Args:
+            inventory_ids (list[int]): Lista ID pozycji inventory
+
+        Returns:
+            InventoryBatch: Pozycje inventory w kolejności ID oraz brakujące ID
+        """
+
+        unique_ids = list(dict.fromkeys(inventory_ids))
+
+        async def fetch(shard: Any, ids: list[int]) -> list[Record]:
+            query = inventory_table.select().where(
+                inventory_table.c.id == any_(bindparam("ids", ids, type_=ARRAY(Integer))),
+                inventory_table.c.deleted_at.is_(None),
+            )
+            return await shard.reader().fetch_all(query)
+
+        results = await asyncio.gather(*(
+            fetch(shard, ids) for shard, ids in shard_router.group(unique_ids)
+        ))
+        found = {inventory["id"]: inventory for rows in results for inventory in rows}
+
+        return InventoryBatch(
+            inventories=[
+                Inventory(**dict(found[inventory_id]))
+                for inventory_id in unique_ids if inventory_id in found
+            ],
+            missing=[
+                inventory_id for inventory_id in unique_ids if inventory_id not in found
+            ],
+        )
+
+    async def _get_by_id(self, inventory_id: int, primary: bool = False) -> Record | None:
         """Prywatna metoda pobierania pozycji inventory po jej ID
 
         Args:
             inventory_id (int): ID pozycji inventory
+            primary (bool): Czy czytać z bazy głównej, np. przy zapisie
 
         Returns:
             Record | None: Pozycja inventory, jeśli istnieje, lub None
@@ -90,7 +381,27 @@ class InventoryRepository(IInventoryRepository):
 
         query = (
             inventory_table.select()
-            .where(inventory_table.c.id == inventory_id)
+            .where(
+                inventory_table.c.id == inventory_id,
+                inventory_table.c.deleted_at.is_(None),
+            )
         )
+        shard = shard_router.for_id(inventory_id)
+        source = shard.writer() if primary else shard.reader()
+
+        return await source.fetch_one(query)
+
+    def _remove_query(self, table: Table) -> Any:
+        """Prywatna metoda budująca usunięcie lub oznaczenie wierszy jako usuniętych
+
+        Args:
+            table (Table): Tabela, z której usuwane są wiersze
+
+        Returns:
+            Any: Zapytanie DELETE lub UPDATE ustawiające `deleted_at`
+        """
+
+        if self._soft_delete:
+            return table.update().values(deleted_at=func.now())
 
-        return await database.fetch_one(query)
+        return table.delete()
@@ -0,0 +1,271 @@
+"""Moduł zawierający implementację repozytorium inventory w pamięci procesu."""
+
+from datetime import datetime, timezone
+from typing import Any, Iterable
+
+from src.core.domain.inventory import Inventory, InventoryBatch, InventoryIn, InventoryUpdate
+from src.core.repositories.iinventory import IInventoryRepository
+from src.infrastructure.utils.itemlist import (
+    consume_itemlist,
+    format_itemlist,
+    join_itemlists,
+)
+from src.infrastructure.utils.memorystore import MemoryStore, MemoryTable
+
+
+class InventoryMemoryRepository(IInventoryRepository):
+    """Klasowe repozytorium inventory przechowywanego w pamięci procesu
+
+    Metody nie oddają sterowania między odczytem a zapisem, więc każda
+    z nich jest atomowa względem innych zadań pętli zdarzeń.
+    """
+
+    def __init__(
+        self,
+        store: MemoryStore,
+        soft_delete: bool = False,
+        cascade: bool = True,
+    ) -> None:
+        """Inicjalizator repozytorium inventory
+
+        Args:
+            store (MemoryStore): Tabele współdzielone z innymi repozytoriami
+            soft_delete (bool): Czy usuwanie tylko oznacza wiersze jako usunięte
+            cascade (bool): Czy usunięcie inventory usuwa również jego playerów
+        """
+
+        self._inventories = store.inventories
+        self._players = store.players
+        self._soft_delete = soft_delete
+        self._cascade = cascade
+
+    async def add_inventory(self, data: InventoryIn) -> Any | None:
+        """Dodaje nową pozycję inventory
+
+        Args:
+            data (InventoryIn): Atrybuty nowej pozycji inventory
+
+        Returns:
+            Any | None: Nowo utworzona pozycja inventory
+        """
+
+        inventory = self._inventories.put({
+            **data.model_dump(),
+            "id": self._inventories.new_id(),
+            "deleted_at": None,
+        })
+
+        return Inventory(**inventory)
+
+    async def update_inventory(
+        self,
+        inventory_id: int,
+        data: InventoryIn,
+    ) -> InventoryUpdate | None:
+        """Aktualizuje istniejącą pozycję inventory
+
+        Args:
+            inventory_id (int): ID pozycji inventory do zaktualizowania
+            data (InventoryIn): Zaktualizowane atrybuty pozycji inventory
+
+        Returns:
+            InventoryUpdate | None: Pozycja inventory przed i po aktualizacji
+                lub None, jeśli nie istnieje
+        """
+
+        if not (inventory := self._get_live(inventory_id)):
+            return None
+
+        return InventoryUpdate(
+            before=Inventory(**inventory),
+            after=Inventory(**self._inventories.put({**inventory, **data.model_dump()})),
+        )
+
+    async def add_items(
+        self,
+        inventory_ids: list[int],
+        itemlists: list[str],
+    ) -> list[tuple[int, str]]:
+        """Dopisuje przedmioty do wielu inventory
+
+        Args:
+            inventory_ids (list[int]): Lista unikalnych ID inventory
+            itemlists (list[str]): Przedmioty dopisywane do każdego inventory
+
+        Returns:
+            list[tuple[int, str]]: ID i nowa lista przedmiotów istniejących inventory
+        """
+
+        added = []
+        for inventory_id, itemlist in zip(inventory_ids, itemlists):
+            if inventory := self._get_live(inventory_id):
+                itemlist = join_itemlists(inventory["itemlist"], itemlist)
+                self._inventories.put({**inventory, "itemlist": itemlist})
+                added.append((inventory_id, itemlist))
+
+        return added
+
+    async def exchange_items(
+        self,
+        inventory_id: int,
+        money: int,
+        consumed: dict[int, int],
+        produced: dict[int, int],
+    ) -> Inventory | None:
+        """Wymienia pieniądze i przedmioty inventory
+
+        Args:
+            inventory_id (int): ID inventory
+            money (int): Zużywane pieniądze
+            consumed (dict[int, int]): Zużywane ilości według ID przedmiotu
+            produced (dict[int, int]): Wytwarzane ilości według ID przedmiotu
+
+        Returns:
+            Inventory | None: Inventory po wymianie lub None, jeśli nie istnieje
+                albo brakuje w nim pieniędzy lub przedmiotów
+        """
+
+        inventory = self._get_live(inventory_id)
+        if not inventory or inventory["money"] < money:
+            return None
+
+        remaining = consume_itemlist(inventory["itemlist"], consumed)
+        if remaining is None:
+            return None
+
+        return Inventory(**self._inventories.put({
+            **inventory,
+            "money": inventory["money"] - money,
+            "itemlist": join_itemlists(remaining, format_itemlist(produced)),
+        }))
+
+    async def remove_inventory(self, inventory_id: int) -> list[int] | None:
+        """Usuwa pozycję inventory
+
+        Args:
+            inventory_id (int): ID pozycji inventory do usunięcia
+
+        Raises:
+            ValueError: Jeśli inventory jest używane przez playera, a kaskada
+                jest wyłączona
+
+        Returns:
+            list[int] | None: ID playerów usuniętych razem z inventory lub
+                None, jeśli inventory nie istnieje
+        """
+
+        referencing = [
+            player["id"]
+            for player in self._players.lookup("connectedinventory", inventory_id)
+            if not self._soft_delete or player["deleted_at"] is None
+        ]
+        if referencing and not self._cascade:
+            raise ValueError(f"Inventory with ID {inventory_id} is used by a player.")
+
+        if not self._get_live(inventory_id):
+            return None
+
+        for player_id in referencing:
+            self._remove(self._players, player_id)
+        self._remove(self._inventories, inventory_id)
+
+        return referencing
+
+    async def show_inventory_by_id(self, inventory_id: int) -> Any | None:
+        """Pobiera pozycję inventory po jej ID
+
+        Args:
+            inventory_id (int): ID pozycji inventory do pobrania
+
+        Returns:
+            Any | None: Pozycja inventory, jeśli istnieje, lub None w przeciwnym wypadku
+        """
+
+        inventory = self._get_live(inventory_id)
+        return Inventory(**inventory) if inventory else None
+
+    async def get_all_inventory(self) -> Iterable[Any]:
+        """Pobiera wszystkie pozycje inventory
+
+        Returns:
+            Iterable[Any]: Kolekcja wszystkich pozycji inventory posortowana po ID
+        """
+
+        return [
+            Inventory(**inventory)
+            for inventory in self._inventories.after()
+            if inventory["deleted_at"] is None
+        ]
+
+    async def get_inventory_page(self, after_id: int, limit: int) -> Iterable[Any]:
+        """Pobiera stronę pozycji inventory o ID większym niż `after_id`
+
+        Args:
+            after_id (int): ID ostatniej pozycji poprzedniej strony
+            limit (int): Maksymalna liczba pozycji na stronie
+
+        Returns:
+            Iterable[Any]: Pozycje inventory posortowane po ID
+        """
+
+        page = []
+        for inventory in self._inventories.after(after_id):
+            if len(page) >= limit:
+                break
+            if inventory["deleted_at"] is None:
+                page.append(Inventory(**inventory))
+
+        return page
+
+    async def get_many_by_ids(self, inventory_ids: list[int]) -> InventoryBatch:
+        """Pobiera wiele pozycji inventory naraz
+
+        Args:
+            inventory_ids (list[int]): Lista ID pozycji inventory
+
+        Returns:
+            InventoryBatch: Pozycje inventory w kolejności ID oraz brakujące ID
+        """
+
+        unique_ids = list(dict.fromkeys(inventory_ids))
+        found = {
+            inventory_id: inventory
+            for inventory_id in unique_ids
+            if (inventory := self._get_live(inventory_id))
+        }
+
+        return InventoryBatch(
+            inventories=[
+                Inventory(**found[inventory_id])
+                for inventory_id in unique_ids if inventory_id in found
+            ],
+            missing=[
+                inventory_id for inventory_id in unique_ids if inventory_id not in found
+            ],
+        )
+
+    def _get_live(self, inventory_id: int) -> dict | None:
+        """Prywatna metoda pobierania nieusuniętej pozycji inventory
+
+        Args:
+            inventory_id (int): ID pozycji inventory
+
+        Returns:
+            dict | None: Wiersz inventory, jeśli istnieje, lub None
+        """
+
+        inventory = self._inventories.get(inventory_id)
+        return inventory if inventory and inventory["deleted_at"] is None else None
+
+    def _remove(self, table: MemoryTable, row_id: int) -> None:
+        """Prywatna metoda usuwająca lub oznaczająca wiersz jako usunięty
+
+        Args:
+            table (MemoryTable): Tabela, z której usuwany jest wiersz
+            row_id (int): ID wiersza
+        """
+
+        if self._soft_delete:
+            table.put({**table.get(row_id), "deleted_at": datetime.now(timezone.utc)})
+        else:
+            table.delete(row_id)
@@ -3,10 +3,19 @@
 from typing import Any, Iterable
 
 from asyncpg import Record  # type: ignore
-
-from src.core.domain.item import Item, ItemIn
+from sqlalchemy import Integer, any_, bindparam, func, select
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from src.core.domain.item import (
+    Item,
+    ItemBatch,
+    ItemCatalog,
+    ItemChange,
+    ItemChanges,
+    ItemIn,
+)
 from src.core.repositories.iitem import IItemRepository
-from src.db import item_table, database
+from src.db import catalog_version_table, item_change_table, item_table, db_router
 
 
 class ItemRepository(IItemRepository):
@@ -34,10 +43,106 @@ class ItemRepository(IItemRepository):
         """
 
         query = item_table.select().order_by(item_table.c.name.asc())
-        items = await database.fetch_all(query)
+        items = await db_router.reader().fetch_all(query)
 
         return [Item(**dict(item)) for item in items]
 
+    async def get_many_by_ids(self, item_ids: list[int]) -> ItemBatch:
+        """The method getting many items in a single query.
+
+        Args:
+            item_ids (list[int]): The ids of the items.
+
+        Returns:
+            ItemBatch: The items in the order of the ids and missing ids.
+        """
+
+        unique_ids = list(dict.fromkeys(item_ids))
+        query = item_table.select().where(
+            item_table.c.id == any_(bindparam("ids", unique_ids, type_=ARRAY(Integer)))
+        )
+        found = {
+            item["id"]: item
+            for item in await db_router.reader().fetch_all(query)
+        }
+
+        return ItemBatch(
+            items=[Item(**dict(found[item_id])) for item_id in unique_ids if item_id in found],
+            missing=[item_id for item_id in unique_ids if item_id not in found],
+        )
+
+    async def get_catalog_version(self) -> int:
+        """The method getting the current catalog version.
+
+        Returns:
+            int: The version of the latest item change, 0 if none.
+        """
+
+        query = select(func.coalesce(func.max(catalog_version_table.c.version), 0))
+
+        return await db_router.reader().fetch_val(query)
+
+    async def get_catalog(self) -> ItemCatalog:
+        """The method getting all items together with their version.
+
+        Returns:
+            ItemCatalog: The consistent snapshot of the catalog.
+        """
+
+        # A single statement reads the items and the version from one
+        # snapshot, so they are consistent without a dedicated transaction.
+        version_query = select(
+            func.coalesce(func.max(catalog_version_table.c.version), 0)
+        ).scalar_subquery()
+        query = (
+            select(item_table, version_query.label("catalog_version"))
+            .order_by(item_table.c.id.asc())
+        )
+        items = await db_router.reader().fetch_all(query)
+
+        if not items:
+            return ItemCatalog(version=await self.get_catalog_version(), items=[])
+
+        return ItemCatalog(
+            version=items[0]["catalog_version"],
+            items=[Item(id=item["id"], name=item["name"]) for item in items],
+        )
+
+    async def get_changes_since(self, version: int) -> ItemChanges:
+        """The method getting the latest change of every item since a version.
+
+        Args:
+            version (int): The catalog version known by the client.
+
+        Returns:
+            ItemChanges: The changes and the version they lead to.
+        """
+
+        query = (
+            select(
+                item_change_table.c.version,
+                item_change_table.c.item_id,
+                item_change_table.c.name,
+                item_change_table.c.deleted,
+            )
+            .where(item_change_table.c.version > version)
+            .distinct(item_change_table.c.item_id)
+            .order_by(item_change_table.c.item_id, item_change_table.c.version.desc())
+        )
+        changes = await db_router.reader().fetch_all(query)
+
+        return ItemChanges(
+            version=max((change["version"] for change in changes), default=version),
+            changes=[
+                ItemChange(
+                    id=change["item_id"],
+                    name=change["name"],
+                    deleted=change["deleted"],
+                )
+                for change in changes
+            ],
+        )
+
     async def get_item_by_name(self, name: str) -> Any | None:
         """The method getting an item by name from the data storage.
 
@@ -53,11 +158,25 @@ class ItemRepository(IItemRepository):
             .where(item_table.c.name == name)
             .order_by(item_table.c.name.asc())
         )
-        item = await database.fetch_one(query)
+        item = await db_router.reader().fetch_one(query)
 
         return Item(**dict(item)) if item else None
 
-        async def item_exists(self, item_id: int) -> bool:
+    async def get_all_names(self) -> list[str]:
+        """The method getting the names of all items.
+
+        Only the name column is read, from the primary, so the filter
+        built at startup does not miss just added items.
+
+        Returns:
+            list[str]: The taken item names.
+        """
+
+        query = select(item_table.c.name).where(item_table.c.name.is_not(None))
+
+        return [row["name"] for row in await db_router.writer().fetch_all(query)]
+
+    async def item_exists(self, item_id: int) -> bool:
         """Sprawdza, czy item istnieje po ID.
 
         Args:
@@ -67,7 +186,7 @@ class ItemRepository(IItemRepository):
             bool: True istnieje; False nie.
         """
         query = item_table.select().where(item_table.c.id == item_id)
-        return await database.fetch_one(query) is not None
+        return await db_router.reader().fetch_one(query) is not None
 
     async def add_item(self, data: ItemIn) -> Any | None:
         """The method adding a new item to the data storage.
@@ -80,8 +199,11 @@ class ItemRepository(IItemRepository):
         """
 
         query = item_table.insert().values(**data.model_dump())
-        new_item_id = await database.execute(query)
-        new_item = await self._get_by_id(new_item_id)
+        async with db_router.writer().transaction():
+            new_item_id = await db_router.writer().execute(query)
+            await self._record_change(new_item_id, data.name)
+
+        new_item = await self._get_by_id(new_item_id, primary=True)
 
         return Item(**dict(new_item)) if new_item else None
 
@@ -96,43 +218,79 @@ class ItemRepository(IItemRepository):
             Any | None: The updated item.
         """
 
-        if self._get_by_id(item_id):
+        if await self._get_by_id(item_id, primary=True):
             query = (
                 item_table.update()
                 .where(item_table.c.id == item_id)
                 .values(**data.model_dump())
             )
-            await database.execute(query)
+            async with db_router.writer().transaction():
+                await db_router.writer().execute(query)
+                await self._record_change(item_id, data.name)
 
-            item = await self._get_by_id(item_id)
+            item = await self._get_by_id(item_id, primary=True)
 
             return Item(**dict(item)) if item else None
 
         return None
 
-    async def delete_item(self, item_id: int) -> bool:
+    async def delete_item(self, item_id: int) -> str | None:
         """The method removing an item from the data storage.
 
         Args:
             item_id (int): The item id.
 
         Returns:
-            bool: Success of the operation.
+            str | None: The name of the removed item, None if it did not exist.
         """
 
-        if self._get_by_id(item_id):
-            query = item_table.delete().where(item_table.c.id == item_id)
-            await database.execute(query)
+        query = (
+            item_table.delete()
+            .where(item_table.c.id == item_id)
+            .returning(item_table.c.name)
+        )
+        async with db_router.writer().transaction():
+            deleted = await db_router.writer().fetch_one(query)
+            if deleted is None:
+                return None
+            await self._record_change(item_id, None)
+
+        return deleted["name"]
 
-            return True
+    async def _record_change(self, item_id: int, name: str | None) -> None:
+        """A private method bumping the catalog version with an item change.
 
-        return False
+        It runs in the transaction of the item write. The counter row stays
+        locked until the commit, so versions follow the commit order and a
+        client never skips a change committed after a higher version.
+
+        Args:
+            item_id (int): The ID of the changed item.
+            name (str | None): The new name, None if the item was deleted.
+        """
+
+        bump = (
+            catalog_version_table.update()
+            .where(catalog_version_table.c.id == 1)
+            .values(version=catalog_version_table.c.version + 1)
+            .returning(catalog_version_table.c.version)
+        )
+        version = await db_router.writer().fetch_val(bump)
+        query = item_change_table.insert().values(
+            version=version,
+            item_id=item_id,
+            name=name,
+            deleted=name is None,
+        )
+        await db_router.writer().execute(query)
 
-    async def _get_by_id(self, item_id: int) -> Record | None:
+    async def _get_by_id(self, item_id: int, primary: bool = False) -> Record | None:
         """A private method getting an item from the DB based on its ID.
 
         Args:
             item_id (int): The ID of the item.
+            primary (bool): Whether to read from the primary, e.g. on
+                a write path.
 
         Returns:
             Any | None: Item record if exists.
@@ -143,5 +301,6 @@ class ItemRepository(IItemRepository):
             .where(item_table.c.id == item_id)
             .order_by(item_table.c.name.asc())
         )
+        source = db_router.writer() if primary else db_router.reader()
 
-        return await database.fetch_one(query)
+        return await source.fetch_one(query)
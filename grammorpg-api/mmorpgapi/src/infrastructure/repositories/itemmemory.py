@@ -0,0 +1,211 @@
+"""Module containing in-process item repository implementation."""
+
+from typing import Any, Iterable
+
+from src.core.domain.item import (
+    Item,
+    ItemBatch,
+    ItemCatalog,
+    ItemChange,
+    ItemChanges,
+    ItemIn,
+)
+from src.core.repositories.iitem import IItemRepository
+from src.infrastructure.utils.memorystore import MemoryStore
+
+
+class ItemMemoryRepository(IItemRepository):
+    """A class implementing the item repository in the worker memory."""
+
+    def __init__(self, store: MemoryStore) -> None:
+        """The initializer of the `item repository`.
+
+        Args:
+            store (MemoryStore): The tables shared with other repositories.
+        """
+
+        self._items = store.items
+        self._store = store
+
+    async def get_item_by_id(self, item_id: int) -> Any | None:
+        """The method getting an item from the data storage.
+
+        Args:
+            item_id (int): The id of the item.
+
+        Returns:
+            Any | None: The item data if exists.
+        """
+
+        item = self._items.get(item_id)
+
+        return Item(**item) if item else None
+
+    async def get_all_items(self) -> Iterable[Any]:
+        """The method getting all items from the data storage.
+
+        Returns:
+            Iterable[Any]: The collection of all items.
+        """
+
+        items = sorted(self._items.after(), key=lambda item: item["name"])
+
+        return [Item(**item) for item in items]
+
+    async def get_many_by_ids(self, item_ids: list[int]) -> ItemBatch:
+        """The method getting many items at once.
+
+        Args:
+            item_ids (list[int]): The ids of the items.
+
+        Returns:
+            ItemBatch: The items in the order of the ids and missing ids.
+        """
+
+        unique_ids = list(dict.fromkeys(item_ids))
+        found = {item_id: item for item_id in unique_ids if (item := self._items.get(item_id))}
+
+        return ItemBatch(
+            items=[Item(**found[item_id]) for item_id in unique_ids if item_id in found],
+            missing=[item_id for item_id in unique_ids if item_id not in found],
+        )
+
+    async def get_catalog_version(self) -> int:
+        """The method getting the current catalog version.
+
+        Returns:
+            int: The version of the latest item change, 0 if none.
+        """
+
+        return len(self._store.item_changes)
+
+    async def get_catalog(self) -> ItemCatalog:
+        """The method getting all items together with their version.
+
+        Returns:
+            ItemCatalog: The consistent snapshot of the catalog.
+        """
+
+        return ItemCatalog(
+            version=await self.get_catalog_version(),
+            items=[Item(id=item["id"], name=item["name"]) for item in self._items.after()],
+        )
+
+    async def get_changes_since(self, version: int) -> ItemChanges:
+        """The method getting the latest change of every item since a version.
+
+        Args:
+            version (int): The catalog version known by the client.
+
+        Returns:
+            ItemChanges: The changes and the version they lead to.
+        """
+
+        latest = {
+            change["item_id"]: change
+            for change in self._store.item_changes[max(version, 0):]
+        }
+
+        return ItemChanges(
+            version=max((change["version"] for change in latest.values()), default=version),
+            changes=[
+                ItemChange(
+                    id=item_id,
+                    name=latest[item_id]["name"],
+                    deleted=latest[item_id]["deleted"],
+                )
+                for item_id in sorted(latest)
+            ],
+        )
+
+    async def get_item_by_name(self, name: str) -> Any | None:
+        """The method getting an item by name from the data storage.
+
+        Args:
+            name (str): The name of the item.
+
+        Returns:
+            Any | None: The item data if exists.
+        """
+
+        items = self._items.lookup("name", name)
+
+        return Item(**items[0]) if items else None
+
+    async def get_all_names(self) -> list[str]:
+        """The method getting the names of all items.
+
+        Returns:
+            list[str]: The taken item names.
+        """
+
+        return [item["name"] for item in self._items.after() if item["name"] is not None]
+
+    async def add_item(self, data: ItemIn) -> Any | None:
+        """The method adding a new item to the data storage.
+
+        Args:
+            data (ItemIn): The attributes of the item.
+
+        Returns:
+            Any | None: The newly created item.
+        """
+
+        item = self._items.put({**data.model_dump(), "id": self._items.new_id()})
+        self._record_change(item["id"], data.name)
+
+        return Item(**item)
+
+    async def update_item(self, item_id: int, data: ItemIn) -> Any | None:
+        """The method updating item data in the data storage.
+
+        Args:
+            item_id (int): The item id.
+            data (ItemIn): The attributes of the item.
+
+        Returns:
+            Any | None: The updated item.
+        """
+
+        if item_id not in self._items.rows:
+            return None
+
+        item = self._items.put({**data.model_dump(), "id": item_id})
+        self._record_change(item_id, data.name)
+
+        return Item(**item)
+
+    async def delete_item(self, item_id: int) -> str | None:
+        """The method removing an item from the data storage.
+
+        Args:
+            item_id (int): The item id.
+
+        Returns:
+            str | None: The name of the removed item, None if it did not exist.
+        """
+
+        if (item := self._items.delete(item_id)) is None:
+            return None
+
+        self._record_change(item_id, None)
+
+        return item["name"]
+
+    def _record_change(self, item_id: int, name: str | None) -> None:
+        """A private method bumping the catalog version with an item change.
+
+        Versions are positions in the change list, so a version is also
+        the offset of the changes made after it.
+
+        Args:
+            item_id (int): The ID of the changed item.
+            name (str | None): The new name, None if the item was deleted.
+        """
+
+        self._store.item_changes.append({
+            "version": len(self._store.item_changes) + 1,
+            "item_id": item_id,
+            "name": name,
+            "deleted": name is None,
+        })
@@ -0,0 +1,319 @@
+"""Moduł zawierający implementację repozytorium dziennika inventory."""
+
+import re
+from datetime import datetime, timezone
+from typing import Iterable
+
+from asyncpg import PostgresError  # type: ignore
+from sqlalchemy import (
+    DateTime,
+    and_,
+    func,
+    insert,
+    literal,
+    literal_column,
+    or_,
+    select,
+    text,
+    union_all,
+)
+
+from src.core.domain.ledger import (
+    MONEY_ITEM_ID,
+    InventoryBalance,
+    LedgerEntry,
+    LedgerEntryIn,
+)
+from src.core.repositories.iledger import ILedgerRepository
+from src.db import inventory_ledger_table, inventory_snapshot_table, db_router
+
+SNAPSHOT_LOCK_ID = 0x6C6564676572
+PARTITION_NAME = re.compile(r"^inventory_ledger_(\d{4})_(\d{2})$")
+
+_ledger = inventory_ledger_table
+_snapshot = inventory_snapshot_table
+_minus_infinity = literal_column("'-infinity'", DateTime(timezone=True))
+
+
+class LedgerRepository(ILedgerRepository):
+    """Klasa implementująca repozytorium dziennika inventory."""
+
+    async def append_entries(self, entries: list[LedgerEntryIn]) -> None:
+        """Metoda dopisująca paczkę wpisów jednym wielowierszowym insertem.
+
+        Args:
+            entries (list[LedgerEntryIn]): Wpisy do dopisania.
+        """
+        if entries:
+            query = _ledger.insert().values([entry.model_dump() for entry in entries])
+            await db_router.writer().execute(query)
+
+    async def get_entries(
+        self,
+        inventory_id: int,
+        since: datetime,
+        until: datetime,
+        limit: int,
+    ) -> Iterable[LedgerEntry]:
+        """Metoda pobierająca historię inventory z repliki.
+
+        Zakres czasu ogranicza skanowanie do pasujących partycji.
+
+        Args:
+            inventory_id (int): ID inventory.
+            since (datetime): Początek zakresu.
+            until (datetime): Koniec zakresu.
+            limit (int): Maksymalna liczba wpisów.
+
+        Returns:
+            Iterable[LedgerEntry]: Wpisy od najnowszego.
+        """
+        query = (
+            _ledger.select()
+            .where(
+                _ledger.c.inventory_id == inventory_id,
+                _ledger.c.created_at >= since,
+                _ledger.c.created_at < until,
+            )
+            .order_by(_ledger.c.created_at.desc(), _ledger.c.id.desc())
+            .limit(limit)
+        )
+        entries = await db_router.reader().fetch_all(query)
+        return [LedgerEntry(**dict(entry)) for entry in entries]
+
+    async def get_balance(self, inventory_id: int) -> InventoryBalance:
+        """Metoda odtwarzająca stan inventory jednym zapytaniem.
+
+        Args:
+            inventory_id (int): ID inventory.
+
+        Returns:
+            InventoryBalance: Stan z ostatniej migawki i późniejszych wpisów.
+        """
+        snapshot_at = (
+            select(func.max(_snapshot.c.covered_until))
+            .where(_snapshot.c.inventory_id == inventory_id)
+            .scalar_subquery()
+        )
+        base = select(
+            _snapshot.c.item_id,
+            _snapshot.c.quantity,
+            literal(0).label("tail"),
+        ).where(
+            _snapshot.c.inventory_id == inventory_id,
+            _snapshot.c.covered_until == snapshot_at,
+        )
+        tail = select(
+            _ledger.c.item_id,
+            _ledger.c.delta.label("quantity"),
+            literal(1).label("tail"),
+        ).where(
+            _ledger.c.inventory_id == inventory_id,
+            _ledger.c.created_at >= func.coalesce(snapshot_at, _minus_infinity),
+        )
+        combined = union_all(base, tail).subquery()
+        query = select(
+            combined.c.item_id,
+            func.sum(combined.c.quantity).label("quantity"),
+            func.sum(combined.c.tail).label("tail_entries"),
+            snapshot_at.label("snapshot_at"),
+        ).group_by(combined.c.item_id)
+        rows = await db_router.reader().fetch_all(query)
+
+        quantities = {row["item_id"]: int(row["quantity"]) for row in rows}
+        return InventoryBalance(
+            inventory_id=inventory_id,
+            money=quantities.pop(MONEY_ITEM_ID, 0),
+            items={item_id: count for item_id, count in quantities.items() if count},
+            snapshot_at=rows[0]["snapshot_at"] if rows else None,
+            tail_entries=sum(int(row["tail_entries"]) for row in rows),
+        )
+
+    async def create_snapshots(self, cutoff: datetime) -> int:
+        """Metoda zapisująca migawki inventory zmienionych od poprzedniej.
+
+        Nowa migawka to poprzednia migawka plus wpisy do `cutoff`,
+        zsumowane w bazie jednym poleceniem. Starsze migawki tych
+        inventory są usuwane. Tylko jeden worker naraz wykonuje migawki.
+
+        Args:
+            cutoff (datetime): Granica wpisów objętych migawką.
+
+        Returns:
+            int: Liczba zapisanych wierszy migawek.
+        """
+        writer = db_router.writer()
+        async with writer.transaction():
+            if not await writer.fetch_val(
+                select(func.pg_try_advisory_xact_lock(SNAPSHOT_LOCK_ID))
+            ):
+                return 0
+
+            previous = select(func.max(_snapshot.c.covered_until)).scalar_subquery()
+            changed = (
+                select(_ledger.c.inventory_id)
+                .where(
+                    _ledger.c.created_at >= func.coalesce(previous, _minus_infinity),
+                    _ledger.c.created_at < cutoff,
+                )
+                .distinct()
+                .cte("changed")
+            )
+            last = (
+                select(
+                    _snapshot.c.inventory_id,
+                    func.max(_snapshot.c.covered_until).label("covered_until"),
+                )
+                .where(_snapshot.c.inventory_id.in_(select(changed.c.inventory_id)))
+                .group_by(_snapshot.c.inventory_id)
+                .cte("last")
+            )
+            base = select(
+                _snapshot.c.inventory_id,
+                _snapshot.c.item_id,
+                _snapshot.c.quantity,
+            ).join_from(_snapshot, last, and_(
+                _snapshot.c.inventory_id == last.c.inventory_id,
+                _snapshot.c.covered_until == last.c.covered_until,
+            ))
+            tail = (
+                select(
+                    _ledger.c.inventory_id,
+                    _ledger.c.item_id,
+                    _ledger.c.delta.label("quantity"),
+                )
+                .join_from(_ledger, changed, _ledger.c.inventory_id == changed.c.inventory_id)
+                .outerjoin(last, _ledger.c.inventory_id == last.c.inventory_id)
+                .where(
+                    _ledger.c.created_at < cutoff,
+                    _ledger.c.created_at >= func.coalesce(last.c.covered_until, _minus_infinity),
+                )
+            )
+            # Every snapshot keeps a money row, even a zero one, so that
+            # an emptied inventory does not fall back to an older snapshot.
+            money = select(
+                changed.c.inventory_id,
+                literal(MONEY_ITEM_ID).label("item_id"),
+                literal(0).label("quantity"),
+            )
+            combined = union_all(base, tail, money).subquery()
+            quantity = func.sum(combined.c.quantity)
+            inserted = (
+                insert(_snapshot)
+                .from_select(
+                    ["inventory_id", "covered_until", "item_id", "quantity"],
+                    select(
+                        combined.c.inventory_id,
+                        literal(cutoff, DateTime(timezone=True)),
+                        combined.c.item_id,
+                        quantity,
+                    )
+                    .group_by(combined.c.inventory_id, combined.c.item_id)
+                    .having(or_(quantity != 0, combined.c.item_id == MONEY_ITEM_ID)),
+                )
+                .returning(_snapshot.c.inventory_id)
+                .cte("inserted")
+            )
+            count = await writer.fetch_val(select(func.count()).select_from(inserted))
+
+            superseded = _snapshot.delete().where(
+                _snapshot.c.covered_until < cutoff,
+                _snapshot.c.inventory_id.in_(
+                    select(_snapshot.c.inventory_id)
+                    .where(_snapshot.c.covered_until == cutoff)
+                ),
+            )
+            await writer.execute(superseded)
+
+        return count
+
+    async def ensure_partitions(self, now: datetime, months_ahead: int) -> None:
+        """Metoda tworząca miesięczne partycje dziennika z wyprzedzeniem.
+
+        Args:
+            now (datetime): Bieżący czas.
+            months_ahead (int): Liczba miesięcy tworzonych z wyprzedzeniem.
+        """
+        writer = db_router.writer()
+        await writer.execute(text(
+            "CREATE TABLE IF NOT EXISTS inventory_ledger_default "
+            "PARTITION OF inventory_ledger DEFAULT"
+        ))
+
+        start = _month_start(now)
+        for _ in range(months_ahead + 1):
+            end = _next_month(start)
+            try:
+                await writer.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS inventory_ledger_{start:%Y_%m} "
+                    f"PARTITION OF inventory_ledger "
+                    f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+                ))
+            except PostgresError as e:
+                print(f"Ledger partition {start:%Y_%m} not created: {e}")
+            start = end
+
+    async def drop_partitions(self, older_than: datetime) -> list[str]:
+        """Metoda usuwająca stare partycje dziennika.
+
+        Usuwane są tylko partycje w całości objęte ostatnią migawką,
+        więc stan inventory nadal da się odtworzyć.
+
+        Args:
+            older_than (datetime): Granica wieku partycji.
+
+        Returns:
+            list[str]: Nazwy usuniętych partycji.
+        """
+        writer = db_router.writer()
+        covered_until = await writer.fetch_val(
+            select(func.max(_snapshot.c.covered_until))
+        )
+        if covered_until is None:
+            return []
+
+        limit = min(older_than, covered_until)
+        partitions = await writer.fetch_all(text(
+            "SELECT child.relname AS name FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = 'inventory_ledger'"
+        ))
+
+        dropped = []
+        for partition in partitions:
+            if not (match := PARTITION_NAME.match(partition["name"])):
+                continue
+            start = datetime(int(match[1]), int(match[2]), 1, tzinfo=timezone.utc)
+            if _next_month(start) <= limit:
+                await writer.execute(text(f"DROP TABLE IF EXISTS {partition['name']}"))
+                dropped.append(partition["name"])
+
+        return dropped
+
+
+def _month_start(moment: datetime) -> datetime:
+    """Prywatna funkcja zwracająca początek miesiąca w UTC.
+
+    Args:
+        moment (datetime): Dowolna chwila w miesiącu.
+
+    Returns:
+        datetime: Północ pierwszego dnia miesiąca.
+    """
+    moment = moment.astimezone(timezone.utc)
+    return datetime(moment.year, moment.month, 1, tzinfo=timezone.utc)
+
+
+def _next_month(start: datetime) -> datetime:
+    """Prywatna funkcja zwracająca początek następnego miesiąca.
+
+    Args:
+        start (datetime): Początek miesiąca.
+
+    Returns:
+        datetime: Początek kolejnego miesiąca.
+    """
+    if start.month == 12:
+        return start.replace(year=start.year + 1, month=1)
+    return start.replace(month=start.month + 1)
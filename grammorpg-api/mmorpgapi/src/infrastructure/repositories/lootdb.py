@@ -0,0 +1,146 @@
+"""Moduł zawierający implementację repozytorium tabel łupów."""
+
+from asyncpg import ForeignKeyViolationError, UniqueViolationError  # type: ignore
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+
+from src.core.domain.loot import LootEntryIn, LootTable, LootTableIn
+from src.core.repositories.iloot import ILootRepository
+from src.db import loot_entry_table, loot_table_table, db_router
+
+
+class LootRepository(ILootRepository):
+    """Klasa implementująca repozytorium tabel łupów."""
+
+    async def add_loot_table(self, data: LootTableIn) -> LootTable:
+        """Metoda dodająca tabelę łupów wraz z pozycjami w jednej transakcji.
+
+        Args:
+            data (LootTableIn): Atrybuty i pozycje tabeli łupów.
+
+        Raises:
+            ValueError: Jeśli nazwa jest zajęta lub przedmiot nie istnieje.
+
+        Returns:
+            LootTable: Nowo utworzona tabela łupów.
+        """
+        query = (
+            loot_table_table.insert()
+            .values(name=data.name, empty_weight=data.empty_weight)
+            .returning(loot_table_table.c.id)
+        )
+        try:
+            async with db_router.writer().transaction():
+                table_id = await db_router.writer().fetch_val(query)
+                await self._insert_entries(table_id, data.entries)
+        except UniqueViolationError:
+            raise ValueError(f"Loot table with name '{data.name}' already exists.")
+        except ForeignKeyViolationError:
+            raise ValueError("Loot table references an item which does not exist.")
+
+        return LootTable(id=table_id, **data.model_dump())
+
+    async def update_loot_table(self, table_id: int, data: LootTableIn) -> LootTable | None:
+        """Metoda zastępująca atrybuty i pozycje tabeli łupów.
+
+        Args:
+            table_id (int): ID tabeli łupów.
+            data (LootTableIn): Nowe atrybuty i pozycje tabeli łupów.
+
+        Raises:
+            ValueError: Jeśli nazwa jest zajęta lub przedmiot nie istnieje.
+
+        Returns:
+            LootTable | None: Zaktualizowana tabela łupów, jeśli istnieje.
+        """
+        query = (
+            loot_table_table.update()
+            .where(loot_table_table.c.id == table_id)
+            .values(name=data.name, empty_weight=data.empty_weight)
+            .returning(loot_table_table.c.id)
+        )
+        try:
+            async with db_router.writer().transaction():
+                if await db_router.writer().fetch_val(query) is None:
+                    return None
+
+                await db_router.writer().execute(
+                    loot_entry_table.delete()
+                    .where(loot_entry_table.c.loot_table_id == table_id)
+                )
+                await self._insert_entries(table_id, data.entries)
+        except UniqueViolationError:
+            raise ValueError(f"Loot table with name '{data.name}' already exists.")
+        except ForeignKeyViolationError:
+            raise ValueError("Loot table references an item which does not exist.")
+
+        return LootTable(id=table_id, **data.model_dump())
+
+    async def remove_loot_table(self, table_id: int) -> bool:
+        """Metoda usuwająca tabelę łupów (pozycje usuwa kaskada).
+
+        Args:
+            table_id (int): ID tabeli łupów.
+
+        Returns:
+            bool: Powodzenie operacji usuwania.
+        """
+        query = (
+            loot_table_table.delete()
+            .where(loot_table_table.c.id == table_id)
+            .returning(loot_table_table.c.id)
+        )
+        return await db_router.writer().fetch_val(query) is not None
+
+    async def get_loot_table(self, table_id: int, primary: bool = False) -> LootTable | None:
+        """Metoda pobierająca tabelę łupów wraz z pozycjami jednym zapytaniem.
+
+        Args:
+            table_id (int): ID tabeli łupów.
+            primary (bool): Czy czytać z bazy głównej.
+
+        Returns:
+            LootTable | None: Tabela łupów, jeśli istnieje.
+        """
+        order = loot_entry_table.c.item_id.asc()
+        query = (
+            select(
+                loot_table_table,
+                func.array_agg(aggregate_order_by(loot_entry_table.c.item_id, order))
+                .label("item_ids"),
+                func.array_agg(aggregate_order_by(loot_entry_table.c.weight, order))
+                .label("weights"),
+            )
+            .select_from(loot_table_table.outerjoin(loot_entry_table))
+            .where(loot_table_table.c.id == table_id)
+            .group_by(loot_table_table.c.id)
+        )
+        source = db_router.writer() if primary else db_router.reader()
+        row = await source.fetch_one(query)
+        if row is None:
+            return None
+
+        return LootTable(
+            id=row["id"],
+            name=row["name"],
+            empty_weight=row["empty_weight"],
+            entries=[
+                LootEntryIn(item_id=item_id, weight=weight)
+                for item_id, weight in zip(row["item_ids"], row["weights"])
+                if item_id is not None
+            ],
+        )
+
+    async def _insert_entries(self, table_id: int, entries: list[LootEntryIn]) -> None:
+        """Prywatna metoda wstawiająca pozycje tabeli jednym zapytaniem.
+
+        Args:
+            table_id (int): ID tabeli łupów.
+            entries (list[LootEntryIn]): Pozycje tabeli łupów.
+        """
+        await db_router.writer().execute(
+            loot_entry_table.insert().values([
+                {"loot_table_id": table_id, **entry.model_dump()}
+                for entry in entries
+            ])
+        )
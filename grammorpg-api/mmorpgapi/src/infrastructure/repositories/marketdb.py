@@ -0,0 +1,393 @@
+"""Moduł zawierający implementację repozytorium rynku przedmiotów."""
+
+from asyncpg import ForeignKeyViolationError  # type: ignore
+from sqlalchemy import (
+    BigInteger,
+    Integer,
+    String,
+    and_,
+    any_,
+    bindparam,
+    case,
+    func,
+    select,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+
+from src.core.domain.inventory import Inventory
+from src.core.domain.ledger import MONEY_ITEM_ID
+from src.core.domain.market import (
+    MarketCancellation,
+    MarketFill,
+    MarketOrder,
+    MarketOrderIn,
+    MarketSettlement,
+    MarketTrade,
+    OrderBookState,
+    StaleOrderBookError,
+)
+from src.core.repositories.imarket import IMarketRepository
+from src.db import (
+    inventory_table,
+    market_book_table,
+    market_order_table,
+    market_trade_table,
+    db_router,
+)
+from src.infrastructure.utils.itemlist import format_itemlist, parse_itemlist
+from src.infrastructure.utils.orderbook import settlement_deltas
+
+
+class MarketRepository(IMarketRepository):
+    """Klasa implementująca repozytorium rynku przedmiotów.
+
+    Każda zmiana księgi podbija jej wersję w `market_books` w tej samej
+    transakcji. Blokada wiersza wersji szereguje zmiany księgi między
+    workerami, a porównanie wersji wykrywa nieaktualną księgę w pamięci.
+    """
+
+    async def get_order_books(self) -> list[OrderBookState]:
+        """Metoda pobierająca otwarte zlecenia wszystkich przedmiotów.
+
+        Returns:
+            list[OrderBookState]: Wersja i otwarte zlecenia każdej księgi.
+        """
+        return await self._get_books(None)
+
+    async def get_order_book(self, item_id: int) -> OrderBookState:
+        """Metoda pobierająca otwarte zlecenia przedmiotu.
+
+        Args:
+            item_id (int): ID przedmiotu.
+
+        Returns:
+            OrderBookState: Wersja i otwarte zlecenia księgi.
+        """
+        books = await self._get_books(item_id)
+        return books[0] if books else OrderBookState(item_id=item_id, version=0, orders=[])
+
+    async def settle_order(
+        self,
+        data: MarketOrderIn,
+        fills: list[MarketFill],
+        expected_version: int,
+    ) -> MarketSettlement:
+        """Metoda atomowo składająca i rozliczająca zlecenie.
+
+        W jednej transakcji podbijana jest wersja księgi, pobierany jest
+        depozyt z inventory składającego, zapisywane jest zlecenie,
+        zmniejszane są dopasowane zlecenia, uznawane są inventory stron
+        i zapisywane są transakcje.
+
+        Args:
+            data (MarketOrderIn): Nowe zlecenie.
+            fills (list[MarketFill]): Dopasowane zlecenia z księgi.
+            expected_version (int): Wersja księgi, na której dopasowano zlecenie.
+
+        Raises:
+            ValueError: Jeśli przedmiot lub inventory nie istnieje lub brakuje
+                środków.
+            StaleOrderBookError: Jeśli księga zmieniła się od tej wersji.
+
+        Returns:
+            MarketSettlement: Zlecenie, transakcje, nowa wersja i inventory.
+        """
+        writer = db_router.writer()
+        deltas = settlement_deltas(data, fills)
+        filled = sum(fill.quantity for fill in fills)
+
+        try:
+            async with writer.transaction():
+                version = await self._bump_version(data.item_id)
+                if version != expected_version + 1:
+                    raise StaleOrderBookError(f"Order book of item {data.item_id} changed.")
+
+                await self._take_escrow(data, deltas.pop(data.inventory_id, {}))
+
+                order = await writer.fetch_one(
+                    market_order_table.insert()
+                    .values(
+                        **data.model_dump(),
+                        remaining=data.quantity - filled,
+                        status="open" if filled < data.quantity else "filled",
+                    )
+                    .returning(*market_order_table.c)
+                )
+                trades = []
+                if fills:
+                    await self._fill_orders(fills)
+                    await self._credit(deltas)
+                    trades = [
+                        MarketTrade(
+                            item_id=data.item_id,
+                            buy_order_id=order["id"] if data.side == "buy" else fill.order_id,
+                            sell_order_id=order["id"] if data.side == "sell" else fill.order_id,
+                            price=fill.price,
+                            quantity=fill.quantity,
+                        )
+                        for fill in fills
+                    ]
+                    await writer.execute(
+                        market_trade_table.insert().values(
+                            [trade.model_dump() for trade in trades]
+                        )
+                    )
+
+                inventories = await writer.fetch_all(
+                    inventory_table.select().where(
+                        inventory_table.c.id == any_(bindparam(
+                            "ids",
+                            [data.inventory_id, *deltas],
+                            type_=ARRAY(Integer),
+                        ))
+                    )
+                )
+        except ForeignKeyViolationError:
+            raise ValueError(f"Item with ID {data.item_id} does not exist.")
+
+        return MarketSettlement(
+            order=MarketOrder(**dict(order)),
+            trades=trades,
+            version=version,
+            inventories=[Inventory(**dict(inventory)) for inventory in inventories],
+        )
+
+    async def cancel_order(self, order_id: int) -> MarketCancellation | None:
+        """Metoda anulująca otwarte zlecenie i zwracająca jego depozyt.
+
+        Args:
+            order_id (int): ID zlecenia.
+
+        Returns:
+            MarketCancellation | None: Anulowane zlecenie, jeśli było otwarte.
+        """
+        writer = db_router.writer()
+        item_id = await writer.fetch_val(
+            select(market_order_table.c.item_id)
+            .where(market_order_table.c.id == order_id)
+        )
+        if item_id is None:
+            return None
+
+        async with writer.transaction():
+            # Wersja księgi jest blokowana przed zleceniem, w tej samej
+            # kolejności co przy rozliczeniu, aby uniknąć zakleszczeń.
+            version = await writer.fetch_val(
+                market_book_table.update()
+                .where(market_book_table.c.item_id == item_id)
+                .values(version=market_book_table.c.version + 1)
+                .returning(market_book_table.c.version)
+            )
+            order = await writer.fetch_one(
+                market_order_table.update()
+                .where(
+                    market_order_table.c.id == order_id,
+                    market_order_table.c.status == "open",
+                )
+                .values(status="cancelled")
+                .returning(*market_order_table.c)
+            )
+            if order is None:
+                return None
+
+            order = MarketOrder(**dict(order))
+            refund = (
+                {MONEY_ITEM_ID: order.price * order.remaining}
+                if order.side == "buy" else {order.item_id: order.remaining}
+            )
+            inventories = await self._credit({order.inventory_id: refund})
+
+        return MarketCancellation(
+            order=order,
+            version=version or 0,
+            inventory=inventories[0] if inventories else None,
+        )
+
+    async def _get_books(self, item_id: int | None) -> list[OrderBookState]:
+        """Prywatna metoda pobierająca wersje i otwarte zlecenia ksiąg.
+
+        Args:
+            item_id (int | None): ID przedmiotu lub None dla wszystkich.
+
+        Returns:
+            list[OrderBookState]: Wersja i otwarte zlecenia każdej księgi.
+        """
+        # Jedno zapytanie czyta wersje i zlecenia z tej samej migawki.
+        query = (
+            select(
+                market_book_table.c.item_id.label("book_item_id"),
+                market_book_table.c.version,
+                market_order_table,
+            )
+            .select_from(
+                market_book_table.outerjoin(
+                    market_order_table,
+                    and_(
+                        market_order_table.c.item_id == market_book_table.c.item_id,
+                        market_order_table.c.status == "open",
+                    ),
+                )
+            )
+            .order_by(market_order_table.c.id.asc())
+        )
+        if item_id is not None:
+            query = query.where(market_book_table.c.item_id == item_id)
+
+        books: dict[int, OrderBookState] = {}
+        for row in await db_router.writer().fetch_all(query):
+            book = books.setdefault(row["book_item_id"], OrderBookState(
+                item_id=row["book_item_id"],
+                version=row["version"],
+                orders=[],
+            ))
+            if row["id"] is not None:
+                book.orders.append(MarketOrder(**dict(row)))
+
+        return list(books.values())
+
+    async def _bump_version(self, item_id: int) -> int:
+        """Prywatna metoda podbijająca i blokującą wersję księgi przedmiotu.
+
+        Args:
+            item_id (int): ID przedmiotu.
+
+        Returns:
+            int: Nowa wersja księgi.
+        """
+        query = (
+            insert(market_book_table)
+            .values(item_id=item_id, version=1)
+            .on_conflict_do_update(
+                index_elements=[market_book_table.c.item_id],
+                set_={"version": market_book_table.c.version + 1},
+            )
+            .returning(market_book_table.c.version)
+        )
+        return await db_router.writer().fetch_val(query)
+
+    async def _take_escrow(self, data: MarketOrderIn, deltas: dict[int, int]) -> None:
+        """Prywatna metoda pobierająca depozyt i rozliczająca składającego.
+
+        Wiersz inventory jest blokowany, więc sprawdzenie środków i zapis
+        nowego stanu nie wyścigują się z innymi zmianami.
+
+        Args:
+            data (MarketOrderIn): Nowe zlecenie.
+            deltas (dict[int, int]): Zmiana ilości przedmiotów i pieniędzy.
+
+        Raises:
+            ValueError: Jeśli inventory nie istnieje lub brakuje środków.
+        """
+        writer = db_router.writer()
+        inventory = await writer.fetch_one(
+            inventory_table.select()
+            .where(
+                inventory_table.c.id == data.inventory_id,
+                inventory_table.c.deleted_at.is_(None),
+            )
+            .with_for_update()
+        )
+        if inventory is None:
+            raise ValueError(f"Inventory with ID {data.inventory_id} does not exist.")
+
+        items = parse_itemlist(inventory["itemlist"] or "")
+        if data.side == "buy" and inventory["money"] < data.price * data.quantity:
+            raise ValueError("Not enough money to place the order.")
+        if data.side == "sell" and items[data.item_id] < data.quantity:
+            raise ValueError("Not enough items to place the order.")
+
+        for item_id, delta in deltas.items():
+            if item_id != MONEY_ITEM_ID:
+                items[item_id] += delta
+
+        await writer.execute(
+            inventory_table.update()
+            .where(inventory_table.c.id == data.inventory_id)
+            .values(
+                money=inventory["money"] + deltas.get(MONEY_ITEM_ID, 0),
+                itemlist=format_itemlist(items),
+            )
+        )
+
+    async def _fill_orders(self, fills: list[MarketFill]) -> None:
+        """Prywatna metoda zmniejszająca dopasowane zlecenia jednym zapytaniem.
+
+        Args:
+            fills (list[MarketFill]): Dopasowane zlecenia z księgi.
+
+        Raises:
+            StaleOrderBookError: Jeśli któreś zlecenie nie jest już otwarte
+                lub ma mniejszą pozostałą ilość.
+        """
+        filled = func.unnest(
+            bindparam("ids", [fill.order_id for fill in fills], type_=ARRAY(BigInteger)),
+            bindparam("filled", [fill.quantity for fill in fills], type_=ARRAY(Integer)),
+        ).table_valued("id", "filled").render_derived(name="v")
+        remaining = market_order_table.c.remaining - filled.c.filled
+        query = (
+            market_order_table.update()
+            .where(
+                market_order_table.c.id == filled.c.id,
+                market_order_table.c.status == "open",
+                remaining >= 0,
+            )
+            .values(
+                remaining=remaining,
+                status=case((remaining == 0, "filled"), else_=market_order_table.c.status),
+            )
+            .returning(market_order_table.c.id)
+        )
+        if len(await db_router.writer().fetch_all(query)) != len(fills):
+            raise StaleOrderBookError("Matched orders are no longer open.")
+
+    async def _credit(self, deltas: dict[int, dict[int, int]]) -> list[Inventory]:
+        """Prywatna metoda uznająca wiele inventory jednym zapytaniem.
+
+        Pieniądze są dodawane, a przedmioty doklejane do bieżącego stanu,
+        więc uznanie nie wymaga blokowania inventory drugiej strony.
+
+        Args:
+            deltas (dict[int, dict[int, int]]): Dodatnie zmiany ilości
+                przedmiotów i pieniędzy każdego inventory.
+
+        Returns:
+            list[Inventory]: Nowy stan uznanych inventory.
+        """
+        if not deltas:
+            return []
+
+        credits = func.unnest(
+            bindparam("ids", list(deltas), type_=ARRAY(Integer)),
+            bindparam(
+                "money",
+                [changes.get(MONEY_ITEM_ID, 0) for changes in deltas.values()],
+                type_=ARRAY(BigInteger),
+            ),
+            bindparam(
+                "itemlists",
+                [
+                    format_itemlist({
+                        item_id: quantity
+                        for item_id, quantity in changes.items()
+                        if item_id != MONEY_ITEM_ID
+                    })
+                    for changes in deltas.values()
+                ],
+                type_=ARRAY(String),
+            ),
+        ).table_valued("id", "money", "itemlist").render_derived(name="v")
+        query = (
+            inventory_table.update()
+            .where(inventory_table.c.id == credits.c.id)
+            .values(
+                money=inventory_table.c.money + credits.c.money,
+                itemlist=func.concat_ws(
+                    ",",
+                    func.nullif(inventory_table.c.itemlist, ""),
+                    func.nullif(credits.c.itemlist, ""),
+                ),
+            )
+            .returning(*inventory_table.c)
+        )
+        rows = await db_router.writer().fetch_all(query)
+        return [Inventory(**dict(row)) for row in rows]
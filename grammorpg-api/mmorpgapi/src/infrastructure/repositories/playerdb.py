@@ -1,16 +1,60 @@
 """Moduł zawierający implementację repozytorium player."""
 
+import asyncio
+from datetime import datetime
 from typing import Any, Iterable
 
-from asyncpg import Record  # type: ignore
+from asyncpg import Record, UniqueViolationError  # type: ignore
+from sqlalchemy import (
+    BigInteger,
+    Integer,
+    TextClause,
+    and_,
+    any_,
+    bindparam,
+    cast,
+    delete,
+    exists,
+    func,
+    insert,
+    null,
+    or_,
+    select,
+    text,
+)
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import ARRAY
 
-from src.core.domain.player import Player, PlayerIn
+from src.core.domain.character import Character, CharacterIn, CharacterPurgeBatch
+from src.core.domain.inventory import Inventory
+from src.core.domain.player import Player, PlayerBatch, PlayerIn
 from src.core.repositories.iplayer import IPlayerRepository
-from src.db import player_table, database
+from src.db import inventory_table, player_table, shard_router
+from src.infrastructure.repositories.playernamedb import (
+    claim_player_name,
+    release_player_names,
+)
+from src.infrastructure.utils.sharding import merge_sorted
 
 
 class PlayerRepository(IPlayerRepository):
-    """Klasa implementująca repozytorium player."""
+    """Klasa implementująca repozytorium player.
+
+    Player jest przechowywany w shardzie swojego inventory: oba ID mają
+    ten sam kubełek. Zapytania o pojedyncze ID trafiają do jednego
+    shardu, a listy są zbierane ze wszystkich i scalane.
+    """
+
+    def __init__(self, soft_delete: bool = False, cascade: bool = True) -> None:
+        """Inicjalizator klasy `PlayerRepository`.
+
+        Args:
+            soft_delete (bool): Czy usuwanie tylko oznacza playera jako usuniętego.
+            cascade (bool): Czy czyszczenie usuwa również inventory playerów.
+        """
+        self._soft_delete = soft_delete
+        self._cascade = cascade
+        self._character_query: tuple[TextClause, dict] | None = None
 
     async def get_player_by_id(self, player_id: int) -> Any | None:
         """Metoda pobierająca playera z magazynu danych po ID.
@@ -24,6 +68,78 @@ class PlayerRepository(IPlayerRepository):
         player = await self._get_by_id(player_id)
         return Player(**dict(player)) if player else None
 
+    async def get_all_players(self) -> Iterable[Any]:
+        """Metoda pobierająca wszystkich playerów z magazynu danych.
+
+        Returns:
+            Iterable[Any]: Kolekcja playerów.
+        """
+        query = (
+            player_table.select()
+            .where(player_table.c.deleted_at.is_(None))
+            .order_by(player_table.c.name.asc())
+        )
+        results = await shard_router.gather(lambda shard: shard.reader().fetch_all(query))
+        players = merge_sorted(
+            results,
+            key=lambda player: (player["name"] is None, player["name"] or ""),
+        )
+        return [Player(**dict(player)) for player in players]
+
+    async def get_players_page(self, after_id: int, limit: int) -> Iterable[Any]:
+        """Metoda pobierająca stronę playerów o ID większym niż `after_id`.
+
+        Każdy shard zwraca co najwyżej `limit` kolejnych playerów, a strona
+        to pierwsze `limit` ID po scaleniu, więc żaden player nie jest
+        pominięty ani powtórzony między stronami.
+
+        Args:
+            after_id (int): ID ostatniego playera poprzedniej strony.
+            limit (int): Maksymalna liczba playerów na stronie.
+
+        Returns:
+            Iterable[Any]: Playerzy posortowani po ID.
+        """
+        query = (
+            player_table.select()
+            .where(player_table.c.id > after_id, player_table.c.deleted_at.is_(None))
+            .order_by(player_table.c.id.asc())
+            .limit(limit)
+        )
+        results = await shard_router.gather(lambda shard: shard.reader().fetch_all(query))
+        players = merge_sorted(results, key=lambda player: player["id"])[:limit]
+        return [Player(**dict(player)) for player in players]
+
+    async def get_many_by_ids(self, player_ids: list[int]) -> PlayerBatch:
+        """Metoda pobierająca wielu playerów jednym zapytaniem.
+
+        Args:
+            player_ids (list[int]): Lista ID playerów.
+
+        Returns:
+            PlayerBatch: Playerzy w kolejności ID oraz brakujące ID.
+        """
+        unique_ids = list(dict.fromkeys(player_ids))
+
+        async def fetch(shard: Any, ids: list[int]) -> list[Record]:
+            query = player_table.select().where(
+                player_table.c.id == any_(bindparam("ids", ids, type_=ARRAY(Integer))),
+                player_table.c.deleted_at.is_(None),
+            )
+            return await shard.reader().fetch_all(query)
+
+        results = await asyncio.gather(*(
+            fetch(shard, ids) for shard, ids in shard_router.group(unique_ids)
+        ))
+        found = {player["id"]: player for rows in results for player in rows}
+        return PlayerBatch(
+            players=[
+                Player(**dict(found[player_id]))
+                for player_id in unique_ids if player_id in found
+            ],
+            missing=[player_id for player_id in unique_ids if player_id not in found],
+        )
+
     async def get_player_by_name(self, name: str) -> Any | None:
         """Metoda pobierająca playera z magazynu danych po nazwie.
 
@@ -35,26 +151,91 @@ class PlayerRepository(IPlayerRepository):
         """
         query = (
             player_table.select()
-            .where(player_table.c.name == name)
+            .where(player_table.c.name == name, player_table.c.deleted_at.is_(None))
             .order_by(player_table.c.name.asc())
         )
-        player = await database.fetch_one(query)
+        results = await shard_router.gather(lambda shard: shard.reader().fetch_one(query))
+        player = next((player for player in results if player), None)
         return Player(**dict(player)) if player else None
 
+    async def get_all_names(self) -> list[str]:
+        """Metoda pobierająca nazwy wszystkich playerów.
+
+        Czyta tylko kolumnę nazwy z bazy głównej, aby filtr nazw
+        zbudowany przy starcie nie pominął świeżo dodanych playerów.
+
+        Returns:
+            list[str]: Zajęte nazwy playerów.
+        """
+        query = select(player_table.c.name).where(
+            player_table.c.deleted_at.is_(None),
+            player_table.c.name.is_not(None),
+        )
+        results = await shard_router.gather(lambda shard: shard.writer().fetch_all(query))
+        return [row["name"] for rows in results for row in rows]
+
     async def add_player(self, data: PlayerIn) -> Any | None:
         """Metoda dodająca nowego playera do magazynu danych.
 
         Args:
             data (PlayerIn): Atrybuty playera.
 
+        Raises:
+            ValueError: Jeśli nazwa playera jest już zajęta.
+
         Returns:
             Any | None: Nowo utworzony player, jeśli operacja się powiodła.
         """
-        query = player_table.insert().values(**data.model_dump())
-        new_player_id = await database.execute(query)
-        new_player = await self._get_by_id(new_player_id)
+        bucket = shard_router.bucket(data.connectedinventory)
+        values = data.model_dump()
+        if (new_id := shard_router.new_id(player_table, bucket)) is not None:
+            values["id"] = new_id
+        query = player_table.insert().values(**values).returning(*player_table.c)
+        async with claim_player_name(data.name):
+            try:
+                new_player = await shard_router.for_bucket(bucket).writer().fetch_one(query)
+            except UniqueViolationError:
+                raise ValueError(f"Player with name '{data.name}' already exists.")
         return Player(**dict(new_player)) if new_player else None
 
+    async def add_character(self, data: CharacterIn) -> Character:
+        """Metoda dodająca playera wraz z jego inventory jednym zapytaniem.
+
+        Oba inserty są w jednym poleceniu (CTE), więc wykonują się
+        atomowo w jednym round tripie, a naruszenie unikalności nazwy
+        nie zostawia osieroconego inventory. Player i inventory dostają
+        ID z tego samego, losowego kubełka, więc trafiają do jednego shardu.
+        Zapytanie jest kompilowane raz, wywołanie tylko wiąże wartości.
+
+        Args:
+            data (CharacterIn): Atrybuty playera i inventory.
+
+        Raises:
+            ValueError: Jeśli nazwa playera jest już zajęta.
+
+        Returns:
+            Character: Nowo utworzony player i jego inventory.
+        """
+        bucket = shard_router.new_bucket()
+        query, values = self._get_character_query()
+        values = {**values, **data.inventory.model_dump(), **data.player.model_dump()}
+        if shard_router.enabled:
+            values["bucket"] = bucket
+        query = query.bindparams(**values)
+        async with claim_player_name(data.player.name):
+            try:
+                row = await shard_router.for_bucket(bucket).writer().fetch_one(query)
+            except UniqueViolationError:
+                raise ValueError(f"Player with name '{data.player.name}' already exists.")
+        return Character(
+            player=Player(**dict(row)),
+            inventory=Inventory(
+                id=row["connectedinventory"],
+                money=row["inventory_money"],
+                itemlist=row["inventory_itemlist"],
+            ),
+        )
+
     async def update_player(self, player_id: int, data: PlayerIn) -> Any | None:
         """Metoda aktualizująca dane playera w magazynie danych.
 
@@ -62,47 +243,389 @@ class PlayerRepository(IPlayerRepository):
             player_id (int): ID playera.
             data (PlayerIn): Zaktualizowane atrybuty playera.
 
+        Raises:
+            ValueError: Jeśli nowa nazwa playera jest już zajęta lub nowe
+                inventory należy do innego kubełka niż player.
+
         Returns:
             Any | None: Zaktualizowany player, jeśli operacja się powiodła.
         """
-        if await self._get_by_id(player_id):
+        current = await self._get_by_id(player_id, primary=True)
+        if not current:
+            return None
+
+        if (
+            shard_router.enabled
+            and data.connectedinventory != current["connectedinventory"]
+            and shard_router.bucket(data.connectedinventory) != shard_router.bucket(player_id)
+        ):
+            raise ValueError(
+                f"Inventory with ID {data.connectedinventory} is stored in "
+                f"another shard bucket than player {player_id}."
+            )
+
+        renamed = data.name != current["name"]
+        query = (
+            player_table.update()
+            .where(player_table.c.id == player_id)
+            .values(**data.model_dump(), last_active_at=func.now())
+            .returning(*player_table.c)
+        )
+        async with claim_player_name(data.name if renamed else None):
+            try:
+                updated_player = await shard_router.for_id(player_id).writer().fetch_one(query)
+            except UniqueViolationError:
+                raise ValueError(f"Player with name '{data.name}' already exists.")
+        if renamed:
+            await release_player_names([current["name"]])
+        return Player(**dict(updated_player)) if updated_player else None
+
+    async def remove_player(self, player_id: int) -> str | None:
+        """Metoda usuwająca (lub oznaczająca jako usuniętego) playera.
+
+        Args:
+            player_id (int): ID playera do usunięcia.
+
+        Returns:
+            str | None: Nazwa usuniętego playera lub None, jeśli nie istniał.
+        """
+        if self._soft_delete:
+            query = player_table.update().values(deleted_at=func.now())
+        else:
+            query = player_table.delete()
+        query = query.where(
+            player_table.c.id == player_id,
+            player_table.c.deleted_at.is_(None),
+        ).returning(player_table.c.id, player_table.c.name)
+        removed = await shard_router.for_id(player_id).writer().fetch_one(query)
+        if removed is None:
+            return None
+
+        await release_player_names([removed["name"]])
+        return removed["name"]
+
+    async def purge_inactive_players(
+        self,
+        inactive_before: datetime,
+        limit: int,
+    ) -> CharacterPurgeBatch:
+        """Metoda trwale usuwająca jedną paczkę nieaktywnych playerów.
+
+        Usuwa playerów nieaktywnych od `inactive_before` oraz oznaczonych
+        jako usunięci przed tą datą. Przy kaskadzie usuwa też inventory,
+        do których nie odwołuje się już żaden inny player. Zablokowane
+        wiersze są pomijane, więc czyszczenie nie czeka na inne zapisy.
+        Każdy shard usuwa własną paczkę, a inni właściciele inventory są
+        zawsze w tym samym shardzie.
+
+        Args:
+            inactive_before (datetime): Granica nieaktywności.
+            limit (int): Maksymalna liczba playerów w paczce.
+
+        Returns:
+            CharacterPurgeBatch: ID usuniętych playerów i inventory.
+        """
+        batch = (
+            select(player_table.c.id)
+            .where(or_(
+                player_table.c.last_active_at < inactive_before,
+                player_table.c.deleted_at < inactive_before,
+            ))
+            .order_by(player_table.c.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte("batch")
+        )
+        removed = (
+            delete(player_table)
+            .where(player_table.c.id == batch.c.id)
+            .returning(
+                player_table.c.id,
+                player_table.c.connectedinventory,
+                player_table.c.name,
+                player_table.c.deleted_at,
+            )
+            .cte("removed")
+        )
+        # Names of players removed earlier were released by that removal.
+        released_names = (
+            select(func.array_agg(removed.c.name))
+            .where(removed.c.deleted_at.is_(None))
+            .scalar_subquery()
+            .label("names")
+        )
+        if not self._cascade:
+            query = select(
+                select(func.array_agg(removed.c.id)).scalar_subquery().label("player_ids"),
+                null().label("inventory_ids"),
+                released_names,
+            )
+            return await self._purge_shards(query)
+
+        # The snapshot still sees the players being removed, so they are
+        # excluded explicitly when looking for other owners.
+        other_owner = player_table.alias("other_owner")
+        removed_inventory = (
+            delete(inventory_table)
+            .where(
+                inventory_table.c.id.in_(select(removed.c.connectedinventory)),
+                ~exists().where(and_(
+                    other_owner.c.connectedinventory == inventory_table.c.id,
+                    other_owner.c.id.not_in(select(removed.c.id)),
+                )),
+            )
+            .returning(inventory_table.c.id)
+            .cte("removed_inventory")
+        )
+        query = select(
+            select(func.array_agg(removed.c.id)).scalar_subquery().label("player_ids"),
+            select(func.array_agg(removed_inventory.c.id))
+            .scalar_subquery()
+            .label("inventory_ids"),
+            released_names,
+        )
+        return await self._purge_shards(query)
+
+    async def get_combat_stats(
+        self,
+        player_ids: list[int],
+    ) -> list[tuple[int, int, int, int]]:
+        """Metoda pobierająca statystyki walki wielu playerów jednym zapytaniem.
+
+        Czyta z bazy głównej, bo wynik walki jest od razu zapisywany.
+
+        Args:
+            player_ids (list[int]): Lista unikalnych ID playerów.
+
+        Returns:
+            list[tuple[int, int, int, int]]: ID, strength, hp i maxhp
+                istniejących playerów, posortowane po ID.
+        """
+        async def fetch(shard: Any, ids: list[int]) -> list[Record]:
+            query = (
+                select(
+                    player_table.c.id,
+                    player_table.c.strength,
+                    player_table.c.hp,
+                    player_table.c.maxhp,
+                )
+                .where(
+                    player_table.c.id == any_(bindparam("ids", ids, type_=ARRAY(Integer))),
+                    player_table.c.deleted_at.is_(None),
+                )
+                .order_by(player_table.c.id.asc())
+            )
+            return await shard.writer().fetch_all(query)
+
+        results = await asyncio.gather(*(
+            fetch(shard, ids) for shard, ids in shard_router.group(player_ids)
+        ))
+        return [
+            (row["id"], row["strength"], row["hp"], row["maxhp"])
+            for row in merge_sorted(list(results), key=lambda row: row["id"])
+        ]
+
+    async def apply_hp_deltas(
+        self,
+        player_ids: list[int],
+        damage: list[int],
+    ) -> list[tuple[int, int]]:
+        """Metoda odejmująca obrażenia od hp wielu playerów jednym zapytaniem.
+
+        Obrażenia są odejmowane od bieżącego hp w bazie i przycinane do
+        `0..maxhp`, więc równoległe zapisy nie są nadpisywane. Obie
+        tablice są przekazywane jako dwa parametry `unnest`, niezależnie
+        od liczby playerów.
+
+        Args:
+            player_ids (list[int]): Lista unikalnych ID playerów.
+            damage (list[int]): Obrażenia każdego playera (ujemne leczą).
+
+        Returns:
+            list[tuple[int, int]]: ID i nowe hp zmienionych playerów.
+        """
+        damage_by_id = dict(zip(player_ids, damage))
+
+        async def apply(shard: Any, ids: list[int]) -> list[Record]:
+            deltas = func.unnest(
+                bindparam("ids", ids, type_=ARRAY(Integer)),
+                bindparam(
+                    "damage",
+                    [damage_by_id[player_id] for player_id in ids],
+                    type_=ARRAY(BigInteger),
+                ),
+            ).table_valued("id", "damage").render_derived(name="v")
             query = (
                 player_table.update()
-                .where(player_table.c.id == player_id)
-                .values(**data.model_dump())
+                .where(
+                    player_table.c.id == deltas.c.id,
+                    player_table.c.deleted_at.is_(None),
+                )
+                .values(
+                    hp=func.least(
+                        func.greatest(player_table.c.hp - deltas.c.damage, 0),
+                        player_table.c.maxhp,
+                    ),
+                )
+                .returning(player_table.c.id, player_table.c.hp)
             )
-            await database.execute(query)
-            updated_player = await self._get_by_id(player_id)
-            return Player(**dict(updated_player)) if updated_player else None
-        return None
+            return await shard.writer().fetch_all(query)
+
+        results = await asyncio.gather(*(
+            apply(shard, ids) for shard, ids in shard_router.group(player_ids)
+        ))
+        return [(row["id"], row["hp"]) for rows in results for row in rows]
 
-    async def remove_player(self, player_id: int) -> bool:
-        """Metoda usuwająca playera z magazynu danych.
+    async def regenerate_hp(
+        self,
+        amount: int,
+        after_id: int,
+        limit: int,
+    ) -> list[tuple[int, int]]:
+        """Metoda regenerująca hp paczki playerów jednym zapytaniem.
+
+        Paczka to kolejne po `after_id` ID playerów z niepełnym hp, więc
+        koszt zapytania jest ograniczony przez `limit` niezależnie od
+        liczby wszystkich playerów. Przy kilku shardach paczka to pierwsze
+        `limit` ID po scaleniu kandydatów ze wszystkich shardów, aby
+        kolejna paczka, zaczynająca się po największym ID, niczego nie
+        pominęła.
 
         Args:
-            player_id (int): ID playera do usunięcia.
+            amount (int): Liczba hp dodawana każdemu playerowi.
+            after_id (int): ID, po którym zaczyna się paczka.
+            limit (int): Maksymalna liczba playerów w paczce.
 
         Returns:
-            bool: Powodzenie operacji usuwania.
+            list[tuple[int, int]]: ID i nowe hp zregenerowanych playerów.
         """
-        if await self._get_by_id(player_id):
-            query = player_table.delete().where(player_table.c.id == player_id)
-            await database.execute(query)
-            return True
-        return False
+        batch = (
+            select(player_table.c.id)
+            .where(
+                player_table.c.id > after_id,
+                player_table.c.hp < player_table.c.maxhp,
+                player_table.c.deleted_at.is_(None),
+            )
+            .order_by(player_table.c.id.asc())
+            .limit(limit)
+            .cte("batch")
+        )
+        regenerate = (
+            player_table.update()
+            .where(player_table.c.hp < player_table.c.maxhp)
+            .values(hp=func.least(player_table.c.hp + amount, player_table.c.maxhp))
+            .returning(player_table.c.id, player_table.c.hp)
+        )
+        if not shard_router.distributed:
+            query = regenerate.where(player_table.c.id == batch.c.id)
+            rows = await shard_router.main().writer().fetch_all(query)
+            return [(row["id"], row["hp"]) for row in rows]
+
+        candidates = await shard_router.gather(
+            lambda shard: shard.writer().fetch_all(select(batch.c.id))
+        )
+        batch_ids = [
+            row["id"] for row in merge_sorted(candidates, key=lambda row: row["id"])
+        ][:limit]
+        results = await asyncio.gather(*(
+            shard.writer().fetch_all(regenerate.where(
+                player_table.c.id == any_(bindparam("ids", ids, type_=ARRAY(Integer))),
+            ))
+            for shard, ids in shard_router.group(batch_ids)
+        ))
+        return [(row["id"], row["hp"]) for rows in results for row in rows]
+
+    def _get_character_query(self) -> tuple[TextClause, dict]:
+        """Prywatna metoda zwracająca skompilowane zapytanie `add_character`.
 
-    async def _get_by_id(self, player_id: int) -> Record | None:
+        Budowanie i kompilacja CTE kosztują więcej niż sam round trip,
+        więc zapytanie powstaje raz, z parametrami w miejscu wartości.
+
+        Returns:
+            tuple[TextClause, dict]: Zapytanie i wartości jego stałych parametrów.
+        """
+        if self._character_query is not None:
+            return self._character_query
+
+        bucket = bindparam("bucket", type_=Integer)
+        inventory_data: dict[str, Any] = {
+            name: cast(bindparam(name), inventory_table.c[name].type)
+            for name in ("money", "itemlist")
+        }
+        player_data: dict[str, Any] = {
+            name: cast(bindparam(name), player_table.c[name].type)
+            for name in ("name", "strength", "hp", "maxhp")
+        }
+        if shard_router.enabled:
+            inventory_data["id"] = shard_router.new_id(inventory_table, bucket)
+            player_data["id"] = shard_router.new_id(player_table, bucket)
+        new_inventory = (
+            insert(inventory_table)
+            .values(**inventory_data)
+            .returning(*inventory_table.c)
+            .cte("new_inventory")
+        )
+        new_player = (
+            insert(player_table)
+            .from_select(
+                [*player_data, "connectedinventory"],
+                select(*player_data.values(), new_inventory.c.id),
+            )
+            .returning(*player_table.c)
+            .cte("new_player")
+        )
+        query = select(
+            new_player,
+            new_inventory.c.money.label("inventory_money"),
+            new_inventory.c.itemlist.label("inventory_itemlist"),
+        ).join_from(
+            new_player,
+            new_inventory,
+            new_player.c.connectedinventory == new_inventory.c.id,
+        )
+        compiled = query.compile(dialect=postgresql.dialect(paramstyle="named"))
+        defaults = {
+            name: value
+            for name, value in compiled.params.items()
+            if name not in (*inventory_data, *player_data, "bucket")
+        }
+        self._character_query = (text(compiled.string), defaults)
+        return self._character_query
+
+    async def _get_by_id(self, player_id: int, primary: bool = False) -> Record | None:
         """Prywatna metoda pobierająca playera z bazy danych na podstawie ID.
 
         Args:
             player_id (int): ID playera.
+            primary (bool): Czy czytać z bazy głównej, np. przy zapisie.
 
         Returns:
             Record | None: Rekord playera, jeśli istnieje.
         """
         query = (
             player_table.select()
-            .where(player_table.c.id == player_id)
+            .where(player_table.c.id == player_id, player_table.c.deleted_at.is_(None))
             .order_by(player_table.c.name.asc())
         )
-        return await database.fetch_one(query)
+        shard = shard_router.for_id(player_id)
+        source = shard.writer() if primary else shard.reader()
+        return await source.fetch_one(query)
+
+    async def _purge_shards(self, query: Any) -> CharacterPurgeBatch:
+        """Prywatna metoda usuwająca paczkę playerów w każdym shardzie.
+
+        Args:
+            query (Any): Zapytanie zwracające ID usuniętych playerów,
+                inventory i nazwy do zwolnienia.
+
+        Returns:
+            CharacterPurgeBatch: ID usuniętych playerów i inventory.
+        """
+        rows = await shard_router.gather(lambda shard: shard.writer().fetch_one(query))
+        await release_player_names(name for row in rows for name in row["names"] or [])
+        return CharacterPurgeBatch(
+            player_ids=[player_id for row in rows for player_id in row["player_ids"] or []],
+            inventory_ids=[
+                inventory_id for row in rows for inventory_id in row["inventory_ids"] or []
+            ],
+        )
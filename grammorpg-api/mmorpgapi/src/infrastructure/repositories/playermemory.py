@@ -0,0 +1,383 @@
+"""Moduł zawierający implementację repozytorium player w pamięci procesu."""
+
+from datetime import datetime, timezone
+from typing import Any, Iterable
+
+from src.core.domain.character import Character, CharacterIn, CharacterPurgeBatch
+from src.core.domain.inventory import Inventory
+from src.core.domain.player import Player, PlayerBatch, PlayerIn
+from src.core.repositories.iplayer import IPlayerRepository
+from src.infrastructure.utils.memorystore import MemoryStore
+
+
+class PlayerMemoryRepository(IPlayerRepository):
+    """Klasa implementująca repozytorium player w pamięci procesu.
+
+    Unikalność nazw zapewnia indeks nazw nieusuniętych playerów, a klucz
+    obcy inventory jest sprawdzany przed zapisem.
+    """
+
+    def __init__(
+        self,
+        store: MemoryStore,
+        soft_delete: bool = False,
+        cascade: bool = True,
+    ) -> None:
+        """Inicjalizator klasy `PlayerMemoryRepository`.
+
+        Args:
+            store (MemoryStore): Tabele współdzielone z innymi repozytoriami.
+            soft_delete (bool): Czy usuwanie tylko oznacza playera jako usuniętego.
+            cascade (bool): Czy czyszczenie usuwa również inventory playerów.
+        """
+        self._players = store.players
+        self._inventories = store.inventories
+        self._soft_delete = soft_delete
+        self._cascade = cascade
+
+    async def get_player_by_id(self, player_id: int) -> Any | None:
+        """Metoda pobierająca playera po ID.
+
+        Args:
+            player_id (int): ID playera.
+
+        Returns:
+            Any | None: Dane playera, jeśli istnieje.
+        """
+        player = self._get_live(player_id)
+        return Player(**player) if player else None
+
+    async def get_all_players(self) -> Iterable[Any]:
+        """Metoda pobierająca wszystkich playerów posortowanych po nazwie.
+
+        Returns:
+            Iterable[Any]: Kolekcja playerów.
+        """
+        players = sorted(
+            (player for player in self._players.after() if player["deleted_at"] is None),
+            key=lambda player: (player["name"] is None, player["name"] or ""),
+        )
+        return [Player(**player) for player in players]
+
+    async def get_players_page(self, after_id: int, limit: int) -> Iterable[Any]:
+        """Metoda pobierająca stronę playerów o ID większym niż `after_id`.
+
+        Args:
+            after_id (int): ID ostatniego playera poprzedniej strony.
+            limit (int): Maksymalna liczba playerów na stronie.
+
+        Returns:
+            Iterable[Any]: Playerzy posortowani po ID.
+        """
+        page = []
+        for player in self._players.after(after_id):
+            if len(page) >= limit:
+                break
+            if player["deleted_at"] is None:
+                page.append(Player(**player))
+        return page
+
+    async def get_many_by_ids(self, player_ids: list[int]) -> PlayerBatch:
+        """Metoda pobierająca wielu playerów naraz.
+
+        Args:
+            player_ids (list[int]): Lista ID playerów.
+
+        Returns:
+            PlayerBatch: Playerzy w kolejności ID oraz brakujące ID.
+        """
+        unique_ids = list(dict.fromkeys(player_ids))
+        found = {
+            player_id: player
+            for player_id in unique_ids
+            if (player := self._get_live(player_id))
+        }
+        return PlayerBatch(
+            players=[Player(**found[player_id]) for player_id in unique_ids if player_id in found],
+            missing=[player_id for player_id in unique_ids if player_id not in found],
+        )
+
+    async def get_player_by_name(self, name: str) -> Any | None:
+        """Metoda pobierająca playera po nazwie z indeksu nazw.
+
+        Args:
+            name (str): Nazwa playera.
+
+        Returns:
+            Any | None: Dane playera, jeśli istnieje.
+        """
+        players = self._players.lookup("name", name)
+        return Player(**players[0]) if players else None
+
+    async def get_all_names(self) -> list[str]:
+        """Metoda pobierająca nazwy wszystkich playerów.
+
+        Returns:
+            list[str]: Zajęte nazwy playerów.
+        """
+        return [
+            player["name"]
+            for player in self._players.after()
+            if player["deleted_at"] is None and player["name"] is not None
+        ]
+
+    async def add_player(self, data: PlayerIn) -> Any | None:
+        """Metoda dodająca nowego playera.
+
+        Args:
+            data (PlayerIn): Atrybuty playera.
+
+        Raises:
+            ValueError: Jeśli nazwa playera jest już zajęta lub inventory
+                nie istnieje.
+
+        Returns:
+            Any | None: Nowo utworzony player.
+        """
+        self._check_name(data.name)
+        self._check_inventory(data.connectedinventory)
+        player = self._players.put(self._new_row(self._players.new_id(), data.model_dump()))
+        return Player(**player)
+
+    async def add_character(self, data: CharacterIn) -> Character:
+        """Metoda dodająca playera wraz z jego inventory.
+
+        Args:
+            data (CharacterIn): Atrybuty playera i inventory.
+
+        Raises:
+            ValueError: Jeśli nazwa playera jest już zajęta.
+
+        Returns:
+            Character: Nowo utworzony player i jego inventory.
+        """
+        self._check_name(data.player.name)
+        inventory = self._inventories.put({
+            **data.inventory.model_dump(),
+            "id": self._inventories.new_id(),
+            "deleted_at": None,
+        })
+        player = self._players.put(self._new_row(
+            self._players.new_id(),
+            {**data.player.model_dump(), "connectedinventory": inventory["id"]},
+        ))
+        return Character(player=Player(**player), inventory=Inventory(**inventory))
+
+    async def update_player(self, player_id: int, data: PlayerIn) -> Any | None:
+        """Metoda aktualizująca dane playera.
+
+        Args:
+            player_id (int): ID playera.
+            data (PlayerIn): Zaktualizowane atrybuty playera.
+
+        Raises:
+            ValueError: Jeśli nowa nazwa playera jest już zajęta lub nowe
+                inventory nie istnieje.
+
+        Returns:
+            Any | None: Zaktualizowany player, jeśli istnieje.
+        """
+        current = self._get_live(player_id)
+        if not current:
+            return None
+
+        if data.name != current["name"]:
+            self._check_name(data.name)
+        if data.connectedinventory != current["connectedinventory"]:
+            self._check_inventory(data.connectedinventory)
+        player = self._players.put({
+            **current,
+            **data.model_dump(),
+            "last_active_at": datetime.now(timezone.utc),
+        })
+        return Player(**player)
+
+    async def remove_player(self, player_id: int) -> str | None:
+        """Metoda usuwająca (lub oznaczająca jako usuniętego) playera.
+
+        Args:
+            player_id (int): ID playera do usunięcia.
+
+        Returns:
+            str | None: Nazwa usuniętego playera lub None, jeśli nie istniał.
+        """
+        player = self._get_live(player_id)
+        if not player:
+            return None
+
+        if self._soft_delete:
+            self._players.put({**player, "deleted_at": datetime.now(timezone.utc)})
+        else:
+            self._players.delete(player_id)
+        return player["name"]
+
+    async def purge_inactive_players(
+        self,
+        inactive_before: datetime,
+        limit: int,
+    ) -> CharacterPurgeBatch:
+        """Metoda trwale usuwająca jedną paczkę nieaktywnych playerów.
+
+        Usuwa playerów nieaktywnych od `inactive_before` oraz oznaczonych
+        jako usunięci przed tą datą. Przy kaskadzie usuwa też inventory,
+        do których nie odwołuje się już żaden inny player.
+
+        Args:
+            inactive_before (datetime): Granica nieaktywności.
+            limit (int): Maksymalna liczba playerów w paczce.
+
+        Returns:
+            CharacterPurgeBatch: ID usuniętych playerów i inventory.
+        """
+        batch = []
+        for player in self._players.after():
+            if len(batch) >= limit:
+                break
+            if player["last_active_at"] < inactive_before or (
+                player["deleted_at"] is not None and player["deleted_at"] < inactive_before
+            ):
+                batch.append(player)
+
+        for player in batch:
+            self._players.delete(player["id"])
+
+        inventory_ids = []
+        if self._cascade:
+            for inventory_id in dict.fromkeys(player["connectedinventory"] for player in batch):
+                if (
+                    not self._players.lookup("connectedinventory", inventory_id)
+                    and self._inventories.delete(inventory_id) is not None
+                ):
+                    inventory_ids.append(inventory_id)
+
+        return CharacterPurgeBatch(
+            player_ids=[player["id"] for player in batch],
+            inventory_ids=inventory_ids,
+        )
+
+    async def get_combat_stats(
+        self,
+        player_ids: list[int],
+    ) -> list[tuple[int, int, int, int]]:
+        """Metoda pobierająca statystyki walki wielu playerów.
+
+        Args:
+            player_ids (list[int]): Lista unikalnych ID playerów.
+
+        Returns:
+            list[tuple[int, int, int, int]]: ID, strength, hp i maxhp
+                istniejących playerów, posortowane po ID.
+        """
+        return [
+            (player["id"], player["strength"], player["hp"], player["maxhp"])
+            for player_id in sorted(player_ids)
+            if (player := self._get_live(player_id))
+        ]
+
+    async def apply_hp_deltas(
+        self,
+        player_ids: list[int],
+        damage: list[int],
+    ) -> list[tuple[int, int]]:
+        """Metoda odejmująca obrażenia od hp wielu playerów.
+
+        Hp jest przycinane do `0..maxhp`, jak w repozytorium bazodanowym.
+
+        Args:
+            player_ids (list[int]): Lista unikalnych ID playerów.
+            damage (list[int]): Obrażenia każdego playera (ujemne leczą).
+
+        Returns:
+            list[tuple[int, int]]: ID i nowe hp zmienionych playerów.
+        """
+        changed = []
+        for player_id, player_damage in zip(player_ids, damage):
+            if player := self._get_live(player_id):
+                hp = min(max(player["hp"] - player_damage, 0), player["maxhp"])
+                self._players.put({**player, "hp": hp})
+                changed.append((player_id, hp))
+        return changed
+
+    async def regenerate_hp(
+        self,
+        amount: int,
+        after_id: int,
+        limit: int,
+    ) -> list[tuple[int, int]]:
+        """Metoda regenerująca hp paczki playerów.
+
+        Args:
+            amount (int): Liczba hp dodawana każdemu playerowi.
+            after_id (int): ID, po którym zaczyna się paczka.
+            limit (int): Maksymalna liczba playerów w paczce.
+
+        Returns:
+            list[tuple[int, int]]: ID i nowe hp zregenerowanych playerów.
+        """
+        batch = []
+        for player in self._players.after(after_id):
+            if len(batch) >= limit:
+                break
+            if player["hp"] < player["maxhp"] and player["deleted_at"] is None:
+                batch.append(player)
+
+        regenerated = []
+        for player in batch:
+            hp = min(player["hp"] + amount, player["maxhp"])
+            self._players.put({**player, "hp": hp})
+            regenerated.append((player["id"], hp))
+        return regenerated
+
+    def _get_live(self, player_id: int) -> dict | None:
+        """Prywatna metoda pobierająca nieusuniętego playera.
+
+        Args:
+            player_id (int): ID playera.
+
+        Returns:
+            dict | None: Wiersz playera, jeśli istnieje.
+        """
+        player = self._players.get(player_id)
+        return player if player and player["deleted_at"] is None else None
+
+    def _check_name(self, name: str) -> None:
+        """Prywatna metoda sprawdzająca unikalność nazwy playera.
+
+        Args:
+            name (str): Nazwa playera.
+
+        Raises:
+            ValueError: Jeśli nazwa jest już zajęta.
+        """
+        if self._players.lookup("name", name):
+            raise ValueError(f"Player with name '{name}' already exists.")
+
+    def _check_inventory(self, inventory_id: int) -> None:
+        """Prywatna metoda sprawdzająca klucz obcy inventory.
+
+        Args:
+            inventory_id (int): ID inventory.
+
+        Raises:
+            ValueError: Jeśli inventory nie istnieje.
+        """
+        if self._inventories.get(inventory_id) is None:
+            raise ValueError(f"Inventory with ID {inventory_id} does not exist.")
+
+    @staticmethod
+    def _new_row(player_id: int, values: dict) -> dict:
+        """Prywatna metoda budująca wiersz nowego playera.
+
+        Args:
+            player_id (int): ID playera.
+            values (dict): Atrybuty playera.
+
+        Returns:
+            dict: Wiersz z domyślnymi kolumnami.
+        """
+        return {
+            **values,
+            "id": player_id,
+            "last_active_at": datetime.now(timezone.utc),
+            "deleted_at": None,
+        }
@@ -0,0 +1,60 @@
+"""Moduł zawierający globalną rezerwację nazw playerów między shardami."""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Iterable
+
+from asyncpg import UniqueViolationError  # type: ignore
+from sqlalchemy import String, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from src.db import player_name_table, shard_router
+
+
+@asynccontextmanager
+async def claim_player_name(name: str | None) -> AsyncIterator[None]:
+    """Rezerwacja nazwy playera na czas zapisu w shardzie.
+
+    Unikalny indeks nazw obejmuje tylko jeden shard, więc przy kilku
+    shardach nazwa jest najpierw rezerwowana w bazie głównej. Jeśli zapis
+    w shardzie się nie powiedzie, rezerwacja jest zwalniana.
+
+    Args:
+        name (str | None): Nowa nazwa playera lub None, gdy się nie zmienia.
+
+    Raises:
+        ValueError: Jeśli nazwa jest już zajęta.
+    """
+    if name is None or not shard_router.distributed:
+        yield
+        return
+
+    try:
+        await shard_router.main().writer().execute(
+            player_name_table.insert().values(name=name)
+        )
+    except UniqueViolationError:
+        raise ValueError(f"Player with name '{name}' already exists.")
+
+    try:
+        yield
+    except BaseException:
+        await release_player_names([name])
+        raise
+
+
+async def release_player_names(names: Iterable[str | None]) -> None:
+    """Zwolnienie nazw usuniętych lub przemianowanych playerów.
+
+    Args:
+        names (Iterable[str | None]): Zwalniane nazwy.
+    """
+    names = [name for name in names if name is not None]
+    if not names or not shard_router.distributed:
+        return
+
+    await shard_router.main().writer().execute(
+        player_name_table.delete().where(
+            player_name_table.c.name == any_(bindparam("names", names, type_=ARRAY(String)))
+        )
+    )
+
@@ -0,0 +1,60 @@
+"""Module containing shared rate limit database repository implementation."""
+
+from sqlalchemy import text
+
+from src.core.repositories.iratelimit import IRateLimitRepository
+from src.db import db_router
+
+# One statement per request: refill, take and report in a single upsert,
+# using the DB clock so that all workers share the same time source.
+TAKE_TOKEN_QUERY = text(
+    """
+    INSERT INTO rate_limit_buckets AS b (key, tokens, updated_at, allowed)
+    VALUES (
+        :key,
+        CAST(:capacity AS float8) - 1,
+        extract(epoch FROM clock_timestamp()),
+        true
+    )
+    ON CONFLICT (key) DO UPDATE SET
+        tokens = CASE
+            WHEN LEAST(CAST(:capacity AS float8), b.tokens
+                    + (EXCLUDED.updated_at - b.updated_at) * CAST(:rate AS float8)) >= 1
+            THEN LEAST(CAST(:capacity AS float8), b.tokens
+                    + (EXCLUDED.updated_at - b.updated_at) * CAST(:rate AS float8)) - 1
+            ELSE LEAST(CAST(:capacity AS float8), b.tokens
+                    + (EXCLUDED.updated_at - b.updated_at) * CAST(:rate AS float8))
+        END,
+        allowed = LEAST(CAST(:capacity AS float8), b.tokens
+                    + (EXCLUDED.updated_at - b.updated_at) * CAST(:rate AS float8)) >= 1,
+        updated_at = EXCLUDED.updated_at
+    RETURNING tokens, allowed
+    """
+)
+
+
+class RateLimitRepository(IRateLimitRepository):
+    """A class implementing token buckets shared by all workers."""
+
+    async def take_token(self, key: str, capacity: int, refill_rate: float) -> float:
+        """The method taking one token from the bucket.
+
+        Args:
+            key (str): The bucket key.
+            capacity (int): The bucket capacity.
+            refill_rate (float): The number of tokens refilled per second.
+
+        Returns:
+            float: 0 if the token was taken, otherwise seconds until
+                the next token is available.
+        """
+
+        # databases only binds values passed separately to plain strings.
+        bucket = await db_router.writer().fetch_one(
+            TAKE_TOKEN_QUERY.bindparams(key=key, capacity=capacity, rate=refill_rate)
+        )
+
+        if bucket is None or bucket["allowed"]:
+            return 0.0
+
+        return (1.0 - bucket["tokens"]) / refill_rate
@@ -0,0 +1,56 @@
+"""Module containing in-process rate limit repository implementation."""
+
+import time
+from collections import OrderedDict
+
+from src.core.repositories.iratelimit import IRateLimitRepository
+
+
+class RateLimitMemoryRepository(IRateLimitRepository):
+    """A class implementing token buckets kept in the worker memory."""
+
+    _buckets: OrderedDict[str, list[float]]
+
+    def __init__(self, max_buckets: int = 100_000) -> None:
+        """The initializer of the `rate limit repository`.
+
+        Args:
+            max_buckets (int): The number of buckets kept before the least
+                recently used ones are evicted.
+        """
+
+        self._buckets = OrderedDict()
+        self._max_buckets = max_buckets
+
+    async def take_token(self, key: str, capacity: int, refill_rate: float) -> float:
+        """The method taking one token from the bucket.
+
+        Args:
+            key (str): The bucket key.
+            capacity (int): The bucket capacity.
+            refill_rate (float): The number of tokens refilled per second.
+
+        Returns:
+            float: 0 if the token was taken, otherwise seconds until
+                the next token is available.
+        """
+
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+
+        if bucket is None:
+            if len(self._buckets) >= self._max_buckets:
+                self._buckets.popitem(last=False)
+            self._buckets[key] = [capacity - 1.0, now]
+            return 0.0
+
+        self._buckets.move_to_end(key)
+        tokens = min(capacity, bucket[0] + (now - bucket[1]) * refill_rate)
+        bucket[1] = now
+
+        if tokens >= 1.0:
+            bucket[0] = tokens - 1.0
+            return 0.0
+
+        bucket[0] = tokens
+        return (1.0 - tokens) / refill_rate
@@ -0,0 +1,185 @@
+"""Moduł zawierający implementację repozytorium receptur."""
+
+from typing import Iterable
+
+from asyncpg import ForeignKeyViolationError, UniqueViolationError  # type: ignore
+from sqlalchemy import Select, func, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+
+from src.core.domain.recipe import Recipe, RecipeIn, RecipeItemIn
+from src.core.repositories.irecipe import IRecipeRepository
+from src.db import recipe_item_table, recipe_table, db_router
+
+
+class RecipeRepository(IRecipeRepository):
+    """Klasa implementująca repozytorium receptur."""
+
+    async def add_recipe(self, data: RecipeIn) -> Recipe:
+        """Metoda dodająca recepturę wraz z przedmiotami w jednej transakcji.
+
+        Args:
+            data (RecipeIn): Atrybuty, wejścia i wyjścia receptury.
+
+        Raises:
+            ValueError: Jeśli nazwa jest zajęta lub przedmiot nie istnieje.
+
+        Returns:
+            Recipe: Nowo utworzona receptura.
+        """
+        query = (
+            recipe_table.insert()
+            .values(name=data.name, money=data.money)
+            .returning(recipe_table.c.id)
+        )
+        try:
+            async with db_router.writer().transaction():
+                recipe_id = await db_router.writer().fetch_val(query)
+                await self._insert_items(recipe_id, data)
+        except UniqueViolationError:
+            raise ValueError(f"Recipe with name '{data.name}' already exists.")
+        except ForeignKeyViolationError:
+            raise ValueError("Recipe references an item which does not exist.")
+
+        return Recipe(id=recipe_id, **data.model_dump())
+
+    async def update_recipe(self, recipe_id: int, data: RecipeIn) -> Recipe | None:
+        """Metoda zastępująca atrybuty i przedmioty receptury.
+
+        Args:
+            recipe_id (int): ID receptury.
+            data (RecipeIn): Nowe atrybuty, wejścia i wyjścia receptury.
+
+        Raises:
+            ValueError: Jeśli nazwa jest zajęta lub przedmiot nie istnieje.
+
+        Returns:
+            Recipe | None: Zaktualizowana receptura, jeśli istnieje.
+        """
+        query = (
+            recipe_table.update()
+            .where(recipe_table.c.id == recipe_id)
+            .values(name=data.name, money=data.money)
+            .returning(recipe_table.c.id)
+        )
+        try:
+            async with db_router.writer().transaction():
+                if await db_router.writer().fetch_val(query) is None:
+                    return None
+
+                await db_router.writer().execute(
+                    recipe_item_table.delete()
+                    .where(recipe_item_table.c.recipe_id == recipe_id)
+                )
+                await self._insert_items(recipe_id, data)
+        except UniqueViolationError:
+            raise ValueError(f"Recipe with name '{data.name}' already exists.")
+        except ForeignKeyViolationError:
+            raise ValueError("Recipe references an item which does not exist.")
+
+        return Recipe(id=recipe_id, **data.model_dump())
+
+    async def remove_recipe(self, recipe_id: int) -> bool:
+        """Metoda usuwająca recepturę (przedmioty usuwa kaskada).
+
+        Args:
+            recipe_id (int): ID receptury.
+
+        Returns:
+            bool: Powodzenie operacji usuwania.
+        """
+        query = (
+            recipe_table.delete()
+            .where(recipe_table.c.id == recipe_id)
+            .returning(recipe_table.c.id)
+        )
+        return await db_router.writer().fetch_val(query) is not None
+
+    async def get_recipe(self, recipe_id: int, primary: bool = False) -> Recipe | None:
+        """Metoda pobierająca recepturę wraz z przedmiotami jednym zapytaniem.
+
+        Args:
+            recipe_id (int): ID receptury.
+            primary (bool): Czy czytać z bazy głównej.
+
+        Returns:
+            Recipe | None: Receptura, jeśli istnieje.
+        """
+        source = db_router.writer() if primary else db_router.reader()
+        row = await source.fetch_one(
+            self._recipes_query().where(recipe_table.c.id == recipe_id)
+        )
+        return self._to_recipe(row) if row else None
+
+    async def get_all_recipes(self) -> Iterable[Recipe]:
+        """Metoda pobierająca wszystkie receptury jednym zapytaniem.
+
+        Returns:
+            Iterable[Recipe]: Kolekcja receptur.
+        """
+        rows = await db_router.reader().fetch_all(
+            self._recipes_query().order_by(recipe_table.c.name.asc())
+        )
+        return [self._to_recipe(row) for row in rows]
+
+    async def _insert_items(self, recipe_id: int, data: RecipeIn) -> None:
+        """Prywatna metoda wstawiająca przedmioty receptury jednym zapytaniem.
+
+        Args:
+            recipe_id (int): ID receptury.
+            data (RecipeIn): Wejścia i wyjścia receptury.
+        """
+        rows = [
+            {"recipe_id": recipe_id, "produced": produced, **entry.model_dump()}
+            for produced, entries in ((False, data.inputs), (True, data.outputs))
+            for entry in entries
+        ]
+        await db_router.writer().execute(recipe_item_table.insert().values(rows))
+
+    @staticmethod
+    def _recipes_query() -> Select:
+        """Prywatna metoda budująca zapytanie o receptury z przedmiotami.
+
+        Returns:
+            Select: Zapytanie zwracające recepturę i tablice jej przedmiotów.
+        """
+        order = recipe_item_table.c.item_id.asc()
+        return (
+            select(
+                recipe_table,
+                func.array_agg(aggregate_order_by(recipe_item_table.c.produced, order))
+                .label("produced"),
+                func.array_agg(aggregate_order_by(recipe_item_table.c.item_id, order))
+                .label("item_ids"),
+                func.array_agg(aggregate_order_by(recipe_item_table.c.quantity, order))
+                .label("quantities"),
+            )
+            .select_from(recipe_table.outerjoin(recipe_item_table))
+            .group_by(recipe_table.c.id)
+        )
+
+    @staticmethod
+    def _to_recipe(row: dict) -> Recipe:
+        """Prywatna metoda budująca recepturę z wiersza zapytania.
+
+        Args:
+            row (dict): Wiersz z recepturą i tablicami jej przedmiotów.
+
+        Returns:
+            Recipe: Receptura.
+        """
+        entries = [
+            (produced, RecipeItemIn(item_id=item_id, quantity=quantity))
+            for produced, item_id, quantity in zip(
+                row["produced"],
+                row["item_ids"],
+                row["quantities"],
+            )
+            if item_id is not None
+        ]
+        return Recipe(
+            id=row["id"],
+            name=row["name"],
+            money=row["money"],
+            inputs=[entry for produced, entry in entries if not produced],
+            outputs=[entry for produced, entry in entries if produced],
+        )
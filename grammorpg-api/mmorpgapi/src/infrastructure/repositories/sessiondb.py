@@ -0,0 +1,134 @@
+"""Moduł zawierający implementację repozytorium sesji user."""
+
+from datetime import datetime
+
+from pydantic import UUID4
+from sqlalchemy import func
+
+from src.core.domain.user import UserSession
+from src.core.repositories.isession import ISessionRepository
+from src.db import user_session_table, db_router
+
+
+class SessionRepository(ISessionRepository):
+    """Klasa implementująca repozytorium sesji user."""
+
+    async def add_session(
+        self,
+        session_id: UUID4,
+        user_id: UUID4,
+        refresh_hash: str,
+        expires_at: datetime,
+    ) -> UserSession:
+        """Metoda zapisująca nową sesję.
+
+        Args:
+            session_id (UUID4): ID sesji.
+            user_id (UUID4): UUID user.
+            refresh_hash (str): Hash tokenu odświeżającego.
+            expires_at (datetime): Koniec ważności tokenu odświeżającego.
+
+        Returns:
+            UserSession: Nowa sesja.
+        """
+        query = (
+            user_session_table.insert()
+            .values(
+                id=session_id,
+                user_id=user_id,
+                refresh_hash=refresh_hash,
+                expires_at=expires_at,
+            )
+            .returning(*user_session_table.c)
+        )
+        return UserSession(**dict(await db_router.writer().fetch_one(query)))
+
+    async def rotate_session(
+        self,
+        session_id: UUID4,
+        refresh_hash: str,
+        new_refresh_hash: str,
+        expires_at: datetime,
+    ) -> UserSession | None:
+        """Metoda wymieniająca token odświeżający jednym warunkowym zapytaniem.
+
+        Warunek na bieżący hash sprawia, że token odświeżający działa
+        tylko raz, także przy równoległych żądaniach.
+
+        Args:
+            session_id (UUID4): ID sesji.
+            refresh_hash (str): Hash przedstawionego tokenu odświeżającego.
+            new_refresh_hash (str): Hash nowego tokenu odświeżającego.
+            expires_at (datetime): Nowy koniec ważności tokenu.
+
+        Returns:
+            UserSession | None: Sesja po wymianie lub None, jeśli nie istnieje,
+                wygasła, została unieważniona lub token nie pasuje.
+        """
+        query = (
+            user_session_table.update()
+            .where(
+                user_session_table.c.id == session_id,
+                user_session_table.c.refresh_hash == refresh_hash,
+                user_session_table.c.revoked_at.is_(None),
+                user_session_table.c.expires_at > func.now(),
+            )
+            .values(refresh_hash=new_refresh_hash, expires_at=expires_at)
+            .returning(*user_session_table.c)
+        )
+        session = await db_router.writer().fetch_one(query)
+        return UserSession(**dict(session)) if session else None
+
+    async def revoke_session(self, session_id: UUID4) -> UserSession | None:
+        """Metoda unieważniająca sesję.
+
+        Args:
+            session_id (UUID4): ID sesji.
+
+        Returns:
+            UserSession | None: Unieważniona sesja, jeśli była aktywna.
+        """
+        query = (
+            user_session_table.update()
+            .where(
+                user_session_table.c.id == session_id,
+                user_session_table.c.revoked_at.is_(None),
+            )
+            .values(revoked_at=func.now())
+            .returning(*user_session_table.c)
+        )
+        session = await db_router.writer().fetch_one(query)
+        return UserSession(**dict(session)) if session else None
+
+    async def get_session(self, session_id: UUID4) -> UserSession | None:
+        """Metoda pobierająca sesję po ID.
+
+        Sesja jest czytana z bazy głównej, bo token dostępu trafia do
+        klienta zaraz po jej zapisaniu.
+
+        Args:
+            session_id (UUID4): ID sesji.
+
+        Returns:
+            UserSession | None: Sesja, jeśli istnieje.
+        """
+        query = user_session_table.select().where(user_session_table.c.id == session_id)
+        session = await db_router.writer().fetch_one(query)
+        return UserSession(**dict(session)) if session else None
+
+    async def get_revoked_since(self, since: datetime) -> list[UserSession]:
+        """Metoda pobierająca sesje unieważnione od podanej chwili.
+
+        Args:
+            since (datetime): Najstarsza chwila unieważnienia.
+
+        Returns:
+            list[UserSession]: Sesje od najdawniej unieważnionej.
+        """
+        query = (
+            user_session_table.select()
+            .where(user_session_table.c.revoked_at >= since)
+            .order_by(user_session_table.c.revoked_at.asc())
+        )
+        sessions = await db_router.writer().fetch_all(query)
+        return [UserSession(**dict(session)) for session in sessions]
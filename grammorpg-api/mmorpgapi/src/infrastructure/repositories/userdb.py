@@ -0,0 +1,67 @@
+"""Moduł zawierający implementację repozytorium user."""
+
+import uuid
+from typing import Any
+
+from asyncpg import UniqueViolationError  # type: ignore
+from pydantic import UUID4
+
+from src.core.domain.user import User, UserIn
+from src.core.repositories.iuser import IUserRepository
+from src.db import user_table, db_router
+
+
+class UserRepository(IUserRepository):
+    """Klasa implementująca repozytorium user."""
+
+    async def register_user(self, user: UserIn) -> Any | None:
+        """Metoda rejestrująca user.
+
+        Args:
+            user (UserIn): Dane user z zahashowanym hasłem.
+
+        Raises:
+            ValueError: Jeśli email jest zajęty.
+
+        Returns:
+            Any | None: Nowy obiekt user.
+        """
+        query = (
+            user_table.insert()
+            .values(id=uuid.uuid4(), **user.model_dump())
+            .returning(*user_table.c)
+        )
+        try:
+            new_user = await db_router.writer().fetch_one(query)
+        except UniqueViolationError:
+            raise ValueError(f"User with email '{user.email}' already exists.")
+        return User(**dict(new_user)) if new_user else None
+
+    async def get_by_uuid(self, uuid: UUID4) -> Any | None:
+        """Metoda pobrania user przez uuid (klucz główny).
+
+        Args:
+            uuid (UUID4): UUID user.
+
+        Returns:
+            Any | None: Obiekt user.
+        """
+        query = user_table.select().where(user_table.c.id == uuid)
+        user = await db_router.reader().fetch_one(query)
+        return User(**dict(user)) if user else None
+
+    async def get_by_email(self, email: str) -> Any | None:
+        """Metoda pobrania user przez email (unikalny indeks).
+
+        Czyta z bazy głównej, bo logowanie zaraz po rejestracji nie może
+        trafić na opóźnioną replikę.
+
+        Args:
+            email (str): Email user.
+
+        Returns:
+            Any | None: Obiekt user.
+        """
+        query = user_table.select().where(user_table.c.email == email)
+        user = await db_router.writer().fetch_one(query)
+        return User(**dict(user)) if user else None
@@ -0,0 +1,102 @@
+"""Moduł zawierający implementację usług walki."""
+
+import numpy as np
+
+from src.core.domain.combat import CombatIn, CombatOut
+from src.core.repositories.iplayer import IPlayerRepository
+from src.infrastructure.services.icombat import ICombatService
+from src.infrastructure.services.inotifier import IChangeNotifier
+from src.infrastructure.utils.combat import resolve_attacks
+from src.infrastructure.utils.singleflight import SingleFlight
+
+
+class CombatService(ICombatService):
+    """Klasa implementująca usługę walki."""
+
+    _repository: IPlayerRepository
+    _notifier: IChangeNotifier
+    _single_flight: SingleFlight
+
+    def __init__(
+        self,
+        repository: IPlayerRepository,
+        notifier: IChangeNotifier,
+        single_flight: SingleFlight,
+    ) -> None:
+        """Inicjalizator klasy `CombatService`.
+
+        Args:
+            repository (IPlayerRepository): Referencja do repozytorium player.
+            notifier (IChangeNotifier): Referencja do notyfikatora zmian.
+            single_flight (SingleFlight): Grupa łącząca identyczne odczyty.
+        """
+
+        self._repository = repository
+        self._notifier = notifier
+        self._single_flight = single_flight
+
+    async def resolve(self, data: CombatIn) -> CombatOut:
+        """Metoda rozstrzygająca rundę walki.
+
+        Statystyki wszystkich uczestników są pobierane jednym zapytaniem,
+        runda jest liczona wektorowo, a suma obrażeń każdego celu jest
+        zapisywana jednym zapytaniem. Ataki z udziałem nieistniejących
+        playerów zadają 0 obrażeń.
+
+        Args:
+            data (CombatIn): Ataki wykonywane jednocześnie.
+
+        Returns:
+            CombatOut: Obrażenia ataków i nowe hp zmienionych playerów.
+        """
+        attacks = np.array(
+            [(attack.attacker_id, attack.target_id) for attack in data.attacks],
+            dtype=np.int64,
+        )
+        power = np.array([attack.power for attack in data.attacks], dtype=np.float64)
+
+        requested_ids, index = np.unique(attacks, return_inverse=True)
+        index = index.reshape(attacks.shape)
+        stats = await self._repository.get_combat_stats(requested_ids.tolist())
+
+        columns = np.array(stats, dtype=np.int64).reshape(-1, 4)
+        player_ids = columns[:, 0]
+        missing = ~np.isin(requested_ids, player_ids)
+
+        # Obie tablice są posortowane, więc pozycja playera wśród
+        # znalezionych jest jego indeksem w kolumnach statystyk.
+        position = np.searchsorted(player_ids, requested_ids)
+        valid = ~(missing[index[:, 0]] | missing[index[:, 1]])
+
+        damage = np.zeros(len(data.attacks), dtype=np.int64)
+        if valid.any():
+            combat_round = resolve_attacks(
+                position[index[valid, 0]],
+                position[index[valid, 1]],
+                power[valid],
+                columns[:, 1],
+                columns[:, 2],
+                columns[:, 3],
+            )
+            damage[valid] = combat_round.damage
+            changed = combat_round.hp != columns[:, 2]
+            updated = await self._repository.apply_hp_deltas(
+                player_ids[changed].tolist(),
+                combat_round.total_damage[changed].tolist(),
+            )
+        else:
+            updated = []
+
+        for player_id, _ in updated:
+            self._single_flight.forget(f"player:{player_id}")
+        await self._notifier.publish_many(
+            "player",
+            [(player_id, {"hp": hp}) for player_id, hp in updated],
+        )
+
+        return CombatOut(
+            damage=damage.tolist(),
+            player_ids=[player_id for player_id, _ in updated],
+            hp=[hp for _, hp in updated],
+            missing=requested_ids[missing].tolist(),
+        )
@@ -0,0 +1,20 @@
+"""Moduł zawierający abstrakcje usług walki."""
+
+from abc import ABC, abstractmethod
+
+from src.core.domain.combat import CombatIn, CombatOut
+
+
+class ICombatService(ABC):
+    """Abstrakcyjna klasa reprezentująca protokół usługi walki."""
+
+    @abstractmethod
+    async def resolve(self, data: CombatIn) -> CombatOut:
+        """Abstrakcyjna metoda rozstrzygająca rundę walki.
+
+        Args:
+            data (CombatIn): Ataki wykonywane jednocześnie.
+
+        Returns:
+            CombatOut: Obrażenia ataków i nowe hp zmienionych playerów.
+        """
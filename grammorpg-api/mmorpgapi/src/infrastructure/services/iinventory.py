@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Iterable
 
-from src.core.domain.inventory import Inventory, InventoryIn
+from src.core.domain.inventory import Inventory, InventoryBatch, InventoryIn, InventoryPage
 
 
 class IInventoryService(ABC):
@@ -18,6 +18,17 @@ class IInventoryService(ABC):
             Inventory | None: Pozycja inventory, jeśli istnieje, lub None w przeciwnym wypadku.
         """
     
+    @abstractmethod
+    async def get_inventories_by_ids(self, inventory_ids: list[int]) -> InventoryBatch:
+        """Abstrakcyjna metoda pobierania wielu pozycji inventory naraz
+
+        Args:
+            inventory_ids (list[int]): Lista ID pozycji inventory.
+
+        Returns:
+            InventoryBatch: Pozycje inventory w kolejności ID oraz brakujące ID.
+        """
+
     @abstractmethod
     async def get_all_inventory(self) -> Iterable[Inventory]:
         """Abstrakcyjna metoda pobierania wszystkich pozycji inventory
@@ -25,6 +36,19 @@ class IInventoryService(ABC):
         Returns:
             Iterable[Inventory]: Kolekcja wszystkich pozycji inventory.
         """
+
+    @abstractmethod
+    async def get_inventory_page(self, after_id: int, limit: int) -> InventoryPage:
+        """Abstrakcyjna metoda pobierania strony pozycji inventory po ID
+
+        Args:
+            after_id (int): ID ostatniej pozycji poprzedniej strony.
+            limit (int): Maksymalna liczba pozycji na stronie.
+
+        Returns:
+            InventoryPage: Pozycje inventory i ID, po którym zaczyna się
+                następna strona.
+        """
     
     @abstractmethod
     async def add_inventory(self, data: InventoryIn) -> Inventory | None:
@@ -56,6 +80,10 @@ class IInventoryService(ABC):
         Args:
             inventory_id (int): ID pozycji inventory do usunięcia.
 
+        Raises:
+            ValueError: Jeśli inventory jest używane przez playera, a kaskada
+                jest wyłączona.
+
         Returns:
             bool: Powodzenie operacji usuwania.
         """
@@ -3,12 +3,28 @@
 from abc import ABC, abstractmethod
 from typing import Iterable
 
-from src.core.domain.item import Item, ItemIn
+from src.core.domain.item import Item, ItemBatch, ItemChanges, ItemIn
+from src.infrastructure.utils.catalog import CatalogSnapshot
 
 
 class IItemService(ABC):
     """An abstract class representing protocol of item service."""
 
+    @abstractmethod
+    async def start(self) -> None:
+        """The abstract building the filter of taken item names."""
+
+    @abstractmethod
+    async def is_name_available(self, name: str) -> bool:
+        """The abstract checking whether no item has the name.
+
+        Args:
+            name (str): The name of the item.
+
+        Returns:
+            bool: Whether the name is free.
+        """
+
     @abstractmethod
     async def get_item_by_id(self, item_id: int) -> Item | None:
         """The abstract getting an item from the repository.
@@ -20,6 +36,17 @@ class IItemService(ABC):
             Item | None: The item data if exists.
         """
 
+    @abstractmethod
+    async def get_items_by_ids(self, item_ids: list[int]) -> ItemBatch:
+        """The abstract getting many items from the repository at once.
+
+        Args:
+            item_ids (list[int]): The ids of the items.
+
+        Returns:
+            ItemBatch: The items in the order of the ids and missing ids.
+        """
+
     @abstractmethod
     async def get_all_items(self) -> Iterable[Item]:
         """The abstract getting all items from the repository.
@@ -28,6 +55,33 @@ class IItemService(ABC):
             Iterable[Item]: The collection of all items.
         """
 
+    @abstractmethod
+    async def get_catalog_version(self) -> int:
+        """The abstract getting the current item catalog version.
+
+        Returns:
+            int: The catalog version.
+        """
+
+    @abstractmethod
+    async def get_catalog_snapshot(self) -> CatalogSnapshot:
+        """The abstract getting the encoded catalog of the current version.
+
+        Returns:
+            CatalogSnapshot: The encoded and compressed catalog.
+        """
+
+    @abstractmethod
+    async def get_catalog_changes(self, version: int) -> ItemChanges:
+        """The abstract getting catalog changes made after a version.
+
+        Args:
+            version (int): The catalog version known by the client.
+
+        Returns:
+            ItemChanges: The latest change of every changed item.
+        """
+
     @abstractmethod
     async def add_item(self, data: ItemIn) -> Item | None:
         """The abstract adding new item to the repository.
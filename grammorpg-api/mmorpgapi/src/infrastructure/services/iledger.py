@@ -0,0 +1,99 @@
+"""Moduł zawierający abstrakcje usługi dziennika inventory."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Iterable
+
+from src.core.domain.inventory import Inventory
+from src.core.domain.ledger import InventoryBalance, LedgerEntry
+
+
+class ILedgerService(ABC):
+    """Abstrakcyjna klasa reprezentująca protokół usługi dziennika inventory."""
+
+    @abstractmethod
+    def record_change(
+        self,
+        before: Inventory | None,
+        after: Inventory,
+        reason: str,
+    ) -> None:
+        """Abstrakcyjna metoda zapisująca zmianę inventory w dzienniku.
+
+        Args:
+            before (Inventory | None): Stan przed zmianą, None dla nowego.
+            after (Inventory): Stan po zmianie.
+            reason (str): Przyczyna zmiany, np. `update`.
+        """
+
+    @abstractmethod
+    def record_deltas(
+        self,
+        inventory_id: int,
+        deltas: dict[int, int],
+        reason: str,
+    ) -> None:
+        """Abstrakcyjna metoda zapisująca zmiany ilości w dzienniku.
+
+        Args:
+            inventory_id (int): ID inventory.
+            deltas (dict[int, int]): Zmiana ilości każdego przedmiotu
+                (`MONEY_ITEM_ID` dla pieniędzy).
+            reason (str): Przyczyna zmiany.
+        """
+
+    @abstractmethod
+    async def get_history(
+        self,
+        inventory_id: int,
+        since: datetime,
+        until: datetime,
+        limit: int,
+    ) -> Iterable[LedgerEntry]:
+        """Abstrakcyjna metoda pobierająca historię inventory.
+
+        Args:
+            inventory_id (int): ID inventory.
+            since (datetime): Początek zakresu.
+            until (datetime): Koniec zakresu.
+            limit (int): Maksymalna liczba wpisów.
+
+        Returns:
+            Iterable[LedgerEntry]: Wpisy od najnowszego.
+        """
+
+    @abstractmethod
+    async def get_balance(self, inventory_id: int) -> InventoryBalance:
+        """Abstrakcyjna metoda odtwarzająca stan inventory z dziennika.
+
+        Args:
+            inventory_id (int): ID inventory.
+
+        Returns:
+            InventoryBalance: Stan z ostatniej migawki i późniejszych wpisów.
+        """
+
+    @abstractmethod
+    def invalidate_topic(self, topic: str) -> None:
+        """Abstrakcyjna metoda wstrzymująca migawki po luce w dzienniku.
+
+        Args:
+            topic (str): Zmieniony temat, np. `ledger:0`.
+        """
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Abstrakcyjna metoda uruchamiająca zapis w tle i konserwację."""
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Abstrakcyjna metoda zatrzymująca pracę w tle i zapisująca bufor."""
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """Abstrakcyjna metoda zwracająca metryki dziennika.
+
+        Returns:
+            dict: Liczba wpisów oczekujących, zapisanych, utraconych
+                i nieudanych paczek oraz wstrzymanie migawek.
+        """
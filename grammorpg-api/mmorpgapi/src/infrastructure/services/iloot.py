@@ -0,0 +1,66 @@
+"""Moduł zawierający abstrakcje usług tabel łupów."""
+
+from abc import ABC, abstractmethod
+
+from src.core.domain.loot import LootRollIn, LootRollOut, LootTable, LootTableIn
+
+
+class ILootService(ABC):
+    """Abstrakcyjna klasa reprezentująca protokół usługi tabel łupów."""
+
+    @abstractmethod
+    async def get_loot_table(self, table_id: int) -> LootTable | None:
+        """Abstrakcyjna metoda pobierająca tabelę łupów.
+
+        Args:
+            table_id (int): ID tabeli łupów.
+
+        Returns:
+            LootTable | None: Tabela łupów, jeśli istnieje.
+        """
+
+    @abstractmethod
+    async def add_loot_table(self, data: LootTableIn) -> LootTable:
+        """Abstrakcyjna metoda dodająca tabelę łupów.
+
+        Args:
+            data (LootTableIn): Atrybuty i pozycje tabeli łupów.
+
+        Returns:
+            LootTable: Nowo utworzona tabela łupów.
+        """
+
+    @abstractmethod
+    async def update_loot_table(self, table_id: int, data: LootTableIn) -> LootTable | None:
+        """Abstrakcyjna metoda zastępująca tabelę łupów.
+
+        Args:
+            table_id (int): ID tabeli łupów.
+            data (LootTableIn): Nowe atrybuty i pozycje tabeli łupów.
+
+        Returns:
+            LootTable | None: Zaktualizowana tabela łupów, jeśli istnieje.
+        """
+
+    @abstractmethod
+    async def delete_loot_table(self, table_id: int) -> bool:
+        """Abstrakcyjna metoda usuwająca tabelę łupów.
+
+        Args:
+            table_id (int): ID tabeli łupów.
+
+        Returns:
+            bool: Powodzenie operacji usuwania.
+        """
+
+    @abstractmethod
+    async def roll(self, data: LootRollIn) -> LootRollOut | None:
+        """Abstrakcyjna metoda losująca łupy i dopisująca je do inventory.
+
+        Args:
+            data (LootRollIn): Tabela łupów, inventory i liczba losowań.
+
+        Returns:
+            LootRollOut | None: Przyznane łupy lub None, jeśli tabela
+                łupów nie istnieje.
+        """
@@ -0,0 +1,73 @@
+"""Moduł zawierający abstrakcje usługi rynku przedmiotów."""
+
+from abc import ABC, abstractmethod
+
+from src.core.domain.market import (
+    BestPrices,
+    MarketOrder,
+    MarketOrderIn,
+    MarketOrderOut,
+    OrderBookOut,
+)
+
+
+class IMarketService(ABC):
+    """Abstrakcyjna klasa reprezentująca protokół usługi rynku przedmiotów."""
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Abstrakcyjna metoda odbudowująca księgi zleceń z bazy danych."""
+
+    @abstractmethod
+    def invalidate_book(self, topic: str, changes: dict | None) -> None:
+        """Abstrakcyjna metoda porzucająca księgę zmienioną przez inny worker.
+
+        Args:
+            topic (str): Zmieniony temat, np. `market:5`.
+            changes (dict | None): Zmienione pola, w tym wersja księgi.
+        """
+
+    @abstractmethod
+    async def place_order(self, data: MarketOrderIn) -> MarketOrderOut:
+        """Abstrakcyjna metoda składająca i dopasowująca zlecenie.
+
+        Args:
+            data (MarketOrderIn): Nowe zlecenie.
+
+        Returns:
+            MarketOrderOut: Zapisane zlecenie i zawarte transakcje.
+        """
+
+    @abstractmethod
+    async def cancel_order(self, order_id: int) -> MarketOrder | None:
+        """Abstrakcyjna metoda anulująca zlecenie.
+
+        Args:
+            order_id (int): ID zlecenia.
+
+        Returns:
+            MarketOrder | None: Anulowane zlecenie, jeśli było otwarte.
+        """
+
+    @abstractmethod
+    async def get_order_book(self, item_id: int, levels: int) -> OrderBookOut:
+        """Abstrakcyjna metoda pobierająca zagregowaną księgę zleceń.
+
+        Args:
+            item_id (int): ID przedmiotu.
+            levels (int): Liczba poziomów cenowych każdej strony.
+
+        Returns:
+            OrderBookOut: Najlepsze poziomy cenowe kupna i sprzedaży.
+        """
+
+    @abstractmethod
+    async def get_best_prices(self, item_id: int) -> BestPrices:
+        """Abstrakcyjna metoda pobierająca najlepsze ceny przedmiotu.
+
+        Args:
+            item_id (int): ID przedmiotu.
+
+        Returns:
+            BestPrices: Najwyższa cena kupna i najniższa cena sprzedaży.
+        """
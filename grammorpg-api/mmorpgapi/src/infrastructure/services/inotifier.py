@@ -0,0 +1,113 @@
+"""Module containing change notifier abstractions."""
+
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Iterable
+
+from pydantic import BaseModel
+
+
+class ISubscription(ABC):
+    """An abstract class representing a single subscriber of changes."""
+
+    @abstractmethod
+    def subscribe(self, topics: Iterable[str]) -> None:
+        """The abstract adding topics to the subscription.
+
+        Args:
+            topics (Iterable[str]): Topics like `player:1` or `inventory:3`.
+        """
+
+    @abstractmethod
+    def unsubscribe(self, topics: Iterable[str]) -> None:
+        """The abstract removing topics from the subscription.
+
+        Args:
+            topics (Iterable[str]): Topics to be removed.
+        """
+
+    @abstractmethod
+    async def next_message(self) -> str:
+        """The abstract waiting for the next encoded message.
+
+        Returns:
+            str: The JSON encoded event.
+        """
+
+
+class IChangeNotifier(ABC):
+    """An abstract class representing protocol of change notifier."""
+
+    @abstractmethod
+    async def publish(
+        self,
+        entity: str,
+        entity_id: int,
+        before: BaseModel | None,
+        after: BaseModel | None,
+    ) -> None:
+        """The abstract publishing a change of an entity to all workers.
+
+        Args:
+            entity (str): The entity name, e.g. `player`.
+            entity_id (int): The id of the entity.
+            before (BaseModel | None): The state before the change.
+            after (BaseModel | None): The state after the change.
+        """
+
+    @abstractmethod
+    async def publish_many(
+        self,
+        entity: str,
+        changes: Iterable[tuple[int, dict | None]],
+    ) -> None:
+        """The abstract publishing changes of many entities in one round trip.
+
+        Args:
+            entity (str): The entity name, e.g. `player`.
+            changes (Iterable[tuple[int, dict | None]]): The id of every
+                entity with its changed fields, None if it was deleted.
+        """
+
+    @abstractmethod
+    def add_listener(self, listener: Callable[[str], None]) -> None:
+        """The abstract registering a callback invoked with every changed topic.
+
+        Args:
+            listener (Callable[[str], None]): The callback, e.g. a cache
+                invalidation.
+        """
+
+    @abstractmethod
+    def add_change_listener(self, listener: Callable[[str, dict | None], None]) -> None:
+        """The abstract registering a callback invoked with every change.
+
+        Args:
+            listener (Callable[[str, dict | None], None]): The callback
+                receiving the topic and its changed fields, None if the
+                entity was deleted or has to be refetched.
+        """
+
+    @abstractmethod
+    def add_resync_listener(self, listener: Callable[[], Awaitable[None]]) -> None:
+        """The abstract registering a callback invoked after a reconnection.
+
+        Args:
+            listener (Callable[[], Awaitable[None]]): The callback
+                rebuilding state which may have missed changes.
+        """
+
+    @abstractmethod
+    def open_subscription(self) -> ISubscription:
+        """The abstract creating a new subscription.
+
+        Returns:
+            ISubscription: The subscription handle.
+        """
+
+    @abstractmethod
+    def close_subscription(self, subscription: ISubscription) -> None:
+        """The abstract removing a subscription with all its topics.
+
+        Args:
+            subscription (ISubscription): The subscription handle.
+        """
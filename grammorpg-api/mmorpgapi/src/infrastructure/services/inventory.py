@@ -1,22 +1,40 @@
 from typing import Iterable
 
-from src.core.domain.inventory import Inventory, InventoryIn
+from src.core.domain.inventory import Inventory, InventoryBatch, InventoryIn, InventoryPage
 from src.core.repositories.iinventory import IInventoryRepository
 from src.infrastructure.services.iinventory import IInventoryService
+from src.infrastructure.services.iledger import ILedgerService
+from src.infrastructure.services.inotifier import IChangeNotifier
+from src.infrastructure.utils.singleflight import SingleFlight
 
 
 class InventoryService(IInventoryService):
     """Klasa implementująca serwis dla inventory."""
 
     _repository: IInventoryRepository
-
-    def __init__(self, repository: IInventoryRepository) -> None:
+    _notifier: IChangeNotifier
+    _single_flight: SingleFlight
+    _ledger: ILedgerService
+
+    def __init__(
+        self,
+        repository: IInventoryRepository,
+        notifier: IChangeNotifier,
+        single_flight: SingleFlight,
+        ledger: ILedgerService,
+    ) -> None:
         """Inicjalizator serwisu inventory.
 
         Args:
             repository (IInventoryRepository): Referencja do repozytorium.
+            notifier (IChangeNotifier): Referencja do notyfikatora zmian.
+            single_flight (SingleFlight): Grupa łącząca identyczne odczyty.
+            ledger (ILedgerService): Dziennik zmian inventory.
         """
         self._repository = repository
+        self._notifier = notifier
+        self._single_flight = single_flight
+        self._ledger = ledger
 
     async def get_inventory_by_id(self, inventory_id: int) -> Inventory | None:
         """Metoda pobierająca pozycję inventory po ID.
@@ -27,7 +45,21 @@ class InventoryService(IInventoryService):
         Returns:
             Inventory | None: Pozycja inventory, jeśli istnieje, lub None.
         """
-        return await self._repository.show_inventory_by_id(inventory_id)
+        return await self._single_flight.do(
+            f"inventory:{inventory_id}",
+            lambda: self._repository.show_inventory_by_id(inventory_id),
+        )
+
+    async def get_inventories_by_ids(self, inventory_ids: list[int]) -> InventoryBatch:
+        """Metoda pobierająca wiele pozycji inventory naraz.
+
+        Args:
+            inventory_ids (list[int]): Lista ID pozycji inventory.
+
+        Returns:
+            InventoryBatch: Pozycje inventory w kolejności ID oraz brakujące ID.
+        """
+        return await self._repository.get_many_by_ids(inventory_ids)
 
     async def get_all_inventory(self) -> Iterable[Inventory]:
         """Metoda pobierająca wszystkie pozycje inventory.
@@ -37,6 +69,23 @@ class InventoryService(IInventoryService):
         """
         return await self._repository.get_all_inventory()
 
+    async def get_inventory_page(self, after_id: int, limit: int) -> InventoryPage:
+        """Metoda pobierająca stronę pozycji inventory po ID.
+
+        Args:
+            after_id (int): ID ostatniej pozycji poprzedniej strony.
+            limit (int): Maksymalna liczba pozycji na stronie.
+
+        Returns:
+            InventoryPage: Pozycje inventory i ID, po którym zaczyna się
+                następna strona.
+        """
+        inventories = list(await self._repository.get_inventory_page(after_id, limit))
+        return InventoryPage(
+            inventories=inventories,
+            next_after_id=inventories[-1].id if len(inventories) == limit else None,
+        )
+
     async def add_inventory(self, data: InventoryIn) -> Inventory | None:
         """Metoda dodająca nową pozycję inventory.
 
@@ -46,8 +95,12 @@ class InventoryService(IInventoryService):
         Returns:
             Inventory | None: Nowo utworzona pozycja inventory, lub None, jeśli operacja się nie powiodła.
         """
-        
-        return await self._repository.add_inventory(data)
+        new_inventory = await self._repository.add_inventory(data)
+        if new_inventory:
+            self._ledger.record_change(None, new_inventory, "create")
+            await self._notifier.publish("inventory", new_inventory.id, None, new_inventory)
+
+        return new_inventory
 
     async def update_inventory(self, inventory_id: int, data: InventoryIn) -> Inventory | None:
         """Metoda aktualizująca istniejącą pozycję inventory.
@@ -59,7 +112,17 @@ class InventoryService(IInventoryService):
         Returns:
             Inventory | None: Zaktualizowana pozycja inventory lub None, jeśli operacja się nie powiodła.
         """
-        return await self._repository.update_inventory(inventory_id, data)
+        update = await self._repository.update_inventory(inventory_id, data)
+        self._single_flight.forget(f"inventory:{inventory_id}")
+        if update is None:
+            return None
+
+        # Stan sprzed zapisu pochodzi z tego samego polecenia na bazie
+        # głównej, więc delty w dzienniku nie zależą od opóźnień replik.
+        self._ledger.record_change(update.before, update.after, "update")
+        await self._notifier.publish("inventory", inventory_id, update.before, update.after)
+
+        return update.after
 
     async def remove_inventory(self, inventory_id: int) -> bool:
         """Metoda usuwająca pozycję inventory.
@@ -67,7 +130,24 @@ class InventoryService(IInventoryService):
         Args:
             inventory_id (int): ID pozycji inventory do usunięcia.
 
+        Raises:
+            ValueError: Jeśli inventory jest używane przez playera, a kaskada
+                jest wyłączona.
+
         Returns:
             bool: Powodzenie operacji usuwania.
         """
-        return await self._repository.remove_inventory(inventory_id)
+        removed_player_ids = await self._repository.remove_inventory(inventory_id)
+        if removed_player_ids is None:
+            return False
+
+        self._single_flight.forget(f"inventory:{inventory_id}")
+        await self._notifier.publish("inventory", inventory_id, None, None)
+        for player_id in removed_player_ids:
+            self._single_flight.forget(f"player:{player_id}")
+        await self._notifier.publish_many(
+            "player",
+            [(player_id, None) for player_id in removed_player_ids],
+        )
+
+        return True
@@ -3,12 +3,22 @@
 from abc import ABC, abstractmethod
 from typing import Iterable
 
-from src.core.domain.player import Player, PlayerIn
+from src.core.domain.character import (
+    Character,
+    CharacterIn,
+    CharacterPurge,
+    CharacterPurgeIn,
+)
+from src.core.domain.player import Player, PlayerBatch, PlayerIn, PlayerPage
 
 
 class IPlayerService(ABC):
     """Abstrakcyjna klasa reprezentująca protokół usługi player."""
 
+    @abstractmethod
+    async def start(self) -> None:
+        """Abstrakcyjna metoda budująca filtr zajętych nazw playerów."""
+
     @abstractmethod
     async def get_player_by_id(self, player_id: int) -> Player | None:
         """Abstrakcyjna metoda pobierająca playera z repozytorium.
@@ -20,6 +30,37 @@ class IPlayerService(ABC):
             Player | None: Dane playera, jeśli istnieje.
         """
 
+    @abstractmethod
+    async def get_players_by_ids(self, player_ids: list[int]) -> PlayerBatch:
+        """Abstrakcyjna metoda pobierająca wielu playerów naraz.
+
+        Args:
+            player_ids (list[int]): Lista ID playerów.
+
+        Returns:
+            PlayerBatch: Playerzy w kolejności ID oraz brakujące ID.
+        """
+
+    @abstractmethod
+    async def get_all_players(self) -> Iterable[Player]:
+        """Abstrakcyjna metoda pobierająca wszystkich playerów z repozytorium.
+
+        Returns:
+            Iterable[Player]: Kolekcja playerów.
+        """
+
+    @abstractmethod
+    async def get_players_page(self, after_id: int, limit: int) -> PlayerPage:
+        """Abstrakcyjna metoda pobierająca stronę playerów po ID.
+
+        Args:
+            after_id (int): ID ostatniego playera poprzedniej strony.
+            limit (int): Maksymalna liczba playerów na stronie.
+
+        Returns:
+            PlayerPage: Playerzy i ID, po którym zaczyna się następna strona.
+        """
+
     @abstractmethod
     async def get_player_by_name(self, name: str) -> Player | None:
         """Abstrakcyjna metoda pobierająca playera z repozytorium po nazwie.
@@ -31,6 +72,17 @@ class IPlayerService(ABC):
             Player | None: Dane playera, jeśli istnieje.
         """
 
+    @abstractmethod
+    async def is_name_available(self, name: str) -> bool:
+        """Abstrakcyjna metoda sprawdzająca, czy nazwa playera jest wolna.
+
+        Args:
+            name (str): Nazwa playera.
+
+        Returns:
+            bool: Czy nazwa jest wolna.
+        """
+
     @abstractmethod
     async def add_player(self, data: PlayerIn) -> Player | None:
         """Abstrakcyjna metoda dodająca nowego playera do repozytorium.
@@ -42,6 +94,17 @@ class IPlayerService(ABC):
             Player | None: Nowo utworzony player.
         """
 
+    @abstractmethod
+    async def create_character(self, data: CharacterIn) -> Character:
+        """Abstrakcyjna metoda tworząca playera wraz z nowym inventory.
+
+        Args:
+            data (CharacterIn): Atrybuty playera i inventory.
+
+        Returns:
+            Character: Nowo utworzony player i jego inventory.
+        """
+
     @abstractmethod
     async def update_player(self, player_id: int, data: PlayerIn) -> Player | None:
         """Abstrakcyjna metoda aktualizująca dane playera w repozytorium.
@@ -64,3 +127,17 @@ class IPlayerService(ABC):
         Returns:
             bool: Powodzenie operacji usuwania.
         """
+
+    @abstractmethod
+    async def purge_inactive_players(self, data: CharacterPurgeIn) -> CharacterPurge:
+        """Abstrakcyjna metoda trwale usuwająca nieaktywnych playerów paczkami.
+
+        Args:
+            data (CharacterPurgeIn): Granica nieaktywności i rozmiar paczki.
+
+        Raises:
+            ValueError: Jeśli granica nieaktywności jest zbyt świeża.
+
+        Returns:
+            CharacterPurge: Liczba usuniętych playerów, inventory i paczek.
+        """
@@ -0,0 +1,70 @@
+"""Moduł zawierający abstrakcje usług receptur."""
+
+from abc import ABC, abstractmethod
+
+from src.core.domain.recipe import CraftIn, CraftOut, Recipe, RecipeIn
+
+
+class IRecipeService(ABC):
+    """Abstrakcyjna klasa reprezentująca protokół usługi receptur."""
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Abstrakcyjna metoda wczytująca i kompilująca wszystkie receptury."""
+
+    @abstractmethod
+    async def get_recipe(self, recipe_id: int) -> Recipe | None:
+        """Abstrakcyjna metoda pobierająca recepturę.
+
+        Args:
+            recipe_id (int): ID receptury.
+
+        Returns:
+            Recipe | None: Receptura, jeśli istnieje.
+        """
+
+    @abstractmethod
+    async def add_recipe(self, data: RecipeIn) -> Recipe:
+        """Abstrakcyjna metoda dodająca recepturę.
+
+        Args:
+            data (RecipeIn): Atrybuty, wejścia i wyjścia receptury.
+
+        Returns:
+            Recipe: Nowo utworzona receptura.
+        """
+
+    @abstractmethod
+    async def update_recipe(self, recipe_id: int, data: RecipeIn) -> Recipe | None:
+        """Abstrakcyjna metoda zastępująca recepturę.
+
+        Args:
+            recipe_id (int): ID receptury.
+            data (RecipeIn): Nowe atrybuty, wejścia i wyjścia receptury.
+
+        Returns:
+            Recipe | None: Zaktualizowana receptura, jeśli istnieje.
+        """
+
+    @abstractmethod
+    async def delete_recipe(self, recipe_id: int) -> bool:
+        """Abstrakcyjna metoda usuwająca recepturę.
+
+        Args:
+            recipe_id (int): ID receptury.
+
+        Returns:
+            bool: Powodzenie operacji usuwania.
+        """
+
+    @abstractmethod
+    async def craft(self, data: CraftIn) -> CraftOut | None:
+        """Abstrakcyjna metoda wytwarzająca przedmioty według receptury.
+
+        Args:
+            data (CraftIn): Receptura, inventory i liczba wytworzeń.
+
+        Returns:
+            CraftOut | None: Inventory po wytworzeniu lub None, jeśli
+                receptura nie istnieje.
+        """
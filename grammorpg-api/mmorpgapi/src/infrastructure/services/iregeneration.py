@@ -0,0 +1,31 @@
+"""Moduł zawierający abstrakcje usługi regeneracji hp."""
+
+from abc import ABC, abstractmethod
+
+
+class IRegenerationService(ABC):
+    """Abstrakcyjna klasa reprezentująca protokół usługi regeneracji hp."""
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Abstrakcyjna metoda uruchamiająca cykliczną regenerację w tle."""
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Abstrakcyjna metoda zatrzymująca regenerację i zwalniająca lidera."""
+
+    @abstractmethod
+    async def tick(self) -> int:
+        """Abstrakcyjna metoda wykonująca jeden cykl regeneracji.
+
+        Returns:
+            int: Liczba zregenerowanych playerów.
+        """
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """Abstrakcyjna metoda zwracająca metryki regeneracji.
+
+        Returns:
+            dict: Przywództwo, liczba cykli, paczek i playerów oraz czasy cykli.
+        """
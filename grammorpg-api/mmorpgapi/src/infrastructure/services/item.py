@@ -2,24 +2,70 @@
 
 from typing import Iterable
 
-from src.core.domain.item import Item, ItemIn
+from src.core.domain.item import Item, ItemBatch, ItemChanges, ItemIn
 from src.core.repositories.iitem import IItemRepository
 from src.infrastructure.services.iitem import IItemService
+from src.infrastructure.services.inotifier import IChangeNotifier
+from src.infrastructure.utils.catalog import CatalogCache, CatalogSnapshot
+from src.infrastructure.utils.namefilter import NameRegistry
+from src.infrastructure.utils.singleflight import SingleFlight
 
 
 class ItemService(IItemService):
     """A class implementing the item service."""
 
     _repository: IItemRepository
-
-    def __init__(self, repository: IItemRepository) -> None:
+    _notifier: IChangeNotifier
+    _single_flight: SingleFlight
+    _catalog_cache: CatalogCache
+    _names: NameRegistry
+
+    def __init__(
+        self,
+        repository: IItemRepository,
+        notifier: IChangeNotifier,
+        single_flight: SingleFlight,
+        catalog_cache: CatalogCache,
+        names: NameRegistry,
+    ) -> None:
         """The initializer of the `item service`.
 
         Args:
             repository (IItemRepository): The reference to the repository.
+            notifier (IChangeNotifier): The notifier of entity changes.
+            single_flight (SingleFlight): The group coalescing identical reads.
+            catalog_cache (CatalogCache): The encoded catalog of the latest version.
+            names (NameRegistry): The filters of taken names.
         """
 
         self._repository = repository
+        self._notifier = notifier
+        self._single_flight = single_flight
+        self._catalog_cache = catalog_cache
+        self._names = names
+
+    async def start(self) -> None:
+        """The method building the filter of taken item names."""
+
+        self._names.load("item", await self._repository.get_all_names())
+
+    async def is_name_available(self, name: str) -> bool:
+        """The method checking whether no item has the name.
+
+        Most free names are answered by the Bloom filter alone, only
+        possible hits are looked up by the name index.
+
+        Args:
+            name (str): The name of the item.
+
+        Returns:
+            bool: Whether the name is free.
+        """
+
+        if not self._names.might_be_taken("item", name):
+            return True
+
+        return await self._repository.get_item_by_name(name) is None
 
     async def get_item_by_id(self, item_id: int) -> Item | None:
         """The method getting an item from the repository.
@@ -31,7 +77,22 @@ class ItemService(IItemService):
             Item | None: The item data if exists.
         """
 
-        return await self._repository.get_item_by_id(item_id)
+        return await self._single_flight.do(
+            f"item:{item_id}",
+            lambda: self._repository.get_item_by_id(item_id),
+        )
+
+    async def get_items_by_ids(self, item_ids: list[int]) -> ItemBatch:
+        """The method getting many items from the repository at once.
+
+        Args:
+            item_ids (list[int]): The ids of the items.
+
+        Returns:
+            ItemBatch: The items in the order of the ids and missing ids.
+        """
+
+        return await self._repository.get_many_by_ids(item_ids)
 
     async def get_all_items(self) -> Iterable[Item]:
         """The method getting all items from the repository.
@@ -42,8 +103,49 @@ class ItemService(IItemService):
 
         return await self._repository.get_all_items()
 
-        async def add_item(self, data: ItemIn) -> Item | None:
-        """The method adding a new item if id number is empty
+    async def get_catalog_version(self) -> int:
+        """The method getting the current item catalog version.
+
+        Returns:
+            int: The catalog version.
+        """
+
+        return await self._repository.get_catalog_version()
+
+    async def get_catalog_snapshot(self) -> CatalogSnapshot:
+        """The method getting the encoded catalog of the current version.
+
+        The catalog is read and compressed only when its version changes.
+
+        Returns:
+            CatalogSnapshot: The encoded and compressed catalog.
+        """
+
+        version = await self._repository.get_catalog_version()
+        if snapshot := self._catalog_cache.get(version):
+            return snapshot
+
+        catalog = await self._single_flight.do(
+            "item:catalog",
+            self._repository.get_catalog,
+        )
+
+        return self._catalog_cache.put(catalog)
+
+    async def get_catalog_changes(self, version: int) -> ItemChanges:
+        """The method getting catalog changes made after a version.
+
+        Args:
+            version (int): The catalog version known by the client.
+
+        Returns:
+            ItemChanges: The latest change of every changed item.
+        """
+
+        return await self._repository.get_changes_since(version)
+
+    async def add_item(self, data: ItemIn) -> Item | None:
+        """The method adding a new item and bumping the catalog version.
 
         Args:
             data (ItemIn): The attributes of the item.
@@ -51,13 +153,16 @@ class ItemService(IItemService):
         Returns:
             Item | None: The newly created item.
         """
-        if await self._repository.item_exists(data.id):
-            raise ValueError(f"Item with ID {data.id} already exists.")
 
-        return await self._repository.add_item(data)
+        new_item = await self._repository.add_item(data)
+        if new_item:
+            await self._publish_names(added=[new_item.name])
+            await self._notifier.publish("item", new_item.id, None, new_item)
+
+        return new_item
 
     async def update_item(self, item_id: int, data: ItemIn) -> Item | None:
-        """The method updating item data in the repository.
+        """The method updating item data and bumping the catalog version.
 
         Args:
             item_id (int): The item id.
@@ -67,13 +172,24 @@ class ItemService(IItemService):
             Item | None: The updated item.
         """
 
-        return await self._repository.update_item(
+        existing_item = await self._repository.get_item_by_id(item_id)
+        updated_item = await self._repository.update_item(
             item_id=item_id,
             data=data,
         )
+        self._single_flight.forget(f"item:{item_id}")
+        if updated_item:
+            if existing_item and existing_item.name != updated_item.name:
+                await self._publish_names(
+                    added=[updated_item.name],
+                    removed=[existing_item.name],
+                )
+            await self._notifier.publish("item", item_id, None, updated_item)
+
+        return updated_item
 
     async def delete_item(self, item_id: int) -> bool:
-        """The method removing an item from the repository.
+        """The method removing an item and bumping the catalog version.
 
         Args:
             item_id (int): The item id.
@@ -82,4 +198,28 @@ class ItemService(IItemService):
             bool: Success of the operation.
         """
 
-        return await self._repository.delete_item(item_id)
+        deleted_name = await self._repository.delete_item(item_id)
+        self._single_flight.forget(f"item:{item_id}")
+        if deleted_name is None:
+            return False
+
+        await self._publish_names(removed=[deleted_name])
+        await self._notifier.publish("item", item_id, None, None)
+
+        return True
+
+
+    async def _publish_names(
+        self,
+        added: list[str] | None = None,
+        removed: list[str] | None = None,
+    ) -> None:
+        """A private method updating the name filters of all workers.
+
+        Args:
+            added (list[str] | None): The names taken by the change.
+            removed (list[str] | None): The names freed by the change.
+        """
+
+        change_ids = self._names.change("item", added or (), removed or ())
+        await self._notifier.publish_many("name", [(change_id, {}) for change_id in change_ids])
@@ -0,0 +1,94 @@
+"""Moduł zawierający abstrakcje usług user."""
+
+from abc import ABC, abstractmethod
+
+from pydantic import UUID4
+
+from src.core.domain.user import User, UserIn
+from src.infrastructure.dto.tokendto import TokenDTO
+
+
+class IUserService(ABC):
+    """Abstrakcyjna klasa reprezentująca protokół usługi user."""
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Abstrakcyjna metoda wczytująca niedawno unieważnione sesje."""
+
+    @abstractmethod
+    async def register_user(self, user: UserIn) -> User | None:
+        """Abstrakcyjna metoda rejestrująca user.
+
+        Args:
+            user (UserIn): Email i hasło user.
+
+        Returns:
+            User | None: Nowy user.
+        """
+
+    @abstractmethod
+    async def authenticate_user(self, user: UserIn) -> TokenDTO | None:
+        """Abstrakcyjna metoda logująca user i otwierająca sesję.
+
+        Args:
+            user (UserIn): Email i hasło user.
+
+        Returns:
+            TokenDTO | None: Tokeny nowej sesji lub None przy złych danych.
+        """
+
+    @abstractmethod
+    async def refresh_tokens(self, refresh_token: str) -> TokenDTO | None:
+        """Abstrakcyjna metoda wymieniająca token odświeżający na nowe tokeny.
+
+        Args:
+            refresh_token (str): Token odświeżający sesji.
+
+        Returns:
+            TokenDTO | None: Nowe tokeny lub None, jeśli token jest nieważny.
+        """
+
+    @abstractmethod
+    async def logout(self, session_id: str) -> bool:
+        """Abstrakcyjna metoda unieważniająca sesję.
+
+        Args:
+            session_id (str): ID sesji.
+
+        Returns:
+            bool: Czy sesja była aktywna.
+        """
+
+    @abstractmethod
+    async def authorize(self, token: str) -> tuple[User, str] | None:
+        """Abstrakcyjna metoda sprawdzająca token dostępu.
+
+        Args:
+            token (str): Token dostępu.
+
+        Returns:
+            tuple[User, str] | None: User i ID jego sesji lub None,
+                jeśli token jest nieważny lub sesja unieważniona.
+        """
+
+    @abstractmethod
+    async def get_by_uuid(self, uuid: UUID4) -> User | None:
+        """Abstrakcyjna metoda pobierająca user po UUID.
+
+        Args:
+            uuid (UUID4): UUID user.
+
+        Returns:
+            User | None: User, jeśli istnieje.
+        """
+
+    @abstractmethod
+    async def get_by_email(self, email: str) -> User | None:
+        """Abstrakcyjna metoda pobierająca user po emailu.
+
+        Args:
+            email (str): Email user.
+
+        Returns:
+            User | None: User, jeśli istnieje.
+        """
@@ -0,0 +1,212 @@
+"""Moduł zawierający implementację usługi dziennika inventory."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Iterable
+
+from asyncpg import InterfaceError, PostgresError  # type: ignore
+
+from src.core.domain.inventory import Inventory
+from src.core.domain.ledger import (
+    MONEY_ITEM_ID,
+    InventoryBalance,
+    LedgerEntry,
+    LedgerEntryIn,
+)
+from src.core.repositories.iledger import ILedgerRepository
+from src.infrastructure.services.iledger import ILedgerService
+from src.infrastructure.services.inotifier import IChangeNotifier
+from src.infrastructure.utils.batchwriter import BatchWriter
+from src.infrastructure.utils.dbguard import DatabaseOverloadedError
+from src.infrastructure.utils.itemlist import item_deltas
+
+
+class LedgerService(ILedgerService):
+    """Klasa implementująca usługę dziennika inventory.
+
+    Wpisy trafiają do bufora i są zapisywane paczkami w tle, więc zapis
+    dziennika nie wydłuża żądań. Okresowo zapisywane są migawki stanu
+    i usuwane stare partycje.
+
+    Gdy baza długo odrzuca zapisy, pełny bufor traci wpisy. Migawka
+    utrwaliłaby wtedy błędny stan, więc worker, który stracił wpisy,
+    ogłasza lukę przez notifier i wszystkie workery wstrzymują migawki
+    aż do uzgodnienia stanów i restartu.
+    """
+
+    _repository: ILedgerRepository
+    _notifier: IChangeNotifier
+    _writer: BatchWriter[LedgerEntryIn]
+
+    def __init__(
+        self,
+        repository: ILedgerRepository,
+        notifier: IChangeNotifier,
+        batch_size: int = 500,
+        flush_seconds: float = 0.05,
+        snapshot_seconds: float = 600.0,
+        snapshot_lag_seconds: float = 60.0,
+        retention_days: int = 365,
+        partitions_ahead: int = 2,
+    ) -> None:
+        """Inicjalizator usługi dziennika.
+
+        Args:
+            repository (ILedgerRepository): Referencja do repozytorium dziennika.
+            notifier (IChangeNotifier): Referencja do notifiera zmian.
+            batch_size (int): Największa paczka wpisów w jednym insercie.
+            flush_seconds (float): Najdłuższy czas oczekiwania wpisu w buforze.
+            snapshot_seconds (float): Odstęp między migawkami.
+            snapshot_lag_seconds (float): Opóźnienie migawki względem bieżącej
+                chwili, aby objęła tylko zatwierdzone wpisy.
+            retention_days (int): Jak długo przechowywane są partycje.
+            partitions_ahead (int): Liczba miesięcy z gotowymi partycjami.
+        """
+        self._repository = repository
+        self._notifier = notifier
+        self._writer = BatchWriter(
+            repository.append_entries,
+            max_batch=batch_size,
+            max_delay=flush_seconds,
+        )
+        self._snapshot_seconds = snapshot_seconds
+        self._snapshot_lag = timedelta(seconds=snapshot_lag_seconds)
+        self._retention = timedelta(days=retention_days)
+        self._partitions_ahead = partitions_ahead
+        self._maintenance_task: asyncio.Task | None = None
+        self._announced_drops = 0
+        self.snapshots_paused = False
+
+    def record_change(
+        self,
+        before: Inventory | None,
+        after: Inventory,
+        reason: str,
+    ) -> None:
+        """Metoda zapisująca zmianę inventory w dzienniku.
+
+        Args:
+            before (Inventory | None): Stan przed zmianą, None dla nowego.
+            after (Inventory): Stan po zmianie.
+            reason (str): Przyczyna zmiany, np. `update`.
+        """
+        deltas = item_deltas(before.itemlist if before else "", after.itemlist)
+        money_delta = after.money - (before.money if before else 0)
+        if money_delta:
+            deltas[MONEY_ITEM_ID] = money_delta
+
+        self.record_deltas(after.id, deltas, reason)
+
+    def record_deltas(
+        self,
+        inventory_id: int,
+        deltas: dict[int, int],
+        reason: str,
+    ) -> None:
+        """Metoda zapisująca zmiany ilości w dzienniku.
+
+        Args:
+            inventory_id (int): ID inventory.
+            deltas (dict[int, int]): Zmiana ilości każdego przedmiotu
+                (`MONEY_ITEM_ID` dla pieniędzy).
+            reason (str): Przyczyna zmiany.
+        """
+        for item_id, delta in deltas.items():
+            if delta:
+                self._writer.add(LedgerEntryIn(
+                    inventory_id=inventory_id,
+                    item_id=item_id,
+                    delta=delta,
+                    reason=reason,
+                ))
+
+    async def get_history(
+        self,
+        inventory_id: int,
+        since: datetime,
+        until: datetime,
+        limit: int,
+    ) -> Iterable[LedgerEntry]:
+        """Metoda pobierająca historię inventory.
+
+        Args:
+            inventory_id (int): ID inventory.
+            since (datetime): Początek zakresu.
+            until (datetime): Koniec zakresu.
+            limit (int): Maksymalna liczba wpisów.
+
+        Returns:
+            Iterable[LedgerEntry]: Wpisy od najnowszego.
+        """
+        return await self._repository.get_entries(inventory_id, since, until, limit)
+
+    async def get_balance(self, inventory_id: int) -> InventoryBalance:
+        """Metoda odtwarzająca stan inventory z dziennika.
+
+        Args:
+            inventory_id (int): ID inventory.
+
+        Returns:
+            InventoryBalance: Stan z ostatniej migawki i późniejszych wpisów.
+        """
+        return await self._repository.get_balance(inventory_id)
+
+    def invalidate_topic(self, topic: str) -> None:
+        """Metoda wstrzymująca migawki po luce w dzienniku.
+
+        Args:
+            topic (str): Zmieniony temat, np. `ledger:0`.
+        """
+        if topic.partition(":")[0] == "ledger":
+            self.snapshots_paused = True
+
+    async def start(self) -> None:
+        """Metoda uruchamiająca zapis w tle i konserwację."""
+        await self._repository.ensure_partitions(
+            datetime.now(timezone.utc),
+            self._partitions_ahead,
+        )
+        await self._writer.start()
+        self._maintenance_task = asyncio.create_task(self._maintain_forever())
+
+    async def stop(self) -> None:
+        """Metoda zatrzymująca pracę w tle i zapisująca bufor."""
+        if self._maintenance_task:
+            self._maintenance_task.cancel()
+            self._maintenance_task = None
+
+        await self._writer.stop()
+
+    def stats(self) -> dict:
+        """Metoda zwracająca metryki dziennika.
+
+        Returns:
+            dict: Liczba wpisów oczekujących, zapisanych, utraconych
+                i nieudanych paczek oraz wstrzymanie migawek.
+        """
+        return {
+            "pending": self._writer.pending,
+            "written": self._writer.written,
+            "dropped": self._writer.dropped,
+            "failed_batches": self._writer.failed_batches,
+            "snapshots_paused": self.snapshots_paused,
+        }
+
+    async def _maintain_forever(self) -> None:
+        """Prywatna pętla tworząca migawki i partycje oraz usuwająca stare."""
+        while True:
+            await asyncio.sleep(self._snapshot_seconds)
+            now = datetime.now(timezone.utc)
+            try:
+                if (dropped := self._writer.dropped) > self._announced_drops:
+                    print(f"Ledger lost {dropped} entries, snapshots are paused.")
+                    self.snapshots_paused = True
+                    await self._notifier.publish_many("ledger", [(0, {"dropped": dropped})])
+                    self._announced_drops = dropped
+                await self._repository.ensure_partitions(now, self._partitions_ahead)
+                if not self.snapshots_paused:
+                    await self._repository.create_snapshots(now - self._snapshot_lag)
+                await self._repository.drop_partitions(now - self._retention)
+            except (OSError, InterfaceError, PostgresError, DatabaseOverloadedError) as e:
+                # Kolejna próba nastąpi w następnym cyklu.
+                print(f"Ledger maintenance failed: {e}")
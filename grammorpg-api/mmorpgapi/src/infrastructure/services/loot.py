@@ -0,0 +1,244 @@
+"""Moduł zawierający implementację usług tabel łupów."""
+
+import numpy as np
+
+from src.core.domain.loot import (
+    LootDrop,
+    LootRollIn,
+    LootRollOut,
+    LootTable,
+    LootTableIn,
+)
+from src.core.repositories.iinventory import IInventoryRepository
+from src.core.repositories.iloot import ILootRepository
+from src.infrastructure.services.iledger import ILedgerService
+from src.infrastructure.services.iloot import ILootService
+from src.infrastructure.services.inotifier import IChangeNotifier
+from src.infrastructure.utils.alias import sample_alias
+from src.infrastructure.utils.itemlist import format_itemlist
+from src.infrastructure.utils.loottable import (
+    EMPTY_DROP,
+    CompiledLootTable,
+    LootTableCache,
+)
+from src.infrastructure.utils.singleflight import SingleFlight
+
+
+class LootService(ILootService):
+    """Klasa implementująca usługę tabel łupów."""
+
+    _repository: ILootRepository
+    _inventory_repository: IInventoryRepository
+    _cache: LootTableCache
+    _notifier: IChangeNotifier
+    _single_flight: SingleFlight
+    _ledger: ILedgerService
+    _rng: np.random.Generator
+
+    def __init__(
+        self,
+        repository: ILootRepository,
+        inventory_repository: IInventoryRepository,
+        cache: LootTableCache,
+        notifier: IChangeNotifier,
+        single_flight: SingleFlight,
+        ledger: ILedgerService,
+        rng: np.random.Generator,
+    ) -> None:
+        """Inicjalizator klasy `LootService`.
+
+        Args:
+            repository (ILootRepository): Referencja do repozytorium tabel łupów.
+            inventory_repository (IInventoryRepository): Referencja do
+                repozytorium inventory.
+            cache (LootTableCache): Cache skompilowanych tabel łupów.
+            notifier (IChangeNotifier): Referencja do notyfikatora zmian.
+            single_flight (SingleFlight): Grupa łącząca identyczne odczyty.
+            ledger (ILedgerService): Dziennik zmian inventory.
+            rng (np.random.Generator): Generator liczb losowych.
+        """
+
+        self._repository = repository
+        self._inventory_repository = inventory_repository
+        self._cache = cache
+        self._notifier = notifier
+        self._single_flight = single_flight
+        self._ledger = ledger
+        self._rng = rng
+
+    async def get_loot_table(self, table_id: int) -> LootTable | None:
+        """Metoda pobierająca tabelę łupów.
+
+        Args:
+            table_id (int): ID tabeli łupów.
+
+        Returns:
+            LootTable | None: Tabela łupów, jeśli istnieje.
+        """
+        return await self._repository.get_loot_table(table_id)
+
+    async def add_loot_table(self, data: LootTableIn) -> LootTable:
+        """Metoda dodająca tabelę łupów.
+
+        Args:
+            data (LootTableIn): Atrybuty i pozycje tabeli łupów.
+
+        Raises:
+            ValueError: Jeśli przedmiot się powtarza, nazwa jest zajęta
+                lub przedmiot nie istnieje.
+
+        Returns:
+            LootTable: Nowo utworzona tabela łupów.
+        """
+        self._check_entries(data)
+        table = await self._repository.add_loot_table(data)
+        await self._notifier.publish("loot", table.id, None, table)
+
+        return table
+
+    async def update_loot_table(self, table_id: int, data: LootTableIn) -> LootTable | None:
+        """Metoda zastępująca tabelę łupów.
+
+        Args:
+            table_id (int): ID tabeli łupów.
+            data (LootTableIn): Nowe atrybuty i pozycje tabeli łupów.
+
+        Raises:
+            ValueError: Jeśli przedmiot się powtarza, nazwa jest zajęta
+                lub przedmiot nie istnieje.
+
+        Returns:
+            LootTable | None: Zaktualizowana tabela łupów, jeśli istnieje.
+        """
+        self._check_entries(data)
+        existing_table = await self._repository.get_loot_table(table_id, primary=True)
+        updated_table = await self._repository.update_loot_table(table_id, data)
+        self._single_flight.forget(f"loot:{table_id}")
+        if updated_table:
+            await self._notifier.publish("loot", table_id, existing_table, updated_table)
+
+        return updated_table
+
+    async def delete_loot_table(self, table_id: int) -> bool:
+        """Metoda usuwająca tabelę łupów.
+
+        Args:
+            table_id (int): ID tabeli łupów.
+
+        Returns:
+            bool: Powodzenie operacji usuwania.
+        """
+        if not await self._repository.remove_loot_table(table_id):
+            return False
+
+        self._single_flight.forget(f"loot:{table_id}")
+        await self._notifier.publish("loot", table_id, None, None)
+
+        return True
+
+    async def roll(self, data: LootRollIn) -> LootRollOut | None:
+        """Metoda losująca łupy i dopisująca je do inventory.
+
+        Wszystkie losowania są wykonywane jednym wywołaniem na tablicy
+        aliasów, zliczane wektorowo per inventory i dopisywane do
+        wszystkich inventory jednym zapytaniem.
+
+        Args:
+            data (LootRollIn): Tabela łupów, inventory i liczba losowań.
+
+        Raises:
+            ValueError: Jeśli tabela łupów nie ma żadnych pozycji.
+
+        Returns:
+            LootRollOut | None: Przyznane łupy lub None, jeśli tabela
+                łupów nie istnieje.
+        """
+        compiled = await self._get_compiled(data.loot_table_id)
+        if compiled is None:
+            return None
+
+        inventory_ids, owners = np.unique(data.inventory_ids, return_inverse=True)
+        outcomes = sample_alias(compiled.alias, owners.size * data.rolls, self._rng)
+        outcome_count = compiled.item_ids.size
+        counts = np.bincount(
+            np.repeat(owners, data.rolls) * outcome_count + outcomes,
+            minlength=inventory_ids.size * outcome_count,
+        ).reshape(inventory_ids.size, outcome_count)
+        dropped = compiled.item_ids != EMPTY_DROP
+
+        drops = {}
+        for inventory_id, row in zip(inventory_ids.tolist(), counts[:, dropped]):
+            won = row.nonzero()[0]
+            drops[inventory_id] = dict(zip(
+                compiled.item_ids[dropped][won].tolist(),
+                row[won].tolist(),
+            ))
+
+        updated = await self._inventory_repository.add_items(
+            list(drops),
+            [format_itemlist(items) for items in drops.values()],
+        )
+
+        changes = []
+        for inventory_id, itemlist in updated:
+            if drops[inventory_id]:
+                self._ledger.record_deltas(inventory_id, drops[inventory_id], "loot")
+                self._single_flight.forget(f"inventory:{inventory_id}")
+                changes.append((inventory_id, {"itemlist": itemlist}))
+        await self._notifier.publish_many("inventory", changes)
+
+        found = {inventory_id for inventory_id, _ in updated}
+        return LootRollOut(
+            drops=[
+                LootDrop(
+                    inventory_id=inventory_id,
+                    item_ids=list(drops[inventory_id]),
+                    quantities=list(drops[inventory_id].values()),
+                )
+                for inventory_id, _ in updated
+            ],
+            missing=[inventory_id for inventory_id in drops if inventory_id not in found],
+        )
+
+    async def _get_compiled(self, table_id: int) -> CompiledLootTable | None:
+        """Prywatna metoda pobierająca skompilowaną tabelę łupów.
+
+        Args:
+            table_id (int): ID tabeli łupów.
+
+        Raises:
+            ValueError: Jeśli tabela łupów nie ma żadnych pozycji.
+
+        Returns:
+            CompiledLootTable | None: Tabela gotowa do losowania, jeśli istnieje.
+        """
+        if (compiled := self._cache.get(table_id)) is not None:
+            return compiled
+
+        generation = self._cache.generation
+        # Wpis cache żyje aż do zmiany tabeli, więc nie może pochodzić
+        # z opóźnionej repliki.
+        table = await self._single_flight.do(
+            f"loot:{table_id}",
+            lambda: self._repository.get_loot_table(table_id, primary=True),
+        )
+        if table is None:
+            return None
+        if not table.entries and not table.empty_weight:
+            raise ValueError(f"Loot table with ID {table_id} has no entries.")
+
+        return self._cache.put(table, generation)
+
+    @staticmethod
+    def _check_entries(data: LootTableIn) -> None:
+        """Prywatna metoda sprawdzająca, czy przedmioty tabeli są unikalne.
+
+        Args:
+            data (LootTableIn): Atrybuty i pozycje tabeli łupów.
+
+        Raises:
+            ValueError: Jeśli przedmiot się powtarza.
+        """
+        item_ids = [entry.item_id for entry in data.entries]
+        if len(set(item_ids)) != len(item_ids):
+            raise ValueError("Loot table entries must reference distinct items.")
@@ -0,0 +1,296 @@
+"""Moduł zawierający implementację usługi rynku przedmiotów.
+
+Każdy worker trzyma księgi zleceń w pamięci i dopasowuje w nich nowe
+zlecenia. Rozliczenie w bazie danych przechodzi tylko wtedy, gdy wersja
+księgi w bazie jest tą, na której dopasowano zlecenie; w przeciwnym razie
+księga jest wczytywana ponownie i dopasowanie jest powtarzane. Zmiana
+księgi rozliczona przez inny worker porzuca jej kopię w pamięci, więc
+odczyty nie zwracają ksiąg starszych niż ostatnie powiadomienie.
+"""
+
+import asyncio
+from collections import defaultdict
+
+from src.core.domain.inventory import Inventory
+from src.core.domain.ledger import MONEY_ITEM_ID
+from src.core.domain.market import (
+    BestPrices,
+    MarketFill,
+    MarketOrder,
+    MarketOrderIn,
+    MarketOrderOut,
+    OrderBookOut,
+    OrderBookState,
+    PriceLevel,
+    StaleOrderBookError,
+)
+from src.core.repositories.imarket import IMarketRepository
+from src.infrastructure.services.iledger import ILedgerService
+from src.infrastructure.services.imarket import IMarketService
+from src.infrastructure.services.inotifier import IChangeNotifier
+from src.infrastructure.utils.orderbook import BookOrder, OrderBook, settlement_deltas
+from src.infrastructure.utils.singleflight import SingleFlight
+
+
+class MarketService(IMarketService):
+    """Klasa implementująca usługę rynku przedmiotów."""
+
+    _repository: IMarketRepository
+    _notifier: IChangeNotifier
+    _single_flight: SingleFlight
+    _ledger: ILedgerService
+    _books: dict[int, OrderBook]
+    _locks: defaultdict[int, asyncio.Lock]
+
+    def __init__(
+        self,
+        repository: IMarketRepository,
+        notifier: IChangeNotifier,
+        single_flight: SingleFlight,
+        ledger: ILedgerService,
+        max_attempts: int = 3,
+    ) -> None:
+        """Inicjalizator klasy `MarketService`.
+
+        Args:
+            repository (IMarketRepository): Referencja do repozytorium rynku.
+            notifier (IChangeNotifier): Referencja do notyfikatora zmian.
+            single_flight (SingleFlight): Grupa łącząca identyczne odczyty.
+            ledger (ILedgerService): Dziennik zmian inventory.
+            max_attempts (int): Liczba prób dopasowania przy nieaktualnej księdze.
+        """
+
+        self._repository = repository
+        self._notifier = notifier
+        self._single_flight = single_flight
+        self._ledger = ledger
+        self._max_attempts = max_attempts
+        self._books = {}
+        self._locks = defaultdict(asyncio.Lock)
+
+    async def start(self) -> None:
+        """Metoda odbudowująca księgi zleceń z bazy danych."""
+        self._books = {
+            state.item_id: self._build_book(state)
+            for state in await self._repository.get_order_books()
+        }
+
+    def invalidate_book(self, topic: str, changes: dict | None) -> None:
+        """Metoda porzucająca księgę zmienioną przez inny worker.
+
+        Własne zmiany workera mają wersję nie nowszą niż jego księga, więc
+        księga jest porzucana tylko, gdy zmianę rozliczył ktoś inny.
+
+        Args:
+            topic (str): Zmieniony temat, np. `market:5`.
+            changes (dict | None): Zmienione pola, w tym wersja księgi.
+        """
+        entity, _, item_id = topic.partition(":")
+        if entity != "market" or (book := self._books.get(int(item_id))) is None:
+            return
+
+        version = (changes or {}).get("version")
+        if version is None or version > book.version:
+            self._books.pop(int(item_id), None)
+
+    async def place_order(self, data: MarketOrderIn) -> MarketOrderOut:
+        """Metoda składająca i dopasowująca zlecenie.
+
+        Args:
+            data (MarketOrderIn): Nowe zlecenie.
+
+        Raises:
+            ValueError: Jeśli przedmiot lub inventory nie istnieje lub brakuje
+                środków.
+            StaleOrderBookError: Jeśli księga zmieniała się przy każdej próbie.
+
+        Returns:
+            MarketOrderOut: Zapisane zlecenie i zawarte transakcje.
+        """
+        async with self._locks[data.item_id]:
+            for _ in range(self._max_attempts):
+                book = await self._get_book(data.item_id)
+                match = book.match(data.side, data.price, data.quantity)
+                fills = [
+                    MarketFill(
+                        order_id=order.id,
+                        inventory_id=order.inventory_id,
+                        price=order.price,
+                        quantity=quantity,
+                    )
+                    for order, quantity in match.fills
+                ]
+
+                try:
+                    settlement = await self._repository.settle_order(
+                        data,
+                        fills,
+                        book.version,
+                    )
+                except StaleOrderBookError:
+                    self._books.pop(data.item_id, None)
+                    continue
+                except BaseException:
+                    book.rollback(match)
+                    raise
+
+                book.commit(match, settlement.version)
+                order = settlement.order
+                if order.remaining:
+                    book.add(BookOrder(
+                        order.id,
+                        order.inventory_id,
+                        order.side,
+                        order.price,
+                        order.remaining,
+                    ))
+                break
+            else:
+                raise StaleOrderBookError(f"Order book of item {data.item_id} is busy.")
+
+        for inventory_id, deltas in settlement_deltas(data, fills).items():
+            self._ledger.record_deltas(inventory_id, deltas, "market")
+        await self._publish(data.item_id, settlement.version, settlement.inventories)
+
+        return MarketOrderOut(order=order, trades=settlement.trades)
+
+    async def cancel_order(self, order_id: int) -> MarketOrder | None:
+        """Metoda anulująca zlecenie i zwracająca depozyt.
+
+        Args:
+            order_id (int): ID zlecenia.
+
+        Returns:
+            MarketOrder | None: Anulowane zlecenie, jeśli było otwarte.
+        """
+        cancellation = await self._repository.cancel_order(order_id)
+        if cancellation is None:
+            return None
+
+        order = cancellation.order
+        async with self._locks[order.item_id]:
+            book = self._books.get(order.item_id)
+            if book and cancellation.version == book.version + 1:
+                book.remove(order.id)
+                book.version = cancellation.version
+            else:
+                self._books.pop(order.item_id, None)
+
+        refund = (
+            {MONEY_ITEM_ID: order.price * order.remaining}
+            if order.side == "buy" else {order.item_id: order.remaining}
+        )
+        self._ledger.record_deltas(order.inventory_id, refund, "market_cancel")
+        await self._publish(
+            order.item_id,
+            cancellation.version,
+            [cancellation.inventory] if cancellation.inventory else [],
+        )
+
+        return order
+
+    async def get_order_book(self, item_id: int, levels: int) -> OrderBookOut:
+        """Metoda pobierająca zagregowaną księgę zleceń z pamięci.
+
+        Args:
+            item_id (int): ID przedmiotu.
+            levels (int): Liczba poziomów cenowych każdej strony.
+
+        Returns:
+            OrderBookOut: Najlepsze poziomy cenowe kupna i sprzedaży.
+        """
+        async with self._locks[item_id]:
+            book = await self._get_book(item_id)
+
+            return OrderBookOut(
+                item_id=item_id,
+                version=book.version,
+                bids=[
+                    PriceLevel(price=price, quantity=quantity)
+                    for price, quantity in book.depth("buy", levels)
+                ],
+                asks=[
+                    PriceLevel(price=price, quantity=quantity)
+                    for price, quantity in book.depth("sell", levels)
+                ],
+            )
+
+    async def get_best_prices(self, item_id: int) -> BestPrices:
+        """Metoda pobierająca najlepsze ceny przedmiotu z pamięci.
+
+        Args:
+            item_id (int): ID przedmiotu.
+
+        Returns:
+            BestPrices: Najwyższa cena kupna i najniższa cena sprzedaży.
+        """
+        async with self._locks[item_id]:
+            book = await self._get_book(item_id)
+            bid, ask = book.best("buy"), book.best("sell")
+
+            return BestPrices(
+                item_id=item_id,
+                bid=bid.price if bid else None,
+                ask=ask.price if ask else None,
+            )
+
+    async def _get_book(self, item_id: int) -> OrderBook:
+        """Prywatna metoda pobierająca księgę, wczytując ją w razie potrzeby.
+
+        Args:
+            item_id (int): ID przedmiotu.
+
+        Returns:
+            OrderBook: Księga zleceń przedmiotu.
+        """
+        if (book := self._books.get(item_id)) is None:
+            state = await self._repository.get_order_book(item_id)
+            book = self._books[item_id] = self._build_book(state)
+
+        return book
+
+    async def _publish(
+        self,
+        item_id: int,
+        version: int,
+        inventories: list[Inventory],
+    ) -> None:
+        """Prywatna metoda publikująca zmianę księgi i stanu inventory.
+
+        Args:
+            item_id (int): ID przedmiotu.
+            version (int): Nowa wersja księgi.
+            inventories (list[Inventory]): Zmienione inventory.
+        """
+        for inventory in inventories:
+            self._single_flight.forget(f"inventory:{inventory.id}")
+        await self._notifier.publish_many(
+            "inventory",
+            [
+                (inventory.id, {"money": inventory.money, "itemlist": inventory.itemlist})
+                for inventory in inventories
+            ],
+        )
+        await self._notifier.publish_many("market", [(item_id, {"version": version})])
+
+    @staticmethod
+    def _build_book(state: OrderBookState) -> OrderBook:
+        """Prywatna metoda budująca księgę z otwartych zleceń.
+
+        Args:
+            state (OrderBookState): Wersja i otwarte zlecenia księgi.
+
+        Returns:
+            OrderBook: Księga zleceń przedmiotu.
+        """
+        book = OrderBook(state.version)
+        for order in state.orders:
+            book.add(BookOrder(
+                order.id,
+                order.inventory_id,
+                order.side,
+                order.price,
+                order.remaining,
+            ))
+
+        return book
@@ -0,0 +1,448 @@
+"""Module containing change notifier implementation.
+
+Changes are fanned out through Postgres LISTEN/NOTIFY, so every worker
+listening on the channel delivers them to its own websocket subscribers.
+Notifications sent while the LISTEN connection is down are lost, so after
+reconnecting subscribers are asked to resync and local caches are rebuilt.
+"""
+
+import asyncio
+import json
+from collections import defaultdict, deque
+from typing import Awaitable, Callable, Iterable
+
+from asyncpg import Connection, InterfaceError, PostgresError  # type: ignore
+from pydantic import BaseModel
+
+from src.db import connect_raw
+from src.infrastructure.services.inotifier import IChangeNotifier, ISubscription
+
+CHANNEL = "entity_changes"
+MAX_PAYLOAD_BYTES = 7900
+RECONNECT_MIN_SECONDS = 0.5
+RECONNECT_MAX_SECONDS = 30.0
+
+
+class Subscription(ISubscription):
+    """A class implementing a bounded subscription of a single client."""
+
+    topics: set[str]
+    dropped: int
+
+    def __init__(self, notifier: "ChangeNotifier", max_pending: int) -> None:
+        """The initializer of the `subscription`.
+
+        Args:
+            notifier (ChangeNotifier): The notifier owning the subscription.
+            max_pending (int): The number of messages buffered before
+                the subscriber is considered too slow.
+        """
+
+        self.topics = set()
+        self.dropped = 0
+        self._notifier = notifier
+        self._max_pending = max_pending
+        self._pending: deque[tuple[str, str]] = deque()
+        self._lagged: set[str] = set()
+        self._ready = asyncio.Event()
+
+    def subscribe(self, topics: Iterable[str]) -> None:
+        """The method adding topics to the subscription.
+
+        Args:
+            topics (Iterable[str]): Topics like `player:1` or `inventory:3`.
+        """
+
+        self._notifier.attach(self, topics)
+
+    def unsubscribe(self, topics: Iterable[str]) -> None:
+        """The method removing topics from the subscription.
+
+        Args:
+            topics (Iterable[str]): Topics to be removed.
+        """
+
+        self._notifier.detach(self, topics)
+
+    def push(self, topic: str, message: str) -> None:
+        """The method buffering a message without ever blocking the fan-out.
+
+        When the buffer is full the pending deltas are discarded and the
+        client is asked to refetch the affected topics instead.
+
+        Args:
+            topic (str): The topic of the message.
+            message (str): The JSON encoded event.
+        """
+
+        if len(self._pending) >= self._max_pending:
+            self.dropped += len(self._pending)
+            self._lagged.update(pending_topic for pending_topic, _ in self._pending)
+            self._lagged.add(topic)
+            self._pending.clear()
+        else:
+            self._pending.append((topic, message))
+
+        self._ready.set()
+
+    async def next_message(self) -> str:
+        """The method waiting for the next encoded message.
+
+        Returns:
+            str: The JSON encoded event.
+        """
+
+        while not self._pending and not self._lagged:
+            self._ready.clear()
+            await self._ready.wait()
+
+        if self._lagged:
+            topics = sorted(self._lagged)
+            self._lagged.clear()
+            return json.dumps({"resync": topics})
+
+        return self._pending.popleft()[1]
+
+    def resync(self) -> None:
+        """The method asking the client to refetch all subscribed topics."""
+
+        self._pending.clear()
+        self._lagged.update(self.topics)
+        self._ready.set()
+
+
+class ChangeNotifier(IChangeNotifier):
+    """A class implementing the change notifier."""
+
+    _topics: dict[str, set[Subscription]]
+    _listeners: list[Callable[[str], None]]
+    _change_listeners: list[Callable[[str, dict | None], None]]
+    _resync_listeners: list[Callable[[], Awaitable[None]]]
+    _connection: Connection | None
+    _reconnect_task: asyncio.Task | None
+
+    def __init__(self, max_pending: int = 256) -> None:
+        """The initializer of the `change notifier`.
+
+        Args:
+            max_pending (int): The per subscriber buffer size.
+        """
+
+        self._max_pending = max_pending
+        self._topics = defaultdict(set)
+        self._listeners = []
+        self._change_listeners = []
+        self._resync_listeners = []
+        self._connection = None
+        self._reconnect_task = None
+        self._lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        """The method opening the LISTEN connection.
+
+        Without a connection the notifier only delivers changes made
+        by the current worker.
+        """
+
+        try:
+            await self._connect()
+        except (OSError, InterfaceError, PostgresError) as e:
+            print(f"Change notifier works locally only: {e}")
+
+    async def stop(self) -> None:
+        """The method closing the LISTEN connection."""
+
+        if self._reconnect_task:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+
+        if connection := self._connection:
+            self._connection = None
+            connection.remove_termination_listener(self._on_termination)
+            await connection.close()
+
+    async def publish(
+        self,
+        entity: str,
+        entity_id: int,
+        before: BaseModel | None,
+        after: BaseModel | None,
+    ) -> None:
+        """The method publishing a change of an entity to all workers.
+
+        Args:
+            entity (str): The entity name, e.g. `player`.
+            entity_id (int): The id of the entity.
+            before (BaseModel | None): The state before the change.
+            after (BaseModel | None): The state after the change.
+        """
+
+        if after is None:
+            await self.publish_many(entity, [(entity_id, None)])
+            return
+
+        old = before.model_dump() if before else {}
+        changes = {
+            key: value
+            for key, value in after.model_dump().items()
+            if key not in old or old[key] != value
+        }
+        if changes:
+            await self.publish_many(entity, [(entity_id, changes)])
+
+    async def publish_many(
+        self,
+        entity: str,
+        changes: Iterable[tuple[int, dict | None]],
+    ) -> None:
+        """The method publishing changes of many entities in one round trip.
+
+        Args:
+            entity (str): The entity name, e.g. `player`.
+            changes (Iterable[tuple[int, dict | None]]): The id of every
+                entity with its changed fields, None if it was deleted.
+        """
+
+        changes = list(changes)
+        topics = []
+        payloads = []
+        for entity_id, fields in changes:
+            topic = f"{entity}:{entity_id}"
+            if fields is None:
+                event = {"topic": topic, "deleted": True}
+            else:
+                event = {"topic": topic, "changes": fields}
+
+            payload = f"{topic}\n{json.dumps(event)}"
+            if len(payload.encode()) > MAX_PAYLOAD_BYTES:
+                payload = f"{topic}\n{json.dumps({'resync': [topic]})}"
+
+            topics.append(topic)
+            payloads.append(payload)
+
+        # Local listeners must not wait for the notification round trip,
+        # e.g. a cache has to forget the old state before the next read.
+        for listener in self._listeners:
+            for topic in topics:
+                listener(topic)
+        for change_listener in self._change_listeners:
+            for topic, (_, fields) in zip(topics, changes):
+                change_listener(topic, fields)
+
+        if not payloads:
+            return
+
+        # Without the round trip the local subscriptions still get the
+        # events, but listeners were already called above.
+        if (connection := self._connection) is None:
+            for payload in payloads:
+                self._push(payload)
+            return
+
+        try:
+            async with self._lock:
+                await connection.execute(
+                    "SELECT pg_notify($1, payload) FROM unnest($2::text[]) AS payload",
+                    CHANNEL,
+                    payloads,
+                )
+        except (OSError, InterfaceError, PostgresError) as e:
+            print(f"Change notification failed: {e}")
+            for payload in payloads:
+                self._push(payload)
+            if not isinstance(e, PostgresError) or connection.is_closed():
+                self._connection_lost(connection)
+
+    def add_listener(self, listener: Callable[[str], None]) -> None:
+        """The method registering a callback invoked with every changed topic.
+
+        Args:
+            listener (Callable[[str], None]): The callback, e.g. a cache
+                invalidation.
+        """
+
+        self._listeners.append(listener)
+
+    def add_change_listener(self, listener: Callable[[str, dict | None], None]) -> None:
+        """The method registering a callback invoked with every change.
+
+        Args:
+            listener (Callable[[str, dict | None], None]): The callback
+                receiving the topic and its changed fields, None if the
+                entity was deleted or has to be refetched.
+        """
+
+        self._change_listeners.append(listener)
+
+    def add_resync_listener(self, listener: Callable[[], Awaitable[None]]) -> None:
+        """The method registering a callback invoked after a reconnection.
+
+        Args:
+            listener (Callable[[], Awaitable[None]]): The callback
+                rebuilding state which may have missed changes.
+        """
+
+        self._resync_listeners.append(listener)
+
+    def open_subscription(self) -> Subscription:
+        """The method creating a new subscription.
+
+        Returns:
+            Subscription: The subscription handle.
+        """
+
+        return Subscription(self, self._max_pending)
+
+    def close_subscription(self, subscription: ISubscription) -> None:
+        """The method removing a subscription with all its topics.
+
+        Args:
+            subscription (ISubscription): The subscription handle.
+        """
+
+        if isinstance(subscription, Subscription):
+            self.detach(subscription, list(subscription.topics))
+
+    def attach(self, subscription: Subscription, topics: Iterable[str]) -> None:
+        """The method registering the subscription for given topics.
+
+        Args:
+            subscription (Subscription): The subscription handle.
+            topics (Iterable[str]): The topics.
+        """
+
+        for topic in topics:
+            self._topics[topic].add(subscription)
+            subscription.topics.add(topic)
+
+    def detach(self, subscription: Subscription, topics: Iterable[str]) -> None:
+        """The method unregistering the subscription from given topics.
+
+        Args:
+            subscription (Subscription): The subscription handle.
+            topics (Iterable[str]): The topics.
+        """
+
+        for topic in topics:
+            subscription.topics.discard(topic)
+            if subscribers := self._topics.get(topic):
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._topics[topic]
+
+    async def _connect(self) -> None:
+        """A private method opening and registering the LISTEN connection."""
+
+        connection = await connect_raw()
+        try:
+            await connection.add_listener(CHANNEL, self._on_notification)
+        except BaseException:
+            connection.terminate()
+            raise
+
+        connection.add_termination_listener(self._on_termination)
+        self._connection = connection
+
+    def _connection_lost(self, connection: Connection) -> None:
+        """A private method dropping a broken connection and reconnecting.
+
+        Until the connection is back, changes are delivered locally only.
+
+        Args:
+            connection (Connection): The broken connection.
+        """
+
+        if connection is not self._connection:
+            return
+
+        self._connection = None
+        connection.remove_termination_listener(self._on_termination)
+        connection.terminate()
+        if self._reconnect_task is None:
+            self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        """A private loop reconnecting with an exponential backoff."""
+
+        delay = RECONNECT_MIN_SECONDS
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                await self._connect()
+                break
+            except (OSError, InterfaceError, PostgresError) as e:
+                print(f"Change notifier reconnection failed: {e}")
+                delay = min(delay * 2, RECONNECT_MAX_SECONDS)
+
+        self._reconnect_task = None
+        subscriptions = {
+            subscription
+            for topic_subscriptions in self._topics.values()
+            for subscription in topic_subscriptions
+        }
+        for subscription in subscriptions:
+            subscription.resync()
+        for listener in self._resync_listeners:
+            try:
+                await listener()
+            except Exception as e:
+                print(f"Change notifier resync failed: {e}")
+
+    def _on_termination(self, connection: Connection) -> None:
+        """A private callback invoked by asyncpg when the connection is lost.
+
+        Args:
+            connection (Connection): The lost connection.
+        """
+
+        self._connection_lost(connection)
+
+    def _on_notification(
+        self,
+        connection: Connection,
+        pid: int,
+        _channel: str,
+        payload: str,
+    ) -> None:
+        """A private callback invoked by asyncpg for every notification.
+
+        Args:
+            connection (Connection): The listening connection.
+            pid (int): The PID of the notifying backend.
+            _channel (str): The channel name.
+            payload (str): The notification payload.
+        """
+
+        if pid == connection.get_server_pid():
+            # Published by this worker, whose listeners were already called.
+            self._push(payload)
+        else:
+            self._dispatch(payload)
+
+    def _dispatch(self, payload: str) -> None:
+        """A private method delivering a payload to listeners and subscribers.
+
+        Args:
+            payload (str): The topic and encoded event separated by newline.
+        """
+
+        topic, _, message = payload.partition("\n")
+        for listener in self._listeners:
+            listener(topic)
+        if self._change_listeners:
+            fields = json.loads(message).get("changes")
+            for change_listener in self._change_listeners:
+                change_listener(topic, fields)
+
+        self._push(payload)
+
+    def _push(self, payload: str) -> None:
+        """A private method delivering a payload to local subscriptions only.
+
+        Args:
+            payload (str): The topic and encoded event separated by newline.
+        """
+
+        topic, _, message = payload.partition("\n")
+        for subscription in self._topics.get(topic, ()):
+            subscription.push(topic, message)
@@ -1,25 +1,64 @@
 """Moduł zawierający implementację usług player."""
 
+import asyncio
+from datetime import datetime, timedelta, timezone
 from typing import Iterable
 
-from src.core.domain.player import Player, PlayerIn
+from src.core.domain.character import (
+    Character,
+    CharacterIn,
+    CharacterPurge,
+    CharacterPurgeIn,
+)
+from src.core.domain.player import Player, PlayerBatch, PlayerIn, PlayerPage
 from src.core.repositories.iplayer import IPlayerRepository
+from src.infrastructure.services.iledger import ILedgerService
+from src.infrastructure.services.inotifier import IChangeNotifier
 from src.infrastructure.services.iplayer import IPlayerService
+from src.infrastructure.utils.namefilter import NameRegistry
+from src.infrastructure.utils.singleflight import SingleFlight
 
 
 class PlayerService(IPlayerService):
     """Klasa implementująca usługę player."""
 
     _repository: IPlayerRepository
+    _notifier: IChangeNotifier
+    _single_flight: SingleFlight
+    _ledger: ILedgerService
+    _names: NameRegistry
 
-    def __init__(self, repository: IPlayerRepository) -> None:
+    def __init__(
+        self,
+        repository: IPlayerRepository,
+        notifier: IChangeNotifier,
+        single_flight: SingleFlight,
+        ledger: ILedgerService,
+        names: NameRegistry,
+        purge_min_inactive_days: int = 30,
+    ) -> None:
         """Inicjalizator klasy `PlayerService`.
 
         Args:
             repository (IPlayerRepository): Referencja do repozytorium player.
+            notifier (IChangeNotifier): Referencja do notyfikatora zmian.
+            single_flight (SingleFlight): Grupa łącząca identyczne odczyty.
+            ledger (ILedgerService): Dziennik zmian inventory.
+            names (NameRegistry): Filtry zajętych nazw.
+            purge_min_inactive_days (int): Minimalny czas nieaktywności
+                playerów usuwanych przez czyszczenie.
         """
 
         self._repository = repository
+        self._notifier = notifier
+        self._single_flight = single_flight
+        self._ledger = ledger
+        self._names = names
+        self._purge_min_inactive_days = purge_min_inactive_days
+
+    async def start(self) -> None:
+        """Metoda budująca filtr zajętych nazw playerów."""
+        self._names.load("player", await self._repository.get_all_names())
 
     async def get_player_by_id(self, player_id: int) -> Player | None:
         """Metoda pobierająca playera z repozytorium po ID.
@@ -30,7 +69,45 @@ class PlayerService(IPlayerService):
         Returns:
             Player | None: Dane playera, jeśli istnieje.
         """
-        return await self._repository.get_player_by_id(player_id)
+        return await self._single_flight.do(
+            f"player:{player_id}",
+            lambda: self._repository.get_player_by_id(player_id),
+        )
+
+    async def get_players_by_ids(self, player_ids: list[int]) -> PlayerBatch:
+        """Metoda pobierająca wielu playerów naraz.
+
+        Args:
+            player_ids (list[int]): Lista ID playerów.
+
+        Returns:
+            PlayerBatch: Playerzy w kolejności ID oraz brakujące ID.
+        """
+        return await self._repository.get_many_by_ids(player_ids)
+
+    async def get_all_players(self) -> Iterable[Player]:
+        """Metoda pobierająca wszystkich playerów z repozytorium.
+
+        Returns:
+            Iterable[Player]: Kolekcja playerów.
+        """
+        return await self._repository.get_all_players()
+
+    async def get_players_page(self, after_id: int, limit: int) -> PlayerPage:
+        """Metoda pobierająca stronę playerów po ID.
+
+        Args:
+            after_id (int): ID ostatniego playera poprzedniej strony.
+            limit (int): Maksymalna liczba playerów na stronie.
+
+        Returns:
+            PlayerPage: Playerzy i ID, po którym zaczyna się następna strona.
+        """
+        players = list(await self._repository.get_players_page(after_id, limit))
+        return PlayerPage(
+            players=players,
+            next_after_id=players[-1].id if len(players) == limit else None,
+        )
 
     async def get_player_by_name(self, name: str) -> Player | None:
         """Metoda pobierająca playera z repozytorium po nazwie.
@@ -43,20 +120,61 @@ class PlayerService(IPlayerService):
         """
         return await self._repository.get_player_by_name(name)
 
+    async def is_name_available(self, name: str) -> bool:
+        """Metoda sprawdzająca, czy nazwa playera jest wolna.
+
+        Filtr Blooma odpowiada bez zapytania, gdy nazwa na pewno jest
+        wolna; tylko możliwe trafienia są sprawdzane indeksem nazw.
+
+        Args:
+            name (str): Nazwa playera.
+
+        Returns:
+            bool: Czy nazwa jest wolna.
+        """
+        if not self._names.might_be_taken("player", name):
+            return True
+
+        return await self._repository.get_player_by_name(name) is None
+
     async def add_player(self, data: PlayerIn) -> Player | None:
         """Metoda dodająca nowego playera do repozytorium.
 
         Args:
             data (PlayerIn): Atrybuty playera.
 
+        Raises:
+            ValueError: Jeśli nazwa playera jest już zajęta.
+
         Returns:
             Player | None: Nowo utworzony player, jeśli operacja się powiodła.
         """
-        existing_player = await self._repository.get_player_by_name(data.name)
-        if existing_player:
-            raise ValueError(f"Player with name '{data.name}' already exists.")
+        new_player = await self._repository.add_player(data)
+        if new_player:
+            await self._publish_names(added=[new_player.name])
+            await self._notifier.publish("player", new_player.id, None, new_player)
+
+        return new_player
 
-        return await self._repository.add_player(data)
+    async def create_character(self, data: CharacterIn) -> Character:
+        """Metoda tworząca playera wraz z nowym inventory.
+
+        Args:
+            data (CharacterIn): Atrybuty playera i inventory.
+
+        Raises:
+            ValueError: Jeśli nazwa playera jest już zajęta.
+
+        Returns:
+            Character: Nowo utworzony player i jego inventory.
+        """
+        character = await self._repository.add_character(data)
+        self._ledger.record_change(None, character.inventory, "create")
+        await self._publish_names(added=[character.player.name])
+        await self._notifier.publish("inventory", character.inventory.id, None, character.inventory)
+        await self._notifier.publish("player", character.player.id, None, character.player)
+
+        return character
 
     async def update_player(self, player_id: int, data: PlayerIn) -> Player | None:
         """Metoda aktualizująca dane playera w repozytorium.
@@ -72,7 +190,22 @@ class PlayerService(IPlayerService):
         if not existing_player:
             raise ValueError(f"Player with ID {player_id} does not exist.")
 
-        return await self._repository.update_player(player_id, data)
+        updated_player = await self._repository.update_player(player_id, data)
+        self._single_flight.forget(f"player:{player_id}")
+        if updated_player:
+            if updated_player.name != existing_player.name:
+                await self._publish_names(
+                    added=[updated_player.name],
+                    removed=[existing_player.name],
+                )
+            await self._notifier.publish(
+                "player",
+                player_id,
+                existing_player,
+                updated_player,
+            )
+
+        return updated_player
 
     async def delete_player(self, player_id: int) -> bool:
         """Metoda usuwająca playera z repozytorium.
@@ -83,8 +216,81 @@ class PlayerService(IPlayerService):
         Returns:
             bool: Powodzenie operacji usuwania.
         """
-        existing_player = await self._repository.get_player_by_id(player_id)
-        if not existing_player:
-            raise ValueError(f"Player with ID {player_id} does not exist.")
+        deleted_name = await self._repository.remove_player(player_id)
+        if deleted_name is not None:
+            self._single_flight.forget(f"player:{player_id}")
+            await self._publish_names(removed=[deleted_name])
+            await self._notifier.publish("player", player_id, None, None)
+
+        return deleted_name is not None
+
+    async def purge_inactive_players(self, data: CharacterPurgeIn) -> CharacterPurge:
+        """Metoda trwale usuwająca nieaktywnych playerów paczkami.
+
+        Każda paczka to osobne, krótkie polecenie, więc blokady są
+        zwalniane, a WAL rośnie stopniowo, zamiast w jednej transakcji.
 
-        return await self._repository.remove_player(player_id)
+        Args:
+            data (CharacterPurgeIn): Granica nieaktywności i rozmiar paczki.
+
+        Raises:
+            ValueError: Jeśli granica nieaktywności jest zbyt świeża.
+
+        Returns:
+            CharacterPurge: Liczba usuniętych playerów, inventory i paczek.
+        """
+        inactive_before = data.inactive_before
+        if inactive_before.tzinfo is None:
+            inactive_before = inactive_before.replace(tzinfo=timezone.utc)
+        limit = datetime.now(timezone.utc) - timedelta(days=self._purge_min_inactive_days)
+        if inactive_before > limit:
+            raise ValueError(
+                "Players can be purged only after "
+                f"{self._purge_min_inactive_days} days of inactivity."
+            )
+
+        purge = CharacterPurge(players=0, inventories=0, batches=0)
+        while True:
+            batch = await self._repository.purge_inactive_players(
+                inactive_before,
+                data.batch_size,
+            )
+            purge.players += len(batch.player_ids)
+            purge.inventories += len(batch.inventory_ids)
+            purge.batches += 1
+
+            for player_id in batch.player_ids:
+                self._single_flight.forget(f"player:{player_id}")
+            for inventory_id in batch.inventory_ids:
+                self._single_flight.forget(f"inventory:{inventory_id}")
+            await self._notifier.publish_many(
+                "player",
+                [(player_id, None) for player_id in batch.player_ids],
+            )
+            await self._notifier.publish_many(
+                "inventory",
+                [(inventory_id, None) for inventory_id in batch.inventory_ids],
+            )
+
+            if len(batch.player_ids) < data.batch_size:
+                # Nazwy usuniętych playerów nie są znane, więc filtr jest
+                # budowany od nowa; bez tego zostałyby w nim jako zajęte.
+                if purge.players:
+                    await self.start()
+                return purge
+
+            await asyncio.sleep(0)
+
+    async def _publish_names(
+        self,
+        added: list[str] | None = None,
+        removed: list[str] | None = None,
+    ) -> None:
+        """Prywatna metoda aktualizująca filtry nazw wszystkich workerów.
+
+        Args:
+            added (list[str] | None): Nazwy zajęte przez zmianę.
+            removed (list[str] | None): Nazwy zwolnione przez zmianę.
+        """
+        change_ids = self._names.change("player", added or (), removed or ())
+        await self._notifier.publish_many("name", [(change_id, {}) for change_id in change_ids])
@@ -0,0 +1,218 @@
+"""Moduł zawierający implementację usług receptur."""
+
+from src.core.domain.ledger import MONEY_ITEM_ID
+from src.core.domain.recipe import CraftIn, CraftOut, Recipe, RecipeIn
+from src.core.repositories.iinventory import IInventoryRepository
+from src.core.repositories.irecipe import IRecipeRepository
+from src.infrastructure.services.iledger import ILedgerService
+from src.infrastructure.services.inotifier import IChangeNotifier
+from src.infrastructure.services.irecipe import IRecipeService
+from src.infrastructure.utils.recipe import CompiledRecipe, RecipeCache
+from src.infrastructure.utils.singleflight import SingleFlight
+
+
+class RecipeService(IRecipeService):
+    """Klasa implementująca usługę receptur."""
+
+    _repository: IRecipeRepository
+    _inventory_repository: IInventoryRepository
+    _cache: RecipeCache
+    _notifier: IChangeNotifier
+    _single_flight: SingleFlight
+    _ledger: ILedgerService
+
+    def __init__(
+        self,
+        repository: IRecipeRepository,
+        inventory_repository: IInventoryRepository,
+        cache: RecipeCache,
+        notifier: IChangeNotifier,
+        single_flight: SingleFlight,
+        ledger: ILedgerService,
+    ) -> None:
+        """Inicjalizator klasy `RecipeService`.
+
+        Args:
+            repository (IRecipeRepository): Referencja do repozytorium receptur.
+            inventory_repository (IInventoryRepository): Referencja do
+                repozytorium inventory.
+            cache (RecipeCache): Cache skompilowanych receptur.
+            notifier (IChangeNotifier): Referencja do notyfikatora zmian.
+            single_flight (SingleFlight): Grupa łącząca identyczne odczyty.
+            ledger (ILedgerService): Dziennik zmian inventory.
+        """
+
+        self._repository = repository
+        self._inventory_repository = inventory_repository
+        self._cache = cache
+        self._notifier = notifier
+        self._single_flight = single_flight
+        self._ledger = ledger
+
+    async def start(self) -> None:
+        """Metoda wczytująca i kompilująca wszystkie receptury przy starcie."""
+        generation = self._cache.generation
+        self._cache.put_all(list(await self._repository.get_all_recipes()), generation)
+
+    async def get_recipe(self, recipe_id: int) -> Recipe | None:
+        """Metoda pobierająca recepturę.
+
+        Args:
+            recipe_id (int): ID receptury.
+
+        Returns:
+            Recipe | None: Receptura, jeśli istnieje.
+        """
+        return await self._repository.get_recipe(recipe_id)
+
+    async def add_recipe(self, data: RecipeIn) -> Recipe:
+        """Metoda dodająca recepturę.
+
+        Args:
+            data (RecipeIn): Atrybuty, wejścia i wyjścia receptury.
+
+        Raises:
+            ValueError: Jeśli przedmiot się powtarza, nazwa jest zajęta
+                lub przedmiot nie istnieje.
+
+        Returns:
+            Recipe: Nowo utworzona receptura.
+        """
+        self._check_items(data)
+        recipe = await self._repository.add_recipe(data)
+        await self._notifier.publish("recipe", recipe.id, None, recipe)
+
+        return recipe
+
+    async def update_recipe(self, recipe_id: int, data: RecipeIn) -> Recipe | None:
+        """Metoda zastępująca recepturę.
+
+        Args:
+            recipe_id (int): ID receptury.
+            data (RecipeIn): Nowe atrybuty, wejścia i wyjścia receptury.
+
+        Raises:
+            ValueError: Jeśli przedmiot się powtarza, nazwa jest zajęta
+                lub przedmiot nie istnieje.
+
+        Returns:
+            Recipe | None: Zaktualizowana receptura, jeśli istnieje.
+        """
+        self._check_items(data)
+        existing_recipe = await self._repository.get_recipe(recipe_id, primary=True)
+        updated_recipe = await self._repository.update_recipe(recipe_id, data)
+        self._single_flight.forget(f"recipe:{recipe_id}")
+        if updated_recipe:
+            await self._notifier.publish("recipe", recipe_id, existing_recipe, updated_recipe)
+
+        return updated_recipe
+
+    async def delete_recipe(self, recipe_id: int) -> bool:
+        """Metoda usuwająca recepturę.
+
+        Args:
+            recipe_id (int): ID receptury.
+
+        Returns:
+            bool: Powodzenie operacji usuwania.
+        """
+        if not await self._repository.remove_recipe(recipe_id):
+            return False
+
+        self._single_flight.forget(f"recipe:{recipe_id}")
+        await self._notifier.publish("recipe", recipe_id, None, None)
+
+        return True
+
+    async def craft(self, data: CraftIn) -> CraftOut | None:
+        """Metoda wytwarzająca przedmioty według receptury.
+
+        Receptura jest mnożona przez liczbę wytworzeń, a pieniądze i
+        przedmioty są wymieniane jednym warunkowym zapytaniem, więc
+        wytworzenie wsadowe kosztuje tyle samo co pojedyncze.
+
+        Args:
+            data (CraftIn): Receptura, inventory i liczba wytworzeń.
+
+        Raises:
+            ValueError: Jeśli inventory nie istnieje lub brakuje w nim
+                pieniędzy albo przedmiotów.
+
+        Returns:
+            CraftOut | None: Inventory po wytworzeniu lub None, jeśli
+                receptura nie istnieje.
+        """
+        compiled = await self._get_compiled(data.recipe_id)
+        if compiled is None:
+            return None
+
+        batch = compiled.scaled(data.times)
+        inventory = await self._inventory_repository.exchange_items(
+            data.inventory_id,
+            batch.money,
+            batch.consumed,
+            batch.produced,
+        )
+        if inventory is None:
+            raise ValueError(
+                f"Inventory with ID {data.inventory_id} does not exist "
+                "or lacks the recipe inputs."
+            )
+
+        deltas = {
+            item_id: -quantity for item_id, quantity in batch.consumed.items()
+        }
+        for item_id, quantity in batch.produced.items():
+            deltas[item_id] = deltas.get(item_id, 0) + quantity
+        deltas[MONEY_ITEM_ID] = -batch.money
+        self._ledger.record_deltas(inventory.id, deltas, "craft")
+
+        self._single_flight.forget(f"inventory:{inventory.id}")
+        await self._notifier.publish_many(
+            "inventory",
+            [(inventory.id, {"money": inventory.money, "itemlist": inventory.itemlist})],
+        )
+
+        return CraftOut(recipe_id=data.recipe_id, times=data.times, inventory=inventory)
+
+    async def _get_compiled(self, recipe_id: int) -> CompiledRecipe | None:
+        """Prywatna metoda pobierająca skompilowaną recepturę.
+
+        Args:
+            recipe_id (int): ID receptury.
+
+        Returns:
+            CompiledRecipe | None: Receptura gotowa do wytwarzania, jeśli istnieje.
+        """
+        if (compiled := self._cache.get(recipe_id)) is not None:
+            return compiled
+
+        generation = self._cache.generation
+        # Wpis cache żyje aż do zmiany receptury, więc nie może pochodzić
+        # z opóźnionej repliki.
+        recipe = await self._single_flight.do(
+            f"recipe:{recipe_id}",
+            lambda: self._repository.get_recipe(recipe_id, primary=True),
+        )
+        if recipe is None:
+            return None
+
+        return self._cache.put(recipe, generation)
+
+    @staticmethod
+    def _check_items(data: RecipeIn) -> None:
+        """Prywatna metoda sprawdzająca, czy przedmioty receptury są unikalne.
+
+        Ten sam przedmiot może być wejściem i wyjściem, ale nie może się
+        powtarzać wśród wejść ani wśród wyjść.
+
+        Args:
+            data (RecipeIn): Atrybuty, wejścia i wyjścia receptury.
+
+        Raises:
+            ValueError: Jeśli przedmiot się powtarza.
+        """
+        for items in (data.inputs, data.outputs):
+            item_ids = [item.item_id for item in items]
+            if len(set(item_ids)) != len(item_ids):
+                raise ValueError("Recipe inputs and outputs must reference distinct items.")
@@ -0,0 +1,208 @@
+"""Moduł zawierający implementację usługi regeneracji hp.
+
+Regeneracja jest liczona przez serwer zamiast przez klientów. Spośród
+wszystkich workerów cykle wykonuje tylko lider, czyli właściciel blokady
+doradczej trzymanej na dedykowanym połączeniu. Gdy lider padnie, jego
+połączenie jest zamykane, blokada zwalniana i przejmuje ją inny worker.
+"""
+
+import asyncio
+import time
+
+from asyncpg import Connection, InterfaceError, PostgresError  # type: ignore
+
+from src.core.repositories.iplayer import IPlayerRepository
+from src.db import connect_raw
+from src.infrastructure.services.inotifier import IChangeNotifier
+from src.infrastructure.services.iregeneration import IRegenerationService
+from src.infrastructure.utils.dbguard import DatabaseOverloadedError
+from src.infrastructure.utils.singleflight import SingleFlight
+
+REGENERATION_LOCK_ID = 7_340_041
+SHED_BACKOFF_MAX_SECONDS = 60.0
+
+
+class RegenerationService(IRegenerationService):
+    """Klasa implementująca usługę regeneracji hp."""
+
+    _repository: IPlayerRepository
+    _notifier: IChangeNotifier
+    _single_flight: SingleFlight
+    _connection: Connection | None
+
+    def __init__(
+        self,
+        repository: IPlayerRepository,
+        notifier: IChangeNotifier,
+        single_flight: SingleFlight,
+        tick_seconds: float = 5.0,
+        amount: int = 1,
+        chunk_size: int = 1000,
+        max_chunks_per_tick: int = 50,
+    ) -> None:
+        """Inicjalizator usługi regeneracji.
+
+        Args:
+            repository (IPlayerRepository): Referencja do repozytorium player.
+            notifier (IChangeNotifier): Referencja do notyfikatora zmian.
+            single_flight (SingleFlight): Grupa łącząca identyczne odczyty.
+            tick_seconds (float): Odstęp między cyklami.
+            amount (int): Liczba hp dodawana w jednym cyklu.
+            chunk_size (int): Liczba playerów aktualizowanych jednym zapytaniem.
+            max_chunks_per_tick (int): Limit paczek w cyklu; niedokończone
+                przejście jest kontynuowane w kolejnym cyklu.
+        """
+        self._repository = repository
+        self._notifier = notifier
+        self._single_flight = single_flight
+        self._tick_seconds = tick_seconds
+        self._amount = amount
+        self._chunk_size = chunk_size
+        self._max_chunks_per_tick = max_chunks_per_tick
+        self._connection = None
+        self._task: asyncio.Task | None = None
+        self._after_id = 0
+        self.leader = False
+        self.ticks = 0
+        self.chunks = 0
+        self.regenerated = 0
+        self.overruns = 0
+        self.failures = 0
+        self.sheds = 0
+        self.last_tick_seconds = 0.0
+        self.max_tick_seconds = 0.0
+        self.total_tick_seconds = 0.0
+
+    async def start(self) -> None:
+        """Metoda uruchamiająca cykliczną regenerację w tle."""
+        self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        """Metoda zatrzymująca regenerację i zwalniająca lidera."""
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+        await self._resign()
+
+    async def tick(self) -> int:
+        """Metoda wykonująca jeden cykl regeneracji paczkami.
+
+        Returns:
+            int: Liczba zregenerowanych playerów.
+        """
+        started = time.perf_counter()
+        regenerated = 0
+
+        for _ in range(self._max_chunks_per_tick):
+            players = await self._repository.regenerate_hp(
+                self._amount,
+                self._after_id,
+                self._chunk_size,
+            )
+            self.chunks += 1
+            regenerated += len(players)
+
+            for player_id, _ in players:
+                self._single_flight.forget(f"player:{player_id}")
+            await self._notifier.publish_many(
+                "player",
+                [(player_id, {"hp": hp}) for player_id, hp in players],
+            )
+
+            if len(players) < self._chunk_size:
+                self._after_id = 0
+                break
+
+            self._after_id = max(player_id for player_id, _ in players)
+
+        elapsed = time.perf_counter() - started
+        self.ticks += 1
+        self.regenerated += regenerated
+        self.last_tick_seconds = elapsed
+        self.max_tick_seconds = max(self.max_tick_seconds, elapsed)
+        self.total_tick_seconds += elapsed
+
+        return regenerated
+
+    def stats(self) -> dict:
+        """Metoda zwracająca metryki regeneracji.
+
+        Returns:
+            dict: Przywództwo, liczba cykli, paczek i playerów oraz czasy cykli.
+        """
+        return {
+            "leader": self.leader,
+            "ticks": self.ticks,
+            "chunks": self.chunks,
+            "regenerated": self.regenerated,
+            "overruns": self.overruns,
+            "failures": self.failures,
+            "sheds": self.sheds,
+            "last_tick_seconds": self.last_tick_seconds,
+            "max_tick_seconds": self.max_tick_seconds,
+            "mean_tick_seconds": self.total_tick_seconds / self.ticks if self.ticks else 0.0,
+        }
+
+    async def _run_forever(self) -> None:
+        """Prywatna pętla wykonująca cykle w stałym rytmie."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        backoff = self._tick_seconds
+
+        while True:
+            try:
+                if await self._elect():
+                    await self.tick()
+                backoff = self._tick_seconds
+            except DatabaseOverloadedError as e:
+                # Baza odrzuciła zapytanie, ale blokada lidera jest cała,
+                # więc lider zostaje i czeka coraz dłużej. Cykl wznowi się
+                # od zapamiętanego ID.
+                print(f"HP regeneration shed: {e}")
+                self.sheds += 1
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, SHED_BACKOFF_MAX_SECONDS)
+            except (OSError, InterfaceError, PostgresError) as e:
+                print(f"HP regeneration failed: {e}")
+                self.failures += 1
+                await self._resign()
+
+            deadline += self._tick_seconds
+            if deadline < loop.time():
+                # Cykl trwał dłużej niż odstęp, więc zaległe cykle są pomijane.
+                self.overruns += 1
+                deadline = loop.time()
+
+            await asyncio.sleep(deadline - loop.time())
+
+    async def _elect(self) -> bool:
+        """Prywatna metoda sprawdzająca lub przejmująca przywództwo.
+
+        Returns:
+            bool: Czy ten worker jest liderem.
+        """
+        if self._connection is None or self._connection.is_closed():
+            self.leader = False
+            self._connection = await connect_raw()
+
+        if self.leader:
+            # Zapytanie wykrywa zerwane połączenie, czyli utraconą blokadę.
+            await self._connection.execute("SELECT 1")
+        else:
+            self.leader = await self._connection.fetchval(
+                "SELECT pg_try_advisory_lock($1)",
+                REGENERATION_LOCK_ID,
+            )
+
+        return self.leader
+
+    async def _resign(self) -> None:
+        """Prywatna metoda zamykająca połączenie, co zwalnia blokadę lidera."""
+        self.leader = False
+        if self._connection:
+            try:
+                await self._connection.close()
+            except (OSError, InterfaceError, PostgresError):
+                self._connection.terminate()
+            self._connection = None
@@ -0,0 +1,298 @@
+"""Moduł zawierający implementację usług user."""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from pydantic import UUID4
+
+from src.core.domain.user import User, UserIn
+from src.core.repositories.isession import ISessionRepository
+from src.core.repositories.iuser import IUserRepository
+from src.infrastructure.dto.tokendto import TokenDTO
+from src.infrastructure.services.inotifier import IChangeNotifier
+from src.infrastructure.services.iuser import IUserService
+from src.infrastructure.utils.consts import EXPIRATION_MINUTES
+from src.infrastructure.utils.password import hash_password, verify_password
+from src.infrastructure.utils.session import SessionStore
+from src.infrastructure.utils.singleflight import SingleFlight
+from src.infrastructure.utils.token import (
+    decode_session_token,
+    generate_refresh_token,
+    generate_user_token,
+    hash_refresh_token,
+    refresh_token_session,
+)
+from src.infrastructure.utils.usercache import UserCache
+
+
+class UserService(IUserService):
+    """Klasa implementująca usługę user."""
+
+    _repository: IUserRepository
+    _session_repository: ISessionRepository
+    _sessions: SessionStore
+    _cache: UserCache
+    _notifier: IChangeNotifier
+    _single_flight: SingleFlight
+
+    def __init__(
+        self,
+        repository: IUserRepository,
+        session_repository: ISessionRepository,
+        sessions: SessionStore,
+        cache: UserCache,
+        notifier: IChangeNotifier,
+        single_flight: SingleFlight,
+    ) -> None:
+        """Inicjalizator klasy `UserService`.
+
+        Args:
+            repository (IUserRepository): Referencja do repozytorium user.
+            session_repository (ISessionRepository): Referencja do
+                repozytorium sesji.
+            sessions (SessionStore): Pamięć unieważnionych sesji.
+            cache (UserCache): Cache userów ścieżki uwierzytelniania.
+            notifier (IChangeNotifier): Referencja do notyfikatora zmian.
+            single_flight (SingleFlight): Grupa łącząca identyczne odczyty.
+        """
+
+        self._repository = repository
+        self._session_repository = session_repository
+        self._sessions = sessions
+        self._cache = cache
+        self._notifier = notifier
+        self._single_flight = single_flight
+
+    async def start(self) -> None:
+        """Metoda wczytująca sesje unieważnione w czasie życia tokenu dostępu.
+
+        Starsze unieważnienia nie są potrzebne, bo wydane w tych sesjach
+        tokeny dostępu już wygasły.
+        """
+        now = datetime.now(timezone.utc)
+        revoked = await self._session_repository.get_revoked_since(
+            now - timedelta(minutes=EXPIRATION_MINUTES),
+        )
+        self._sessions.load(
+            (str(session.id), (now - session.revoked_at).total_seconds())
+            for session in revoked
+            if session.revoked_at
+        )
+
+    async def register_user(self, user: UserIn) -> User | None:
+        """Metoda rejestrująca user.
+
+        Hashowanie hasła jest celowo kosztowne, więc odbywa się w wątku,
+        aby nie blokować pętli zdarzeń.
+
+        Args:
+            user (UserIn): Email i hasło user.
+
+        Raises:
+            ValueError: Jeśli email jest zajęty.
+
+        Returns:
+            User | None: Nowy user.
+        """
+        hashed = await asyncio.to_thread(hash_password, user.password)
+        return await self._repository.register_user(
+            UserIn(email=self._normalize_email(user.email), password=hashed),
+        )
+
+    async def authenticate_user(self, user: UserIn) -> TokenDTO | None:
+        """Metoda logująca user i otwierająca sesję.
+
+        Args:
+            user (UserIn): Email i hasło user.
+
+        Returns:
+            TokenDTO | None: Tokeny nowej sesji lub None przy złych danych.
+        """
+        existing = await self._repository.get_by_email(self._normalize_email(user.email))
+        if existing is None:
+            return None
+
+        if not await asyncio.to_thread(verify_password, user.password, existing.password):
+            return None
+
+        session_id = uuid.uuid4()
+        refresh = generate_refresh_token(session_id)
+        await self._session_repository.add_session(
+            session_id,
+            existing.id,
+            refresh["refresh_hash"],
+            refresh["refresh_expires"],
+        )
+        self._sessions.remember(str(session_id), str(existing.id))
+
+        return self._issue(existing.id, session_id, refresh)
+
+    async def refresh_tokens(self, refresh_token: str) -> TokenDTO | None:
+        """Metoda wymieniająca token odświeżający na nowe tokeny.
+
+        Każdy token odświeżający działa tylko raz, a wymiana jest jednym
+        warunkowym zapytaniem.
+
+        Args:
+            refresh_token (str): Token odświeżający sesji.
+
+        Returns:
+            TokenDTO | None: Nowe tokeny lub None, jeśli token jest nieważny.
+        """
+        session_id = refresh_token_session(refresh_token)
+        if session_id is None or self._sessions.is_revoked(str(session_id)):
+            return None
+
+        refresh = generate_refresh_token(session_id)
+        session = await self._session_repository.rotate_session(
+            session_id,
+            hash_refresh_token(refresh_token),
+            refresh["refresh_hash"],
+            refresh["refresh_expires"],
+        )
+        if session is None:
+            return None
+
+        self._sessions.remember(str(session_id), str(session.user_id))
+        return self._issue(session.user_id, session_id, refresh)
+
+    async def logout(self, session_id: str) -> bool:
+        """Metoda unieważniająca sesję we wszystkich workerach.
+
+        Args:
+            session_id (str): ID sesji.
+
+        Returns:
+            bool: Czy sesja była aktywna.
+        """
+        session = await self._session_repository.revoke_session(uuid.UUID(session_id))
+        if session is None:
+            return False
+
+        await self._notifier.publish_many("session", [(session_id, None)])
+
+        return True
+
+    async def authorize(self, token: str) -> tuple[User, str] | None:
+        """Metoda sprawdzająca token dostępu, zwykle bez zapytań do bazy.
+
+        Podpis tokenu jest sprawdzany lokalnie, a unieważnienie sesji
+        słownikiem w pamięci. Sesja, której worker jeszcze nie zna, jest
+        raz sprawdzana w bazie: musi istnieć, należeć do usera z tokenu
+        i nie być unieważniona. User pochodzi z cache.
+
+        Args:
+            token (str): Token dostępu.
+
+        Returns:
+            tuple[User, str] | None: User i ID jego sesji lub None,
+                jeśli token jest nieważny lub sesja unieważniona.
+        """
+        claims = decode_session_token(token)
+        if claims is None:
+            return None
+
+        user_id, session_id = claims
+        if self._sessions.is_revoked(session_id):
+            return None
+
+        try:
+            if not self._sessions.is_active(session_id, user_id):
+                if not await self._check_session(uuid.UUID(session_id), user_id):
+                    return None
+            user = await self.get_by_uuid(uuid.UUID(user_id))
+        except ValueError:
+            return None
+
+        return (user, session_id) if user else None
+
+    async def get_by_uuid(self, uuid: UUID4) -> User | None:
+        """Metoda pobierająca user po UUID z użyciem cache.
+
+        Args:
+            uuid (UUID4): UUID user.
+
+        Returns:
+            User | None: User, jeśli istnieje.
+        """
+        if (user := self._cache.get(str(uuid))) is not None:
+            return user
+
+        generation = self._cache.generation
+        user = await self._single_flight.do(
+            f"user:{uuid}",
+            lambda: self._repository.get_by_uuid(uuid),
+        )
+        if user is not None:
+            self._cache.put(user, generation)
+
+        return user
+
+    async def get_by_email(self, email: str) -> User | None:
+        """Metoda pobierająca user po emailu.
+
+        Args:
+            email (str): Email user.
+
+        Returns:
+            User | None: User, jeśli istnieje.
+        """
+        return await self._repository.get_by_email(self._normalize_email(email))
+
+    async def _check_session(self, session_id: UUID4, user_id: str) -> bool:
+        """Prywatna metoda sprawdzająca sesję tokenu w bazie danych.
+
+        Args:
+            session_id (UUID4): ID sesji z tokenu.
+            user_id (str): UUID usera z tokenu.
+
+        Returns:
+            bool: Czy sesja istnieje, należy do usera i jest aktywna.
+        """
+        session = await self._single_flight.do(
+            f"session:{session_id}",
+            lambda: self._session_repository.get_session(session_id),
+        )
+        if (
+            session is None
+            or str(session.user_id) != user_id
+            or session.revoked_at is not None
+            or session.expires_at <= datetime.now(timezone.utc)
+        ):
+            return False
+
+        self._sessions.remember(str(session_id), user_id)
+        return True
+
+    @staticmethod
+    def _issue(user_id: UUID4, session_id: UUID4, refresh: dict) -> TokenDTO:
+        """Prywatna metoda budująca tokeny sesji.
+
+        Args:
+            user_id (UUID4): UUID user.
+            session_id (UUID4): ID sesji.
+            refresh (dict): Nowy token odświeżający i jego ważność.
+
+        Returns:
+            TokenDTO: Token dostępu i token odświeżający.
+        """
+        access = generate_user_token(user_id, session_id)
+        return TokenDTO(
+            user_token=access["user_token"],
+            expires=access["expires"],
+            refresh_token=refresh["refresh_token"],
+            refresh_expires=refresh["refresh_expires"],
+        )
+
+    @staticmethod
+    def _normalize_email(email: str) -> str:
+        """Prywatna metoda sprowadzająca email do postaci z indeksu.
+
+        Args:
+            email (str): Email user.
+
+        Returns:
+            str: Email bez białych znaków, małymi literami.
+        """
+        return email.strip().lower()
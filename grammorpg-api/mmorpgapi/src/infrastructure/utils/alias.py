@@ -0,0 +1,76 @@
+"""A module containing Walker alias tables for weighted sampling."""
+
+from typing import NamedTuple
+
+import numpy as np
+
+
+class AliasTable(NamedTuple):
+    """A tuple keeping a precomputed alias table.
+
+    Outcome `i` is kept with `probability[i]`, otherwise `alias[i]` is
+    taken instead, so a weighted draw costs one uniform column and one
+    uniform threshold regardless of the number of outcomes.
+    """
+    probability: np.ndarray
+    alias: np.ndarray
+
+
+def build_alias_table(weights: np.ndarray) -> AliasTable:
+    """A function building the alias table with Vose's method.
+
+    Args:
+        weights (np.ndarray): The non-negative weight of every outcome,
+            at least one of them positive.
+
+    Raises:
+        ValueError: If the weights do not describe a distribution.
+
+    Returns:
+        AliasTable: The table sampling the outcomes proportionally
+            to the weights.
+    """
+
+    weights = np.asarray(weights, dtype=np.float64)
+    total = weights.sum()
+    if weights.ndim != 1 or not weights.size or (weights < 0).any() or not total > 0:
+        raise ValueError("Weights must be non-negative with a positive sum.")
+
+    size = weights.size
+    scaled = weights * (size / total)
+    probability = np.ones(size, dtype=np.float64)
+    alias = np.arange(size, dtype=np.int64)
+
+    small = [index for index in range(size) if scaled[index] < 1.0]
+    large = [index for index in range(size) if scaled[index] >= 1.0]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        probability[less] = scaled[less]
+        alias[less] = more
+        scaled[more] -= 1.0 - scaled[less]
+        (small if scaled[more] < 1.0 else large).append(more)
+
+    # Whatever is left is 1.0 up to rounding errors and keeps the defaults.
+    return AliasTable(probability=probability, alias=alias)
+
+
+def sample_alias(
+    table: AliasTable,
+    size: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """A function drawing many outcomes from the alias table at once.
+
+    Args:
+        table (AliasTable): The precomputed alias table.
+        size (int): The number of draws.
+        rng (np.random.Generator): The source of randomness.
+
+    Returns:
+        np.ndarray: The index of the outcome of every draw.
+    """
+
+    columns = rng.integers(0, table.probability.size, size=size)
+    keep = rng.random(size) < table.probability[columns]
+
+    return np.where(keep, columns, table.alias[columns])
@@ -0,0 +1,124 @@
+"""A module containing a buffer writing records in batches."""
+
+import asyncio
+from collections import deque
+from typing import Awaitable, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class BatchWriter(Generic[T]):
+    """A class buffering records and writing them in batches off the hot path.
+
+    Callers only append to an in-memory queue. A background task writes
+    the queue when it reaches `max_batch` records or after `max_delay`
+    seconds, so a burst of changes costs a few multi-row inserts.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[list[T]], Awaitable[None]],
+        max_batch: int = 500,
+        max_delay: float = 0.05,
+        max_pending: int = 100_000,
+        retry_delay: float = 1.0,
+    ) -> None:
+        """The initializer of the batch writer.
+
+        Args:
+            write (Callable[[list[T]], Awaitable[None]]): The call writing a batch.
+            max_batch (int): The largest number of records written at once.
+            max_delay (float): The longest time a record waits in seconds.
+            max_pending (int): The number of buffered records kept when
+                writes keep failing; records beyond it are dropped and
+                counted in `dropped`.
+            retry_delay (float): The pause after a failed write in seconds.
+        """
+
+        self._write = write
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        self._retry_delay = retry_delay
+        self._pending: deque[T] = deque(maxlen=max_pending)
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.written = 0
+        self.failed_batches = 0
+        self.dropped = 0
+
+    def add(self, record: T) -> None:
+        """The method buffering a record without waiting for the write.
+
+        Args:
+            record (T): The record to be written.
+        """
+
+        if len(self._pending) == self._pending.maxlen:
+            # The oldest record is pushed out of the full buffer.
+            self.dropped += 1
+        self._pending.append(record)
+        if len(self._pending) >= self._max_batch:
+            self._wakeup.set()
+
+    @property
+    def pending(self) -> int:
+        """The number of buffered records."""
+
+        return len(self._pending)
+
+    async def start(self) -> None:
+        """The method starting the background writes."""
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """The method stopping the background writes and flushing the buffer."""
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.flush()
+
+    async def flush(self) -> None:
+        """The method writing all buffered records."""
+
+        while self._pending:
+            batch = [
+                self._pending.popleft()
+                for _ in range(min(self._max_batch, len(self._pending)))
+            ]
+            try:
+                await self._write(batch)
+            except Exception as e:
+                # The batch goes back to the front, so order is kept and
+                # the next flush retries it. Records added meanwhile are
+                # pushed out of the other end if the buffer is full.
+                overflow = len(self._pending) + len(batch) - (self._pending.maxlen or 0)
+                if self._pending.maxlen is not None and overflow > 0:
+                    self.dropped += overflow
+                self._pending.extendleft(reversed(batch))
+                self.failed_batches += 1
+                print(f"Batch write failed: {e}")
+                return
+            self.written += len(batch)
+
+    async def _run(self) -> None:
+        """A private loop flushing the buffer by size or time."""
+
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._max_delay)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            failed_batches = self.failed_batches
+            await self.flush()
+            if self.failed_batches != failed_batches:
+                await asyncio.sleep(self._retry_delay)
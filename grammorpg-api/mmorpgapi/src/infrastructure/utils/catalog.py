@@ -0,0 +1,112 @@
+"""A module containing the precomputed item catalog snapshot."""
+
+import gzip
+
+from pydantic import BaseModel
+
+from src.core.domain.item import ItemCatalog
+
+
+class CatalogSnapshot(BaseModel):
+    """A model of the encoded catalog of one version."""
+    version: int
+    etag: str
+    body: bytes
+    gzip_body: bytes
+
+
+class CatalogCache:
+    """A class keeping the encoded catalog of the latest version.
+
+    The catalog changes rarely, so it is serialized and compressed once
+    per version instead of once per request.
+    """
+
+    _snapshot: CatalogSnapshot | None
+
+    def __init__(self) -> None:
+        """The initializer of the catalog cache."""
+
+        self._snapshot = None
+
+    def get(self, version: int) -> CatalogSnapshot | None:
+        """A method getting the snapshot of the given version.
+
+        Args:
+            version (int): The current catalog version.
+
+        Returns:
+            CatalogSnapshot | None: The snapshot if it is up to date.
+        """
+
+        if self._snapshot and self._snapshot.version == version:
+            return self._snapshot
+
+        return None
+
+    def put(self, catalog: ItemCatalog) -> CatalogSnapshot:
+        """A method encoding and remembering the catalog.
+
+        Args:
+            catalog (ItemCatalog): The catalog read from the repository.
+
+        Returns:
+            CatalogSnapshot: The encoded catalog.
+        """
+
+        body = catalog.model_dump_json().encode()
+        snapshot = CatalogSnapshot(
+            version=catalog.version,
+            etag=catalog_etag(catalog.version),
+            body=body,
+            gzip_body=gzip.compress(body, compresslevel=9, mtime=0),
+        )
+
+        if self._snapshot is None or self._snapshot.version <= snapshot.version:
+            self._snapshot = snapshot
+
+        return snapshot
+
+
+def catalog_etag(version: int, encoding: str | None = None) -> str:
+    """A function returning the strong ETag of the catalog version.
+
+    Every content coding is a different representation, so it gets its
+    own ETag, e.g. `"catalog-5-gzip"`.
+
+    Args:
+        version (int): The catalog version.
+        encoding (str | None): The content coding, None for identity.
+
+    Returns:
+        str: The quoted ETag.
+    """
+
+    if encoding:
+        return f'"catalog-{version}-{encoding}"'
+
+    return f'"catalog-{version}"'
+
+
+def etag_matches(if_none_match: str, etags: set[str]) -> bool:
+    """A function checking an If-None-Match header against current ETags.
+
+    The header is a list of ETags or `*`. As required for If-None-Match,
+    the comparison is weak, so `W/"catalog-5"` matches `"catalog-5"`.
+
+    Args:
+        if_none_match (str): The value of the If-None-Match header.
+        etags (set[str]): The ETags of the current representations.
+
+    Returns:
+        bool: True if the client already has a current representation.
+    """
+
+    for etag in if_none_match.split(","):
+        etag = etag.strip()
+        if etag == "*":
+            return True
+        if etag.removeprefix("W/") in etags:
+            return True
+
+    return False
@@ -0,0 +1,53 @@
+"""A module containing the vectorized combat resolution."""
+
+from typing import NamedTuple
+
+import numpy as np
+
+
+class CombatRound(NamedTuple):
+    """A tuple keeping the result of a resolved combat round."""
+    damage: np.ndarray
+    total_damage: np.ndarray
+    hp: np.ndarray
+
+
+def resolve_attacks(
+    attackers: np.ndarray,
+    targets: np.ndarray,
+    power: np.ndarray,
+    strength: np.ndarray,
+    hp: np.ndarray,
+    maxhp: np.ndarray,
+) -> CombatRound:
+    """A function resolving a batch of attacks as one simultaneous round.
+
+    Every attack deals `strength * power` of its attacker, rounded;
+    a negative power heals. Attackers defeated before the round deal
+    nothing. The damage of all attacks on a target is summed and the
+    hp is clamped to `0..maxhp`.
+
+    Args:
+        attackers (np.ndarray): The player index of every attacker.
+        targets (np.ndarray): The player index of every target.
+        power (np.ndarray): The multiplier of every attack.
+        strength (np.ndarray): The strength of every player.
+        hp (np.ndarray): The hp of every player before the round.
+        maxhp (np.ndarray): The max hp of every player.
+
+    Returns:
+        CombatRound: The damage of every attack, the total damage and
+            the hp after the round of every player.
+    """
+
+    damage = np.rint(strength[attackers] * power).astype(np.int64)
+    damage[hp[attackers] <= 0] = 0
+
+    total_damage = np.zeros(hp.shape[0], dtype=np.int64)
+    np.add.at(total_damage, targets, damage)
+
+    return CombatRound(
+        damage=damage,
+        total_damage=total_damage,
+        hp=np.clip(hp - total_damage, 0, maxhp),
+    )
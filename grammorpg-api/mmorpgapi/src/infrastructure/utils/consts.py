@@ -1,5 +1,5 @@
 """A module containing constant values for infrastructure layer."""
 
 EXPIRATION_MINUTES = 60
-SECRET_KEY = "s3cr3t"  # TODO: -> random generation - it's safe 
+REFRESH_EXPIRATION_DAYS = 30
 ALGORITHM = "HS256"
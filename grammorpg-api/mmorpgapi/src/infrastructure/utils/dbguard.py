@@ -0,0 +1,582 @@
+"""A module containing overload protection of database calls."""
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable
+
+from asyncpg import InterfaceError, PostgresConnectionError, QueryCanceledError  # type: ignore
+from databases import Database
+
+from src.infrastructure.utils.deadline import DeadlineExceededError, remaining_budget
+
+PRIORITY_GAMEPLAY = 0
+PRIORITY_DEFAULT = 1
+PRIORITY_ANALYTICS = 2
+
+# Errors meaning the database itself is unhealthy, as opposed to errors
+# of a single statement (e.g. a unique violation) which are results.
+FAILURES = (
+    OSError,
+    asyncio.TimeoutError,
+    InterfaceError,
+    PostgresConnectionError,
+    QueryCanceledError,
+)
+
+_priority: ContextVar[int] = ContextVar("db_priority", default=PRIORITY_DEFAULT)
+_in_transaction: ContextVar[bool] = ContextVar("db_in_transaction", default=False)
+
+
+class DatabaseOverloadedError(RuntimeError):
+    """An error raised when a call is shed instead of queued."""
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        """The initializer of the error.
+
+        Args:
+            message (str): The reason of shedding the call.
+            retry_after (float): The suggested delay before a retry.
+        """
+
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def set_request_priority(priority: int) -> None:
+    """A function setting the priority of database calls of the request.
+
+    Args:
+        priority (int): The priority, lower is served first.
+    """
+
+    _priority.set(priority)
+
+
+async def _within(budget: float | None, call: Callable[[], Awaitable[Any]]) -> Any:
+    """A function running a statement within the request budget.
+
+    Args:
+        budget (float | None): The time left, None for no deadline.
+        call (Callable[[], Awaitable[Any]]): The statement to run.
+
+    Raises:
+        DeadlineExceededError: If the statement outlived the budget.
+
+    Returns:
+        Any: The result of the statement.
+    """
+
+    if budget is None:
+        return await call()
+
+    timeout = asyncio.timeout(budget)
+    try:
+        async with timeout:
+            return await call()
+    except TimeoutError:
+        if timeout.expired():
+            raise DeadlineExceededError("Request deadline exceeded.") from None
+        raise
+
+
+class AdaptiveLimiter:
+    """A class limiting concurrent calls with AIMD on the call latency.
+
+    While calls finish within the target latency and the limit is in
+    use, the limit grows by one per limit calls (additive increase).
+    A slow or failed call shrinks it by the backoff factor, at most once
+    per target latency (multiplicative decrease). Calls above the limit
+    wait in a priority queue for at most their priority's timeout, so
+    the queueing delay, and with it the tail latency, stays bounded.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 50,
+        target_latency: float = 0.05,
+        backoff: float = 0.9,
+        max_queue: int = 500,
+        queue_timeouts: tuple[float, ...] = (1.0, 0.5, 0.1),
+    ) -> None:
+        """The initializer of the limiter.
+
+        Args:
+            initial_limit (int): The starting number of concurrent calls.
+            min_limit (int): The lowest limit.
+            max_limit (int): The highest limit.
+            target_latency (float): The call latency regarded as healthy.
+            backoff (float): The factor applied to the limit on overload.
+            max_queue (int): The number of waiting calls before shedding.
+            queue_timeouts (tuple[float, ...]): The longest wait per priority.
+        """
+
+        self.limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._target_latency = target_latency
+        self._backoff = backoff
+        self._max_queue = max_queue
+        self._queue_timeouts = queue_timeouts
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._last_decrease = 0.0
+        self.in_flight = 0
+        self.queued = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    async def acquire(self, priority: int, budget: float | None = None) -> None:
+        """A method waiting for a free slot.
+
+        Args:
+            priority (int): The priority of the call, lower is served first.
+            budget (float | None): The time left until the request deadline.
+
+        Raises:
+            DatabaseOverloadedError: If the queue is full or the wait
+                exceeded the timeout of the priority.
+        """
+
+        if self.in_flight < int(self.limit) and not self.queued:
+            self.in_flight += 1
+            return
+
+        if self.queued >= self._max_queue:
+            self.rejected += 1
+            raise DatabaseOverloadedError("Database queue is full.", self._target_latency)
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self.queued += 1
+        timeout = self._queue_timeouts[min(priority, len(self._queue_timeouts) - 1)]
+        wait = timeout if budget is None else min(timeout, budget)
+
+        try:
+            await asyncio.wait_for(future, wait)
+        except asyncio.TimeoutError:
+            self.queued -= 1
+            if wait < timeout:
+                raise DeadlineExceededError("Request deadline exceeded while queued.")
+            self.timed_out += 1
+            raise DatabaseOverloadedError("Database is overloaded.", timeout)
+        except BaseException:
+            # The slot may have been granted just before the cancellation.
+            if future.done() and not future.cancelled():
+                self.release(0.0, failed=False)
+            else:
+                self.queued -= 1
+            raise
+
+    def release(self, latency: float, failed: bool) -> None:
+        """A method returning a slot and adapting the limit.
+
+        Args:
+            latency (float): The duration of the finished call.
+            failed (bool): Whether the call failed because of the database.
+        """
+
+        now = time.monotonic()
+        if failed or latency > self._target_latency:
+            if now - self._last_decrease > self._target_latency:
+                self.limit = max(self._min_limit, self.limit * self._backoff)
+                self._last_decrease = now
+        elif self.in_flight >= int(self.limit):
+            self.limit = min(self._max_limit, self.limit + 1 / self.limit)
+
+        self.in_flight -= 1
+        while self._waiters and self.in_flight < int(self.limit):
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                self.queued -= 1
+                self.in_flight += 1
+
+    def stats(self) -> dict:
+        """A method returning the limiter metrics.
+
+        Returns:
+            dict: The limit, calls in flight and waiting, shed calls.
+        """
+
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+        }
+
+
+class CircuitBreaker:
+    """A class failing calls fast while the database is unhealthy.
+
+    After `failure_threshold` consecutive failures the circuit opens
+    and every call is rejected for `reset_seconds`. Then a single probe
+    is let through (half-open): its success closes the circuit, its
+    failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 5.0) -> None:
+        """The initializer of the circuit breaker.
+
+        Args:
+            failure_threshold (int): Consecutive failures opening the circuit.
+            reset_seconds (float): How long the circuit stays open.
+        """
+
+        self._failure_threshold = failure_threshold
+        self._reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+        self.opened = 0
+
+    @property
+    def state(self) -> str:
+        """The current state of the circuit.
+
+        Returns:
+            str: `closed`, `open` or `half_open`.
+        """
+
+        if self._opened_at is None:
+            return "closed"
+
+        if time.monotonic() - self._opened_at < self._reset_seconds:
+            return "open"
+
+        return "half_open"
+
+    def allow(self) -> None:
+        """A method letting a call through or rejecting it.
+
+        Raises:
+            DatabaseOverloadedError: If the circuit is open or the
+                half-open probe is already running.
+        """
+
+        if self._opened_at is None:
+            return
+
+        remaining = self._reset_seconds - (time.monotonic() - self._opened_at)
+        if remaining > 0 or self._probing:
+            raise DatabaseOverloadedError(
+                "Database is unavailable.",
+                max(remaining, self._reset_seconds / 10),
+            )
+
+        self._probing = True
+
+    def cancel(self) -> None:
+        """A method forgetting a call let through which did not run."""
+
+        self._probing = False
+
+    def record(self, failed: bool) -> None:
+        """A method recording the outcome of a call let through.
+
+        Args:
+            failed (bool): Whether the call failed because of the database.
+        """
+
+        probe, self._probing = self._probing, False
+        if not failed:
+            self._failures = 0
+            # A late success of a call started before the circuit opened
+            # does not close it, only the half-open probe does.
+            if probe:
+                self._opened_at = None
+            return
+
+        self._failures += 1
+        if self._opened_at is not None or self._failures >= self._failure_threshold:
+            self._opened_at = time.monotonic()
+            self.opened += 1
+
+
+class GuardedDatabase:
+    """A class wrapping a database with a limiter and a circuit breaker.
+
+    Every statement outside of a transaction takes a limiter slot. A
+    transaction takes a single slot for its whole duration and the
+    statements inside it bypass the guard, as they already hold a
+    pooled connection and waiting again could deadlock.
+
+    Every statement, inside a transaction or not, is also bounded by
+    the deadline of the request. Cancelling a running asyncpg query
+    sends a cancel request to the server, so an expired or abandoned
+    statement stops there too and its connection returns to the pool.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        limiter: AdaptiveLimiter | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
+        """The initializer of the guarded database.
+
+        Args:
+            database (Database): The wrapped database.
+            limiter (AdaptiveLimiter | None): The concurrency limiter.
+            breaker (CircuitBreaker | None): The circuit breaker.
+        """
+
+        self._database = database
+        self.limiter = limiter
+        self.breaker = breaker
+
+    @property
+    def available(self) -> bool:
+        """Whether the circuit lets calls through.
+
+        Returns:
+            bool: False while the circuit is open.
+        """
+
+        return self.breaker is None or self.breaker.state != "open"
+
+    @property
+    def unguarded(self) -> Database:
+        """The wrapped database, e.g. for health checks.
+
+        Returns:
+            Database: The database bypassing the limiter and the breaker.
+        """
+
+        return self._database
+
+    async def fetch_one(self, query: Any, values: dict | None = None) -> Any:
+        """A method fetching a single row.
+
+        Args:
+            query (Any): The query.
+            values (dict | None): The query parameters.
+
+        Returns:
+            Any: The row if exists.
+        """
+
+        return await self._call(lambda: self._database.fetch_one(query, values))
+
+    async def fetch_all(self, query: Any, values: dict | None = None) -> Any:
+        """A method fetching all rows.
+
+        Args:
+            query (Any): The query.
+            values (dict | None): The query parameters.
+
+        Returns:
+            Any: The rows.
+        """
+
+        return await self._call(lambda: self._database.fetch_all(query, values))
+
+    async def fetch_val(
+        self,
+        query: Any,
+        values: dict | None = None,
+        column: Any = 0,
+    ) -> Any:
+        """A method fetching a single value.
+
+        Args:
+            query (Any): The query.
+            values (dict | None): The query parameters.
+            column (Any): The column of the value.
+
+        Returns:
+            Any: The value if exists.
+        """
+
+        return await self._call(lambda: self._database.fetch_val(query, values, column))
+
+    async def execute(self, query: Any, values: dict | None = None) -> Any:
+        """A method executing a statement.
+
+        Args:
+            query (Any): The statement.
+            values (dict | None): The statement parameters.
+
+        Returns:
+            Any: The result of the statement.
+        """
+
+        return await self._call(lambda: self._database.execute(query, values))
+
+    async def execute_many(self, query: Any, values: list) -> None:
+        """A method executing a statement for many parameter sets.
+
+        Args:
+            query (Any): The statement.
+            values (list): The parameter sets.
+        """
+
+        await self._call(lambda: self._database.execute_many(query, values))
+
+    def transaction(self, **kwargs: Any) -> "GuardedTransaction":
+        """A method starting a transaction holding a single limiter slot.
+
+        Returns:
+            GuardedTransaction: The transaction context manager.
+        """
+
+        return GuardedTransaction(self, kwargs)
+
+    def stats(self) -> dict:
+        """A method returning the guard metrics.
+
+        Returns:
+            dict: The limiter metrics and the circuit state.
+        """
+
+        stats = self.limiter.stats() if self.limiter is not None else {}
+        if self.breaker is not None:
+            stats["circuit"] = self.breaker.state
+            stats["circuit_opened"] = self.breaker.opened
+
+        return stats
+
+    def __getattr__(self, name: str) -> Any:
+        """A method forwarding other attributes to the wrapped database.
+
+        Args:
+            name (str): The attribute name, e.g. `is_connected`.
+
+        Returns:
+            Any: The attribute of the wrapped database.
+        """
+
+        return getattr(self._database, name)
+
+    async def _enter(self, budget: float | None) -> float:
+        """A private method taking a slot for a call or a transaction.
+
+        Args:
+            budget (float | None): The time left until the request deadline.
+
+        Returns:
+            float: The start time of the call.
+        """
+
+        if self.breaker is not None:
+            self.breaker.allow()
+        try:
+            if self.limiter is not None:
+                await self.limiter.acquire(_priority.get(), budget)
+        except BaseException:
+            # The call never reached the database.
+            if self.breaker is not None:
+                self.breaker.cancel()
+            raise
+
+        return time.monotonic()
+
+    def _exit(self, started: float, error: BaseException | None) -> None:
+        """A private method returning the slot of a call or a transaction.
+
+        Args:
+            started (float): The start time of the call.
+            error (BaseException | None): The error raised by the call.
+        """
+
+        failed = isinstance(error, FAILURES)
+        if self.limiter is not None:
+            self.limiter.release(time.monotonic() - started, failed)
+        if self.breaker is None:
+            return
+
+        if isinstance(error, (asyncio.CancelledError, DeadlineExceededError)):
+            # A cancelled call says nothing about the database health.
+            self.breaker.cancel()
+        else:
+            self.breaker.record(failed)
+
+    async def _call(self, call: Callable[[], Awaitable[Any]]) -> Any:
+        """A private method running a statement under the guard.
+
+        Args:
+            call (Callable[[], Awaitable[Any]]): The statement to run.
+
+        Raises:
+            DeadlineExceededError: If the request deadline passed before
+                or during the statement.
+
+        Returns:
+            Any: The result of the statement.
+        """
+
+        budget = remaining_budget()
+        if _in_transaction.get():
+            return await _within(budget, call)
+
+        started = await self._enter(budget)
+        try:
+            result = await _within(remaining_budget(), call)
+        except BaseException as e:
+            self._exit(started, e)
+            raise
+
+        self._exit(started, None)
+
+        return result
+
+
+class GuardedTransaction:
+    """A class holding a limiter slot for a whole transaction."""
+
+    def __init__(self, database: GuardedDatabase, options: dict) -> None:
+        """The initializer of the guarded transaction.
+
+        Args:
+            database (GuardedDatabase): The guarded database.
+            options (dict): The options of the wrapped transaction.
+        """
+
+        self._database = database
+        self._options = options
+
+    async def __aenter__(self) -> Any:
+        """A method taking a slot and starting the transaction.
+
+        Returns:
+            Any: The wrapped transaction.
+        """
+
+        if _in_transaction.get():
+            self._transaction = self._database._database.transaction(**self._options)
+            self._token = None
+            return await self._transaction.__aenter__()
+
+        self._started = await self._database._enter(remaining_budget())
+        self._token = _in_transaction.set(True)
+        try:
+            self._transaction = self._database._database.transaction(**self._options)
+            return await self._transaction.__aenter__()
+        except BaseException as e:
+            _in_transaction.reset(self._token)
+            self._database._exit(self._started, e)
+            raise
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """A method finishing the transaction and returning the slot.
+
+        Args:
+            exc_info (Any): The exception raised in the block, if any.
+        """
+
+        error = exc_info[1]
+        try:
+            await self._transaction.__aexit__(*exc_info)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if self._token is not None:
+                _in_transaction.reset(self._token)
+                self._database._exit(self._started, error)
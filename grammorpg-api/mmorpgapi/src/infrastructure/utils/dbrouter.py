@@ -0,0 +1,208 @@
+"""A module containing routing of queries between primary and replicas."""
+
+import asyncio
+import itertools
+import time
+from contextvars import ContextVar
+
+from asyncpg import InterfaceError, PostgresError  # type: ignore
+from databases import Database
+
+# A mutable holder, so that writes made in nested tasks (e.g. coalesced
+# reads) are visible to the request that started them.
+_sticky_until: ContextVar[list[float] | None] = ContextVar("sticky_until", default=None)
+
+
+class DatabaseRouter:
+    """A class routing read-only queries to healthy replicas.
+
+    After a write the current request (and, through the session cookie,
+    the following ones) keeps reading from the primary for a while, so
+    clients always see their own writes.
+    """
+
+    def __init__(
+        self,
+        primary: Database,
+        replicas: list[Database],
+        sticky_seconds: float = 5.0,
+        check_seconds: float = 5.0,
+    ) -> None:
+        """The initializer of the router.
+
+        Args:
+            primary (Database): The primary database.
+            replicas (list[Database]): The read-only replicas.
+            sticky_seconds (float): How long reads stay on the primary
+                after a write.
+            check_seconds (float): The interval of replica health checks.
+        """
+
+        self._primary = primary
+        self._replicas = replicas
+        self._healthy: list[Database] = []
+        self._round_robin = itertools.count()
+        self._sticky_seconds = sticky_seconds
+        self._check_seconds = check_seconds
+        self._health_task: asyncio.Task | None = None
+
+    @property
+    def primary(self) -> Database:
+        """The primary database, e.g. to connect it.
+
+        Returns:
+            Database: The primary database.
+        """
+
+        return self._primary
+
+    def writer(self) -> Database:
+        """A method returning the database for a write.
+
+        Returns:
+            Database: The primary database.
+        """
+
+        if (sticky := _sticky_until.get()) is not None:
+            sticky[0] = time.time() + self._sticky_seconds
+
+        return self._primary
+
+    def reader(self) -> Database:
+        """A method returning the database for a read-only query.
+
+        Returns:
+            Database: A healthy replica, or the primary when there is none
+                or the caller has written recently.
+        """
+
+        if not self._healthy:
+            return self._primary
+
+        if self.is_sticky():
+            return self._primary
+
+        for _ in range(len(self._healthy)):
+            replica = self._healthy[next(self._round_robin) % len(self._healthy)]
+            # A replica with an open circuit is skipped until it recovers.
+            if getattr(replica, "available", True):
+                return replica
+
+        return self._primary
+
+    def stats(self) -> dict:
+        """A method returning the overload protection metrics.
+
+        Returns:
+            dict: The guard metrics of the primary and every replica.
+        """
+
+        return {
+            "primary": self._guard_stats(self._primary),
+            "replicas": [self._guard_stats(replica) for replica in self._replicas],
+            "healthy_replicas": len(self._healthy),
+        }
+
+    async def connect(self) -> None:
+        """A method connecting replicas and starting health checks."""
+
+        for replica in self._replicas:
+            try:
+                await replica.connect()
+            except (OSError, InterfaceError, PostgresError) as e:
+                print(f"Replica connection failed: {e}")
+
+        if self._replicas:
+            await self._check_replicas()
+            self._health_task = asyncio.create_task(self._check_forever())
+
+    async def disconnect(self) -> None:
+        """A method stopping health checks and disconnecting replicas."""
+
+        if self._health_task:
+            self._health_task.cancel()
+            self._health_task = None
+
+        for replica in self._replicas:
+            if replica.is_connected:
+                await replica.disconnect()
+
+    @staticmethod
+    def begin_request(sticky_until: float) -> list[float]:
+        """A method starting read-your-writes tracking of a request.
+
+        Args:
+            sticky_until (float): The end of stickiness carried by the session.
+
+        Returns:
+            list[float]: The holder updated by writes made in the request.
+        """
+
+        sticky = [sticky_until]
+        _sticky_until.set(sticky)
+
+        return sticky
+
+    @staticmethod
+    def is_sticky() -> bool:
+        """A method checking whether the current request reads from the primary.
+
+        Returns:
+            bool: True if the request (or its session) has written recently.
+        """
+
+        sticky = _sticky_until.get()
+
+        return sticky is not None and sticky[0] > time.time()
+
+    @staticmethod
+    def _guard_stats(database: Database) -> dict:
+        """A private method returning the guard metrics of a database.
+
+        Args:
+            database (Database): The database, guarded or not.
+
+        Returns:
+            dict: The metrics, empty if the database is not guarded.
+        """
+
+        stats = getattr(database, "stats", None)
+
+        return stats() if callable(stats) else {}
+
+    async def _check_forever(self) -> None:
+        """A private loop checking replicas periodically."""
+
+        while True:
+            await asyncio.sleep(self._check_seconds)
+            try:
+                await self._check_replicas()
+            except Exception as e:
+                # A single failed round must not stop the checks for good.
+                print(f"Replica health check round failed: {e}")
+
+    async def _check_replicas(self) -> None:
+        """A private method keeping only responsive replicas for reads.
+
+        The probe bypasses the guard of a replica, so an open circuit
+        (or a full limiter queue) does not keep the replica out of the
+        rotation once it responds again.
+        """
+
+        healthy = []
+        for replica in self._replicas:
+            try:
+                if not replica.is_connected:
+                    await replica.connect()
+                probe = getattr(replica, "unguarded", replica)
+                await asyncio.wait_for(probe.fetch_val("SELECT 1"), self._check_seconds)
+                healthy.append(replica)
+            except (
+                OSError,
+                asyncio.TimeoutError,
+                InterfaceError,
+                PostgresError,
+            ) as e:
+                print(f"Replica health check failed: {e}")
+
+        self._healthy = healthy
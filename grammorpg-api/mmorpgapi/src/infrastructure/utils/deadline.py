@@ -0,0 +1,41 @@
+"""A module containing the deadline of the current request."""
+
+import time
+from contextvars import ContextVar
+
+_deadline: ContextVar[float | None] = ContextVar("deadline", default=None)
+
+
+class DeadlineExceededError(RuntimeError):
+    """An error raised when the request ran out of its time budget."""
+
+
+def set_deadline(seconds: float | None) -> None:
+    """A function setting the time budget of the current request.
+
+    Args:
+        seconds (float | None): The budget, None for no deadline.
+    """
+
+    _deadline.set(None if seconds is None else time.monotonic() + seconds)
+
+
+def remaining_budget() -> float | None:
+    """A function returning the time left until the deadline.
+
+    Raises:
+        DeadlineExceededError: If the deadline has already passed.
+
+    Returns:
+        float | None: The seconds left, None if there is no deadline.
+    """
+
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceededError("Request deadline exceeded.")
+
+    return remaining
@@ -0,0 +1,105 @@
+"""A module containing helpers for the inventory item list."""
+
+from collections import Counter
+
+
+def parse_itemlist(itemlist: str) -> Counter[int]:
+    """A function parsing the item list into item quantities.
+
+    The list is a comma separated multiset of item ids, e.g. `1,1,4`.
+    Tokens which are not ids are skipped, as the column is free text.
+
+    Args:
+        itemlist (str): The item list of an inventory.
+
+    Returns:
+        Counter[int]: The quantity of every item.
+    """
+
+    items: Counter[int] = Counter()
+    for token in itemlist.split(","):
+        token = token.strip()
+        if token.isdigit():
+            items[int(token)] += 1
+
+    return items
+
+
+def format_itemlist(items: Counter[int] | dict[int, int]) -> str:
+    """A function formatting item quantities as the item list.
+
+    Args:
+        items (Counter[int] | dict[int, int]): The quantity of every item.
+
+    Returns:
+        str: The comma separated item ids, sorted.
+    """
+
+    return ",".join(
+        str(item_id)
+        for item_id in sorted(items)
+        for _ in range(max(items[item_id], 0))
+    )
+
+
+def item_deltas(before: str, after: str) -> dict[int, int]:
+    """A function computing how item quantities changed between two lists.
+
+    Args:
+        before (str): The item list before the change.
+        after (str): The item list after the change.
+
+    Returns:
+        dict[int, int]: The non-zero change of every changed item.
+    """
+
+    old, new = parse_itemlist(before), parse_itemlist(after)
+
+    return {
+        item_id: new[item_id] - old[item_id]
+        for item_id in sorted(old.keys() | new.keys())
+        if new[item_id] != old[item_id]
+    }
+
+
+def consume_itemlist(itemlist: str | None, consumed: dict[int, int]) -> str | None:
+    """A function removing item quantities from the item list.
+
+    It mirrors the `itemlist_consume` database function: the first
+    occurrences are removed and the order of the rest is kept.
+
+    Args:
+        itemlist (str | None): The item list of an inventory.
+        consumed (dict[int, int]): The consumed quantity of every item.
+
+    Returns:
+        str | None: The remaining item list, None if an item is missing.
+    """
+
+    tokens = [token.strip() for token in (itemlist or "").split(",")]
+    needed = {str(item_id): quantity for item_id, quantity in consumed.items()}
+    counts = Counter(tokens)
+    if any(quantity > counts[token] for token, quantity in needed.items()):
+        return None
+
+    remaining = []
+    for token in tokens:
+        if needed.get(token, 0) > 0:
+            needed[token] -= 1
+        elif token:
+            remaining.append(token)
+
+    return ",".join(remaining)
+
+
+def join_itemlists(*itemlists: str | None) -> str:
+    """A function appending item lists like `concat_ws` skipping empty ones.
+
+    Args:
+        *itemlists (str | None): The item lists.
+
+    Returns:
+        str: The comma separated item lists.
+    """
+
+    return ",".join(itemlist for itemlist in itemlists if itemlist)
@@ -0,0 +1,83 @@
+"""A module containing the event loop lag monitor."""
+
+import asyncio
+from collections import deque
+
+
+class LoopLagMonitor:
+    """A class measuring how late the event loop wakes up a sleeping task.
+
+    A task sleeps for a fixed interval and compares the expected and the
+    real wake-up time. The difference is the time other callbacks held
+    the loop, i.e. the extra latency added to every request at that time.
+    """
+
+    _lags: deque[float]
+
+    def __init__(
+        self,
+        interval_seconds: float = 0.5,
+        stall_seconds: float = 0.1,
+        window: int = 1200,
+    ) -> None:
+        """The initializer of the monitor.
+
+        Args:
+            interval_seconds (float): The time between measurements.
+            stall_seconds (float): The lag counted as a stall.
+            window (int): The number of recent measurements kept.
+        """
+
+        self._interval_seconds = interval_seconds
+        self._stall_seconds = stall_seconds
+        self._lags = deque(maxlen=window)
+        self._task: asyncio.Task | None = None
+        self.max_lag = 0.0
+        self.stalls = 0
+
+    async def start(self) -> None:
+        """A method starting the measurements in the background."""
+
+        self._task = asyncio.create_task(self._run_forever())
+
+    async def stop(self) -> None:
+        """A method stopping the measurements."""
+
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def stats(self) -> dict:
+        """A method returning the lag metrics.
+
+        Returns:
+            dict: The last, median, p99 and max lag in seconds over the
+                window and the number of stalls.
+        """
+
+        lags = sorted(self._lags)
+
+        def percentile(share: float) -> float:
+            return lags[min(int(share * len(lags)), len(lags) - 1)] if lags else 0.0
+
+        return {
+            "last": self._lags[-1] if self._lags else 0.0,
+            "p50": percentile(0.5),
+            "p99": percentile(0.99),
+            "max": self.max_lag,
+            "samples": len(lags),
+            "stalls": self.stalls,
+        }
+
+    async def _run_forever(self) -> None:
+        """A private method measuring the lag until cancelled."""
+
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self._interval_seconds
+            await asyncio.sleep(self._interval_seconds)
+            lag = max(loop.time() - expected, 0.0)
+            self._lags.append(lag)
+            self.max_lag = max(self.max_lag, lag)
+            if lag >= self._stall_seconds:
+                self.stalls += 1
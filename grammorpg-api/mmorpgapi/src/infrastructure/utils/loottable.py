@@ -0,0 +1,139 @@
+"""A module containing the cache of compiled loot tables."""
+
+from collections import OrderedDict
+from typing import NamedTuple
+
+import numpy as np
+
+from src.core.domain.loot import LootTable
+from src.infrastructure.utils.alias import AliasTable, build_alias_table
+
+EMPTY_DROP = -1
+
+
+class CompiledLootTable(NamedTuple):
+    """A tuple keeping a loot table ready for sampling."""
+    item_ids: np.ndarray
+    alias: AliasTable
+
+
+def compile_loot_table(table: LootTable) -> CompiledLootTable:
+    """A function precomputing the alias table of a loot table.
+
+    Args:
+        table (LootTable): The loot table.
+
+    Returns:
+        CompiledLootTable: The item id of every outcome (`EMPTY_DROP`
+            for no drop) and the alias table of the outcomes.
+    """
+
+    item_ids = [entry.item_id for entry in table.entries]
+    weights = [entry.weight for entry in table.entries]
+    if table.empty_weight > 0:
+        item_ids.append(EMPTY_DROP)
+        weights.append(table.empty_weight)
+
+    return CompiledLootTable(
+        item_ids=np.array(item_ids, dtype=np.int64),
+        alias=build_alias_table(np.array(weights, dtype=np.float64)),
+    )
+
+
+class LootTableCache:
+    """A class keeping compiled loot tables until they change.
+
+    A change of a loot table drops it, while a change of any item drops
+    all tables, as deleting an item removes it from the tables.
+    """
+
+    _tables: OrderedDict[int, CompiledLootTable]
+
+    def __init__(self, max_tables: int = 1024) -> None:
+        """The initializer of the loot table cache.
+
+        Args:
+            max_tables (int): How many compiled tables are kept at most.
+        """
+
+        self._tables = OrderedDict()
+        self._max_tables = max_tables
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, table_id: int) -> CompiledLootTable | None:
+        """A method getting a compiled loot table.
+
+        Args:
+            table_id (int): The id of the loot table.
+
+        Returns:
+            CompiledLootTable | None: The table if cached.
+        """
+
+        if (compiled := self._tables.get(table_id)) is None:
+            self.misses += 1
+            return None
+
+        self._tables.move_to_end(table_id)
+        self.hits += 1
+
+        return compiled
+
+    def put(self, table: LootTable, generation: int) -> CompiledLootTable:
+        """A method compiling and remembering a loot table.
+
+        Args:
+            table (LootTable): The loot table read from the repository.
+            generation (int): The generation read before the table, so
+                a table loaded before an invalidation is not kept.
+
+        Returns:
+            CompiledLootTable: The compiled table.
+        """
+
+        compiled = compile_loot_table(table)
+        if generation != self.generation:
+            return compiled
+
+        self._tables[table.id] = compiled
+        self._tables.move_to_end(table.id)
+        while len(self._tables) > self._max_tables:
+            self._tables.popitem(last=False)
+
+        return compiled
+
+    def clear(self) -> None:
+        """A method dropping all compiled tables."""
+
+        self.generation += 1
+        self._tables.clear()
+
+    def invalidate_topic(self, topic: str) -> None:
+        """A method dropping tables affected by a changed topic.
+
+        Args:
+            topic (str): The changed topic, e.g. `loot:5`.
+        """
+
+        entity, _, entity_id = topic.partition(":")
+        if entity == "loot":
+            self.generation += 1
+            self._tables.pop(int(entity_id), None)
+        elif entity == "item":
+            self.generation += 1
+            self._tables.clear()
+
+    def stats(self) -> dict:
+        """A method returning the cache metrics.
+
+        Returns:
+            dict: The number of tables, hits and misses.
+        """
+
+        return {
+            "tables": len(self._tables),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,230 @@
+"""A module containing tables kept in the worker memory."""
+
+import bisect
+import os
+import pickle
+from typing import Callable, Hashable, Iterator
+
+
+class MemoryTable:
+    """A table of rows by id with secondary indexes.
+
+    Rows are plain dicts, like database records. They are replaced, not
+    mutated, through `put`, so the indexes always match the rows. The
+    ids are kept sorted for keyset pages and ordered scans.
+    """
+
+    def __init__(self, **indexes: Callable[[dict], Hashable | None]) -> None:
+        """The initializer of the table.
+
+        Args:
+            **indexes (Callable[[dict], Hashable | None]): The key of every
+                index by its name; rows with a None key are not indexed.
+        """
+
+        self.rows: dict[int, dict] = {}
+        self.last_id = 0
+        self._ids: list[int] = []
+        self._keys = indexes
+        self._indexes: dict[str, dict[Hashable, set[int]]] = {name: {} for name in indexes}
+
+    def new_id(self) -> int:
+        """A method allocating the id of a new row, like a serial column.
+
+        Returns:
+            int: The next id.
+        """
+
+        self.last_id += 1
+
+        return self.last_id
+
+    def get(self, row_id: int) -> dict | None:
+        """A method getting a row.
+
+        Args:
+            row_id (int): The id of the row.
+
+        Returns:
+            dict | None: The row if exists.
+        """
+
+        return self.rows.get(row_id)
+
+    def put(self, row: dict) -> dict:
+        """A method inserting or replacing a row.
+
+        Args:
+            row (dict): The row with its id.
+
+        Returns:
+            dict: The stored row.
+        """
+
+        row_id = row["id"]
+        if (old := self.rows.get(row_id)) is not None:
+            self._unindex(old)
+        else:
+            bisect.insort(self._ids, row_id)
+            self.last_id = max(self.last_id, row_id)
+
+        self.rows[row_id] = row
+        for name, key in self._keys.items():
+            if (value := key(row)) is not None:
+                self._indexes[name].setdefault(value, set()).add(row_id)
+
+        return row
+
+    def delete(self, row_id: int) -> dict | None:
+        """A method removing a row.
+
+        Args:
+            row_id (int): The id of the row.
+
+        Returns:
+            dict | None: The removed row if existed.
+        """
+
+        row = self.rows.pop(row_id, None)
+        if row is not None:
+            self._unindex(row)
+            del self._ids[bisect.bisect_left(self._ids, row_id)]
+
+        return row
+
+    def lookup(self, index: str, value: Hashable) -> list[dict]:
+        """A method getting rows by a secondary index.
+
+        Args:
+            index (str): The name of the index.
+            value (Hashable): The key.
+
+        Returns:
+            list[dict]: The rows with the key, sorted by id.
+        """
+
+        return [self.rows[row_id] for row_id in sorted(self._indexes[index].get(value, ()))]
+
+    def after(self, after_id: int = 0) -> Iterator[dict]:
+        """A method iterating rows with ids greater than `after_id`.
+
+        The table must not change while iterating.
+
+        Args:
+            after_id (int): The id before the first returned row.
+
+        Yields:
+            dict: The rows sorted by id.
+        """
+
+        for index in range(bisect.bisect_right(self._ids, after_id), len(self._ids)):
+            yield self.rows[self._ids[index]]
+
+    def dump(self) -> dict:
+        """A method returning the picklable state of the table.
+
+        Returns:
+            dict: The rows and the last allocated id.
+        """
+
+        return {"rows": list(self.rows.values()), "last_id": self.last_id}
+
+    def restore(self, state: dict) -> None:
+        """A method replacing the table with a dumped state.
+
+        Args:
+            state (dict): The rows and the last allocated id.
+        """
+
+        self.rows, self._ids = {}, []
+        self._indexes = {name: {} for name in self._keys}
+        for row in state["rows"]:
+            self.put(row)
+        self.last_id = max(self.last_id, state["last_id"])
+
+    def _unindex(self, row: dict) -> None:
+        """A private method removing a row from the secondary indexes.
+
+        Args:
+            row (dict): The indexed row.
+        """
+
+        for name, key in self._keys.items():
+            if (value := key(row)) is None:
+                continue
+            ids = self._indexes[name][value]
+            ids.discard(row["id"])
+            if not ids:
+                del self._indexes[name][value]
+
+
+class MemoryStore:
+    """A class keeping the in-memory tables of items, inventories and players.
+
+    The tables mirror `src.db`: players are indexed by the name of live
+    players, which keeps names unique, and by their inventory.
+    """
+
+    def __init__(self, snapshot_path: str | None = None) -> None:
+        """The initializer of the store.
+
+        Args:
+            snapshot_path (str | None): The file of the snapshot, None
+                to keep the data only until shutdown.
+        """
+
+        self.items = MemoryTable(name=lambda row: row["name"])
+        self.item_changes: list[dict] = []
+        self.inventories = MemoryTable()
+        self.players = MemoryTable(
+            name=lambda row: row["name"] if row["deleted_at"] is None else None,
+            connectedinventory=lambda row: row["connectedinventory"],
+        )
+        self._snapshot_path = snapshot_path
+
+    def _tables(self) -> dict[str, MemoryTable]:
+        """A private method returning the tables by their names.
+
+        Returns:
+            dict[str, MemoryTable]: The tables.
+        """
+
+        return {"items": self.items, "inventory": self.inventories, "players": self.players}
+
+    def load(self) -> bool:
+        """A method restoring the store from the snapshot.
+
+        Returns:
+            bool: Whether a snapshot was loaded.
+        """
+
+        if not self._snapshot_path or not os.path.exists(self._snapshot_path):
+            return False
+
+        with open(self._snapshot_path, "rb") as snapshot_file:
+            snapshot = pickle.load(snapshot_file)
+
+        for name, table in self._tables().items():
+            table.restore(snapshot[name])
+        self.item_changes = snapshot["item_changes"]
+
+        return True
+
+    def save(self) -> bool:
+        """A method writing the snapshot atomically.
+
+        Returns:
+            bool: Whether a snapshot was written.
+        """
+
+        if not self._snapshot_path:
+            return False
+
+        snapshot = {name: table.dump() for name, table in self._tables().items()}
+        snapshot["item_changes"] = self.item_changes
+        temporary_path = f"{self._snapshot_path}.tmp"
+        with open(temporary_path, "wb") as snapshot_file:
+            pickle.dump(snapshot, snapshot_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, self._snapshot_path)
+
+        return True
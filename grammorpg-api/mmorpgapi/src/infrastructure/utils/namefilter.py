@@ -0,0 +1,294 @@
+"""A module containing counting Bloom filters of taken names."""
+
+import hashlib
+import math
+import secrets
+from collections import OrderedDict
+from typing import Iterable
+
+import numpy as np
+
+MAX_COUNT = np.iinfo(np.uint8).max
+
+
+def _hashes(name: str) -> tuple[int, int]:
+    """A function returning two independent 64-bit hashes of a name.
+
+    Args:
+        name (str): The name.
+
+    Returns:
+        tuple[int, int]: The hashes used for double hashing.
+    """
+
+    digest = hashlib.blake2b(name.encode(), digest_size=16).digest()
+
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+
+class CountingBloomFilter:
+    """A Bloom filter with 8-bit counters instead of bits.
+
+    Counters make deletes possible: a name is removed by decrementing
+    its slots. A saturated counter is never decremented, so overflow
+    can only cause false positives, never false negatives.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        """The initializer of the filter.
+
+        Args:
+            capacity (int): The expected number of names.
+            error_rate (float): The false positive rate at capacity.
+        """
+
+        capacity = max(capacity, 1)
+        self.size = max(
+            int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)),
+            8,
+        )
+        self.hash_count = max(int(round(self.size / capacity * math.log(2))), 1)
+        self.capacity = capacity
+        self._counters = np.zeros(self.size, dtype=np.uint8)
+        self.count = 0
+
+    def add(self, name: str) -> None:
+        """A method adding a name.
+
+        Args:
+            name (str): The name.
+        """
+
+        slots = self._slots(name)
+        self._counters[slots] = np.minimum(self._counters[slots].astype(np.uint16) + 1, MAX_COUNT)
+        self.count += 1
+
+    def remove(self, name: str) -> None:
+        """A method removing a previously added name.
+
+        Args:
+            name (str): The name.
+        """
+
+        slots = self._slots(name)
+        counters = self._counters[slots]
+        if not counters.all():
+            return
+
+        decremented = counters < MAX_COUNT
+        self._counters[slots[decremented]] -= 1
+        self.count = max(self.count - 1, 0)
+
+    def might_contain(self, name: str) -> bool:
+        """A method checking whether a name may have been added.
+
+        Args:
+            name (str): The name.
+
+        Returns:
+            bool: False if the name was certainly not added.
+        """
+
+        return bool(self._counters[self._slots(name)].all())
+
+    def add_many(self, names: Iterable[str]) -> None:
+        """A method adding many names with a single counter update.
+
+        Args:
+            names (Iterable[str]): The names.
+        """
+
+        hashes = np.array([_hashes(name) for name in names], dtype=np.uint64).reshape(-1, 2)
+        if not hashes.size:
+            return
+
+        rounds = np.arange(self.hash_count, dtype=np.uint64)
+        slots = (hashes[:, :1] + rounds * hashes[:, 1:]) % np.uint64(self.size)
+        counts = np.bincount(slots.ravel().astype(np.int64), minlength=self.size)
+        self._counters = np.minimum(
+            self._counters.astype(np.int64) + counts,
+            MAX_COUNT,
+        ).astype(np.uint8)
+        self.count += len(hashes)
+
+    def error_rate(self) -> float:
+        """A method estimating the current false positive rate.
+
+        Returns:
+            float: The probability that an absent name is reported.
+        """
+
+        filled = np.count_nonzero(self._counters) / self.size
+
+        return filled ** self.hash_count
+
+    def _slots(self, name: str) -> np.ndarray:
+        """A private method returning the counters of a name.
+
+        Args:
+            name (str): The name.
+
+        Returns:
+            np.ndarray: The indexes of the counters.
+        """
+
+        first, second = _hashes(name)
+        # Same wrap-around as the uint64 arithmetic used by `add_many`.
+        return np.array(
+            [((first + i * second) % 2**64) % self.size for i in range(self.hash_count)],
+            dtype=np.int64,
+        )
+
+
+class NameRegistry:
+    """A class keeping a filter of taken names per namespace.
+
+    Changes are broadcast as `name:<namespace>:<+|->:<nonce>:<name>`
+    topics, so the filters of all workers stay in sync. A worker sees
+    its own topics again (locally and as the NOTIFY echo), so applied
+    nonces are remembered and skipped, which keeps the counters exact.
+    """
+
+    _filters: dict[str, CountingBloomFilter]
+    _applied: OrderedDict[str, None]
+
+    def __init__(
+        self,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.01,
+        max_nonces: int = 10000,
+    ) -> None:
+        """The initializer of the name registry.
+
+        Args:
+            capacity (int): The expected number of names per namespace.
+            error_rate (float): The false positive rate at capacity.
+            max_nonces (int): How many applied changes are remembered.
+        """
+
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._max_nonces = max_nonces
+        self._filters = {}
+        self._applied = OrderedDict()
+        self.negatives = 0
+        self.positives = 0
+
+    def load(self, namespace: str, names: list[str]) -> None:
+        """A method replacing the filter of a namespace.
+
+        Args:
+            namespace (str): The namespace, e.g. `player`.
+            names (list[str]): All taken names.
+        """
+
+        name_filter = CountingBloomFilter(
+            max(self._capacity, 2 * len(names)),
+            self._error_rate,
+        )
+        name_filter.add_many(names)
+        self._filters[namespace] = name_filter
+
+    def might_be_taken(self, namespace: str, name: str) -> bool:
+        """A method checking whether a name may be taken.
+
+        Args:
+            namespace (str): The namespace, e.g. `player`.
+            name (str): The name.
+
+        Returns:
+            bool: False if the name is certainly free, True if it is
+                taken or the namespace was not loaded yet.
+        """
+
+        name_filter = self._filters.get(namespace)
+        if name_filter is not None and not name_filter.might_contain(name):
+            self.negatives += 1
+            return False
+
+        self.positives += 1
+
+        return True
+
+    def change(
+        self,
+        namespace: str,
+        added: Iterable[str] = (),
+        removed: Iterable[str] = (),
+    ) -> list[str]:
+        """A method applying a local change of names.
+
+        Args:
+            namespace (str): The namespace, e.g. `player`.
+            added (Iterable[str]): The names taken by the change.
+            removed (Iterable[str]): The names freed by the change.
+
+        Returns:
+            list[str]: The ids to publish under the `name` entity.
+        """
+
+        ids = [
+            f"{namespace}:{sign}:{secrets.token_hex(8)}:{name}"
+            for sign, names in (("+", added), ("-", removed))
+            for name in names
+        ]
+        for change_id in ids:
+            self._apply(change_id)
+
+        return ids
+
+    def invalidate_topic(self, topic: str) -> None:
+        """A method applying a change of names made by any worker.
+
+        Args:
+            topic (str): The changed topic, e.g. `name:player:+:<nonce>:Bob`.
+        """
+
+        entity, _, change_id = topic.partition(":")
+        if entity == "name":
+            self._apply(change_id)
+
+    def stats(self) -> dict:
+        """A method returning the registry metrics.
+
+        Returns:
+            dict: The names, size and estimated error rate per namespace
+                with the number of negative and possibly positive checks.
+        """
+
+        return {
+            "filters": {
+                namespace: {
+                    "names": name_filter.count,
+                    "counters": name_filter.size,
+                    "hashes": name_filter.hash_count,
+                    "error_rate": name_filter.error_rate(),
+                }
+                for namespace, name_filter in self._filters.items()
+            },
+            "negatives": self.negatives,
+            "positives": self.positives,
+        }
+
+    def _apply(self, change_id: str) -> None:
+        """A private method applying a change exactly once.
+
+        Args:
+            change_id (str): The namespace, sign, nonce and name.
+        """
+
+        namespace, sign, nonce, name = (change_id.split(":", 3) + ["", "", ""])[:4]
+        if not nonce or nonce in self._applied:
+            return
+
+        self._applied[nonce] = None
+        while len(self._applied) > self._max_nonces:
+            self._applied.popitem(last=False)
+
+        if (name_filter := self._filters.get(namespace)) is None:
+            return
+
+        if sign == "+":
+            name_filter.add(name)
+        elif sign == "-":
+            name_filter.remove(name)
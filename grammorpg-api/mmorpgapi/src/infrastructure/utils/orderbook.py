@@ -0,0 +1,264 @@
+"""A module containing the in-memory price-time priority order book."""
+
+import heapq
+from collections import Counter, defaultdict
+from typing import NamedTuple
+
+from src.core.domain.ledger import MONEY_ITEM_ID
+from src.core.domain.market import MarketFill, MarketOrderIn
+
+
+class BookOrder:
+    """A class keeping the open part of a resting order."""
+
+    __slots__ = ("id", "inventory_id", "side", "price", "remaining")
+
+    def __init__(
+        self,
+        id: int,
+        inventory_id: int,
+        side: str,
+        price: int,
+        remaining: int,
+    ) -> None:
+        """The initializer of the resting order.
+
+        Args:
+            id (int): The id of the order, also its time priority.
+            inventory_id (int): The id of the inventory of the order.
+            side (str): `buy` or `sell`.
+            price (int): The limit price per unit.
+            remaining (int): The open quantity.
+        """
+
+        self.id = id
+        self.inventory_id = inventory_id
+        self.side = side
+        self.price = price
+        self.remaining = remaining
+
+
+class BookMatch(NamedTuple):
+    """A tuple keeping the planned fills of an incoming order."""
+    side: str
+    fills: list[tuple[BookOrder, int]]
+    entries: list[tuple[int, int]]
+
+
+class OrderBook:
+    """A class keeping the resting orders of a single item.
+
+    Both sides are binary heaps keyed by price and then by order id,
+    so adding an order and finding the best price are O(log n).
+    Cancelled orders are dropped lazily when they reach the top.
+    """
+
+    _orders: dict[int, BookOrder]
+    _heaps: dict[str, list[tuple[int, int]]]
+
+    def __init__(self, version: int = 0) -> None:
+        """The initializer of the order book.
+
+        Args:
+            version (int): The persisted version the book reflects.
+        """
+
+        self.version = version
+        self._orders = {}
+        self._heaps = {"buy": [], "sell": []}
+
+    def __len__(self) -> int:
+        """A method returning the number of resting orders.
+
+        Returns:
+            int: The number of resting orders.
+        """
+
+        return len(self._orders)
+
+    def add(self, order: BookOrder) -> None:
+        """A method adding a resting order.
+
+        Args:
+            order (BookOrder): The order with an open quantity.
+        """
+
+        self._orders[order.id] = order
+        heapq.heappush(self._heaps[order.side], self._entry(order))
+
+    def remove(self, order_id: int) -> BookOrder | None:
+        """A method removing a resting order.
+
+        Args:
+            order_id (int): The id of the order.
+
+        Returns:
+            BookOrder | None: The removed order if it was resting.
+        """
+
+        order = self._orders.pop(order_id, None)
+        if order is not None:
+            heap = self._heaps[order.side]
+            # Stale entries are dropped lazily, unless they dominate the heap.
+            if len(heap) > 2 * len(self._orders) + 64:
+                heap[:] = [entry for entry in heap if entry[1] in self._orders]
+                heapq.heapify(heap)
+
+        return order
+
+    def best(self, side: str) -> BookOrder | None:
+        """A method getting the order with the best price of a side.
+
+        Args:
+            side (str): `buy` for the highest bid, `sell` for the lowest ask.
+
+        Returns:
+            BookOrder | None: The first order in price-time priority.
+        """
+
+        heap = self._heaps[side]
+        while heap and heap[0][1] not in self._orders:
+            heapq.heappop(heap)
+
+        return self._orders[heap[0][1]] if heap else None
+
+    def match(self, side: str, price: int, quantity: int) -> BookMatch:
+        """A method planning the fills of an incoming order.
+
+        The book is left unchanged until the plan is committed or rolled
+        back, so the fills can be settled in the database first.
+
+        Args:
+            side (str): The side of the incoming order.
+            price (int): The limit price of the incoming order.
+            quantity (int): The quantity of the incoming order.
+
+        Returns:
+            BookMatch: The resting orders with their filled quantities.
+        """
+
+        resting_side = "sell" if side == "buy" else "buy"
+        heap = self._heaps[resting_side]
+        fills = []
+        entries = []
+
+        while quantity and (best := self.best(resting_side)) is not None:
+            if (best.price > price) if side == "buy" else (best.price < price):
+                break
+
+            entries.append(heapq.heappop(heap))
+            filled = min(quantity, best.remaining)
+            fills.append((best, filled))
+            quantity -= filled
+
+        return BookMatch(resting_side, fills, entries)
+
+    def commit(self, match: BookMatch, version: int) -> None:
+        """A method applying settled fills to the book.
+
+        Args:
+            match (BookMatch): The settled plan.
+            version (int): The persisted version after the settlement.
+        """
+
+        heap = self._heaps[match.side]
+        for (order, filled), entry in zip(match.fills, match.entries):
+            order.remaining -= filled
+            if order.remaining > 0:
+                heapq.heappush(heap, entry)
+            else:
+                self._orders.pop(order.id, None)
+
+        self.version = version
+
+    def rollback(self, match: BookMatch) -> None:
+        """A method restoring the book after an unsettled plan.
+
+        Args:
+            match (BookMatch): The plan which was not settled.
+        """
+
+        heap = self._heaps[match.side]
+        for entry in match.entries:
+            heapq.heappush(heap, entry)
+
+    def depth(self, side: str, levels: int) -> list[tuple[int, int]]:
+        """A method aggregating the best price levels of a side.
+
+        Args:
+            side (str): `buy` or `sell`.
+            levels (int): The number of price levels.
+
+        Returns:
+            list[tuple[int, int]]: The price and open quantity of every
+                level, best first.
+        """
+
+        quantities: dict[int, int] = {}
+        for order in self._orders.values():
+            if order.side == side:
+                quantities[order.price] = quantities.get(order.price, 0) + order.remaining
+
+        best_prices = (
+            heapq.nlargest(levels, quantities)
+            if side == "buy" else heapq.nsmallest(levels, quantities)
+        )
+
+        return [(price, quantities[price]) for price in best_prices]
+
+    @staticmethod
+    def _entry(order: BookOrder) -> tuple[int, int]:
+        """A private method building the heap key of an order.
+
+        Args:
+            order (BookOrder): The order.
+
+        Returns:
+            tuple[int, int]: The price (negated for bids) and the order id.
+        """
+
+        return (-order.price if order.side == "buy" else order.price, order.id)
+
+
+def settlement_deltas(
+    order: MarketOrderIn,
+    fills: list[MarketFill],
+) -> dict[int, dict[int, int]]:
+    """A function computing how a settled order changes the inventories.
+
+    The incoming order escrows its full limit value, i.e. the money of
+    a bid or the items of an ask. Every fill is traded at the price of
+    the resting order, so a bid filled below its limit is refunded the
+    difference. The resting orders had their escrow taken when placed.
+
+    Args:
+        order (MarketOrderIn): The incoming order.
+        fills (list[MarketFill]): The resting orders it was matched with.
+
+    Returns:
+        dict[int, dict[int, int]]: The change of every item quantity
+            (`MONEY_ITEM_ID` for money) of every affected inventory.
+    """
+
+    deltas: defaultdict[int, Counter[int]] = defaultdict(Counter)
+    placed = deltas[order.inventory_id]
+
+    if order.side == "buy":
+        placed[MONEY_ITEM_ID] -= order.price * order.quantity
+    else:
+        placed[order.item_id] -= order.quantity
+
+    for fill in fills:
+        value = fill.price * fill.quantity
+        if order.side == "buy":
+            placed[order.item_id] += fill.quantity
+            placed[MONEY_ITEM_ID] += (order.price - fill.price) * fill.quantity
+            deltas[fill.inventory_id][MONEY_ITEM_ID] += value
+        else:
+            placed[MONEY_ITEM_ID] += value
+            deltas[fill.inventory_id][order.item_id] += fill.quantity
+
+    return {
+        inventory_id: {item_id: delta for item_id, delta in changes.items() if delta}
+        for inventory_id, changes in deltas.items()
+    }
@@ -0,0 +1,264 @@
+"""A module containing the sampling CPU profiler and heap snapshots."""
+
+import asyncio
+import os
+import signal
+import threading
+import tracemalloc
+from collections import Counter
+from types import FrameType
+
+# Allocations made by tracemalloc, threads and imports are not the app's.
+_SKIPPED_FILES = (tracemalloc.__file__, threading.__file__, "<frozen importlib._bootstrap")
+
+
+class ProfilerError(RuntimeError):
+    """An error raised when a profile cannot be captured now."""
+
+
+def _frame_label(frame: FrameType) -> str:
+    """A function naming a frame in the folded stack format.
+
+    Args:
+        frame (FrameType): The frame.
+
+    Returns:
+        str: The function with its file and first line, e.g.
+            `get_player_by_id (playerdb.py:56)`.
+    """
+
+    code = frame.f_code
+    name = getattr(code, "co_qualname", code.co_name)
+
+    return f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ":")
+
+
+def _fold(frame: FrameType | None) -> str:
+    """A function folding a stack from its root to the given frame.
+
+    Args:
+        frame (FrameType | None): The innermost frame.
+
+    Returns:
+        str: The frames separated by semicolons.
+    """
+
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+
+    return ";".join(reversed(labels))
+
+
+def _is_idle(frame: FrameType) -> bool:
+    """A function checking whether the event loop waits for I/O.
+
+    Args:
+        frame (FrameType): The innermost frame of the loop thread.
+
+    Returns:
+        bool: True if the thread is blocked in the selector.
+    """
+
+    return frame.f_code.co_name in ("select", "poll", "control") and (
+        os.path.basename(frame.f_code.co_filename) == "selectors.py"
+    )
+
+
+def folded(stacks: Counter[str]) -> str:
+    """A function formatting stacks as the folded (collapsed) format.
+
+    The lines `frame;frame;frame count` are read by `flamegraph.pl`,
+    inferno and speedscope.
+
+    Args:
+        stacks (Counter[str]): The number of samples or bytes per stack.
+
+    Returns:
+        str: The folded stacks, the heaviest first.
+    """
+
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+class SamplingProfiler:
+    """A class sampling the stacks of the event loop on CPU time.
+
+    `ITIMER_PROF` sends SIGPROF after every `interval` of CPU time used
+    by the process and the handler, run by the main thread between two
+    bytecodes, folds the stack it interrupted. So the profiled code is
+    not instrumented, the sample is exactly where the loop runs (a
+    sampling thread would only see the loop when it releases the GIL,
+    mostly in the selector) and waiting for I/O costs no samples. A
+    coroutine is on the stack only while it runs, e.g. a repository
+    building models from records, with its awaiting callers above it.
+    """
+
+    def __init__(self, max_seconds: float = 60.0) -> None:
+        """The initializer of the profiler.
+
+        Args:
+            max_seconds (float): The longest allowed capture.
+        """
+
+        self._max_seconds = max_seconds
+        self._lock = asyncio.Lock()
+        self.captures = 0
+
+    async def capture(
+        self,
+        seconds: float,
+        interval: float = 0.005,
+        idle: bool = False,
+    ) -> Counter[str]:
+        """A method sampling the stacks for a number of seconds.
+
+        Args:
+            seconds (float): The duration of the capture.
+            interval (float): The CPU time between samples.
+            idle (bool): Whether to keep samples taken in the selector,
+                e.g. CPU used by other threads.
+
+        Raises:
+            ProfilerError: If another capture is running or the loop does
+                not run in the main thread.
+
+        Returns:
+            Counter[str]: The number of samples per folded stack.
+        """
+
+        if not hasattr(signal, "setitimer") or threading.current_thread() is not threading.main_thread():
+            raise ProfilerError("CPU sampling needs SIGPROF and the event loop in the main thread.")
+
+        if self._lock.locked():
+            raise ProfilerError("A profile is already being captured.")
+
+        async with self._lock:
+            stacks: Counter[str] = Counter()
+
+            def sample(_: int, frame: FrameType | None) -> None:
+                if frame is not None and (idle or not _is_idle(frame)):
+                    stacks[_fold(frame)] += 1
+
+            previous = signal.signal(signal.SIGPROF, sample)
+            signal.setitimer(signal.ITIMER_PROF, interval, interval)
+            try:
+                await asyncio.sleep(min(seconds, self._max_seconds))
+            finally:
+                signal.setitimer(signal.ITIMER_PROF, 0)
+                signal.signal(signal.SIGPROF, previous)
+            self.captures += 1
+
+        return stacks
+
+
+class HeapProfiler:
+    """A class taking tracemalloc snapshots on demand.
+
+    Tracing slows allocations down, so unless it was started at boot it
+    only runs for the requested seconds and stops with the snapshot.
+    """
+
+    def __init__(self, frames: int = 25, max_seconds: float = 60.0) -> None:
+        """The initializer of the heap profiler.
+
+        Args:
+            frames (int): The number of frames stored per allocation.
+            max_seconds (float): The longest allowed tracing.
+        """
+
+        self._frames = frames
+        self._max_seconds = max_seconds
+        self._lock = asyncio.Lock()
+
+    def start(self) -> None:
+        """A method tracing allocations until the process stops."""
+
+        tracemalloc.start(self._frames)
+
+    async def snapshot(self, seconds: float) -> tracemalloc.Snapshot:
+        """A method taking a snapshot of the traced allocations.
+
+        Args:
+            seconds (float): How long to trace if tracing is not running.
+
+        Raises:
+            ProfilerError: If another snapshot is being traced.
+
+        Returns:
+            tracemalloc.Snapshot: The live allocations without profiler noise.
+        """
+
+        if tracemalloc.is_tracing():
+            return self._filtered(tracemalloc.take_snapshot())
+
+        if self._lock.locked():
+            raise ProfilerError("A heap snapshot is already being traced.")
+
+        async with self._lock:
+            tracemalloc.start(self._frames)
+            try:
+                await asyncio.sleep(min(seconds, self._max_seconds))
+                snapshot = tracemalloc.take_snapshot()
+            finally:
+                tracemalloc.stop()
+
+        return self._filtered(snapshot)
+
+    @staticmethod
+    def top(snapshot: tracemalloc.Snapshot, limit: int) -> list[dict]:
+        """A method listing the lines which hold the most memory.
+
+        Args:
+            snapshot (tracemalloc.Snapshot): The snapshot.
+            limit (int): The number of lines.
+
+        Returns:
+            list[dict]: The line, bytes and number of blocks of every allocator.
+        """
+
+        return [
+            {
+                "line": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                "bytes": stat.size,
+                "blocks": stat.count,
+            }
+            for stat in snapshot.statistics("lineno")[:limit]
+        ]
+
+    @staticmethod
+    def stacks(snapshot: tracemalloc.Snapshot) -> Counter[str]:
+        """A method summing live bytes per allocation stack.
+
+        Args:
+            snapshot (tracemalloc.Snapshot): The snapshot.
+
+        Returns:
+            Counter[str]: The bytes per folded stack, for a flamegraph.
+        """
+
+        stacks: Counter[str] = Counter()
+        for stat in snapshot.statistics("traceback"):
+            frames = [
+                f"{os.path.basename(frame.filename)}:{frame.lineno}"
+                for frame in stat.traceback
+            ]
+            stacks[";".join(frames)] += stat.size
+
+        return stacks
+
+    @staticmethod
+    def _filtered(snapshot: tracemalloc.Snapshot) -> tracemalloc.Snapshot:
+        """A private method dropping allocations of the profiler and imports.
+
+        Args:
+            snapshot (tracemalloc.Snapshot): The snapshot.
+
+        Returns:
+            tracemalloc.Snapshot: The snapshot of the application allocations.
+        """
+
+        return snapshot.filter_traces([
+            tracemalloc.Filter(False, f"{skipped}*") for skipped in _SKIPPED_FILES
+        ])
@@ -0,0 +1,153 @@
+"""A module containing the cache of compiled crafting recipes."""
+
+from collections import Counter
+from typing import NamedTuple
+
+from src.core.domain.recipe import Recipe
+
+
+class CompiledRecipe(NamedTuple):
+    """A tuple keeping the per-craft quantities of a recipe."""
+    id: int
+    money: int
+    consumed: dict[int, int]
+    produced: dict[int, int]
+
+    def scaled(self, times: int) -> "CompiledRecipe":
+        """A method multiplying the recipe for a batch of crafts.
+
+        Args:
+            times (int): The number of crafts.
+
+        Returns:
+            CompiledRecipe: The quantities of all crafts together.
+        """
+
+        return CompiledRecipe(
+            self.id,
+            self.money * times,
+            {item_id: quantity * times for item_id, quantity in self.consumed.items()},
+            {item_id: quantity * times for item_id, quantity in self.produced.items()},
+        )
+
+
+def compile_recipe(recipe: Recipe) -> CompiledRecipe:
+    """A function summing the inputs and outputs of a recipe per item.
+
+    Args:
+        recipe (Recipe): The recipe.
+
+    Returns:
+        CompiledRecipe: The money and item quantities of a single craft.
+    """
+
+    consumed: Counter[int] = Counter()
+    produced: Counter[int] = Counter()
+    for entry in recipe.inputs:
+        consumed[entry.item_id] += entry.quantity
+    for entry in recipe.outputs:
+        produced[entry.item_id] += entry.quantity
+
+    return CompiledRecipe(recipe.id, recipe.money, dict(consumed), dict(produced))
+
+
+class RecipeCache:
+    """A class keeping all compiled recipes in memory.
+
+    The recipes are loaded at startup. A change of a recipe drops it,
+    while a change of any item drops all recipes, as deleting an item
+    removes it from the recipes.
+    """
+
+    _recipes: dict[int, CompiledRecipe]
+
+    def __init__(self) -> None:
+        """The initializer of the recipe cache."""
+
+        self._recipes = {}
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, recipe_id: int) -> CompiledRecipe | None:
+        """A method getting a compiled recipe.
+
+        Args:
+            recipe_id (int): The id of the recipe.
+
+        Returns:
+            CompiledRecipe | None: The recipe if cached.
+        """
+
+        if (compiled := self._recipes.get(recipe_id)) is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+
+        return compiled
+
+    def put_all(self, recipes: list[Recipe], generation: int) -> None:
+        """A method compiling and remembering many recipes.
+
+        Args:
+            recipes (list[Recipe]): The recipes read from the repository.
+            generation (int): The generation read before the recipes, so
+                recipes loaded before an invalidation are not kept.
+        """
+
+        if generation == self.generation:
+            self._recipes.update(
+                (recipe.id, compile_recipe(recipe)) for recipe in recipes
+            )
+
+    def put(self, recipe: Recipe, generation: int) -> CompiledRecipe:
+        """A method compiling and remembering a recipe.
+
+        Args:
+            recipe (Recipe): The recipe read from the repository.
+            generation (int): The generation read before the recipe.
+
+        Returns:
+            CompiledRecipe: The compiled recipe.
+        """
+
+        compiled = compile_recipe(recipe)
+        if generation == self.generation:
+            self._recipes[recipe.id] = compiled
+
+        return compiled
+
+    def clear(self) -> None:
+        """A method dropping all compiled recipes."""
+
+        self.generation += 1
+        self._recipes.clear()
+
+    def invalidate_topic(self, topic: str) -> None:
+        """A method dropping recipes affected by a changed topic.
+
+        Args:
+            topic (str): The changed topic, e.g. `recipe:5`.
+        """
+
+        entity, _, entity_id = topic.partition(":")
+        if entity == "recipe":
+            self.generation += 1
+            self._recipes.pop(int(entity_id), None)
+        elif entity == "item":
+            self.generation += 1
+            self._recipes.clear()
+
+    def stats(self) -> dict:
+        """A method returning the cache metrics.
+
+        Returns:
+            dict: The number of recipes, hits and misses.
+        """
+
+        return {
+            "recipes": len(self._recipes),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
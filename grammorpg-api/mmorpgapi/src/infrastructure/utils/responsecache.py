@@ -0,0 +1,228 @@
+"""A module containing the cache of already encoded responses."""
+
+import gzip
+import time
+from collections import OrderedDict, defaultdict
+from typing import NamedTuple
+
+GZIP_MIN_BYTES = 1024
+
+
+class CachedResponse(NamedTuple):
+    """A tuple keeping an encoded response body."""
+    media_type: str
+    body: bytes
+    gzip_body: bytes | None
+    expires: float
+
+
+class ResponseCache:
+    """A class keeping encoded response bodies within a memory budget.
+
+    Entries are grouped either by a topic (e.g. `player:5`) for bodies
+    of a single entity, or by a namespace (e.g. `player`) for lists and
+    pages. A write to an entity bumps the version of its topic and of its
+    namespace and drops their entries, so a cached body never outlives
+    the data it was built from, while bodies of other entities stay.
+    The TTL only bounds staleness of bodies built from a lagging replica.
+    """
+
+    _entries: OrderedDict[tuple, CachedResponse]
+    _group_keys: defaultdict[str, set[tuple]]
+    _versions: defaultdict[str, int]
+    _topic_versions: OrderedDict[str, int]
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: float = 60.0,
+        max_topics: int = 100_000,
+    ) -> None:
+        """The initializer of the response cache.
+
+        Args:
+            max_bytes (int): The memory budget of the cached bodies.
+            ttl_seconds (float): How long a body is served at most.
+            max_topics (int): The number of changed topics whose
+                versions are remembered.
+        """
+
+        self._entries = OrderedDict()
+        self._group_keys = defaultdict(set)
+        self._versions = defaultdict(int)
+        self._topic_versions = OrderedDict()
+        self._max_topics = max_topics
+        # Topic versions come from one counter; a forgotten topic gets
+        # the newest forgotten version, which no older key can carry.
+        self._last_version = 0
+        self._forgotten_version = 0
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def version(self, group: str) -> int:
+        """A method returning the data version of the namespace or topic.
+
+        Args:
+            group (str): The namespace, e.g. `item`, or the topic,
+                e.g. `item:5`.
+
+        Returns:
+            int: The version to be used in the cache key.
+        """
+
+        if ":" in group:
+            return self._topic_versions.get(group, self._forgotten_version)
+
+        return self._versions[group]
+
+    def get(self, key: tuple) -> CachedResponse | None:
+        """A method getting an encoded response.
+
+        Args:
+            key (tuple): The namespace or topic, version, route and query.
+
+        Returns:
+            CachedResponse | None: The response if cached.
+        """
+
+        entry = self._entries.get(key)
+        if entry is None or entry.expires <= time.monotonic():
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+
+        return entry
+
+    def put(self, key: tuple, media_type: str, body: bytes) -> CachedResponse:
+        """A method storing an encoded response.
+
+        Args:
+            key (tuple): The namespace or topic, version, route and query.
+            media_type (str): The media type of the body.
+            body (bytes): The encoded body.
+
+        Returns:
+            CachedResponse: The stored response.
+        """
+
+        gzip_body = (
+            gzip.compress(body, compresslevel=6, mtime=0)
+            if len(body) >= GZIP_MIN_BYTES else None
+        )
+        entry = CachedResponse(
+            media_type,
+            body,
+            gzip_body,
+            time.monotonic() + self._ttl_seconds,
+        )
+
+        group, version = key[0], key[1]
+        if version != self.version(group) or self._sizeof(entry) > self._max_bytes:
+            return entry
+
+        self._remove(key)
+        self._entries[key] = entry
+        self._group_keys[group].add(key)
+        self._size += self._sizeof(entry)
+
+        while self._size > self._max_bytes:
+            self._remove(next(iter(self._entries)))
+
+        return entry
+
+    def invalidate(self, namespace: str) -> None:
+        """A method dropping all responses of the namespace.
+
+        Args:
+            namespace (str): The namespace, e.g. `player`.
+        """
+
+        self._versions[namespace] += 1
+        self._drop_group(namespace)
+
+    def clear(self) -> None:
+        """A method dropping the responses of all namespaces and topics."""
+
+        for namespace in list(self._versions):
+            self._versions[namespace] += 1
+        self._last_version += 1
+        self._forgotten_version = self._last_version
+        self._topic_versions.clear()
+        self._entries.clear()
+        self._group_keys.clear()
+        self._size = 0
+
+    def invalidate_topic(self, topic: str) -> None:
+        """A method dropping responses affected by a changed topic.
+
+        The bodies of the entity are dropped together with the lists
+        and pages of its namespace.
+
+        Args:
+            topic (str): The changed topic, e.g. `player:5`.
+        """
+
+        self._last_version += 1
+        self._topic_versions.pop(topic, None)
+        self._topic_versions[topic] = self._last_version
+        while len(self._topic_versions) > self._max_topics:
+            _, self._forgotten_version = self._topic_versions.popitem(last=False)
+
+        self._drop_group(topic)
+        self.invalidate(topic.partition(":")[0])
+
+    def stats(self) -> dict:
+        """A method returning the cache metrics.
+
+        Returns:
+            dict: The number of entries, used bytes, hits and misses.
+        """
+
+        return {
+            "entries": len(self._entries),
+            "bytes": self._size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _drop_group(self, group: str) -> None:
+        """A private method removing all entries of a namespace or topic.
+
+        Args:
+            group (str): The namespace or topic.
+        """
+
+        for key in list(self._group_keys.pop(group, ())):
+            self._remove(key)
+
+    def _remove(self, key: tuple) -> None:
+        """A private method removing a single entry.
+
+        Args:
+            key (tuple): The key of the entry.
+        """
+
+        if (entry := self._entries.pop(key, None)) is not None:
+            self._size -= self._sizeof(entry)
+            if (keys := self._group_keys.get(key[0])) is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._group_keys[key[0]]
+
+    @staticmethod
+    def _sizeof(entry: CachedResponse) -> int:
+        """A private method estimating the memory used by an entry.
+
+        Args:
+            entry (CachedResponse): The entry.
+
+        Returns:
+            int: The size of the bodies in bytes.
+        """
+
+        return len(entry.body) + len(entry.gzip_body or b"")
@@ -0,0 +1,164 @@
+"""A module containing the in-memory store of revoked sessions."""
+
+import time
+from collections import OrderedDict
+from typing import Iterable
+
+from src.infrastructure.utils.consts import EXPIRATION_MINUTES
+
+
+class SessionStore:
+    """A class answering whether a session was revoked in O(1).
+
+    An access token is only valid for `EXPIRATION_MINUTES`, so a
+    revocation has to be remembered only that long. The store keeps
+    the revoked session ids in the order they expire, which bounds its
+    size by the number of logouts within one token lifetime and lets
+    the expired ones be dropped from the front.
+
+    Next to the revocations it remembers sessions found active in the
+    database, so a token naming an unknown session is checked once and
+    a known one costs no query.
+    """
+
+    _revoked: OrderedDict[str, float]
+    _active: OrderedDict[str, tuple[str, float]]
+
+    def __init__(
+        self,
+        ttl_seconds: float = EXPIRATION_MINUTES * 60,
+        max_active: int = 100_000,
+    ) -> None:
+        """The initializer of the session store.
+
+        Args:
+            ttl_seconds (float): How long a revocation is remembered.
+            max_active (int): How many active sessions are remembered.
+        """
+
+        self._revoked = OrderedDict()
+        self._active = OrderedDict()
+        self._ttl_seconds = ttl_seconds
+        self._max_active = max_active
+        self.checks = 0
+        self.rejections = 0
+        self.lookups = 0
+
+    def is_revoked(self, session_id: str) -> bool:
+        """A method checking whether the session was revoked.
+
+        Args:
+            session_id (str): The id of the session.
+
+        Returns:
+            bool: True if tokens of the session must be rejected.
+        """
+
+        self.checks += 1
+        expires = self._revoked.get(session_id)
+        if expires is None or expires <= time.monotonic():
+            return False
+
+        self.rejections += 1
+
+        return True
+
+    def is_active(self, session_id: str, user_id: str) -> bool:
+        """A method checking whether the session is known to be active.
+
+        Args:
+            session_id (str): The id of the session.
+            user_id (str): The UUID of the user named by the token.
+
+        Returns:
+            bool: True if the session was found active for the user,
+                False if it has to be looked up.
+        """
+
+        entry = self._active.get(session_id)
+        if entry is None or entry[1] <= time.monotonic():
+            self.lookups += 1
+            return False
+
+        return entry[0] == user_id
+
+    def remember(self, session_id: str, user_id: str) -> None:
+        """A method remembering a session found active in the database.
+
+        Args:
+            session_id (str): The id of the session.
+            user_id (str): The UUID of the session owner.
+        """
+
+        if session_id in self._revoked:
+            return
+
+        self._active.pop(session_id, None)
+        self._active[session_id] = (user_id, time.monotonic() + self._ttl_seconds)
+        while len(self._active) > self._max_active:
+            self._active.popitem(last=False)
+
+    def revoke(self, session_id: str, age_seconds: float = 0.0) -> None:
+        """A method remembering a revoked session.
+
+        Args:
+            session_id (str): The id of the session.
+            age_seconds (float): How long ago the session was revoked.
+        """
+
+        self._active.pop(session_id, None)
+        expires = time.monotonic() + self._ttl_seconds - age_seconds
+        if expires <= time.monotonic():
+            return
+
+        self._revoked.pop(session_id, None)
+        self._revoked[session_id] = expires
+        self._purge()
+
+    def load(self, revoked: Iterable[tuple[str, float]]) -> None:
+        """A method remembering sessions revoked before the start.
+
+        Args:
+            revoked (Iterable[tuple[str, float]]): The id of every
+                session with how long ago it was revoked, oldest first.
+        """
+
+        for session_id, age_seconds in revoked:
+            self.revoke(session_id, age_seconds)
+
+    def invalidate_topic(self, topic: str) -> None:
+        """A method revoking a session announced by another worker.
+
+        Args:
+            topic (str): The changed topic, e.g. `session:<uuid>`.
+        """
+
+        entity, _, session_id = topic.partition(":")
+        if entity == "session":
+            self.revoke(session_id)
+
+    def stats(self) -> dict:
+        """A method returning the store metrics.
+
+        Returns:
+            dict: The number of remembered sessions, checks, rejections
+                and database lookups.
+        """
+
+        return {
+            "revoked": len(self._revoked),
+            "active": len(self._active),
+            "lookups": self.lookups,
+            "checks": self.checks,
+            "rejections": self.rejections,
+        }
+
+    def _purge(self) -> None:
+        """A private method dropping revocations of expired tokens."""
+
+        now = time.monotonic()
+        while self._revoked:
+            session_id, expires = next(iter(self._revoked.items()))
+            if expires > now:
+                break
+            del self._revoked[session_id]
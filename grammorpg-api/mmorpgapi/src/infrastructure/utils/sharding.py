@@ -0,0 +1,260 @@
+"""A module containing routing of rows between database shards."""
+
+import asyncio
+import bisect
+import hashlib
+import heapq
+import random
+from collections import Counter
+from typing import Any, Awaitable, Callable, Iterable, TypeVar
+
+from sqlalchemy import Table, func
+
+from src.infrastructure.utils.dbrouter import DatabaseRouter
+
+T = TypeVar("T")
+
+
+def _point(key: str) -> int:
+    """A function placing a key on the hash ring.
+
+    Args:
+        key (str): The key, e.g. `db1#3` or `bucket:17`.
+
+    Returns:
+        int: The 64-bit position on the ring.
+    """
+
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+def bucket_placement(shards: list[str], buckets: int, virtual_nodes: int = 64) -> list[str]:
+    """A function assigning every bucket to a shard on a consistent hash ring.
+
+    Every shard owns `virtual_nodes` points of the ring and a bucket
+    belongs to the first point after its own. Adding or removing a
+    shard only moves the buckets of the points it takes or leaves.
+
+    Args:
+        shards (list[str]): The names of the shards, e.g. their hosts.
+        buckets (int): The number of buckets.
+        virtual_nodes (int): The points of every shard on the ring.
+
+    Returns:
+        list[str]: The shard of every bucket.
+    """
+
+    ring = sorted(
+        (_point(f"{shard}#{node}"), shard)
+        for shard in shards
+        for node in range(virtual_nodes)
+    )
+    points = [point for point, _ in ring]
+
+    return [
+        ring[bisect.bisect(points, _point(f"bucket:{bucket}")) % len(ring)][1]
+        for bucket in range(buckets)
+    ]
+
+
+def merge_sorted(results: list[list[T]], key: Callable[[T], Any]) -> list[T]:
+    """A function merging results of shards sorted by the same key.
+
+    Args:
+        results (list[list[T]]): The sorted rows of every shard.
+        key (Callable[[T], Any]): The sort key of a row.
+
+    Returns:
+        list[T]: All rows sorted by the key.
+    """
+
+    if len(results) == 1:
+        return results[0]
+
+    return list(heapq.merge(*results, key=key))
+
+
+class ShardRouter:
+    """A class routing players and inventories to their shards.
+
+    A row belongs to the bucket `id % buckets` and buckets are placed on
+    shards by a consistent hash ring. With sharding enabled, new ids are
+    allocated as `sequence * buckets + bucket`, so a player gets the
+    bucket, and with it the shard, of its inventory.
+    """
+
+    def __init__(
+        self,
+        shards: dict[str, DatabaseRouter],
+        buckets: int = 64,
+        virtual_nodes: int = 64,
+        enabled: bool = False,
+    ) -> None:
+        """The initializer of the shard router.
+
+        Args:
+            shards (dict[str, DatabaseRouter]): The router of every shard by
+                its name. The first one is the main database.
+            buckets (int): The number of buckets.
+            virtual_nodes (int): The points of every shard on the ring.
+            enabled (bool): Whether new ids carry their bucket.
+        """
+
+        self._shards = shards
+        self._main = next(iter(shards.values()))
+        self.names = bucket_placement(list(shards), buckets, virtual_nodes)
+        self._placement = [shards[name] for name in self.names]
+        self.buckets = buckets
+        self.enabled = enabled
+
+    @property
+    def distributed(self) -> bool:
+        """Whether rows are spread over more than one database.
+
+        Returns:
+            bool: True if there are several shards.
+        """
+
+        return len(self._shards) > 1
+
+    def main(self) -> DatabaseRouter:
+        """A method returning the main database, e.g. for global tables.
+
+        Returns:
+            DatabaseRouter: The router of the first shard.
+        """
+
+        return self._main
+
+    def all(self) -> list[DatabaseRouter]:
+        """A method returning every shard.
+
+        Returns:
+            list[DatabaseRouter]: The routers of the shards.
+        """
+
+        return list(self._shards.values())
+
+    def bucket(self, entity_id: int) -> int:
+        """A method returning the bucket of an id.
+
+        Args:
+            entity_id (int): The id of a player or an inventory.
+
+        Returns:
+            int: The bucket.
+        """
+
+        return entity_id % self.buckets
+
+    def new_bucket(self) -> int:
+        """A method choosing the bucket of a new inventory.
+
+        Returns:
+            int: A random bucket, so new rows spread evenly.
+        """
+
+        return random.randrange(self.buckets)
+
+    def for_bucket(self, bucket: int) -> DatabaseRouter:
+        """A method returning the shard of a bucket.
+
+        Args:
+            bucket (int): The bucket.
+
+        Returns:
+            DatabaseRouter: The router of the shard.
+        """
+
+        return self._placement[bucket]
+
+    def for_id(self, entity_id: int) -> DatabaseRouter:
+        """A method returning the shard of an id.
+
+        Args:
+            entity_id (int): The id of a player or an inventory.
+
+        Returns:
+            DatabaseRouter: The router of the shard.
+        """
+
+        return self._placement[self.bucket(entity_id)]
+
+    def group(self, ids: Iterable[int]) -> list[tuple[DatabaseRouter, list[int]]]:
+        """A method splitting ids by their shards.
+
+        Args:
+            ids (Iterable[int]): The ids of players or inventories.
+
+        Returns:
+            list[tuple[DatabaseRouter, list[int]]]: Every shard with its ids,
+                in the original order.
+        """
+
+        groups: dict[int, tuple[DatabaseRouter, list[int]]] = {}
+        for entity_id in ids:
+            shard = self.for_id(entity_id)
+            groups.setdefault(id(shard), (shard, []))[1].append(entity_id)
+
+        return list(groups.values())
+
+    async def gather(self, call: Callable[[DatabaseRouter], Awaitable[T]]) -> list[T]:
+        """A method running a query on every shard concurrently.
+
+        Args:
+            call (Callable[[DatabaseRouter], Awaitable[T]]): The query of a shard.
+
+        Returns:
+            list[T]: The results in the order of the shards.
+        """
+
+        if not self.distributed:
+            return [await call(self._main)]
+
+        return list(await asyncio.gather(*(call(shard) for shard in self._shards.values())))
+
+    def new_id(self, table: Table, bucket: int) -> Any | None:
+        """A method building the id of a new row in a bucket.
+
+        Args:
+            table (Table): The table of the row.
+            bucket (int): The bucket of the row.
+
+        Returns:
+            Any | None: The id expression, None to use the column default.
+        """
+
+        if not self.enabled:
+            return None
+
+        sequence = func.nextval(func.pg_get_serial_sequence(table.name, "id"))
+
+        return sequence * self.buckets + bucket
+
+    async def connect(self) -> None:
+        """A method connecting the shards other than the main database."""
+
+        for shard in self.all()[1:]:
+            await shard.primary.connect()
+            await shard.connect()
+
+    async def disconnect(self) -> None:
+        """A method disconnecting the shards other than the main database."""
+
+        for shard in self.all()[1:]:
+            await shard.disconnect()
+            await shard.primary.disconnect()
+
+    def stats(self) -> dict:
+        """A method returning the shard metrics.
+
+        Returns:
+            dict: The buckets and guard metrics of every shard.
+        """
+
+        counts = Counter(self.names)
+
+        return {
+            name: {"buckets": counts[name], **shard.stats()}
+            for name, shard in self._shards.items()
+        }
@@ -0,0 +1,123 @@
+"""A module containing request coalescing for identical concurrent reads."""
+
+import asyncio
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+from src.infrastructure.utils.dbrouter import DatabaseRouter
+
+PRIMARY_SUFFIX = "@primary"
+
+
+class SingleFlight:
+    """A class sharing one in-flight call between identical concurrent calls.
+
+    Nothing is cached: once the call finishes, the next caller starts
+    a fresh one. A request which has just written reads from the primary,
+    so its calls are kept apart from calls that may read a replica.
+    """
+
+    _calls: dict[str, asyncio.Task]
+    _stats: OrderedDict[str, list[int]]
+
+    def __init__(self, max_tracked_keys: int = 10_000) -> None:
+        """The initializer of the single flight group.
+
+        Args:
+            max_tracked_keys (int): The number of keys with kept metrics.
+        """
+
+        self._calls = {}
+        self._stats = OrderedDict()
+        self._max_tracked_keys = max_tracked_keys
+
+    async def do(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """A method running the call once for all concurrent callers.
+
+        The call runs in its own task, so a cancelled caller does not
+        cancel the query shared with the others.
+
+        Args:
+            key (str): The identity of the call, e.g. `item:5`.
+            call (Callable[[], Awaitable[Any]]): The call to be executed.
+
+        Returns:
+            Any: The result of the shared call.
+        """
+
+        if DatabaseRouter.is_sticky():
+            key += PRIMARY_SUFFIX
+
+        task = self._calls.get(key)
+        coalesced = task is not None
+
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+
+        self._record(key, coalesced)
+
+        return await asyncio.shield(task)
+
+    def forget(self, key: str) -> None:
+        """A method detaching the in-flight call, e.g. after a write.
+
+        Callers arriving later start a new call instead of joining one
+        that may have read the data before the write.
+
+        Args:
+            key (str): The identity of the call.
+        """
+
+        self._calls.pop(key, None)
+        self._calls.pop(key + PRIMARY_SUFFIX, None)
+
+    def stats(self, limit: int = 20) -> list[dict]:
+        """A method returning keys with the most coalesced calls.
+
+        Args:
+            limit (int): The number of keys to be returned.
+
+        Returns:
+            list[dict]: The per key number of calls and coalesced calls.
+        """
+
+        top = sorted(self._stats.items(), key=lambda entry: entry[1][1], reverse=True)
+
+        return [
+            {"key": key, "calls": calls, "coalesced": coalesced}
+            for key, (calls, coalesced) in top[:limit]
+        ]
+
+    def _record(self, key: str, coalesced: bool) -> None:
+        """A private method updating the metrics of the key.
+
+        Args:
+            key (str): The identity of the call.
+            coalesced (bool): Whether the call joined an in-flight one.
+        """
+
+        if (counters := self._stats.get(key)) is None:
+            counters = self._stats[key] = [0, 0]
+            if len(self._stats) > self._max_tracked_keys:
+                self._stats.popitem(last=False)
+        else:
+            self._stats.move_to_end(key)
+
+        counters[0] += 1
+        counters[1] += coalesced
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        """A private callback removing a finished call.
+
+        Args:
+            key (str): The identity of the call.
+            task (asyncio.Task): The finished task.
+        """
+
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+        if not task.cancelled():
+            task.exception()
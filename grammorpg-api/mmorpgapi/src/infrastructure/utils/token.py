@@ -1,28 +1,133 @@
 """A module containing helper functions for token generation."""
 
+import hashlib
+import secrets
 from datetime import datetime, timedelta, timezone
+from uuid import UUID
 
-from jose import jwt
+from jose import JWTError, jwt
 from pydantic import UUID4
 
+from src.config import config
 from src.infrastructure.utils.consts import (
     EXPIRATION_MINUTES,
     ALGORITHM,
-    SECRET_KEY,
+    REFRESH_EXPIRATION_DAYS,
 )
 
 
-def generate_user_token(user_uuid: UUID4) -> dict:
+def generate_user_token(user_uuid: UUID4, session_id: UUID4) -> dict:
     """A function returning JWT token for user.
 
     Args:
-        user_uuid (UUID5): The UUID of the user.
+        user_uuid (UUID4): The UUID of the user.
+        session_id (UUID4): The id of the session the token belongs to.
 
     Returns:
         dict: The token details.
     """
     expire = datetime.now(timezone.utc) + timedelta(minutes=EXPIRATION_MINUTES)
-    jwt_data = {"sub": str(user_uuid), "exp": expire, "type": "confirmation"}
-    encoded_jwt = jwt.encode(jwt_data, key=SECRET_KEY, algorithm=ALGORITHM)
+    jwt_data = {
+        "sub": str(user_uuid),
+        "sid": str(session_id),
+        "exp": expire,
+        "type": "confirmation",
+    }
+    encoded_jwt = jwt.encode(jwt_data, key=config.JWT_SECRET, algorithm=ALGORITHM)
 
     return {"user_token": encoded_jwt, "expires": expire}
+
+
+def decode_user_token(token: str) -> tuple[str, float] | None:
+    """A function returning the user UUID and expiry of a valid JWT token.
+
+    Args:
+        token (str): The encoded JWT token.
+
+    Returns:
+        tuple[str, float] | None: The `sub` claim and the `exp` timestamp
+            if the token is valid.
+    """
+    try:
+        jwt_data = jwt.decode(token, key=config.JWT_SECRET, algorithms=[ALGORITHM])
+    except JWTError:
+        return None
+
+    if not jwt_data.get("sub") or jwt_data.get("exp") is None:
+        return None
+
+    return jwt_data["sub"], float(jwt_data["exp"])
+
+
+def decode_session_token(token: str) -> tuple[str, str] | None:
+    """A function returning the user UUID and session id of a JWT token.
+
+    Args:
+        token (str): The encoded JWT token.
+
+    Returns:
+        tuple[str, str] | None: The `sub` and `sid` claims if the token
+            is valid and bound to a session.
+    """
+    try:
+        jwt_data = jwt.decode(token, key=config.JWT_SECRET, algorithms=[ALGORITHM])
+    except JWTError:
+        return None
+
+    if not jwt_data.get("sub") or not jwt_data.get("sid"):
+        return None
+
+    return jwt_data["sub"], jwt_data["sid"]
+
+
+def generate_refresh_token(session_id: UUID4) -> dict:
+    """A function returning an opaque refresh token of a session.
+
+    Only the hash of the token is stored, so the token is random
+    enough to use a plain SHA-256 instead of a slow password hash.
+
+    Args:
+        session_id (UUID4): The id of the session.
+
+    Returns:
+        dict: The token, its hash and expiration.
+    """
+    refresh_token = f"{session_id}.{secrets.token_urlsafe(32)}"
+    expire = datetime.now(timezone.utc) + timedelta(days=REFRESH_EXPIRATION_DAYS)
+
+    return {
+        "refresh_token": refresh_token,
+        "refresh_hash": hash_refresh_token(refresh_token),
+        "refresh_expires": expire,
+    }
+
+
+def hash_refresh_token(refresh_token: str) -> str:
+    """A function hashing a refresh token for storage.
+
+    Args:
+        refresh_token (str): The refresh token.
+
+    Returns:
+        str: The hex encoded SHA-256 of the token.
+    """
+    return hashlib.sha256(refresh_token.encode()).hexdigest()
+
+
+def refresh_token_session(refresh_token: str) -> UUID | None:
+    """A function returning the session id a refresh token belongs to.
+
+    Args:
+        refresh_token (str): The refresh token.
+
+    Returns:
+        UUID | None: The session id if the token is well formed.
+    """
+    session_id, _, secret = refresh_token.partition(".")
+    if not secret:
+        return None
+
+    try:
+        return UUID(session_id)
+    except ValueError:
+        return None
@@ -0,0 +1,102 @@
+"""A module containing the cache of users on the authenticated path."""
+
+import time
+from collections import OrderedDict
+
+from src.core.domain.user import User
+
+
+class UserCache:
+    """A class keeping recently authenticated users in memory.
+
+    Every authenticated request resolves the user by the UUID stored in
+    its token. The cache answers these lookups without a query, while
+    a `user:` change drops the entry and the TTL bounds staleness of
+    changes made outside of the service.
+    """
+
+    _users: OrderedDict[str, tuple[User, float]]
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 300.0) -> None:
+        """The initializer of the user cache.
+
+        Args:
+            max_entries (int): The maximum number of cached users.
+            ttl_seconds (float): How long a user is served at most.
+        """
+
+        self._users = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: str) -> User | None:
+        """A method getting a cached user.
+
+        Args:
+            user_id (str): The UUID of the user.
+
+        Returns:
+            User | None: The user if cached.
+        """
+
+        entry = self._users.get(user_id)
+        if entry is None or entry[1] <= time.monotonic():
+            self.misses += 1
+            return None
+
+        self._users.move_to_end(user_id)
+        self.hits += 1
+
+        return entry[0]
+
+    def put(self, user: User, generation: int) -> None:
+        """A method remembering a user.
+
+        Args:
+            user (User): The user read from the repository.
+            generation (int): The generation read before the user, so
+                a user loaded before an invalidation is not kept.
+        """
+
+        if generation != self.generation:
+            return
+
+        user_id = str(user.id)
+        self._users.pop(user_id, None)
+        self._users[user_id] = (user, time.monotonic() + self._ttl_seconds)
+        while len(self._users) > self._max_entries:
+            self._users.popitem(last=False)
+
+    def clear(self) -> None:
+        """A method dropping all cached users."""
+
+        self.generation += 1
+        self._users.clear()
+
+    def invalidate_topic(self, topic: str) -> None:
+        """A method dropping a user affected by a changed topic.
+
+        Args:
+            topic (str): The changed topic, e.g. `user:<uuid>`.
+        """
+
+        entity, _, user_id = topic.partition(":")
+        if entity == "user":
+            self.generation += 1
+            self._users.pop(user_id, None)
+
+    def stats(self) -> dict:
+        """A method returning the cache metrics.
+
+        Returns:
+            dict: The number of users, hits and misses.
+        """
+
+        return {
+            "users": len(self._users),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
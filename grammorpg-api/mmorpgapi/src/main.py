@@ -1,39 +1,173 @@
+import math
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.exception_handlers import http_exception_handler
+from fastapi.responses import JSONResponse
 
+from src.api.middlewares.compression import CompressionMiddleware
+from src.api.middlewares.deadline import DeadlineMiddleware
+from src.api.middlewares.idempotency import IdempotencyMiddleware
+from src.api.middlewares.negotiation import ContentNegotiationMiddleware
+from src.api.middlewares.priority import PriorityMiddleware
+from src.api.middlewares.ratelimit import RateLimitMiddleware
+from src.api.middlewares.readyourwrites import ReadYourWritesMiddleware
+from src.api.responses import NegotiatedResponse
+from src.api.routers.combat import router as combat_router
 from src.api.routers.item import router as item_router
 from src.api.routers.inventory import router as inventory_router
+from src.api.routers.loot import router as loot_router
+from src.api.routers.market import router as market_router
+from src.api.routers.metrics import router as metrics_router
 from src.api.routers.player import router as player_router
+from src.api.routers.profiling import router as profiling_router
+from src.api.routers.recipe import router as recipe_router
+from src.api.routers.subscription import router as subscription_router
 from src.api.routers.user import router as user_router
+from src.config import config
 from src.container import Container
-from src.db import database, init_db
+from src.db import database, db_router, init_db, init_shards, shard_router
+from src.infrastructure.utils.dbguard import DatabaseOverloadedError
+from src.infrastructure.utils.deadline import DeadlineExceededError
 
 container = Container()
 container.wire(modules=[
     "src.api.routers.item", 
     "src.api.routers.inventory",
+    "src.api.routers.metrics",
     "src.api.routers.player",
+    "src.api.routers.profiling",
+    "src.api.routers.combat",
+    "src.api.routers.loot",
+    "src.api.routers.market",
+    "src.api.routers.recipe",
+    "src.api.routers.subscription",
     "src.api.routers.user",
+    "src.api.dependencies.auth",
 ])
 
 
+async def resync_caches() -> None:
+    """Funkcja odbudowująca cache, które mogły przegapić powiadomienia o zmianach"""
+    container.response_cache().clear()
+    container.loot_table_cache().clear()
+    container.recipe_cache().clear()
+    container.user_cache().clear()
+    await container.recipe_service().start()
+    await container.user_service().start()
+    await container.player_service().start()
+    await container.item_service().start()
+    if config.MARKET_ENABLED:
+        await container.market_service().start()
+
+
 @asynccontextmanager
 async def lifespan(_: FastAPI) -> AsyncGenerator:
     """Funkcja żywotności działająca przy uruchomieniu aplikacji"""
+    if config.MARKET_ENABLED and shard_router.distributed:
+        raise RuntimeError(
+            "The marketplace settles on the main database only and cannot run "
+            "with inventories on several shards; set MARKET_ENABLED=false."
+        )
+    if config.TRACEMALLOC_ENABLED:
+        container.heap_profiler().start()
     await init_db()
+    await init_shards()
     await database.connect()
+    await db_router.connect()
+    await shard_router.connect()
+    if config.REPOSITORY_BACKEND == "memory":
+        container.memory_store().load()
+    container.change_notifier().add_listener(container.response_cache().invalidate_topic)
+    container.change_notifier().add_listener(container.loot_table_cache().invalidate_topic)
+    container.change_notifier().add_listener(container.recipe_cache().invalidate_topic)
+    container.change_notifier().add_listener(container.session_store().invalidate_topic)
+    container.change_notifier().add_listener(container.user_cache().invalidate_topic)
+    container.change_notifier().add_listener(container.name_registry().invalidate_topic)
+    container.change_notifier().add_listener(container.ledger_service().invalidate_topic)
+    if config.MARKET_ENABLED:
+        container.change_notifier().add_change_listener(container.market_service().invalidate_book)
+    container.change_notifier().add_resync_listener(resync_caches)
+    await container.change_notifier().start()
+    await container.ledger_service().start()
+    if config.MARKET_ENABLED:
+        await container.market_service().start()
+    await container.recipe_service().start()
+    await container.user_service().start()
+    await container.player_service().start()
+    await container.item_service().start()
+    if config.REGENERATION_ENABLED:
+        await container.regeneration_service().start()
+    if config.LOOP_LAG_ENABLED:
+        await container.loop_lag_monitor().start()
     yield
+    await container.loop_lag_monitor().stop()
+    await container.regeneration_service().stop()
+    await container.ledger_service().stop()
+    await container.change_notifier().stop()
+    if config.REPOSITORY_BACKEND == "memory":
+        container.memory_store().save()
+    await shard_router.disconnect()
+    await db_router.disconnect()
     await database.disconnect()
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=NegotiatedResponse)
 app.include_router(item_router, prefix="/item")
 app.include_router(inventory_router, prefix="/inventory")
 app.include_router(player_router, prefix="/player")
+app.include_router(combat_router, prefix="/combat")
+app.include_router(loot_router, prefix="/loot")
+app.include_router(recipe_router, prefix="/recipe")
 app.include_router(user_router, prefix="/user")
+app.include_router(subscription_router, prefix="/subscription")
+app.include_router(metrics_router, prefix="/metrics")
+
+if config.MARKET_ENABLED:
+    app.include_router(market_router, prefix="/market")
+
+if config.PROFILING_ENABLED:
+    app.include_router(profiling_router, prefix="/profiling")
+
+if config.DB_REPLICA_HOSTS:
+    app.add_middleware(
+        ReadYourWritesMiddleware,
+        secret=config.JWT_SECRET,
+        sticky_seconds=config.DB_REPLICA_STICKY_SECONDS,
+    )
+
+if config.IDEMPOTENCY_ENABLED:
+    app.add_middleware(
+        IdempotencyMiddleware,
+        repository=container.idempotency_repository(),
+        paths=config.IDEMPOTENT_PATHS,
+    )
+
+if config.RATE_LIMIT_ENABLED:
+    app.add_middleware(
+        RateLimitMiddleware,
+        repository=container.rate_limit_repository(),
+        rules=config.RATE_LIMIT_RULES,
+    )
+
+if config.DB_GUARD_ENABLED:
+    app.add_middleware(PriorityMiddleware, priorities=config.DB_ROUTE_PRIORITIES)
+
+app.add_middleware(ContentNegotiationMiddleware)
+
+if config.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=config.COMPRESSION_MIN_BYTES,
+    )
+
+if config.DEADLINES_ENABLED:
+    app.add_middleware(
+        DeadlineMiddleware,
+        deadlines=config.REQUEST_DEADLINES,
+        default=config.REQUEST_DEADLINE_SECONDS,
+    )
 
 @app.exception_handler(HTTPException)
 async def http_exception_handle_logging(
@@ -50,3 +184,41 @@ async def http_exception_handle_logging(
         Response: Odpowiedź http
     """
     return await http_exception_handler(request, exception)
+
+
+@app.exception_handler(DatabaseOverloadedError)
+async def database_overloaded_handler(
+    _: Request,
+    exception: DatabaseOverloadedError,
+) -> Response:
+    """Funkcja odrzucająca żądanie, gdy baza danych jest przeciążona.
+
+    Args:
+        _ (Request): Żądanie http
+        exception (DatabaseOverloadedError): Wyjątek
+
+    Returns:
+        Response: Odpowiedź 503 z sugerowanym czasem ponowienia
+    """
+    return JSONResponse(
+        {"detail": str(exception)},
+        status_code=503,
+        headers={"Retry-After": str(max(1, math.ceil(exception.retry_after)))},
+    )
+
+
+@app.exception_handler(DeadlineExceededError)
+async def deadline_exceeded_handler(
+    _: Request,
+    exception: DeadlineExceededError,
+) -> Response:
+    """Funkcja kończąca żądanie, które przekroczyło swój limit czasu.
+
+    Args:
+        _ (Request): Żądanie http
+        exception (DeadlineExceededError): Wyjątek
+
+    Returns:
+        Response: Odpowiedź 504
+    """
+    return JSONResponse({"detail": str(exception)}, status_code=504)
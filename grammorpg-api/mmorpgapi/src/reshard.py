@@ -0,0 +1,344 @@
+"""Narzędzie przenoszące kubełki playerów i inventory między shardami.
+
+Użycie (z katalogu `mmorpgapi`, z konfiguracją bazy w zmiennych środowiska):
+
+    python -m src.reshard --to db db-shard1 db-shard2            # plan
+    python -m src.reshard --to db db-shard1 db-shard2 --copy     # kopiowanie
+    python -m src.reshard --to db db-shard1 db-shard2 --cleanup  # sprzątanie
+
+Kopiowanie synchronizuje każdy przenoszony kubełek ze źródłem i można je
+powtarzać. Procedura: `--copy` przy działającej aplikacji, wstrzymanie
+zapisów, ponowne `--copy`, wdrożenie z nowym `SHARD_HOSTS` i `--cleanup`.
+Kubełki z playerami, których inventory leży w innym kubełku (dane sprzed
+włączenia shardingu), są pomijane i wypisywane.
+"""
+
+import argparse
+import asyncio
+from collections import Counter
+
+import databases
+from sqlalchemy import Integer, Table, all_, bindparam, delete, func, or_, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+
+from src.config import config
+from src.db import (
+    SHARDED_TABLES,
+    host_uri,
+    init_shards,
+    player_name_table,
+    player_table,
+)
+from src.infrastructure.utils.sharding import bucket_placement
+
+COPY_BATCH_SIZE = 1000
+
+
+def plan_moves(
+    old_hosts: list[str],
+    new_hosts: list[str],
+    buckets: int,
+    virtual_nodes: int,
+) -> dict[int, tuple[str, str]]:
+    """Wyznaczenie kubełków zmieniających shard.
+
+    Args:
+        old_hosts (list[str]): Obecne shardy.
+        new_hosts (list[str]): Docelowe shardy.
+        buckets (int): Liczba kubełków.
+        virtual_nodes (int): Liczba punktów shardu na pierścieniu.
+
+    Returns:
+        dict[int, tuple[str, str]]: Źródłowy i docelowy shard kubełków.
+    """
+    old = bucket_placement(old_hosts, buckets, virtual_nodes)
+    new = bucket_placement(new_hosts, buckets, virtual_nodes)
+    return {
+        bucket: (old[bucket], new[bucket])
+        for bucket in range(buckets)
+        if old[bucket] != new[bucket]
+    }
+
+
+async def find_conflicts(source: databases.Database, bucket: int, buckets: int) -> list[int]:
+    """Wyszukanie playerów kubełka przechowywanych poza kubełkiem inventory.
+
+    Args:
+        source (databases.Database): Shard źródłowy.
+        bucket (int): Kubełek.
+        buckets (int): Liczba kubełków.
+
+    Returns:
+        list[int]: ID playerów, których nie można przenieść razem z inventory.
+    """
+    query = select(player_table.c.id).where(
+        player_table.c.id % buckets != player_table.c.connectedinventory % buckets,
+        or_(
+            player_table.c.id % buckets == bucket,
+            player_table.c.connectedinventory % buckets == bucket,
+        ),
+    )
+    return [row["id"] for row in await source.fetch_all(query)]
+
+
+async def bucket_ids(shard: databases.Database, table: Table, bucket: int, buckets: int) -> set[int]:
+    """Pobranie ID wierszy kubełka.
+
+    Args:
+        shard (databases.Database): Shard.
+        table (Table): Tabela.
+        bucket (int): Kubełek.
+        buckets (int): Liczba kubełków.
+
+    Returns:
+        set[int]: ID wierszy kubełka, także oznaczonych jako usunięte.
+    """
+    query = select(table.c.id).where(table.c.id % buckets == bucket)
+    return {row["id"] for row in await shard.fetch_all(query)}
+
+
+async def copy_rows(
+    source: databases.Database,
+    target: databases.Database,
+    table: Table,
+    bucket: int,
+    buckets: int,
+) -> list[int]:
+    """Skopiowanie wierszy kubełka paczkami po ID.
+
+    Istniejące wiersze są nadpisywane, więc kopiowanie można powtarzać.
+
+    Args:
+        source (databases.Database): Shard źródłowy.
+        target (databases.Database): Shard docelowy.
+        table (Table): Tabela.
+        bucket (int): Kubełek.
+        buckets (int): Liczba kubełków.
+
+    Returns:
+        list[int]: ID skopiowanych wierszy.
+    """
+    copied: list[int] = []
+    while True:
+        query = (
+            table.select()
+            .where(table.c.id % buckets == bucket)
+            .order_by(table.c.id)
+            .limit(COPY_BATCH_SIZE)
+        )
+        if copied:
+            query = query.where(table.c.id > copied[-1])
+        rows = await source.fetch_all(query)
+        if not rows:
+            return copied
+
+        statement = insert(table).values([dict(row) for row in rows])
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.id],
+            set_={
+                column.name: statement.excluded[column.name]
+                for column in table.c
+                if column.name != "id"
+            },
+        )
+        await target.execute(statement)
+        copied.extend(row["id"] for row in rows)
+
+
+async def sync_bucket(
+    source: databases.Database,
+    target: databases.Database,
+    bucket: int,
+    buckets: int,
+) -> Counter:
+    """Synchronizacja kubełka w shardzie docelowym ze źródłem.
+
+    Args:
+        source (databases.Database): Shard źródłowy.
+        target (databases.Database): Shard docelowy.
+        bucket (int): Kubełek.
+        buckets (int): Liczba kubełków.
+
+    Returns:
+        Counter: Liczba skopiowanych wierszy każdej tabeli.
+    """
+    copied = {}
+    async with target.transaction():
+        # Inventory najpierw ze względu na klucz obcy playerów.
+        for table in SHARDED_TABLES:
+            copied[table.name] = await copy_rows(source, target, table, bucket, buckets)
+        # Wiersze usunięte w źródle od poprzedniego kopiowania.
+        for table in reversed(SHARDED_TABLES):
+            await target.execute(
+                delete(table).where(
+                    table.c.id % buckets == bucket,
+                    table.c.id != all_(bindparam(
+                        "ids",
+                        copied[table.name],
+                        type_=ARRAY(Integer),
+                    )),
+                )
+            )
+    return Counter({name: len(ids) for name, ids in copied.items()})
+
+
+async def claim_names(shards: dict[str, databases.Database], main: str) -> None:
+    """Zarezerwowanie w bazie głównej nazw istniejących playerów.
+
+    Args:
+        shards (dict[str, databases.Database]): Wszystkie shardy.
+        main (str): Host bazy głównej.
+    """
+    query = select(player_table.c.name).where(
+        player_table.c.deleted_at.is_(None),
+        player_table.c.name.is_not(None),
+    )
+    names: Counter = Counter()
+    for shard in shards.values():
+        names.update(row["name"] for row in await shard.fetch_all(query))
+
+    for name, count in names.items():
+        if count > 1:
+            print(f"Player name '{name}' is used {count} times.")
+
+    names_list = list(names)
+    for start in range(0, len(names_list), COPY_BATCH_SIZE):
+        await shards[main].execute(
+            insert(player_name_table)
+            .values([{"name": name} for name in names_list[start:start + COPY_BATCH_SIZE]])
+            .on_conflict_do_nothing()
+        )
+
+
+async def align_sequences(shards: dict[str, databases.Database]) -> None:
+    """Wyrównanie sekwencji ID wszystkich shardów do największej.
+
+    Numer z sekwencji jest częścią ID, więc po przeniesieniu kubełka nowy
+    shard nie może wydać numeru użytego już w nim przez stary shard.
+
+    Args:
+        shards (dict[str, databases.Database]): Wszystkie shardy.
+    """
+    for table in SHARDED_TABLES:
+        sequence = func.pg_get_serial_sequence(table.name, "id")
+        last_values = [
+            await shard.fetch_val(select(func.pg_sequence_last_value(sequence)))
+            for shard in shards.values()
+        ]
+        last_value = max((value for value in last_values if value), default=0)
+        if last_value:
+            for shard in shards.values():
+                await shard.fetch_val(select(func.setval(
+                    sequence,
+                    func.greatest(
+                        func.coalesce(func.pg_sequence_last_value(sequence), 1),
+                        last_value,
+                    ),
+                )))
+
+
+async def reshard(
+    old_hosts: list[str],
+    new_hosts: list[str],
+    copy: bool,
+    cleanup: bool,
+) -> None:
+    """Przeniesienie kubełków zmieniających shard.
+
+    Args:
+        old_hosts (list[str]): Obecne shardy, baza główna jako pierwsza.
+        new_hosts (list[str]): Docelowe shardy, baza główna jako pierwsza.
+        copy (bool): Czy kopiować kubełki do nowych shardów.
+        cleanup (bool): Czy usuwać skopiowane kubełki ze starych shardów.
+    """
+    if old_hosts[0] != new_hosts[0]:
+        raise SystemExit("The main database must stay the first shard.")
+
+    buckets = config.SHARD_BUCKETS
+    moves = plan_moves(old_hosts, new_hosts, buckets, config.SHARD_VIRTUAL_NODES)
+    for (source, target), count in sorted(Counter(moves.values()).items()):
+        print(f"{source} -> {target}: {count} of {buckets} buckets")
+    if not moves or not (copy or cleanup):
+        return
+
+    shards = {host: databases.Database(host_uri(host)) for host in dict.fromkeys(old_hosts + new_hosts)}
+    for shard in shards.values():
+        await shard.connect()
+
+    try:
+        if copy:
+            await init_shards([host for host in new_hosts[1:] if host not in old_hosts])
+            await claim_names(shards, new_hosts[0])
+            await align_sequences(shards)
+
+        for bucket, (source, target) in moves.items():
+            if conflicts := await find_conflicts(shards[source], bucket, buckets):
+                print(f"Bucket {bucket} skipped, players outside it: {conflicts[:10]}")
+                continue
+
+            if copy:
+                copied = await sync_bucket(shards[source], shards[target], bucket, buckets)
+                print(f"Bucket {bucket} copied to {target}: {dict(copied)}")
+
+            if cleanup:
+                await cleanup_bucket(shards[source], shards[target], bucket, buckets)
+    finally:
+        for shard in shards.values():
+            await shard.disconnect()
+
+
+async def cleanup_bucket(
+    source: databases.Database,
+    target: databases.Database,
+    bucket: int,
+    buckets: int,
+) -> None:
+    """Usunięcie kubełka ze starego shardu, jeśli nowy ma wszystkie jego wiersze.
+
+    Args:
+        source (databases.Database): Stary shard kubełka.
+        target (databases.Database): Nowy shard kubełka.
+        bucket (int): Kubełek.
+        buckets (int): Liczba kubełków.
+    """
+    for table in SHARDED_TABLES:
+        missing = (
+            await bucket_ids(source, table, bucket, buckets)
+            - await bucket_ids(target, table, bucket, buckets)
+        )
+        if missing:
+            print(f"Bucket {bucket} kept, {len(missing)} rows of {table.name} not copied.")
+            return
+
+    async with source.transaction():
+        for table in reversed(SHARDED_TABLES):
+            await source.execute(delete(table).where(table.c.id % buckets == bucket))
+    print(f"Bucket {bucket} removed from the old shard.")
+
+
+def main() -> None:
+    """Uruchomienie narzędzia z argumentami wiersza poleceń."""
+    parser = argparse.ArgumentParser(description="Move player and inventory buckets between shards.")
+    parser.add_argument(
+        "--from",
+        dest="old_hosts",
+        nargs="+",
+        default=[str(config.DB_HOST), *config.SHARD_HOSTS],
+        help="current shard hosts, the main database first",
+    )
+    parser.add_argument(
+        "--to",
+        dest="new_hosts",
+        nargs="+",
+        required=True,
+        help="new shard hosts, the main database first",
+    )
+    parser.add_argument("--copy", action="store_true", help="copy moving buckets")
+    parser.add_argument("--cleanup", action="store_true", help="remove moved buckets")
+    args = parser.parse_args()
+
+    asyncio.run(reshard(args.old_hosts, args.new_hosts, args.copy, args.cleanup))
+
+
+if __name__ == "__main__":
+    main()
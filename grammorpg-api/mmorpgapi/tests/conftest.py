@@ -0,0 +1,11 @@
+"""Wspólne fixture'y testów repozytoriów w pamięci procesu."""
+
+import pytest
+
+from src.infrastructure.utils.memorystore import MemoryStore
+
+
+@pytest.fixture
+def store() -> MemoryStore:
+    """Pusty magazyn bez pliku migawki."""
+    return MemoryStore()
@@ -0,0 +1,49 @@
+"""Funkcje pomocnicze budujące dane testów repozytoriów w pamięci procesu."""
+
+from datetime import datetime, timedelta, timezone
+
+from src.core.domain.character import Character, CharacterIn
+from src.infrastructure.repositories.playermemory import PlayerMemoryRepository
+from src.infrastructure.utils.memorystore import MemoryStore
+
+LONG_AGO = datetime.now(timezone.utc) - timedelta(days=365)
+
+
+def character_in(name: str, money: int = 10) -> CharacterIn:
+    """Atrybuty nowego playera i jego inventory.
+
+    Args:
+        name (str): Nazwa playera.
+        money (int): Pieniądze w inventory.
+
+    Returns:
+        CharacterIn: Dane postaci.
+    """
+    return CharacterIn(
+        player={"name": name, "strength": 5, "hp": 50, "maxhp": 100},
+        inventory={"money": money, "itemlist": ""},
+    )
+
+
+async def add_character(store: MemoryStore, name: str) -> Character:
+    """Dodanie postaci przez repozytorium playerów.
+
+    Args:
+        store (MemoryStore): Magazyn.
+        name (str): Nazwa playera.
+
+    Returns:
+        Character: Nowa postać.
+    """
+    return await PlayerMemoryRepository(store).add_character(character_in(name))
+
+
+def make_inactive(store: MemoryStore, player_id: int, since: datetime = LONG_AGO) -> None:
+    """Cofnięcie ostatniej aktywności playera.
+
+    Args:
+        store (MemoryStore): Magazyn.
+        player_id (int): ID playera.
+        since (datetime): Nowy czas ostatniej aktywności.
+    """
+    store.players.put({**store.players.get(player_id), "last_active_at": since})
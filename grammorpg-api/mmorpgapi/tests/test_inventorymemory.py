@@ -0,0 +1,76 @@
+"""Testy repozytorium inventory w pamięci procesu."""
+
+import pytest
+
+from src.core.domain.inventory import InventoryIn
+from src.infrastructure.repositories.inventorymemory import InventoryMemoryRepository
+from src.infrastructure.repositories.playermemory import PlayerMemoryRepository
+from tests.factories import add_character
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_remove_cascades_to_players(store):
+    repository = InventoryMemoryRepository(store)
+    character = await add_character(store, "hero")
+
+    assert await repository.remove_inventory(character.inventory.id) == [character.player.id]
+
+    assert store.inventories.get(character.inventory.id) is None
+    assert store.players.get(character.player.id) is None
+    assert store.players.lookup("connectedinventory", character.inventory.id) == []
+
+
+async def test_remove_without_cascade_rejects_used_inventory(store):
+    repository = InventoryMemoryRepository(store, cascade=False)
+    character = await add_character(store, "hero")
+    unused = await repository.add_inventory(InventoryIn(money=0, itemlist=""))
+
+    with pytest.raises(ValueError):
+        await repository.remove_inventory(character.inventory.id)
+
+    assert store.inventories.get(character.inventory.id) is not None
+    assert await repository.remove_inventory(unused.id) == []
+    assert await repository.remove_inventory(unused.id) is None
+
+
+async def test_soft_delete_marks_inventory_and_players(store):
+    repository = InventoryMemoryRepository(store, soft_delete=True)
+    character = await add_character(store, "hero")
+
+    assert await repository.remove_inventory(character.inventory.id) == [character.player.id]
+
+    assert store.inventories.get(character.inventory.id)["deleted_at"] is not None
+    assert store.players.get(character.player.id)["deleted_at"] is not None
+    assert await repository.show_inventory_by_id(character.inventory.id) is None
+    assert await repository.remove_inventory(character.inventory.id) is None
+    assert await PlayerMemoryRepository(store).get_player_by_name("hero") is None
+
+
+async def test_soft_deleted_players_do_not_block_removal(store):
+    repository = InventoryMemoryRepository(store, soft_delete=True, cascade=False)
+    character = await add_character(store, "hero")
+    await PlayerMemoryRepository(store, soft_delete=True).remove_player(character.player.id)
+
+    assert await repository.remove_inventory(character.inventory.id) == []
+
+
+async def test_keyset_pages_skip_deleted_inventories(store):
+    repository = InventoryMemoryRepository(store, soft_delete=True)
+    ids = [
+        (await repository.add_inventory(InventoryIn(money=money, itemlist=""))).id
+        for money in range(5)
+    ]
+    await repository.remove_inventory(ids[2])
+
+    first = await repository.get_inventory_page(0, 2)
+    second = await repository.get_inventory_page(first[-1].id, 2)
+    last = await repository.get_inventory_page(second[-1].id, 2)
+
+    assert [inventory.id for inventory in first] == ids[:2]
+    assert [inventory.id for inventory in second] == ids[3:]
+    assert last == []
+
+    batch = await repository.get_many_by_ids([ids[3], ids[2], ids[3], 404])
+    assert [inventory.id for inventory in batch.inventories] == [ids[3]]
+    assert batch.missing == [ids[2], 404]
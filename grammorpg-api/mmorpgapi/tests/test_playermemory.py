@@ -0,0 +1,148 @@
+"""Testy repozytorium player w pamięci procesu."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.core.domain.player import PlayerIn
+from src.infrastructure.repositories.playermemory import PlayerMemoryRepository
+from tests.factories import LONG_AGO, add_character, character_in, make_inactive
+
+pytestmark = pytest.mark.asyncio
+
+RECENTLY = datetime.now(timezone.utc) - timedelta(days=30)
+
+
+async def test_name_index_rejects_taken_name(store):
+    repository = PlayerMemoryRepository(store)
+    character = await add_character(store, "hero")
+
+    with pytest.raises(ValueError):
+        await repository.add_character(character_in("hero"))
+    with pytest.raises(ValueError):
+        await repository.add_player(PlayerIn(
+            name="hero", strength=1, hp=1, maxhp=1,
+            connectedinventory=character.inventory.id,
+        ))
+    assert len(store.players.rows) == 1
+    assert len(store.inventories.rows) == 1
+
+
+async def test_name_index_follows_renames(store):
+    repository = PlayerMemoryRepository(store)
+    character = await add_character(store, "hero")
+    await add_character(store, "villain")
+
+    renamed = await repository.update_player(character.player.id, PlayerIn(
+        **{**character.player.model_dump(), "name": "champion"},
+    ))
+
+    assert renamed.name == "champion"
+    assert await repository.get_player_by_name("hero") is None
+    assert (await repository.get_player_by_name("champion")).id == character.player.id
+    with pytest.raises(ValueError):
+        await repository.update_player(character.player.id, PlayerIn(
+            **{**renamed.model_dump(), "name": "villain"},
+        ))
+    await add_character(store, "hero")
+
+
+async def test_soft_delete_hides_player_and_frees_name(store):
+    repository = PlayerMemoryRepository(store, soft_delete=True)
+    character = await add_character(store, "hero")
+
+    assert await repository.remove_player(character.player.id) == "hero"
+
+    assert store.players.get(character.player.id)["deleted_at"] is not None
+    assert await repository.get_player_by_id(character.player.id) is None
+    assert await repository.remove_player(character.player.id) is None
+    assert await repository.get_all_names() == []
+    assert (await add_character(store, "hero")).player.id != character.player.id
+
+
+async def test_hard_delete_removes_row(store):
+    repository = PlayerMemoryRepository(store)
+    character = await add_character(store, "hero")
+
+    await repository.remove_player(character.player.id)
+
+    assert store.players.get(character.player.id) is None
+    assert store.inventories.get(character.inventory.id) is not None
+
+
+async def test_add_player_requires_existing_inventory(store):
+    with pytest.raises(ValueError):
+        await PlayerMemoryRepository(store).add_player(PlayerIn(
+            name="hero", strength=1, hp=1, maxhp=1, connectedinventory=404,
+        ))
+
+
+async def test_keyset_pages_skip_deleted_players(store):
+    repository = PlayerMemoryRepository(store, soft_delete=True)
+    ids = [(await add_character(store, f"player{number}")).player.id for number in range(5)]
+    await repository.remove_player(ids[1])
+
+    first = await repository.get_players_page(0, 2)
+    second = await repository.get_players_page(first[-1].id, 2)
+    last = await repository.get_players_page(second[-1].id, 2)
+
+    assert [player.id for player in first] == [ids[0], ids[2]]
+    assert [player.id for player in second] == [ids[3], ids[4]]
+    assert last == []
+
+
+async def test_purge_cascades_to_unused_inventories(store):
+    repository = PlayerMemoryRepository(store)
+    inactive = await add_character(store, "inactive")
+    active = await add_character(store, "active")
+    make_inactive(store, inactive.player.id)
+
+    batch = await repository.purge_inactive_players(RECENTLY, 100)
+
+    assert batch.player_ids == [inactive.player.id]
+    assert batch.inventory_ids == [inactive.inventory.id]
+    assert store.inventories.get(inactive.inventory.id) is None
+    assert await repository.get_player_by_id(active.player.id) is not None
+
+
+async def test_purge_keeps_inventories_without_cascade(store):
+    repository = PlayerMemoryRepository(store, cascade=False)
+    character = await add_character(store, "inactive")
+    make_inactive(store, character.player.id)
+
+    batch = await repository.purge_inactive_players(RECENTLY, 100)
+
+    assert batch.player_ids == [character.player.id]
+    assert batch.inventory_ids == []
+    assert store.inventories.get(character.inventory.id) is not None
+
+
+async def test_purge_keeps_inventory_shared_with_active_player(store):
+    repository = PlayerMemoryRepository(store)
+    character = await add_character(store, "inactive")
+    sharing = await repository.add_player(PlayerIn(
+        name="active", strength=1, hp=1, maxhp=1,
+        connectedinventory=character.inventory.id,
+    ))
+    make_inactive(store, character.player.id)
+
+    batch = await repository.purge_inactive_players(RECENTLY, 100)
+
+    assert batch.player_ids == [character.player.id]
+    assert batch.inventory_ids == []
+    assert store.players.get(sharing.id) is not None
+
+
+async def test_purge_removes_soft_deleted_players_in_batches(store):
+    repository = PlayerMemoryRepository(store, soft_delete=True)
+    ids = [(await add_character(store, f"player{number}")).player.id for number in range(3)]
+    for player_id in ids:
+        await repository.remove_player(player_id)
+        store.players.put({**store.players.get(player_id), "deleted_at": LONG_AGO})
+
+    first = await repository.purge_inactive_players(RECENTLY, 2)
+    second = await repository.purge_inactive_players(RECENTLY, 2)
+
+    assert first.player_ids == ids[:2]
+    assert second.player_ids == ids[2:]
+    assert store.players.rows == {}
@@ -0,0 +1,76 @@
+"""Testy czyszczenia nieaktywnych playerów przez serwis player."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.core.domain.character import CharacterPurgeIn
+from src.infrastructure.repositories.playermemory import PlayerMemoryRepository
+from src.infrastructure.services.player import PlayerService
+from src.infrastructure.utils.namefilter import NameRegistry
+from src.infrastructure.utils.singleflight import SingleFlight
+from tests.factories import add_character, make_inactive
+
+pytestmark = pytest.mark.asyncio
+
+
+class RecordingNotifier:
+    """Notyfikator zapamiętujący opublikowane zmiany."""
+
+    def __init__(self) -> None:
+        """Inicjalizator notyfikatora."""
+        self.changes: list[tuple[str, int, dict | None]] = []
+
+    async def publish(self, entity, entity_id, before, after) -> None:
+        """Zapamiętanie zmiany pojedynczej encji."""
+        self.changes.append((entity, entity_id, None))
+
+    async def publish_many(self, entity, changes) -> None:
+        """Zapamiętanie zmian wielu encji."""
+        self.changes.extend((entity, entity_id, fields) for entity_id, fields in changes)
+
+
+def player_service(store, notifier: RecordingNotifier) -> PlayerService:
+    """Serwis player na repozytorium w pamięci procesu.
+
+    Args:
+        store (MemoryStore): Magazyn.
+        notifier (RecordingNotifier): Notyfikator.
+
+    Returns:
+        PlayerService: Serwis.
+    """
+    return PlayerService(
+        PlayerMemoryRepository(store),
+        notifier,
+        SingleFlight(),
+        ledger=None,
+        names=NameRegistry(capacity=1000),
+    )
+
+
+async def test_purge_accepts_naive_datetime(store):
+    notifier = RecordingNotifier()
+    service = player_service(store, notifier)
+    inactive = await add_character(store, "inactive")
+    active = await add_character(store, "active")
+    make_inactive(store, inactive.player.id)
+    # Naiwna data z żądania jest traktowana jako UTC, a porównanie z
+    # `last_active_at` ze strefą nie może zgłosić TypeError.
+    naive = (datetime.now(timezone.utc) - timedelta(days=60)).replace(tzinfo=None)
+
+    purge = await service.purge_inactive_players(CharacterPurgeIn(inactive_before=naive))
+
+    assert (purge.players, purge.inventories) == (1, 1)
+    assert store.players.get(inactive.player.id) is None
+    assert store.players.get(active.player.id) is not None
+    assert ("player", inactive.player.id, None) in notifier.changes
+    assert ("inventory", inactive.inventory.id, None) in notifier.changes
+
+
+async def test_purge_rejects_recent_naive_datetime(store):
+    service = player_service(store, RecordingNotifier())
+    naive = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=1)
+
+    with pytest.raises(ValueError):
+        await service.purge_inactive_players(CharacterPurgeIn(inactive_before=naive))